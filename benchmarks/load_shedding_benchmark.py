@@ -0,0 +1,99 @@
+"""
+Measures the latency of a critical route while clients hammer a slow low priority route, with and without load
+shedding.  Handlers share a downstream which only serves a few requests at a time, first come first served, so
+without shedding every request queues behind the slow ones.
+
+Run from the repository root with: PYTHONPATH=. python benchmarks/load_shedding_benchmark.py
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from eynnyd import EynnydWebappBuilder, LoadShedderBuilder, ResponseBuilder, RoutesBuilder
+
+_DOWNSTREAM_SLOTS = 4
+_BASELINE_CLIENTS = 4
+_SPIKE_CLIENTS = 3 * _BASELINE_CLIENTS
+_SECONDS = 3.0
+_CRITICAL_SECONDS = 0.002
+_REPORT_SECONDS = 0.02
+
+
+def _build_application(shed, downstream):
+    def work(seconds):
+        downstream.submit(time.sleep, seconds).result()
+        return ResponseBuilder().set_utf8_body("done").build()
+
+    routes = RoutesBuilder()\
+        .add_handler("GET", "/health", lambda request: work(_CRITICAL_SECONDS))\
+        .add_handler("GET", "/reports", lambda request: work(_REPORT_SECONDS))\
+        .set_priority("/health", 0)\
+        .set_priority("/reports", 2)\
+        .build()
+    webapp_builder = EynnydWebappBuilder().set_routes(routes)
+    if shed:
+        webapp_builder.set_load_shedder(
+            LoadShedderBuilder()
+            .set_target_latency_seconds(_CRITICAL_SECONDS * 5)
+            .set_interval_seconds(0.1)
+            .build())
+    return webapp_builder.build()
+
+
+def _request(application, path):
+    statuses = []
+    wsgi_environment = {
+        "REQUEST_METHOD": "GET",
+        "wsgi.url_scheme": "http",
+        "SERVER_NAME": "localhost",
+        "SERVER_PORT": "80",
+        "PATH_INFO": path,
+        "QUERY_STRING": ""
+    }
+    for _ in application(wsgi_environment, lambda status, headers: statuses.append(status)):
+        pass
+    return statuses[0]
+
+
+def _run(shed, report_clients):
+    downstream = ThreadPoolExecutor(max_workers=_DOWNSTREAM_SLOTS)
+    application = _build_application(shed, downstream)
+    deadline = time.perf_counter() + _SECONDS
+    critical_latencies = []
+    shed_count = [0]
+
+    def report_client():
+        while time.perf_counter() < deadline:
+            if _request(application, "/reports").startswith("503"):
+                shed_count[0] += 1
+                time.sleep(0.001)
+
+    threads = [threading.Thread(target=report_client) for _ in range(report_clients)]
+    for thread in threads:
+        thread.start()
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        _request(application, "/health")
+        critical_latencies.append(time.perf_counter() - start)
+        time.sleep(0.005)
+    for thread in threads:
+        thread.join()
+    downstream.shutdown()
+
+    critical_latencies.sort()
+    return critical_latencies[int(len(critical_latencies) * 0.99) - 1], shed_count[0]
+
+
+def main():
+    for shed in (False, True):
+        for report_clients in (_BASELINE_CLIENTS, _SPIKE_CLIENTS):
+            p99, shed_count = _run(shed, report_clients)
+            print("shedding {s:<5} report clients {c:>2}: critical p99 {p:.1f}ms, {n} report requests shed".format(
+                s=str(shed),
+                c=report_clients,
+                p=p99 * 1000,
+                n=shed_count))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Counts backend calls when many threads request the same slow resource at once, with and without request coalescing.
+
+Run from the repository root with: PYTHONPATH=. python benchmarks/request_coalescing_benchmark.py
+"""
+import threading
+import time
+
+from eynnyd import EynnydWebappBuilder, RequestCoalescerBuilder, ResponseBuilder, RoutesBuilder
+
+_THREADS = 32
+_ROUNDS = 10
+_BACKEND_SECONDS = 0.05
+
+
+class SlowBackend:
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.call_count = 0
+
+    def __call__(self, request):
+        with self._lock:
+            self.call_count += 1
+        time.sleep(_BACKEND_SECONDS)
+        return ResponseBuilder().set_utf8_body("expensive report").build()
+
+
+def _build_application(backend, coalesce):
+    routes_builder = RoutesBuilder().add_handler("GET", "/report", backend)
+    if coalesce:
+        routes_builder.set_request_coalescer("GET", "/report", RequestCoalescerBuilder().build())
+    return EynnydWebappBuilder().set_routes(routes_builder.build()).build()
+
+
+def _request(application):
+    wsgi_environment = {"REQUEST_METHOD": "GET", "PATH_INFO": "/report", "QUERY_STRING": ""}
+    for _ in application(wsgi_environment, lambda status, headers: None):
+        pass
+
+
+def _run(coalesce):
+    backend = SlowBackend()
+    application = _build_application(backend, coalesce)
+    start = time.perf_counter()
+    for _ in range(_ROUNDS):
+        threads = [threading.Thread(target=_request, args=(application,)) for _ in range(_THREADS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    return backend.call_count, time.perf_counter() - start
+
+
+def main():
+    for coalesce in (False, True):
+        call_count, elapsed = _run(coalesce)
+        print("coalescing {c:<5}: {r} requests, {n} backend calls, {e:.2f}s".format(
+            c=str(coalesce),
+            r=_THREADS * _ROUNDS,
+            n=call_count,
+            e=elapsed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Compares serving a file through the StaticFilesHandler against opening and streaming it in a handler.
+
+Run from the repository root with: PYTHONPATH=. python benchmarks/static_files_benchmark.py
+"""
+import os
+import shutil
+import tempfile
+import timeit
+from wsgiref.util import FileWrapper
+
+from eynnyd import EynnydWebappBuilder, ResponseBuilder, RoutesBuilder, StaticFilesHandlerBuilder
+
+_ITERATIONS = 20000
+_FILE_SIZES = (1024, 32 * 1024, 1024 * 1024)
+
+
+def _build_application(directory):
+    def open_and_stream(request):
+        return ResponseBuilder()\
+            .add_header("content-type", "application/octet-stream")\
+            .set_stream_body(open(os.path.join(directory, request.path_parameters["file_name"]), "rb"))\
+            .build()
+
+    routes = RoutesBuilder()\
+        .add_handler("GET", "/stream/{file_name}", open_and_stream)\
+        .add_handler("GET", "/static/{file_name}", StaticFilesHandlerBuilder(directory, "/static").build())\
+        .build()
+    return EynnydWebappBuilder().set_routes(routes).build()
+
+
+def _request(application, path):
+    wsgi_environment = {
+        "REQUEST_METHOD": "GET",
+        "PATH_INFO": path,
+        "QUERY_STRING": "",
+        "wsgi.file_wrapper": FileWrapper
+    }
+    body = application(wsgi_environment, lambda status, headers: None)
+    for _ in body:
+        pass
+    if hasattr(body, "close"):
+        body.close()
+
+
+def main():
+    directory = tempfile.mkdtemp()
+    try:
+        application = _build_application(directory)
+        for file_size in _FILE_SIZES:
+            file_name = "file_{s}.bin".format(s=file_size)
+            with open(os.path.join(directory, file_name), "wb") as benchmark_file:
+                benchmark_file.write(os.urandom(file_size))
+
+            iterations = max(_ITERATIONS * 1024 // file_size, 200)
+            for route in ("stream", "static"):
+                path = "/{r}/{f}".format(r=route, f=file_name)
+                seconds = timeit.timeit(lambda: _request(application, path), number=iterations)
+                print("{r:>6} {s:>8} bytes: {o:>10.0f} requests/second".format(
+                    r=route, s=file_size, o=iterations / seconds))
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
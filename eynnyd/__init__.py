@@ -5,6 +5,20 @@ from eynnyd.response_cookie_builder import ResponseCookieBuilder
 from eynnyd.response_builder import ResponseBuilder
 from eynnyd.eynnyd_webapp_builder import EynnydWebappBuilder
 from eynnyd.error_handlers_builder import ErrorHandlersBuilder
+from eynnyd.compression_interceptor_builder import CompressionInterceptorBuilder
+from eynnyd.etag_interceptor_builder import ETagInterceptorBuilder
+from eynnyd.conditional_requests import ConditionalRequests
+from eynnyd.range_interceptor_builder import RangeInterceptorBuilder
+from eynnyd.static_files_handler_builder import StaticFilesHandlerBuilder
+from eynnyd.response_cache_builder import ResponseCacheBuilder
+from eynnyd.request_coalescer_builder import RequestCoalescerBuilder
+from eynnyd.handler_executor_builder import HandlerExecutorBuilder
+from eynnyd.bulkhead_builder import BulkheadBuilder
+from eynnyd.rate_limit_interceptor_builder import RateLimitInterceptorBuilder
+from eynnyd.load_shedder_builder import LoadShedderBuilder
+from eynnyd.background_task_runner_builder import BackgroundTaskRunnerBuilder
+from eynnyd.phase_timings_builder import PhaseTimingsBuilder
 from eynnyd.exceptions import *
 from eynnyd.abstract_request import AbstractRequest
 from eynnyd.abstract_response import AbstractResponse
+from eynnyd.abstract_rate_limit_store import AbstractRateLimitStore
@@ -0,0 +1,27 @@
+from abc import ABC, abstractmethod
+
+
+class AbstractRateLimitStore(ABC):
+    """
+    The expected interface for a store of rate limit token buckets.
+
+    The default store keeps buckets in process, so each worker process limits requests on its own.  To share limits
+    across worker processes (ex. through shared memory or a cache server) implement this class and set it on the
+    RateLimitInterceptorBuilder.  Stores are called from many threads at once and must be thread safe.
+    """
+
+    @abstractmethod
+    def acquire(self, key, tokens_per_second, capacity, now):
+        """
+        Takes a token from the bucket for a key, refilling it first for the time passed since it was last used.
+        Buckets which do not exist yet start full.  Clocks may step backwards, so a bucket last refilled after now is
+        not refilled.
+
+        :param key: a hashable tuple of strings identifying the bucket
+        :param tokens_per_second: how quickly the bucket refills
+        :param capacity: how many tokens the bucket holds when full
+        :param now: the current time.time() in seconds, comparable between processes and between hosts with
+            synchronised clocks
+        :return: 0 if a token was taken, otherwise the seconds until a token will be available
+        """
+        pass
@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
 
+from optional import Optional
+
 
 class AbstractRequest(ABC):
     """
@@ -88,6 +90,36 @@ class AbstractRequest(ABC):
         """
         pass
 
+    @property
+    def route(self):
+        """
+        The route the request matched, its http method and path template (ex. GET /users/{user_id}).
+
+        :return: An Optional of the route.  Empty before the request has been routed.
+        """
+        return Optional.empty()
+
+    @property
+    def deadline(self):
+        """
+        The time budget left to answer the request.  Handlers calling other services can pass
+        ``deadline.remaining_seconds`` along as their own timeout so the whole call chain gives up together.
+
+        :return: An Optional of an Eynnyd Deadline with remaining_seconds, expired, and expires_at properties.  Empty
+            when neither the route nor the request set a deadline.
+        """
+        return Optional.empty()
+
+    @abstractmethod
+    def copy_and_set_deadline(self, deadline):
+        """
+        Copies the request giving it a deadline, called by the webapp once a route's deadline is known.
+
+        :param deadline: An Eynnyd Deadline
+        :return: A copy of the request whose deadline property holds the given deadline.
+        """
+        pass
+
     @property
     @abstractmethod
     def byte_body(self):
@@ -48,4 +48,11 @@ class AbstractResponse(ABC):
         """
         pass
 
+    @property
+    def background_tasks(self):
+        """
+        Work to run once the response has been sent, such as sending emails, writing audit logs or warming caches.
 
+        :return: a tuple of functions taking no arguments
+        """
+        return ()
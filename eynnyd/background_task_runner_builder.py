@@ -0,0 +1,90 @@
+import inspect
+
+from eynnyd.exceptions import EynnydWebappBuildException
+from eynnyd.internal.background_tasks.background_task_runner import BackgroundTaskRunner, \
+    default_background_task_error_hook
+
+
+class BackgroundTaskRunnerBuilder:
+    """
+    A builder for where background tasks run.  Background tasks are added to a response with the Eynnyd
+    ResponseBuilder add_background_task method and run once the server has sent the response and closed its body.
+
+    By default tasks run inline, on the server thread which sent the response, before it moves on to the next
+    request.  A bounded thread pool frees that thread straight away instead.  Once the pool has as many tasks running
+    and queued as it allows, further tasks run inline again, so a burst slows the server down rather than dropping
+    work or growing without bound.
+
+    A task raising an exception does not affect other tasks or the response, which has already been sent.  The
+    exception and the task are passed to the error hook, which by default logs them.  The built runner exposes a
+    metrics property with the active, backlog (queued), completed, failed and ran inline task counts.
+    """
+
+    def __init__(self):
+        self._name = "eynnyd-background"
+        self._maximum_workers = 0
+        self._maximum_queue_size = 0
+        self._error_hook = default_background_task_error_hook
+
+    def set_name(self, name):
+        """
+        Sets the name used for the pool's threads and in its metrics (default eynnyd-background).
+
+        :param name: the name of the runner
+        :return: This builder to allow for fluent design.
+        """
+        self._name = str(name)
+        return self
+
+    def set_maximum_workers(self, maximum_workers):
+        """
+        Runs tasks on a thread pool of this size rather than inline (default 0, inline).
+
+        :param maximum_workers: zero or a positive number of threads
+        :return: This builder to allow for fluent design.
+        """
+        if not isinstance(maximum_workers, int) or isinstance(maximum_workers, bool) or maximum_workers < 0:
+            raise EynnydWebappBuildException(
+                "Maximum workers {m} must be zero or a positive integer.".format(m=maximum_workers))
+        self._maximum_workers = maximum_workers
+        return self
+
+    def set_maximum_queue_size(self, maximum_queue_size):
+        """
+        Sets how many tasks may wait for a free worker before tasks run inline again (default 0).
+
+        :param maximum_queue_size: zero or a positive number of tasks
+        :return: This builder to allow for fluent design.
+        """
+        if not isinstance(maximum_queue_size, int) or isinstance(maximum_queue_size, bool) or maximum_queue_size < 0:
+            raise EynnydWebappBuildException(
+                "Maximum queue size {m} must be zero or a positive integer.".format(m=maximum_queue_size))
+        self._maximum_queue_size = maximum_queue_size
+        return self
+
+    def set_error_hook(self, error_hook):
+        """
+        Sets the function called when a background task raises an exception.
+
+        :param error_hook: a function taking the exception and the task
+        :return: This builder to allow for fluent design.
+        """
+        if not callable(error_hook) or 2 != len(inspect.signature(error_hook).parameters):
+            raise EynnydWebappBuildException("Error hook must be a function taking exactly 2 arguments.")
+        self._error_hook = error_hook
+        return self
+
+    def build(self):
+        """
+        Builds the background task runner.
+
+        :return: A background task runner for usage with the Eynnyd EynnydWebappBuilder set_background_task_runner
+            method.
+        """
+        if self._maximum_workers == 0 and self._maximum_queue_size > 0:
+            raise EynnydWebappBuildException("Background tasks cannot be queued without any workers.")
+        return BackgroundTaskRunner(
+            self._name,
+            self._maximum_workers,
+            self._maximum_queue_size,
+            self._error_hook)
@@ -0,0 +1,68 @@
+from eynnyd.exceptions import RouteBuildException
+from eynnyd.internal.plan_execution.bulkhead import Bulkhead
+
+
+class BulkheadBuilder:
+    """
+    A builder for limiting how many requests are in flight at once on a route or on every route under a path.
+
+    A slow endpoint (ex. a report export) given a bulkhead can only ever occupy that many server threads, leaving
+    the rest free for other routes and health checks.  Requests past the limit are rejected at once, before any
+    interceptor runs, with a BulkheadFullException which by default is answered with 503 Service Unavailable and a
+    Retry-After header.  A request counts as in flight from before its request interceptors run until its response
+    interceptors have finished.
+
+    The built bulkhead exposes a metrics property with its current and peak number of requests in flight and the
+    number of requests it has rejected.  Setting one bulkhead on several routes shares its limit between them.
+    """
+
+    def __init__(self):
+        self._name = "eynnyd-bulkhead"
+        self._maximum_in_flight = None
+        self._retry_after_seconds = 1
+
+    def set_name(self, name):
+        """
+        Sets the name used in the bulkhead's metrics and rejection messages (default eynnyd-bulkhead).
+
+        :param name: the name of the bulkhead
+        :return: This builder to allow for fluent design.
+        """
+        self._name = str(name)
+        return self
+
+    def set_maximum_in_flight(self, maximum_in_flight):
+        """
+        Sets how many requests may be in flight at once.  Required.
+
+        :param maximum_in_flight: a positive number of requests
+        :return: This builder to allow for fluent design.
+        """
+        if not isinstance(maximum_in_flight, int) or maximum_in_flight < 1:
+            raise RouteBuildException(
+                "Maximum in flight {m} must be a positive integer.".format(m=maximum_in_flight))
+        self._maximum_in_flight = maximum_in_flight
+        return self
+
+    def set_retry_after_seconds(self, retry_after_seconds):
+        """
+        Sets the Retry-After header sent with rejections (default 1).
+
+        :param retry_after_seconds: zero or a positive whole number of seconds
+        :return: This builder to allow for fluent design.
+        """
+        if not isinstance(retry_after_seconds, int) or retry_after_seconds < 0:
+            raise RouteBuildException(
+                "Retry after seconds {r} must be zero or a positive integer.".format(r=retry_after_seconds))
+        self._retry_after_seconds = retry_after_seconds
+        return self
+
+    def build(self):
+        """
+        Builds the bulkhead.
+
+        :return: A bulkhead for usage with the Eynnyd RoutesBuilder add_bulkhead and add_route_bulkhead methods.
+        """
+        if self._maximum_in_flight is None:
+            raise RouteBuildException("A bulkhead needs a maximum number of requests in flight.")
+        return Bulkhead(self._name, self._maximum_in_flight, self._retry_after_seconds)
@@ -0,0 +1,82 @@
+from eynnyd.exceptions import InterceptorBuildException
+from eynnyd.internal.interceptors.compression_response_interceptor import CompressionResponseInterceptor
+
+
+class CompressionInterceptorBuilder:
+    """
+    A builder for a response interceptor which compresses response bodies for clients that accept it.
+
+    The interceptor negotiates gzip or deflate from the Accept-Encoding header of the request.  UTF8 and byte
+    bodies are compressed in one shot while stream and iterable bodies are compressed incrementally as they are
+    sent.  Bodies smaller than the minimum size, already encoded bodies and already compressed content types
+    are left alone.  A Vary header is added to any response which could have been compressed.
+    """
+
+    _DEFAULT_UNCOMPRESSIBLE_CONTENT_TYPES = (
+        "image/png",
+        "image/jpeg",
+        "image/gif",
+        "image/webp",
+        "video/",
+        "audio/",
+        "font/woff",
+        "application/zip",
+        "application/gzip",
+        "application/x-gzip",
+        "application/x-bzip2",
+        "application/x-xz",
+        "application/x-7z-compressed",
+        "application/x-rar-compressed")
+
+    def __init__(self):
+        self._minimum_size = 1024
+        self._compression_level = 6
+        self._uncompressible_content_types = list(CompressionInterceptorBuilder._DEFAULT_UNCOMPRESSIBLE_CONTENT_TYPES)
+
+    def set_minimum_size(self, minimum_size):
+        """
+        Sets the size, in bytes, below which utf-8 and byte bodies are not compressed (default 1024).
+
+        :param minimum_size: a non negative number of bytes
+        :return: This builder to allow for fluent design.
+        """
+        if not isinstance(minimum_size, int) or minimum_size < 0:
+            raise InterceptorBuildException(
+                "Minimum size {m} must be a non negative integer.".format(m=minimum_size))
+        self._minimum_size = minimum_size
+        return self
+
+    def set_compression_level(self, compression_level):
+        """
+        Sets the zlib compression level, from 1 (fastest) to 9 (smallest) (default 6).
+
+        :param compression_level: an integer from 1 to 9
+        :return: This builder to allow for fluent design.
+        """
+        if not isinstance(compression_level, int) or not 1 <= compression_level <= 9:
+            raise InterceptorBuildException(
+                "Compression level {c} must be an integer from 1 to 9.".format(c=compression_level))
+        self._compression_level = compression_level
+        return self
+
+    def add_uncompressible_content_type(self, content_type):
+        """
+        Adds a content type which should never be compressed.  Matching is done on the start of the media type
+        so, for example, "video/" excludes all video types.
+
+        :param content_type: the content type (or start of one) to exclude
+        :return: This builder to allow for fluent design.
+        """
+        self._uncompressible_content_types.append(str(content_type).lower())
+        return self
+
+    def build(self):
+        """
+        Builds the interceptor.
+
+        :return: A response interceptor for usage with the Eynnyd RoutesBuilder add_response_interceptor method.
+        """
+        return CompressionResponseInterceptor(
+            self._minimum_size,
+            self._compression_level,
+            self._uncompressible_content_types)
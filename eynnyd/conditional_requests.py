@@ -0,0 +1,47 @@
+from http import HTTPStatus
+
+from eynnyd.internal.utils.conditional_request_evaluator import ConditionalRequestEvaluator
+from eynnyd.response_builder import ResponseBuilder
+
+
+class ConditionalRequests:
+    """
+    Helpers allowing handlers to answer conditional GET requests before doing the expensive work of building a body.
+
+    A handler which can cheaply find a validator (ex. a version number or an updated at time from a database) can
+    check it against the request and return a 304 Not Modified response without ever generating the body.
+    """
+
+    @staticmethod
+    def is_not_modified(request, etag=None, last_modified=None):
+        """
+        Checks whether the client already holds the current version of the resource.
+
+        If-None-Match is checked against the etag when sent, otherwise If-Modified-Since is checked against the
+        last modified time.  Only GET and HEAD requests are ever considered not modified.
+
+        :param request: the request being handled.
+        :param etag: the current ETag of the resource (quoted or not).
+        :param last_modified: the time the resource last changed as a datetime or HTTP date string.
+        :return: True if a 304 Not Modified response should be sent.
+        """
+        return ConditionalRequestEvaluator.is_not_modified(
+            request,
+            None if etag is None else ConditionalRequestEvaluator.format_etag(etag),
+            last_modified)
+
+    @staticmethod
+    def build_not_modified_response(etag=None, last_modified=None):
+        """
+        Builds a 304 Not Modified response carrying the given validators.
+
+        :param etag: the current ETag of the resource (quoted or not).
+        :param last_modified: the time the resource last changed as a datetime or HTTP date string.
+        :return: A response ready for returning from the webapp.
+        """
+        response_builder = ResponseBuilder().set_status(HTTPStatus.NOT_MODIFIED)
+        if etag is not None:
+            response_builder.add_header("etag", ConditionalRequestEvaluator.format_etag(etag))
+        if last_modified is not None:
+            response_builder.add_header("last-modified", ConditionalRequestEvaluator.format_http_date(last_modified))
+        return response_builder.build()
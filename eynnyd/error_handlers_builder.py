@@ -5,10 +5,13 @@ import logging
 from eynnyd.internal.plan_execution.error_handlers import ErrorHandlers
 from eynnyd.internal.plan_execution.default_error_handlers import default_route_not_found_error_handler, \
     default_internal_server_error_error_handler, default_internal_server_error_error_handler_only_request, \
-    default_invalid_cookie_header_error_handler
+    default_invalid_cookie_header_error_handler, static_route_not_found_error_handler, \
+    default_service_unavailable_error_handler, default_rate_limit_exceeded_error_handler, \
+    default_deadline_exceeded_error_handler_only_request, default_deadline_exceeded_error_handler
 from eynnyd.exceptions import ErrorHandlingBuilderException, RouteNotFoundException, \
     CallbackIncorrectNumberOfParametersException, NonCallableExceptionHandlerException, \
-    InvalidCookieHeaderException
+    InvalidCookieHeaderException, ServiceUnavailableException, RateLimitExceededException, \
+    DeadlineExceededException
 
 
 LOG = logging.getLogger("error_handlers_builder")
@@ -25,12 +28,27 @@ class ErrorHandlersBuilder:
     Handling will prefer the most specific exception but will execute against a base exception if one was set.
 
     Several default handlers are set if they are not set manually.  The defaults registered
-    are for RouteNotFound, InvalidCookieHeader, and Exception.
+    are for RouteNotFound, InvalidCookieHeader, ServiceUnavailable (a 503 with any Retry-After it carries),
+    RateLimitExceeded (a 429 with its Retry-After), DeadlineExceeded (a 504, before or after a response), and
+    Exception.  Their responses (other than the detailed RouteNotFound message) are prebuilt once and shared.
     """
 
     def __init__(self):
         self._pre_response_error_handlers = []
         self._post_response_error_handler = []
+        self._detailed_route_not_found_message = True
+
+    def set_detailed_route_not_found_message(self, detailed_route_not_found_message):
+        """
+        Sets whether the default RouteNotFound handler names the http method and path in its body (default True).
+        When False the handler returns one prebuilt "Not Found" response, making floods of unknown routes cheap
+        to answer.  Has no effect when a RouteNotFound handler is added.
+
+        :param detailed_route_not_found_message: True to name the method and path, False for a static response.
+        :return: This builder so that fluent design can optionally be used.
+        """
+        self._detailed_route_not_found_message = bool(detailed_route_not_found_message)
+        return self
 
     def add_pre_response_error_handler(self, error_class, handler):
         """
@@ -89,7 +107,8 @@ class ErrorHandlersBuilder:
                 self._pre_response_error_handlers):
             self.add_pre_response_error_handler(
                 RouteNotFoundException,
-                default_route_not_found_error_handler)
+                default_route_not_found_error_handler if self._detailed_route_not_found_message
+                else static_route_not_found_error_handler)
 
         if not ErrorHandlersBuilder._is_registered_already(
                 InvalidCookieHeaderException,
@@ -98,6 +117,27 @@ class ErrorHandlersBuilder:
                 InvalidCookieHeaderException,
                 default_invalid_cookie_header_error_handler)
 
+        if not ErrorHandlersBuilder._is_registered_already(
+                ServiceUnavailableException,
+                self._pre_response_error_handlers):
+            self.add_pre_response_error_handler(
+                ServiceUnavailableException,
+                default_service_unavailable_error_handler)
+
+        if not ErrorHandlersBuilder._is_registered_already(
+                RateLimitExceededException,
+                self._pre_response_error_handlers):
+            self.add_pre_response_error_handler(
+                RateLimitExceededException,
+                default_rate_limit_exceeded_error_handler)
+
+        if not ErrorHandlersBuilder._is_registered_already(
+                DeadlineExceededException,
+                self._pre_response_error_handlers):
+            self.add_pre_response_error_handler(
+                DeadlineExceededException,
+                default_deadline_exceeded_error_handler_only_request)
+
         if not ErrorHandlersBuilder._is_registered_already(
                 Exception,
                 self._pre_response_error_handlers):
@@ -105,6 +145,13 @@ class ErrorHandlersBuilder:
                 Exception,
                 default_internal_server_error_error_handler_only_request)
 
+        if not ErrorHandlersBuilder._is_registered_already(
+                DeadlineExceededException,
+                self._post_response_error_handler):
+            self.add_post_response_error_handler(
+                DeadlineExceededException,
+                default_deadline_exceeded_error_handler)
+
         if not ErrorHandlersBuilder._is_registered_already(
                 Exception,
                 self._post_response_error_handler):
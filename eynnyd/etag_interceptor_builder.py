@@ -0,0 +1,35 @@
+from eynnyd.internal.interceptors.etag_response_interceptor import ETagResponseInterceptor
+
+
+class ETagInterceptorBuilder:
+    """
+    A builder for a response interceptor which adds ETags to responses and answers conditional GET requests.
+
+    For successful GET and HEAD requests the interceptor computes an ETag (a truncated sha1 digest of the body)
+    for utf-8 and byte bodies which do not already have one.  If the request's If-None-Match (or, failing that,
+    If-Modified-Since against the response's Last-Modified header) shows the client already has the body,
+    the response is replaced with a body-less 304 Not Modified.
+
+    Handlers which are expensive to run should check conditions up front using ConditionalRequests instead.
+    """
+
+    def __init__(self):
+        self._weak_etags = False
+
+    def set_weak_etags(self, weak_etags):
+        """
+        Sets whether generated ETags are weak (W/"...") rather than strong (default strong).
+
+        :param weak_etags: a boolean to indicate if generated ETags should be weak
+        :return: This builder to allow for fluent design.
+        """
+        self._weak_etags = bool(weak_etags)
+        return self
+
+    def build(self):
+        """
+        Builds the interceptor.
+
+        :return: A response interceptor for usage with the Eynnyd RoutesBuilder add_response_interceptor method.
+        """
+        return ETagResponseInterceptor(self._weak_etags)
@@ -190,3 +190,82 @@ class ExecutionPlanBuildException(Exception):
     Raised when an execution plan is finished but cannot build. (should not happen)
     """
     pass
+
+
+class InterceptorBuildException(Exception):
+    """
+    Raised when one of the built in interceptors is configured with invalid values.
+    """
+    pass
+
+
+class HandlerBuildException(Exception):
+    """
+    Raised when one of the built in handlers is configured with invalid values.
+    """
+    pass
+
+
+class UnsupportedASGIScopeTypeException(Exception):
+    """
+    Raised when an ASGI server calls the webapp with a scope type other than http or lifespan.
+    """
+    pass
+
+
+class ServiceUnavailableException(Exception):
+    """
+    Raised when a request is turned away because part of the webapp is at capacity.  Answered by default with
+    503 Service Unavailable, with a Retry-After header when retry_after_seconds is set.
+    """
+
+    def __init__(self, message, retry_after_seconds=None):
+        super().__init__(message)
+        self.retry_after_seconds = retry_after_seconds
+
+
+class HandlerExecutorSaturatedException(ServiceUnavailableException):
+    """
+    Raised when a handler executor already has as many requests running and queued as it allows.
+    """
+    pass
+
+
+class BulkheadFullException(ServiceUnavailableException):
+    """
+    Raised when a bulkhead already has as many requests in flight as it allows.
+    """
+    pass
+
+
+class RateLimitExceededException(Exception):
+    """
+    Raised when a request is over its rate limit.  Answered by default with 429 Too Many Requests and a Retry-After
+    header of the whole seconds until the request would be allowed.
+    """
+
+    def __init__(self, message, retry_after_seconds):
+        super().__init__(message)
+        self.retry_after_seconds = retry_after_seconds
+
+
+class RequestShedException(ServiceUnavailableException):
+    """
+    Raised when the load shedder turns away a request to a lower priority route while the webapp is overloaded.
+    """
+    pass
+
+
+class DeadlineExceededException(Exception):
+    """
+    Raised when a request's deadline passes before its response is ready.  Answered by default with 504 Gateway
+    Timeout.
+    """
+    pass
+
+
+class InvalidBackgroundTaskException(Exception):
+    """
+    Raised when adding a background task which is not callable, or prebuilding a response with background tasks.
+    """
+    pass
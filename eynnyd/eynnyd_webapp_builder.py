@@ -1,8 +1,16 @@
+import inspect
+
 from optional import Optional
 
 from eynnyd.exceptions import EynnydWebappBuildException
 from eynnyd.internal.eynnyd_webapp import EynnydWebapp
+from eynnyd.internal.timed_eynnyd_webapp import TimedEynnydWebapp
+from eynnyd.internal.phase_timing.phase_timings import PhaseTimings
+from eynnyd.internal.background_tasks.background_task_runner import BackgroundTaskRunner
+from eynnyd.internal.asgi.eynnyd_asgi_app import EynnydAsgiApp
+from eynnyd.internal.plan_execution.load_shedder import LoadShedder
 from eynnyd.error_handlers_builder import ErrorHandlersBuilder
+from eynnyd.internal.wsgi.stream_response_body import StreamResponseBody
 
 
 class EynnydWebappBuilder:
@@ -10,6 +18,14 @@ class EynnydWebappBuilder:
     def __init__(self):
         self._routes = Optional.empty()
         self._error_handlers = ErrorHandlersBuilder().build()
+        self._stream_block_size = StreamResponseBody.DEFAULT_BLOCK_SIZE
+        self._maximum_stream_block_size = Optional.empty()
+        self._load_shedder = None
+        self._honor_deadline_headers = False
+        self._background_task_runner = None
+        self._phase_timings = None
+        self._startup_hooks = []
+        self._shutdown_hooks = []
 
     def set_routes(self, root_tree_node):
         """
@@ -30,13 +46,150 @@ class EynnydWebappBuilder:
         self._error_handlers = error_handlers
         return self
 
+    def set_stream_block_size(self, block_size):
+        """
+        Sets the number of bytes read at a time from streaming response bodies which do not set their own block size.
+        Defaults to 8KiB.  Larger blocks mean fewer reads and writes for large downloads at the cost of memory per
+        response.  Servers offering a wsgi.file_wrapper are handed this block size as well.
+
+        :param block_size: the positive number of bytes to read from a stream at a time
+        :return: This builder so that fluent design can be used
+        """
+        if not isinstance(block_size, int) or block_size < 1:
+            raise EynnydWebappBuildException(
+                "Stream block size {b} must be a positive integer.".format(b=block_size))
+        self._stream_block_size = block_size
+        return self
+
+    def set_adaptive_stream_block_size(self, maximum_block_size):
+        """
+        Enables adaptive reading of streaming response bodies.  Streams start being read at the stream block size and
+        the block size doubles each time a full block is read, up to the given maximum.  Small bodies are sent in
+        small blocks while large bodies quickly ramp up to large ones.  Has no effect when the server offers a
+        wsgi.file_wrapper, which reads the stream itself.
+
+        :param maximum_block_size: the largest number of bytes to read from a stream at a time
+        :return: This builder so that fluent design can be used
+        """
+        if not isinstance(maximum_block_size, int) or maximum_block_size < 1:
+            raise EynnydWebappBuildException(
+                "Maximum stream block size {b} must be a positive integer.".format(b=maximum_block_size))
+        self._maximum_stream_block_size = Optional.of(maximum_block_size)
+        return self
+
+    def set_load_shedder(self, load_shedder):
+        """
+        Sets a load shedder which rejects requests to lower priority routes while the webapp is overloaded, so that
+        higher priority routes stay fast.  Route priorities are set with the Eynnyd RoutesBuilder.
+
+        :param load_shedder: the result from the Eynnyd LoadShedderBuilder build method
+        :return: This builder so that fluent design can be used
+        """
+        if not isinstance(load_shedder, LoadShedder):
+            raise EynnydWebappBuildException("Load shedder was not built by the LoadShedderBuilder.")
+        self._load_shedder = load_shedder
+        return self
+
+    def honor_deadline_headers(self):
+        """
+        Lets callers shorten a request's deadline.  A grpc-timeout header (such as 250m for 250 milliseconds) or an
+        X-Request-Deadline header (absolute unix epoch seconds) sets the deadline when it is sooner than the route's
+        own.  Malformed headers are ignored.  Route deadlines are set with the Eynnyd RoutesBuilder.
+
+        :return: This builder so that fluent design can be used
+        """
+        self._honor_deadline_headers = True
+        return self
+
+    def set_background_task_runner(self, background_task_runner):
+        """
+        Sets where background tasks added to responses run.  By default they run inline once the response is sent.
+
+        :param background_task_runner: the result from the Eynnyd BackgroundTaskRunnerBuilder build method
+        :return: This builder so that fluent design can be used
+        """
+        if not isinstance(background_task_runner, BackgroundTaskRunner):
+            raise EynnydWebappBuildException("Background task runner was not built by the BackgroundTaskRunnerBuilder.")
+        self._background_task_runner = background_task_runner
+        return self
+
+    def set_phase_timings(self, phase_timings):
+        """
+        Times routing, interceptors, handlers and response adaptation for every request, per route.  Without phase
+        timings none of this timing code runs.
+
+        :param phase_timings: the result from the Eynnyd PhaseTimingsBuilder build method
+        :return: This builder so that fluent design can be used
+        """
+        if not isinstance(phase_timings, PhaseTimings):
+            raise EynnydWebappBuildException("Phase timings were not built by the PhaseTimingsBuilder.")
+        self._phase_timings = phase_timings
+        return self
+
+    def add_startup_hook(self, hook):
+        """
+        Adds a hook run when an ASGI server starts the webapp, in the order added.  Hooks take no arguments and may
+        be plain functions or coroutine functions.  Only used by webapps built with build_asgi.
+
+        :param hook: a function taking no arguments
+        :return: This builder so that fluent design can be used
+        """
+        EynnydWebappBuilder._validate_lifespan_hook(hook)
+        self._startup_hooks.append(hook)
+        return self
+
+    def add_shutdown_hook(self, hook):
+        """
+        Adds a hook run when an ASGI server shuts the webapp down, in the order added.  Hooks take no arguments and
+        may be plain functions or coroutine functions.  Only used by webapps built with build_asgi.
+
+        :param hook: a function taking no arguments
+        :return: This builder so that fluent design can be used
+        """
+        EynnydWebappBuilder._validate_lifespan_hook(hook)
+        self._shutdown_hooks.append(hook)
+        return self
+
+    @staticmethod
+    def _validate_lifespan_hook(hook):
+        if not callable(hook):
+            raise EynnydWebappBuildException("Lifespan hook {h} must be callable.".format(h=hook))
+        if 0 != len(inspect.signature(hook).parameters):
+            raise EynnydWebappBuildException("Lifespan hook {h} must take no arguments.".format(h=hook))
+
+    def build_asgi(self, executor=None):
+        """
+        Builds the webapp for ASGI servers such as uvicorn or hypercorn.  The same routes, interceptors, and error
+        handlers are used as for the WSGI webapp.  Request bodies are read in full before routing and handlers run
+        in a threadpool so that they never block the event loop.
+
+        :param executor: an optional concurrent.futures executor to run handlers in, defaults to the event loop's
+        :return: the ASGI 3 compliant webapp
+        """
+        return EynnydAsgiApp(self.build(), self._startup_hooks, self._shutdown_hooks, executor)
+
     def build(self):
         """
         Builds the webapp
 
         :return: the WSGI compliant webapp
         """
-        return EynnydWebapp(
+        if self._maximum_stream_block_size.is_present() and \
+                self._maximum_stream_block_size.get() < self._stream_block_size:
+            raise EynnydWebappBuildException(
+                "Maximum stream block size {m} cannot be smaller than the stream block size {b}.".format(
+                    m=self._maximum_stream_block_size.get(),
+                    b=self._stream_block_size))
+
+        webapp_arguments = (
             self._routes.get_or_raise(EynnydWebappBuildException(
                 "You must set routes for the webapp to route requests too.")),
-            self._error_handlers)
\ No newline at end of file
+            self._error_handlers,
+            self._stream_block_size,
+            self._maximum_stream_block_size.get_or_default(None),
+            self._load_shedder,
+            self._honor_deadline_headers,
+            self._background_task_runner)
+        if self._phase_timings is not None:
+            return TimedEynnydWebapp(self._phase_timings, *webapp_arguments)
+        return EynnydWebapp(*webapp_arguments)
\ No newline at end of file
@@ -0,0 +1,120 @@
+import inspect
+
+from eynnyd.exceptions import HandlerBuildException
+from eynnyd.internal.handlers.inline_handler_executor import InlineHandlerExecutor
+from eynnyd.internal.handlers.pooled_handler_executor import PooledHandlerExecutor
+
+
+class HandlerExecutorBuilder:
+    """
+    A builder for choosing where a route's handler runs.
+
+    By default handlers run on a bounded thread pool.  Routes with slow or CPU heavy handlers (report rendering, PDF
+    generation) can be given their own pool so they cannot starve the rest of the webapp, or a process pool so that
+    they do not hold the GIL.  Setting the same built executor on several routes shares its pool between them.
+    Inline executors run the handler on the thread dispatching the request, which under an ASGI server is the event
+    loop itself, and suit handlers which only do a little work in memory.
+
+    Pools are bounded.  Once a pool has as many requests running and queued as it allows, further requests raise a
+    HandlerExecutorSaturatedException, which by default is answered with 503 Service Unavailable.  The built executor
+    exposes a metrics property (active, queued, saturation, completed and rejected counts) and calls an optional
+    saturation listener with those metrics each time it rejects a request.
+
+    Handlers run in a process pool must be picklable (defined at module level) and are given a copy of the request
+    with its body read in full.  Their responses must be picklable as well, so cannot have stream or iterable bodies.
+    """
+
+    def __init__(self):
+        self._name = "eynnyd-handler"
+        self._maximum_workers = 4
+        self._maximum_queue_size = 32
+        self._use_processes = False
+        self._inline = False
+        self._saturation_listener = None
+
+    def set_name(self, name):
+        """
+        Sets the name used for the pool's threads and in its metrics (default eynnyd-handler).
+
+        :param name: the name of the executor
+        :return: This builder to allow for fluent design.
+        """
+        self._name = str(name)
+        return self
+
+    def set_maximum_workers(self, maximum_workers):
+        """
+        Sets how many handlers the pool runs at once (default 4).
+
+        :param maximum_workers: a positive number of threads or processes
+        :return: This builder to allow for fluent design.
+        """
+        if not isinstance(maximum_workers, int) or maximum_workers < 1:
+            raise HandlerBuildException(
+                "Maximum workers {m} must be a positive integer.".format(m=maximum_workers))
+        self._maximum_workers = maximum_workers
+        return self
+
+    def set_maximum_queue_size(self, maximum_queue_size):
+        """
+        Sets how many requests may wait for a free worker before requests are rejected (default 32).
+
+        :param maximum_queue_size: zero or a positive number of requests
+        :return: This builder to allow for fluent design.
+        """
+        if not isinstance(maximum_queue_size, int) or maximum_queue_size < 0:
+            raise HandlerBuildException(
+                "Maximum queue size {m} must be zero or a positive integer.".format(m=maximum_queue_size))
+        self._maximum_queue_size = maximum_queue_size
+        return self
+
+    def use_process_pool(self):
+        """
+        Runs handlers in a pool of processes rather than threads, for CPU heavy handlers.  Handlers are pickled to be
+        sent to the pool, so they must be synchronous module level functions (or picklable objects) and the executor
+        must be registered before any response cache or request coalescer on the route.  Other handlers are rejected
+        when the routes are built.
+
+        :return: This builder to allow for fluent design.
+        """
+        self._use_processes = True
+        return self
+
+    def use_inline(self):
+        """
+        Runs handlers on the thread dispatching the request instead of a pool.  Pool settings are ignored.
+
+        :return: This builder to allow for fluent design.
+        """
+        self._inline = True
+        return self
+
+    def set_saturation_listener(self, saturation_listener):
+        """
+        Sets a function called with the executor's metrics each time it rejects a request.
+
+        :param saturation_listener: a function taking the metrics (name, maximum_workers, maximum_queue_size,
+            active, queued, saturation, completed and rejected properties)
+        :return: This builder to allow for fluent design.
+        """
+        if not callable(saturation_listener) or 1 != len(inspect.signature(saturation_listener).parameters):
+            raise HandlerBuildException("Saturation listener must be a function taking exactly 1 argument.")
+        self._saturation_listener = saturation_listener
+        return self
+
+    def build(self):
+        """
+        Builds the handler executor.
+
+        :return: A handler executor for usage with the Eynnyd RoutesBuilder set_handler_executor method.
+        """
+        if self._inline:
+            if self._use_processes:
+                raise HandlerBuildException("A handler executor cannot be both inline and a process pool.")
+            return InlineHandlerExecutor()
+        return PooledHandlerExecutor(
+            self._name,
+            self._maximum_workers,
+            self._maximum_queue_size,
+            self._use_processes,
+            self._saturation_listener)
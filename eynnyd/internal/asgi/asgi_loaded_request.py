@@ -0,0 +1,89 @@
+import functools
+
+from optional import Optional
+
+from eynnyd.abstract_request import AbstractRequest
+from eynnyd.internal.utils.cookies.header_converter import CookieHeaderConverter
+from eynnyd.internal.utils.query_parameters_parser import QueryParametersParser
+from eynnyd.internal.utils.request_uri import RequestURI
+
+
+class ASGILoadedRequest(AbstractRequest):
+
+    def __init__(self, asgi_scope, body, path_parameters=None, deadline=None, route=None):
+        self._asgi_scope = asgi_scope
+        self._body = body
+        self._path_parameters = path_parameters if path_parameters else {}
+        self._deadline = deadline
+        self._route = route
+
+    def copy_and_set_path_parameters(self, path_parameters, route=None):
+        return ASGILoadedRequest(self._asgi_scope, self._body, path_parameters, self._deadline, route)
+
+    def copy_and_set_deadline(self, deadline):
+        return ASGILoadedRequest(self._asgi_scope, self._body, self._path_parameters, deadline, self._route)
+
+    @property
+    def http_method(self):
+        return self._asgi_scope.get("method")
+
+    @property
+    def request_uri(self):
+        return RequestURI.from_asgi_scope(self._asgi_scope)
+
+    @property
+    @functools.lru_cache()
+    def forwarded_request_uri(self):
+        return RequestURI.forwarded_from_asgi_scope(self._asgi_scope, self.headers)
+
+    @property
+    @functools.lru_cache()
+    def headers(self):
+        headers = {}
+        for raw_name, raw_value in self._asgi_scope.get("headers", []):
+            name = raw_name.decode("latin-1").upper()
+            value = raw_value.decode("latin-1")
+            if name in headers:
+                separator = "; " if name == "COOKIE" else ", "
+                headers[name] = separator.join((headers[name], value))
+            else:
+                headers[name] = value
+        return headers
+
+    @property
+    def client_ip_address(self):
+        client = self._asgi_scope.get("client")
+        return client[0] if client else None
+
+    @property
+    def cookies(self):
+        return CookieHeaderConverter.from_header(self.headers.get("COOKIE"))
+
+    @property
+    @functools.lru_cache()
+    def query_parameters(self):
+        return QueryParametersParser.parse(self._asgi_scope.get("query_string", b"").decode("latin-1"))
+
+    @property
+    def path_parameters(self):
+        return self._path_parameters
+
+    @property
+    def route(self):
+        return Optional.of(self._route) if self._route is not None else Optional.empty()
+
+    @property
+    def deadline(self):
+        return Optional.of(self._deadline) if self._deadline is not None else Optional.empty()
+
+    @property
+    def byte_body(self):
+        return self._body
+
+    @property
+    @functools.lru_cache()
+    def utf8_body(self):
+        return str(self.byte_body.decode("utf-8"))
+
+    def __str__(self):
+        return "<{m} {p}>".format(m=self.http_method, p=self.request_uri)
@@ -0,0 +1,111 @@
+import asyncio
+import inspect
+import logging
+
+from eynnyd.exceptions import UnsupportedASGIScopeTypeException
+from eynnyd.internal.asgi.asgi_loaded_request import ASGILoadedRequest
+from eynnyd.internal.utils.rate_limited_logger import RateLimitedLogger
+from eynnyd.internal.wsgi.raw_wsgi_server_error_response import RawWSGIServerErrorResponse
+
+LOG = logging.getLogger("eynnyd_asgi_app")
+RATE_LIMITED_LOG = RateLimitedLogger(LOG, messages_per_second=1, burst=10)
+
+_END_OF_BODY = object()
+
+
+class EynnydAsgiApp:
+
+    def __init__(self, webapp, startup_hooks=(), shutdown_hooks=(), executor=None):
+        self._webapp = webapp
+        self._startup_hooks = tuple(startup_hooks)
+        self._shutdown_hooks = tuple(shutdown_hooks)
+        self._executor = executor
+
+    async def __call__(self, asgi_scope, asgi_receive, asgi_send):
+        if asgi_scope["type"] == "http":
+            await self._handle_http(asgi_scope, asgi_receive, asgi_send)
+        elif asgi_scope["type"] == "lifespan":
+            await self._handle_lifespan(asgi_receive, asgi_send)
+        else:
+            raise UnsupportedASGIScopeTypeException(
+                "ASGI scope type {t} is not supported.".format(t=asgi_scope["type"]))
+
+    async def _handle_http(self, asgi_scope, asgi_receive, asgi_send):
+        loop = asyncio.get_event_loop()
+        try:
+            body = await EynnydAsgiApp._read_body(asgi_receive)
+            if body is None:
+                # The client went away before sending the whole body, so there is no request to handle or answer.
+                return
+            asgi_loaded_request = ASGILoadedRequest(asgi_scope, body)
+            wsgi_response = await self._webapp.process_request_to_wsgi_output_async(asgi_loaded_request, self._executor)
+        except Exception as e:
+            RATE_LIMITED_LOG.log(
+                logging.ERROR,
+                type(e),
+                "Unexpected error thrown, asgi request was: %s %s",
+                asgi_scope.get("method"),
+                asgi_scope.get("path"),
+                exc_info=e,
+                extra={"error_type": type(e).__name__})
+            wsgi_response = RawWSGIServerErrorResponse()
+
+        await asgi_send({
+            "type": "http.response.start",
+            "status": int(wsgi_response.status.split(" ", 1)[0]),
+            "headers": [
+                (name.lower().encode("latin-1"), value.encode("latin-1"))
+                for name, value in wsgi_response.headers]})
+        await self._send_body(loop, wsgi_response.body, asgi_send)
+
+    @staticmethod
+    async def _read_body(asgi_receive):
+        chunks = []
+        while True:
+            message = await asgi_receive()
+            if message["type"] == "http.disconnect":
+                return None
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                break
+        return b"".join(chunks)
+
+    async def _send_body(self, loop, body, asgi_send):
+        if isinstance(body, (list, tuple)):
+            await asgi_send({"type": "http.response.body", "body": b"".join(body), "more_body": False})
+            return
+
+        try:
+            body_iterator = iter(body)
+            while True:
+                chunk = await loop.run_in_executor(self._executor, next, body_iterator, _END_OF_BODY)
+                if chunk is _END_OF_BODY:
+                    break
+                if chunk:
+                    await asgi_send({"type": "http.response.body", "body": bytes(chunk), "more_body": True})
+            await asgi_send({"type": "http.response.body", "body": b"", "more_body": False})
+        finally:
+            if hasattr(body, "close"):
+                await loop.run_in_executor(self._executor, body.close)
+
+    async def _handle_lifespan(self, asgi_receive, asgi_send):
+        while True:
+            message = await asgi_receive()
+            if message["type"] == "lifespan.startup":
+                await self._run_lifespan_hooks(self._startup_hooks, "lifespan.startup", asgi_send)
+            elif message["type"] == "lifespan.shutdown":
+                await self._run_lifespan_hooks(self._shutdown_hooks, "lifespan.shutdown", asgi_send)
+                return
+
+    @staticmethod
+    async def _run_lifespan_hooks(hooks, message_type, asgi_send):
+        try:
+            for hook in hooks:
+                result = hook()
+                if inspect.isawaitable(result):
+                    await result
+        except Exception as e:
+            LOG.exception("Lifespan hook failed during {t}".format(t=message_type))
+            await asgi_send({"type": "{t}.failed".format(t=message_type), "message": str(e)})
+            return
+        await asgi_send({"type": "{t}.complete".format(t=message_type)})
@@ -0,0 +1,54 @@
+
+class BackgroundTaskMetrics:
+
+    def __init__(self, name, maximum_workers, maximum_queue_size, pending, completed, failed, ran_inline):
+        self._name = name
+        self._maximum_workers = maximum_workers
+        self._maximum_queue_size = maximum_queue_size
+        self._pending = pending
+        self._completed = completed
+        self._failed = failed
+        self._ran_inline = ran_inline
+
+    @property
+    def name(self):
+        return self._name
+
+    @property
+    def maximum_workers(self):
+        return self._maximum_workers
+
+    @property
+    def maximum_queue_size(self):
+        return self._maximum_queue_size
+
+    @property
+    def active(self):
+        return min(self._pending, self._maximum_workers)
+
+    @property
+    def backlog(self):
+        return max(0, self._pending - self._maximum_workers)
+
+    @property
+    def completed(self):
+        return self._completed
+
+    @property
+    def failed(self):
+        return self._failed
+
+    @property
+    def ran_inline(self):
+        return self._ran_inline
+
+    def __str__(self):
+        return "<{n} active={a}/{w} backlog={b}/{s} completed={c} failed={f} ran_inline={i}>".format(
+            n=self._name,
+            a=self.active,
+            w=self._maximum_workers,
+            b=self.backlog,
+            s=self._maximum_queue_size,
+            c=self._completed,
+            f=self._failed,
+            i=self._ran_inline)
@@ -0,0 +1,102 @@
+import logging
+import os
+import threading
+
+from eynnyd.internal.background_tasks.background_task_metrics import BackgroundTaskMetrics
+from eynnyd.internal.utils.named_thread_pool_executor import named_thread_pool_executor
+from eynnyd.internal.utils.rate_limited_logger import RateLimitedLogger
+
+LOG = logging.getLogger("background_task_runner")
+RATE_LIMITED_LOG = RateLimitedLogger(LOG, messages_per_second=1, burst=10)
+
+
+def default_background_task_error_hook(exc, task):
+    RATE_LIMITED_LOG.log(
+        logging.ERROR,
+        type(exc),
+        "Background task %s failed.",
+        task,
+        exc_info=exc,
+        extra={"error_type": type(exc).__name__})
+
+
+class BackgroundTaskRunner:
+
+    def __init__(
+            self,
+            name,
+            maximum_workers=0,
+            maximum_queue_size=0,
+            error_hook=default_background_task_error_hook):
+        self._name = name
+        self._maximum_workers = maximum_workers
+        self._maximum_queue_size = maximum_queue_size
+        self._error_hook = error_hook
+        self._lock = threading.Lock()
+        self._executor = None
+        self._pid = None
+        self._pending = 0
+        self._completed = 0
+        self._failed = 0
+        self._ran_inline = 0
+
+    @property
+    def metrics(self):
+        with self._lock:
+            return BackgroundTaskMetrics(
+                self._name,
+                self._maximum_workers,
+                self._maximum_queue_size,
+                self._pending,
+                self._completed,
+                self._failed,
+                self._ran_inline)
+
+    def run(self, tasks):
+        with self._lock:
+            if self._pending >= self._maximum_workers + self._maximum_queue_size:
+                self._ran_inline += len(tasks)
+                executor = None
+            else:
+                self._pending += len(tasks)
+                executor = self._get_executor()
+
+        if executor is None:
+            for task in tasks:
+                self._run_task(task)
+            return
+
+        for task in tasks:
+            try:
+                executor.submit(self._run_pending_task, task)
+            except RuntimeError:
+                with self._lock:
+                    self._pending -= 1
+                self._run_task(task)
+
+    def _run_pending_task(self, task):
+        try:
+            self._run_task(task)
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+    def _run_task(self, task):
+        try:
+            task()
+        except Exception as e:
+            with self._lock:
+                self._failed += 1
+            try:
+                self._error_hook(e, task)
+            except Exception as hook_error:
+                default_background_task_error_hook(hook_error, self._error_hook)
+        else:
+            with self._lock:
+                self._completed += 1
+
+    def _get_executor(self):
+        if self._executor is None or self._pid != os.getpid():
+            self._executor = named_thread_pool_executor(self._maximum_workers, self._name)
+            self._pid = os.getpid()
+        return self._executor
@@ -1,27 +1,60 @@
+import asyncio
 import logging
+import time
 
+from eynnyd.internal.background_tasks.background_task_runner import BackgroundTaskRunner
+from eynnyd.internal.utils.deadline import Deadline
+from eynnyd.internal.utils.deadline_header_parser import DeadlineHeaderParser
+from eynnyd.internal.utils.rate_limited_logger import RateLimitedLogger
 from eynnyd.internal.wsgi_loaded_request import WSGILoadedRequest
 from eynnyd.internal.routing.route_tree_traverser import RouteTreeTraverser
 from eynnyd.internal.plan_execution.plan_executor import PlanExecutor
+from eynnyd.internal.plan_execution.async_plan_executor import AsyncPlanExecutor
+from eynnyd.internal.wsgi.background_tasks_iterator import BackgroundTasksIterator
 from eynnyd.internal.wsgi.raw_wsgi_server_error_response import RawWSGIServerErrorResponse
+from eynnyd.internal.wsgi.redacted_wsgi_environment import RedactedWSGIEnvironment
+from eynnyd.internal.wsgi.wsgi_response import WSGIResponse
 from eynnyd.internal.wsgi.wsgi_response_adapter import WSGIResponseAdapter
 from eynnyd.internal.wsgi.stream_reader_factory import StreamReaderFactory
+from eynnyd.internal.wsgi.stream_response_body import StreamResponseBody
 
 LOG = logging.getLogger("eynnyd_webapp")
+RATE_LIMITED_LOG = RateLimitedLogger(LOG, messages_per_second=1, burst=10)
 
 
 class EynnydWebapp:
 
-    def __init__(self, route_tree, error_handlers):
+    def __init__(
+            self,
+            route_tree,
+            error_handlers,
+            stream_block_size=StreamResponseBody.DEFAULT_BLOCK_SIZE,
+            maximum_stream_block_size=None,
+            load_shedder=None,
+            honor_deadline_headers=False,
+            background_task_runner=None):
         self._route_tree = route_tree
         self._error_handlers = error_handlers
+        self._stream_block_size = stream_block_size
+        self._maximum_stream_block_size = maximum_stream_block_size
+        self._load_shedder = load_shedder
+        self._honor_deadline_headers = honor_deadline_headers
+        self._background_task_runner = \
+            background_task_runner if background_task_runner else BackgroundTaskRunner("eynnyd-background")
         self._plan_executor = PlanExecutor(self._error_handlers)
+        self._async_plan_executor = AsyncPlanExecutor(self._error_handlers)
 
     def __call__(self, wsgi_environment, wsgi_start_response):  # pragma: no cover
         try:
             wsgi_response = self._wsgi_input_to_wsgi_output(wsgi_environment)
         except Exception as e:
-            LOG.exception("Unexpected error thrown, wsgi environment was: {wsgi}".format(wsgi=wsgi_environment))
+            RATE_LIMITED_LOG.log(
+                logging.ERROR,
+                type(e),
+                "Unexpected error thrown, wsgi environment was: %s",
+                RedactedWSGIEnvironment(wsgi_environment),
+                exc_info=e,
+                extra={"error_type": type(e).__name__})
             wsgi_response = RawWSGIServerErrorResponse()
 
         wsgi_start_response(wsgi_response.status, wsgi_response.headers)
@@ -30,12 +63,26 @@ class EynnydWebapp:
     def _wsgi_input_to_wsgi_output(self, wsgi_environment):  # pragma: no cover
         wsgi_loaded_request = WSGILoadedRequest(wsgi_environment)
         response = self.process_request_to_response(wsgi_loaded_request)
-        response_stream_reader = StreamReaderFactory.create_reader(wsgi_environment.get("wsgi.file_wrapper"))
+        return self.process_response_to_wsgi_output(
+            wsgi_loaded_request,
+            response,
+            wsgi_environment.get("wsgi.file_wrapper"))
+
+    def process_response_to_wsgi_output(self, request, response, wsgi_file_wrapper=None):
+        response_stream_reader = StreamReaderFactory.create_reader(wsgi_file_wrapper, self._maximum_stream_block_size)
+        response_adapter = WSGIResponseAdapter(response_stream_reader, self._stream_block_size)
         try:
-            return WSGIResponseAdapter(response_stream_reader).adapt(response)
+            wsgi_response = response_adapter.adapt(response)
         except Exception as e:
-            error_response = self._error_handlers.handle_post_response_error(e, wsgi_loaded_request, response)
-            return WSGIResponseAdapter(response_stream_reader).adapt(error_response)
+            error_response = self._error_handlers.handle_post_response_error(e, request, response)
+            wsgi_response = response_adapter.adapt(error_response)
+
+        if not response.background_tasks:
+            return wsgi_response
+        return WSGIResponse(
+            wsgi_response.status,
+            wsgi_response.headers,
+            BackgroundTasksIterator(wsgi_response.body, response.background_tasks, self._background_task_runner))
 
     def process_request_to_response(self, wsgi_loaded_request):
         try:
@@ -47,7 +94,72 @@ class EynnydWebapp:
         except Exception as e:
             return self._error_handlers.handle_pre_response_error(e, wsgi_loaded_request)
 
-        updated_request = wsgi_loaded_request.copy_and_set_path_parameters(execution_plan.path_parameters)
-        return self._plan_executor.execute_plan(execution_plan, updated_request)
+        return self._execute_plan(execution_plan, wsgi_loaded_request)
+
+    def _execute_plan(self, execution_plan, request):
+        updated_request = request.copy_and_set_path_parameters(execution_plan.path_parameters, execution_plan.route)
+        deadline = self._create_deadline(execution_plan, updated_request)
+        if deadline is not None:
+            updated_request = updated_request.copy_and_set_deadline(deadline)
+        if self._load_shedder is None:
+            return self._plan_executor.execute_plan(execution_plan, updated_request, deadline)
+
+        try:
+            admitted_at = self._load_shedder.admit(execution_plan.priority)
+        except Exception as e:
+            return self._error_handlers.handle_pre_response_error(e, updated_request)
+
+        try:
+            return self._plan_executor.execute_plan(execution_plan, updated_request, deadline)
+        finally:
+            self._load_shedder.release(admitted_at)
+
+    async def process_request_to_wsgi_output_async(self, loaded_request, executor=None):
+        response = await self.process_request_to_response_async(loaded_request, executor)
+        return await asyncio.get_event_loop().run_in_executor(
+            executor,
+            self.process_response_to_wsgi_output,
+            loaded_request,
+            response)
+
+    async def process_request_to_response_async(self, loaded_request, executor=None):
+        try:
+            execution_plan = \
+                RouteTreeTraverser.traverse(
+                    self._route_tree,
+                    loaded_request.http_method,
+                    loaded_request.request_uri.path)
+        except Exception as e:
+            return self._error_handlers.handle_pre_response_error(e, loaded_request)
+
+        return await self._execute_plan_async(execution_plan, loaded_request, executor)
+
+    async def _execute_plan_async(self, execution_plan, request, executor):
+        updated_request = request.copy_and_set_path_parameters(execution_plan.path_parameters, execution_plan.route)
+        deadline = self._create_deadline(execution_plan, updated_request)
+        if deadline is not None:
+            updated_request = updated_request.copy_and_set_deadline(deadline)
+        if self._load_shedder is None:
+            return await self._async_plan_executor.execute_plan(execution_plan, updated_request, executor, deadline)
+
+        try:
+            admitted_at = self._load_shedder.admit(execution_plan.priority)
+        except Exception as e:
+            return self._error_handlers.handle_pre_response_error(e, updated_request)
+
+        try:
+            return await self._async_plan_executor.execute_plan(execution_plan, updated_request, executor, deadline)
+        finally:
+            self._load_shedder.release(admitted_at)
 
+    def _create_deadline(self, execution_plan, request):
+        deadline_seconds = execution_plan.deadline_seconds
+        if self._honor_deadline_headers:
+            header_deadline_seconds = DeadlineHeaderParser.parse_remaining_seconds(request.headers)
+            if header_deadline_seconds is not None and \
+                    (deadline_seconds is None or header_deadline_seconds < deadline_seconds):
+                deadline_seconds = header_deadline_seconds
 
+        if deadline_seconds is None:
+            return None
+        return Deadline(time.monotonic() + deadline_seconds)
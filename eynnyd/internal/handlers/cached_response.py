@@ -0,0 +1,29 @@
+
+class CachedResponse:
+
+    def __init__(self, response, vary_header_names, vary_header_values, size, expires_at):
+        self._response = response
+        self._vary_header_names = vary_header_names
+        self._vary_header_values = vary_header_values
+        self._size = size
+        self._expires_at = expires_at
+
+    @property
+    def response(self):
+        return self._response
+
+    @property
+    def vary_header_names(self):
+        return self._vary_header_names
+
+    @property
+    def vary_header_values(self):
+        return self._vary_header_values
+
+    @property
+    def size(self):
+        return self._size
+
+    @property
+    def expires_at(self):
+        return self._expires_at
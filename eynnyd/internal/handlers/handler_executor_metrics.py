@@ -0,0 +1,52 @@
+
+class HandlerExecutorMetrics:
+
+    def __init__(self, name, maximum_workers, maximum_queue_size, pending, completed, rejected):
+        self._name = name
+        self._maximum_workers = maximum_workers
+        self._maximum_queue_size = maximum_queue_size
+        self._pending = pending
+        self._completed = completed
+        self._rejected = rejected
+
+    @property
+    def name(self):
+        return self._name
+
+    @property
+    def maximum_workers(self):
+        return self._maximum_workers
+
+    @property
+    def maximum_queue_size(self):
+        return self._maximum_queue_size
+
+    @property
+    def active(self):
+        return min(self._pending, self._maximum_workers)
+
+    @property
+    def queued(self):
+        return max(0, self._pending - self._maximum_workers)
+
+    @property
+    def saturation(self):
+        return self._pending / (self._maximum_workers + self._maximum_queue_size)
+
+    @property
+    def completed(self):
+        return self._completed
+
+    @property
+    def rejected(self):
+        return self._rejected
+
+    def __str__(self):
+        return "<{n} active={a}/{w} queued={q}/{s} completed={c} rejected={r}>".format(
+            n=self._name,
+            a=self.active,
+            w=self._maximum_workers,
+            q=self.queued,
+            s=self._maximum_queue_size,
+            c=self._completed,
+            r=self._rejected)
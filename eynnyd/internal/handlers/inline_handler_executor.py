@@ -0,0 +1,24 @@
+import functools
+
+from eynnyd.internal.plan_execution.async_callable import AsyncCallable
+
+
+class InlineHandler(AsyncCallable):
+
+    def __init__(self, handler):
+        self._handler = handler
+        functools.update_wrapper(self, handler)
+
+    async def call_async(self, request):
+        if isinstance(self._handler, AsyncCallable):
+            return await self._handler.call_async(request)
+        return self._handler(request)
+
+    def __call__(self, request):
+        return self._handler(request)
+
+
+class InlineHandlerExecutor:
+
+    def wrap(self, handler):
+        return InlineHandler(handler)
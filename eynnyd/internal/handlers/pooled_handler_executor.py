@@ -0,0 +1,126 @@
+import asyncio
+import functools
+import os
+import pickle
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+
+from eynnyd.exceptions import HandlerExecutorSaturatedException, DeadlineExceededException, RouteBuildException
+from eynnyd.internal.handlers.handler_executor_metrics import HandlerExecutorMetrics
+from eynnyd.internal.handlers.snapshot_request import SnapshotRequest
+from eynnyd.internal.plan_execution.async_callable import AsyncCallable
+from eynnyd.internal.utils.named_thread_pool_executor import named_thread_pool_executor
+from eynnyd.internal.utils.thread_future import await_thread_future
+
+
+def _run_handler(handler, request):
+    return handler(request)
+
+
+class OffloadedHandler(AsyncCallable):
+
+    def __init__(self, handler, handler_executor):
+        self._handler = handler
+        self._handler_executor = handler_executor
+        functools.update_wrapper(self, handler)
+
+    async def call_async(self, request):
+        return await await_thread_future(asyncio.wrap_future(self._handler_executor.submit(self._handler, request)))
+
+    def __call__(self, request):
+        future = self._handler_executor.submit(self._handler, request)
+        try:
+            return future.result(request.deadline.map(lambda deadline: deadline.remaining_seconds).get_or_default(None))
+        except FutureTimeoutError:
+            future.cancel()
+            raise DeadlineExceededException("Deadline passed while waiting on handler {h}.".format(h=self._handler))
+
+
+class PooledHandlerExecutor:
+
+    def __init__(self, name, maximum_workers, maximum_queue_size, use_processes=False, saturation_listener=None):
+        self._name = name
+        self._maximum_workers = maximum_workers
+        self._maximum_queue_size = maximum_queue_size
+        self._use_processes = use_processes
+        self._saturation_listener = saturation_listener
+        self._lock = threading.Lock()
+        self._executor = None
+        self._pid = None
+        self._pending = 0
+        self._completed = 0
+        self._rejected = 0
+
+    @property
+    def metrics(self):
+        with self._lock:
+            return self._create_metrics()
+
+    def wrap(self, handler):
+        if self._use_processes:
+            PooledHandlerExecutor._validate_picklable_or_raise(handler)
+        return OffloadedHandler(handler, self)
+
+    def submit(self, handler, request):
+        with self._lock:
+            if self._pending >= self._maximum_workers + self._maximum_queue_size:
+                self._rejected += 1
+                metrics = self._create_metrics()
+            else:
+                self._pending += 1
+                metrics = None
+                executor = self._get_executor()
+
+        if metrics is not None:
+            if self._saturation_listener is not None:
+                self._saturation_listener(metrics)
+            raise HandlerExecutorSaturatedException(
+                "Handler executor {n} is saturated, rejected request {r}.".format(n=self._name, r=request))
+
+        try:
+            if self._use_processes:
+                future = executor.submit(_run_handler, handler, SnapshotRequest.from_request(request))
+            else:
+                future = executor.submit(handler, request)
+        except BaseException:
+            with self._lock:
+                self._pending -= 1
+            raise
+        future.add_done_callback(self._on_done)
+        return future
+
+    def _on_done(self, future):
+        with self._lock:
+            self._pending -= 1
+            self._completed += 1
+
+    def _get_executor(self):
+        if self._executor is None or self._pid != os.getpid():
+            if self._use_processes:
+                self._executor = ProcessPoolExecutor(max_workers=self._maximum_workers)
+            else:
+                self._executor = named_thread_pool_executor(self._maximum_workers, self._name)
+            self._pid = os.getpid()
+        return self._executor
+
+    @staticmethod
+    def _validate_picklable_or_raise(handler):
+        if isinstance(handler, AsyncCallable):
+            raise RouteBuildException(
+                "Async handler {h} cannot run on a process pool, only synchronous handlers can.".format(h=handler))
+        try:
+            pickle.dumps(handler)
+        except Exception as e:
+            raise RouteBuildException(
+                "Handler {h} cannot run on a process pool as it cannot be pickled.  Use a module level function and "
+                "register the handler executor before any response cache or request coalescer.".format(h=handler),
+                e)
+
+    def _create_metrics(self):
+        return HandlerExecutorMetrics(
+            self._name,
+            self._maximum_workers,
+            self._maximum_queue_size,
+            self._pending,
+            self._completed,
+            self._rejected)
@@ -0,0 +1,80 @@
+import functools
+
+from eynnyd.exceptions import InvalidBodyTypeException
+from eynnyd.internal.plan_execution.async_callable import AsyncCallable
+from eynnyd.internal.prebuilt_response import PrebuiltResponse
+from eynnyd.internal.utils.header_helpers import RequestHeaderReader
+from eynnyd.internal.utils.single_flight import SingleFlight
+from eynnyd.response_builder import ResponseBuilder
+
+
+class RequestCoalescer:
+
+    _COALESCIBLE_METHODS = frozenset(["GET", "HEAD"])
+
+    def __init__(self, key_header_names, wait_timeout_seconds):
+        self._key_header_names = key_header_names
+        self._wait_timeout_seconds = wait_timeout_seconds
+        self._single_flight = SingleFlight()
+
+    def wrap(self, handler):
+        if isinstance(handler, AsyncCallable):
+            @functools.wraps(handler)
+            async def async_coalescing_handler(request):
+                return await self.handle_async(request, handler)
+            return AsyncCallable(async_coalescing_handler)
+
+        @functools.wraps(handler)
+        def coalescing_handler(request):
+            return self.handle(request, handler)
+        return coalescing_handler
+
+    def handle(self, request, handler):
+        if request.http_method not in RequestCoalescer._COALESCIBLE_METHODS:
+            return handler(request)
+
+        (response, is_shareable), executed = self._single_flight.execute(
+            self._create_key(request),
+            lambda: RequestCoalescer._execute(request, handler),
+            self._wait_timeout_seconds)
+        if executed or is_shareable:
+            return response
+        return handler(request)
+
+    async def handle_async(self, request, handler):
+        if request.http_method not in RequestCoalescer._COALESCIBLE_METHODS:
+            return await handler.call_async(request)
+
+        (response, is_shareable), executed = await self._single_flight.execute_async(
+            self._create_key(request),
+            lambda: RequestCoalescer._execute_async(request, handler),
+            self._wait_timeout_seconds)
+        if executed or is_shareable:
+            return response
+        return await handler.call_async(request)
+
+    def _create_key(self, request):
+        return (
+            request.http_method,
+            request.request_uri.path,
+            request.request_uri.query or "",
+            tuple(RequestHeaderReader.get(request.headers, name) for name in self._key_header_names))
+
+    @staticmethod
+    def _execute(request, handler):
+        return RequestCoalescer._to_shareable(handler(request))
+
+    @staticmethod
+    async def _execute_async(request, handler):
+        return RequestCoalescer._to_shareable(await handler.call_async(request))
+
+    @staticmethod
+    def _to_shareable(response):
+        if response.cookies or response.background_tasks:
+            return response, False
+        if isinstance(response, PrebuiltResponse):
+            return response, True
+        try:
+            return ResponseBuilder.from_response(response).build_prebuilt(), True
+        except InvalidBodyTypeException:
+            return response, False
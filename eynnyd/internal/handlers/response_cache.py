@@ -0,0 +1,225 @@
+import functools
+import threading
+import time
+from collections import OrderedDict
+from http import HTTPStatus
+
+from eynnyd.exceptions import InvalidBodyTypeException
+from eynnyd.internal.handlers.cached_response import CachedResponse
+from eynnyd.internal.plan_execution.async_callable import AsyncCallable
+from eynnyd.internal.prebuilt_response import PrebuiltResponse
+from eynnyd.internal.utils.header_helpers import HeaderSplitter, RequestHeaderReader
+from eynnyd.internal.utils.single_flight import SingleFlight
+from eynnyd.response_builder import ResponseBuilder
+
+
+class ResponseCache:
+
+    _CACHEABLE_METHODS = frozenset(["GET", "HEAD"])
+    _CREDENTIAL_HEADER_NAMES = ("authorization", "cookie")
+    _CACHEABLE_STATUSES = frozenset([
+        HTTPStatus.OK,
+        HTTPStatus.NON_AUTHORITATIVE_INFORMATION,
+        HTTPStatus.MULTIPLE_CHOICES,
+        HTTPStatus.MOVED_PERMANENTLY,
+        HTTPStatus.NOT_FOUND,
+        HTTPStatus.GONE])
+    _UNCACHEABLE_DIRECTIVES = frozenset(["no-store", "no-cache", "private"])
+
+    def __init__(
+            self,
+            ttl_seconds,
+            maximum_bytes,
+            key_query_parameter_names,
+            wait_timeout_seconds,
+            cache_credentialed_requests=False):
+        self._ttl_seconds = ttl_seconds
+        self._maximum_bytes = maximum_bytes
+        self._key_query_parameter_names = key_query_parameter_names
+        self._wait_timeout_seconds = wait_timeout_seconds
+        self._cache_credentialed_requests = cache_credentialed_requests
+        self._lock = threading.Lock()
+        self._cached_responses = OrderedDict()
+        self._vary_header_names_by_key = {}
+        self._variant_count_by_key = {}
+        self._size = 0
+        self._single_flight = SingleFlight()
+
+    def wrap(self, handler):
+        if isinstance(handler, AsyncCallable):
+            @functools.wraps(handler)
+            async def async_caching_handler(request):
+                return await self.handle_async(request, handler)
+            return AsyncCallable(async_caching_handler)
+
+        @functools.wraps(handler)
+        def caching_handler(request):
+            return self.handle(request, handler)
+        return caching_handler
+
+    def handle(self, request, handler):
+        if not self._is_cacheable(request):
+            return handler(request)
+
+        key, variant_key, fresh_response = self._find_fresh_response(request)
+        if fresh_response is not None:
+            return fresh_response
+
+        (response, cached_response), executed = self._single_flight.execute(
+            variant_key,
+            lambda: self._load(key, request, handler(request)),
+            self._wait_timeout_seconds)
+        if executed:
+            return response
+        if not ResponseCache._is_variant_for(cached_response, request):
+            return handler(request)
+        return cached_response.response
+
+    async def handle_async(self, request, handler):
+        if not self._is_cacheable(request):
+            return await handler.call_async(request)
+
+        key, variant_key, fresh_response = self._find_fresh_response(request)
+        if fresh_response is not None:
+            return fresh_response
+
+        async def load():
+            return self._load(key, request, await handler.call_async(request))
+
+        (response, cached_response), executed = await self._single_flight.execute_async(
+            variant_key,
+            load,
+            self._wait_timeout_seconds)
+        if executed:
+            return response
+        if not ResponseCache._is_variant_for(cached_response, request):
+            return await handler.call_async(request)
+        return cached_response.response
+
+    def _is_cacheable(self, request):
+        if request.http_method not in ResponseCache._CACHEABLE_METHODS:
+            return False
+        return self._cache_credentialed_requests or all(
+            RequestHeaderReader.get(request.headers, name) is None for name in ResponseCache._CREDENTIAL_HEADER_NAMES)
+
+    def _find_fresh_response(self, request):
+        key = self._create_key(request)
+        with self._lock:
+            vary_header_names = self._vary_header_names_by_key.get(key, ())
+            variant_key = (key, ResponseCache._get_vary_header_values(request, vary_header_names))
+            cached_response = self._cached_responses.get(variant_key)
+            if cached_response is not None:
+                self._cached_responses.move_to_end(variant_key)
+
+        if cached_response is not None and \
+                (cached_response.expires_at > time.monotonic() or self._single_flight.is_in_flight(variant_key)):
+            return key, variant_key, cached_response.response
+        return key, variant_key, None
+
+    @staticmethod
+    def _is_variant_for(cached_response, request):
+        return cached_response is not None and cached_response.vary_header_values == \
+            ResponseCache._get_vary_header_values(request, cached_response.vary_header_names)
+
+    def _load(self, key, request, response):
+        ttl_seconds = self._get_ttl_seconds(response)
+        if ttl_seconds is None:
+            return response, None
+
+        vary_header_names = tuple(
+            name.lower() for name in HeaderSplitter.split_to_values(response.headers.get("vary", "")))
+        if "*" in vary_header_names:
+            return response, None
+
+        try:
+            prebuilt_response = response if isinstance(response, PrebuiltResponse) else \
+                ResponseBuilder.from_response(response).build_prebuilt()
+        except InvalidBodyTypeException:
+            return response, None
+
+        cached_response = CachedResponse(
+            prebuilt_response,
+            vary_header_names,
+            ResponseCache._get_vary_header_values(request, vary_header_names),
+            ResponseCache._get_size(prebuilt_response),
+            time.monotonic() + ttl_seconds)
+        if cached_response.size <= self._maximum_bytes:
+            self._store(key, cached_response)
+        return prebuilt_response, cached_response
+
+    def _get_ttl_seconds(self, response):
+        if response.status.code not in ResponseCache._CACHEABLE_STATUSES or response.cookies or \
+                response.background_tasks:
+            return None
+
+        max_age = None
+        shared_max_age = None
+        for directive in HeaderSplitter.split_to_values(response.headers.get("cache-control", "").lower()):
+            name, _, value = directive.partition("=")
+            name = name.strip()
+            if name in ResponseCache._UNCACHEABLE_DIRECTIVES:
+                return None
+            if name == "max-age":
+                max_age = ResponseCache._parse_seconds(value)
+            elif name == "s-maxage":
+                shared_max_age = ResponseCache._parse_seconds(value)
+
+        ttl_seconds = self._ttl_seconds
+        if shared_max_age is not None:
+            ttl_seconds = shared_max_age
+        elif max_age is not None:
+            ttl_seconds = max_age
+        return ttl_seconds if ttl_seconds > 0 else None
+
+    def _store(self, key, cached_response):
+        variant_key = (key, cached_response.vary_header_values)
+        with self._lock:
+            if cached_response.vary_header_names:
+                self._vary_header_names_by_key[key] = cached_response.vary_header_names
+            else:
+                self._vary_header_names_by_key.pop(key, None)
+
+            replaced_response = self._cached_responses.pop(variant_key, None)
+            if replaced_response is None:
+                self._variant_count_by_key[key] = self._variant_count_by_key.get(key, 0) + 1
+            else:
+                self._size -= replaced_response.size
+            self._cached_responses[variant_key] = cached_response
+            self._size += cached_response.size
+
+            while self._size > self._maximum_bytes:
+                (evicted_key, _), evicted_response = self._cached_responses.popitem(last=False)
+                self._size -= evicted_response.size
+                self._variant_count_by_key[evicted_key] -= 1
+                if self._variant_count_by_key[evicted_key] == 0:
+                    # Other variants stay reachable until the last one under the key is evicted.
+                    del self._variant_count_by_key[evicted_key]
+                    self._vary_header_names_by_key.pop(evicted_key, None)
+
+    def _create_key(self, request):
+        if self._key_query_parameter_names is None:
+            query = request.request_uri.query or ""
+        else:
+            query_parameters = request.query_parameters
+            query = tuple(
+                tuple(query_parameters.get(name, ())) for name in self._key_query_parameter_names)
+        if not self._cache_credentialed_requests:
+            return request.http_method, request.request_uri.path, query
+        return request.http_method, request.request_uri.path, query, tuple(
+            RequestHeaderReader.get(request.headers, name) for name in ResponseCache._CREDENTIAL_HEADER_NAMES)
+
+    @staticmethod
+    def _get_vary_header_values(request, vary_header_names):
+        return tuple(RequestHeaderReader.get(request.headers, name) for name in vary_header_names)
+
+    @staticmethod
+    def _parse_seconds(value):
+        try:
+            return int(value.strip().strip('"'))
+        except ValueError:
+            return 0
+
+    @staticmethod
+    def _get_size(prebuilt_response):
+        return sum(len(chunk) for chunk in prebuilt_response.wsgi_body) + \
+            sum(len(name) + len(value) for name, value in prebuilt_response.wsgi_headers)
@@ -0,0 +1,122 @@
+from optional import Optional
+
+from eynnyd.abstract_request import AbstractRequest
+from eynnyd.internal.utils.cookies.header_converter import CookieHeaderConverter
+
+
+class SnapshotRequest(AbstractRequest):
+
+    def __init__(
+            self,
+            http_method,
+            request_uri,
+            forwarded_request_uri,
+            headers,
+            client_ip_address,
+            query_parameters,
+            path_parameters,
+            byte_body,
+            deadline=None,
+            route=None):
+        self._http_method = http_method
+        self._request_uri = request_uri
+        self._forwarded_request_uri = forwarded_request_uri
+        self._headers = headers
+        self._client_ip_address = client_ip_address
+        self._query_parameters = query_parameters
+        self._path_parameters = path_parameters
+        self._byte_body = byte_body
+        self._deadline = deadline
+        self._route = route
+
+    @staticmethod
+    def from_request(request):
+        return SnapshotRequest(
+            request.http_method,
+            request.request_uri,
+            request.forwarded_request_uri,
+            dict(request.headers),
+            request.client_ip_address,
+            request.query_parameters,
+            request.path_parameters,
+            request.byte_body,
+            request.deadline.get_or_default(None),
+            request.route.get_or_default(None))
+
+    def copy_and_set_path_parameters(self, path_parameters, route=None):
+        return SnapshotRequest(
+            self._http_method,
+            self._request_uri,
+            self._forwarded_request_uri,
+            self._headers,
+            self._client_ip_address,
+            self._query_parameters,
+            path_parameters,
+            self._byte_body,
+            self._deadline,
+            route)
+
+    def copy_and_set_deadline(self, deadline):
+        return SnapshotRequest(
+            self._http_method,
+            self._request_uri,
+            self._forwarded_request_uri,
+            self._headers,
+            self._client_ip_address,
+            self._query_parameters,
+            self._path_parameters,
+            self._byte_body,
+            deadline,
+            self._route)
+
+    @property
+    def http_method(self):
+        return self._http_method
+
+    @property
+    def request_uri(self):
+        return self._request_uri
+
+    @property
+    def forwarded_request_uri(self):
+        return self._forwarded_request_uri
+
+    @property
+    def headers(self):
+        return self._headers
+
+    @property
+    def client_ip_address(self):
+        return self._client_ip_address
+
+    @property
+    def cookies(self):
+        cookie_header = self._headers.get("COOKIE")
+        return CookieHeaderConverter.from_header(cookie_header) if cookie_header else {}
+
+    @property
+    def query_parameters(self):
+        return self._query_parameters
+
+    @property
+    def path_parameters(self):
+        return self._path_parameters
+
+    @property
+    def route(self):
+        return Optional.of(self._route) if self._route is not None else Optional.empty()
+
+    @property
+    def deadline(self):
+        return Optional.of(self._deadline) if self._deadline is not None else Optional.empty()
+
+    @property
+    def byte_body(self):
+        return self._byte_body
+
+    @property
+    def utf8_body(self):
+        return str(self._byte_body.decode("utf-8"))
+
+    def __str__(self):
+        return "<{m} {p}>".format(m=self.http_method, p=self.request_uri)
@@ -0,0 +1,29 @@
+
+class StaticFile:
+
+    def __init__(self, file_path, size, headers, prebuilt_response, expires_at):
+        self._file_path = file_path
+        self._size = size
+        self._headers = headers
+        self._prebuilt_response = prebuilt_response
+        self._expires_at = expires_at
+
+    @property
+    def file_path(self):
+        return self._file_path
+
+    @property
+    def size(self):
+        return self._size
+
+    @property
+    def headers(self):
+        return self._headers
+
+    @property
+    def prebuilt_response(self):
+        return self._prebuilt_response
+
+    @property
+    def expires_at(self):
+        return self._expires_at
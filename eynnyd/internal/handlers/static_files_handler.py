@@ -0,0 +1,115 @@
+import email.utils
+import mimetypes
+import os
+import stat
+import time
+from http import HTTPStatus
+
+from optional import Optional
+
+from eynnyd.exceptions import RouteNotFoundException
+from eynnyd.internal.handlers.static_file import StaticFile
+from eynnyd.internal.utils.conditional_request_evaluator import ConditionalRequestEvaluator
+from eynnyd.response_builder import ResponseBuilder
+
+
+class StaticFilesHandler:
+
+    _DEFAULT_CONTENT_TYPE = "application/octet-stream"
+
+    def __init__(self, directory, url_prefix, cache_ttl_seconds, in_memory_size_limit, cache_control):
+        self._directory = os.path.realpath(directory)
+        self._url_prefix = url_prefix.rstrip("/") + "/"
+        self._cache_ttl_seconds = cache_ttl_seconds
+        self._in_memory_size_limit = in_memory_size_limit
+        self._cache_control = cache_control
+        self._static_files_by_path = {}
+
+    def __call__(self, request):
+        static_file = self._get_static_file(request.request_uri.path)
+
+        if ConditionalRequestEvaluator.is_not_modified(
+                request,
+                static_file.headers["etag"],
+                static_file.headers["last-modified"]):
+            return ResponseBuilder()\
+                .set_status(HTTPStatus.NOT_MODIFIED)\
+                .set_headers({name: value for name, value in static_file.headers.items() if name != "content-type"})\
+                .build()
+
+        if static_file.prebuilt_response.is_present():
+            return static_file.prebuilt_response.get()
+
+        try:
+            file_stream = open(static_file.file_path, "rb")
+        except OSError as e:
+            self._static_files_by_path.pop(request.request_uri.path, None)
+            raise RouteNotFoundException(
+                "Static file for {p} could not be opened".format(p=request.request_uri.path), e)
+        return ResponseBuilder()\
+            .set_headers(static_file.headers)\
+            .set_stream_body(file_stream, content_length=static_file.size)\
+            .build()
+
+    def _get_static_file(self, request_path):
+        static_file = self._static_files_by_path.get(request_path)
+        if static_file is not None and static_file.expires_at > time.monotonic():
+            return static_file
+
+        static_file = self._load_static_file(request_path)
+        self._static_files_by_path[request_path] = static_file
+        return static_file
+
+    def _load_static_file(self, request_path):
+        file_path = self._resolve_file_path(request_path)
+        try:
+            file_stat = os.stat(file_path)
+        except OSError as e:
+            raise RouteNotFoundException("No static file found for {p}".format(p=request_path), e)
+        if not stat.S_ISREG(file_stat.st_mode):
+            raise RouteNotFoundException("No static file found for {p}".format(p=request_path))
+
+        headers = {
+            "content-type": StaticFilesHandler._guess_content_type(file_path),
+            "etag": '"{m:x}-{s:x}"'.format(m=int(file_stat.st_mtime * 1000000), s=file_stat.st_size),
+            "last-modified": email.utils.formatdate(file_stat.st_mtime, usegmt=True)
+        }
+        if self._cache_control is not None:
+            headers["cache-control"] = self._cache_control
+
+        return StaticFile(
+            file_path,
+            file_stat.st_size,
+            headers,
+            self._prebuild_response_if_small(file_path, file_stat.st_size, headers),
+            time.monotonic() + self._cache_ttl_seconds)
+
+    def _resolve_file_path(self, request_path):
+        if not request_path.startswith(self._url_prefix) or "\x00" in request_path:
+            raise RouteNotFoundException("No static file found for {p}".format(p=request_path))
+
+        relative_path = request_path[len(self._url_prefix):]
+        if ".." in relative_path.replace("\\", "/").split("/"):
+            raise RouteNotFoundException("No static file found for {p}".format(p=request_path))
+
+        file_path = os.path.realpath(os.path.join(self._directory, relative_path))
+        if os.path.commonpath([self._directory, file_path]) != self._directory:
+            raise RouteNotFoundException("No static file found for {p}".format(p=request_path))
+        return file_path
+
+    def _prebuild_response_if_small(self, file_path, size, headers):
+        if size > self._in_memory_size_limit:
+            return Optional.empty()
+        try:
+            with open(file_path, "rb") as file_stream:
+                content = file_stream.read()
+        except OSError as e:
+            raise RouteNotFoundException("Static file {f} could not be read".format(f=file_path), e)
+        return Optional.of(ResponseBuilder().set_headers(headers).set_byte_body(content).build_prebuilt())
+
+    @staticmethod
+    def _guess_content_type(file_path):
+        content_type, _ = mimetypes.guess_type(file_path)
+        if content_type is None:
+            return StaticFilesHandler._DEFAULT_CONTENT_TYPE
+        return content_type
@@ -0,0 +1,127 @@
+import zlib
+
+from eynnyd.internal.response_body_type import ResponseBodyType
+from eynnyd.internal.utils.header_helpers import HeaderSplitter, RequestHeaderReader
+from eynnyd.internal.utils.http_status_groups import NON_BODY_STATUSES
+from eynnyd.internal.utils.in_memory_body_reader import InMemoryBodyReader
+from eynnyd.internal.wsgi.closeable_stream_iterator import CloseableStreamIterator
+from eynnyd.internal.wsgi.compressing_iterator import CompressingIterator
+from eynnyd.internal.wsgi.stream_response_body import StreamResponseBody
+from eynnyd.response_builder import ResponseBuilder
+
+
+class CompressionResponseInterceptor:
+
+    _GZIP = "gzip"
+    _DEFLATE = "deflate"
+    _WINDOW_BITS_BY_ENCODING = {
+        _GZIP: 16 + zlib.MAX_WBITS,
+        _DEFLATE: zlib.MAX_WBITS
+    }
+    _ENCODING_PREFERENCE = (_GZIP, _DEFLATE)
+    _COMPRESSIBLE_BODY_TYPES = frozenset([
+        ResponseBodyType.UTF8,
+        ResponseBodyType.BYTE,
+        ResponseBodyType.STREAM,
+        ResponseBodyType.ITERABLE,
+        ResponseBodyType.JSON])
+
+    def __init__(self, minimum_size, compression_level, uncompressible_content_types):
+        self._minimum_size = minimum_size
+        self._compression_level = compression_level
+        self._uncompressible_content_types = tuple(uncompressible_content_types)
+
+    def __call__(self, request, response):
+        if not self._is_compressible(response):
+            return response
+
+        response_builder = ResponseBuilder.from_response(response)\
+            .add_header("vary", CompressionResponseInterceptor._add_accept_encoding_to_vary(response.headers))
+
+        encoding = CompressionResponseInterceptor._negotiate_encoding(request.headers)
+        if encoding is None:
+            return response_builder.build()
+
+        compressor = zlib.compressobj(
+            self._compression_level,
+            zlib.DEFLATED,
+            CompressionResponseInterceptor._WINDOW_BITS_BY_ENCODING[encoding])
+
+        response_builder\
+            .remove_header("content-length")\
+            .add_header("content-encoding", encoding)
+        if "etag" in response.headers:
+            response_builder.add_header("etag", CompressionResponseInterceptor._weaken_etag(response.headers["etag"]))
+
+        content = InMemoryBodyReader.read(response.body)
+        if content is not None:
+            return response_builder\
+                .set_byte_body(compressor.compress(content) + compressor.flush())\
+                .build()
+
+        return response_builder\
+            .set_iterable_body(CompressingIterator(
+                CompressionResponseInterceptor._get_chunks(response.body),
+                compressor))\
+            .build()
+
+    def _is_compressible(self, response):
+        if response.body.type not in CompressionResponseInterceptor._COMPRESSIBLE_BODY_TYPES:
+            return False
+        if response.status.code in NON_BODY_STATUSES:
+            return False
+        if "content-encoding" in response.headers:
+            return False
+        if "no-transform" in response.headers.get("cache-control", "").lower():
+            return False
+        if self._is_uncompressible_content_type(response.headers.get("content-type", "")):
+            return False
+        content = InMemoryBodyReader.read(response.body)
+        if content is not None:
+            return len(content) >= self._minimum_size
+        return True
+
+    def _is_uncompressible_content_type(self, content_type):
+        media_type = content_type.partition(";")[0].strip().lower()
+        return bool(media_type) and media_type.startswith(self._uncompressible_content_types)
+
+    @staticmethod
+    def _negotiate_encoding(request_headers):
+        accept_encoding = RequestHeaderReader.get(request_headers, "accept-encoding")
+        if not accept_encoding:
+            return None
+
+        quality_by_encoding = HeaderSplitter.split_to_quality_values(accept_encoding)
+        wildcard_quality = quality_by_encoding.get("*", 0.0)
+        best_encoding = None
+        best_quality = 0.0
+        for encoding in CompressionResponseInterceptor._ENCODING_PREFERENCE:
+            quality = quality_by_encoding.get(encoding, wildcard_quality)
+            if quality > best_quality:
+                best_encoding = encoding
+                best_quality = quality
+        return best_encoding
+
+    @staticmethod
+    def _add_accept_encoding_to_vary(response_headers):
+        vary_values = HeaderSplitter.split_to_values(response_headers.get("vary", ""))
+        lowered_vary_values = [value.lower() for value in vary_values]
+        if "accept-encoding" not in lowered_vary_values and "*" not in lowered_vary_values:
+            vary_values.append("Accept-Encoding")
+        return ", ".join(vary_values)
+
+    @staticmethod
+    def _weaken_etag(etag):
+        if etag.startswith("W/"):
+            return etag
+        return "W/" + etag
+
+    @staticmethod
+    def _get_chunks(body):
+        if body.type == ResponseBodyType.STREAM:
+            return CloseableStreamIterator(
+                body.content,
+                body.block_size.get_or_default(StreamResponseBody.DEFAULT_BLOCK_SIZE))
+        if body.type == ResponseBodyType.JSON:
+            return body.content.iter_encoded()
+        return body.content
@@ -0,0 +1,53 @@
+import hashlib
+from http import HTTPStatus
+
+from eynnyd.internal.utils.conditional_request_evaluator import ConditionalRequestEvaluator
+from eynnyd.internal.utils.in_memory_body_reader import InMemoryBodyReader
+from eynnyd.response_builder import ResponseBuilder
+
+
+class ETagResponseInterceptor:
+
+    _ETAG_METHODS = frozenset(["GET", "HEAD"])
+    _NOT_MODIFIED_HEADER_NAMES = (
+        "cache-control",
+        "content-location",
+        "date",
+        "etag",
+        "expires",
+        "last-modified",
+        "vary")
+
+    def __init__(self, weak_etags):
+        self._weak_etags = weak_etags
+
+    def __call__(self, request, response):
+        if request.http_method not in ETagResponseInterceptor._ETAG_METHODS or response.status.code != HTTPStatus.OK:
+            return response
+
+        etag = response.headers.get("etag")
+        if etag is None:
+            content = InMemoryBodyReader.read(response.body)
+            if content is not None:
+                etag = self._generate_etag(content)
+                response = ResponseBuilder.from_response(response).add_header("etag", etag).build()
+
+        if ConditionalRequestEvaluator.is_not_modified(request, etag, response.headers.get("last-modified")):
+            return ETagResponseInterceptor._build_not_modified_response(response)
+        return response
+
+    def _generate_etag(self, content):
+        etag = '"' + hashlib.sha1(content).hexdigest()[:32] + '"'
+        if self._weak_etags:
+            return "W/" + etag
+        return etag
+
+    @staticmethod
+    def _build_not_modified_response(response):
+        response_builder = ResponseBuilder()\
+            .set_status(HTTPStatus.NOT_MODIFIED)\
+            .set_cookies(response.cookies)
+        for header_name in ETagResponseInterceptor._NOT_MODIFIED_HEADER_NAMES:
+            if header_name in response.headers:
+                response_builder.add_header(header_name, response.headers[header_name])
+        return response_builder.build()
@@ -0,0 +1,159 @@
+import binascii
+import os
+from http import HTTPStatus
+
+from eynnyd.internal.response_body_type import ResponseBodyType
+from eynnyd.internal.utils.byte_range_parser import ByteRangeParser
+from eynnyd.internal.utils.conditional_request_evaluator import ConditionalRequestEvaluator
+from eynnyd.internal.utils.header_helpers import RequestHeaderReader
+from eynnyd.internal.wsgi.bounded_stream import BoundedStream
+from eynnyd.internal.wsgi.multipart_byte_ranges_iterator import MultipartByteRangesIterator
+from eynnyd.internal.wsgi.stream_response_body import StreamResponseBody
+from eynnyd.response_builder import ResponseBuilder
+
+
+class RangeResponseInterceptor:
+
+    _IN_MEMORY_BODY_TYPES = frozenset([ResponseBodyType.UTF8, ResponseBodyType.BYTE])
+
+    def __init__(self, maximum_ranges):
+        self._maximum_ranges = maximum_ranges
+
+    def __call__(self, request, response):
+        content_length = RangeResponseInterceptor._get_rangeable_content_length(response)
+        if content_length is None:
+            return response
+
+        response_builder = ResponseBuilder.from_response(response).add_header("accept-ranges", "bytes")
+        range_header = RequestHeaderReader.get(request.headers, "range")
+        if request.http_method != "GET" or range_header is None:
+            return response_builder.build()
+
+        if not RangeResponseInterceptor._is_if_range_satisfied(request, response):
+            return response_builder.build()
+
+        byte_ranges = ByteRangeParser.parse(range_header.strip(), content_length)
+        if byte_ranges is None or len(byte_ranges) > self._maximum_ranges:
+            return response_builder.build()
+
+        if not byte_ranges:
+            RangeResponseInterceptor._close_body(response.body)
+            return ResponseBuilder.from_response(response)\
+                .set_status(HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)\
+                .unset_body()\
+                .remove_header("content-type")\
+                .remove_header("content-length")\
+                .add_header("content-range", "bytes */{l}".format(l=content_length))\
+                .add_header("content-length", "0")\
+                .build()
+
+        response_builder\
+            .set_status(HTTPStatus.PARTIAL_CONTENT)\
+            .remove_header("content-length")
+        if len(byte_ranges) == 1:
+            return RangeResponseInterceptor._build_single_range(
+                response, response_builder, byte_ranges[0], content_length)
+        return RangeResponseInterceptor._build_multiple_ranges(response, response_builder, byte_ranges, content_length)
+
+    @staticmethod
+    def _get_rangeable_content_length(response):
+        if response.status.code != HTTPStatus.OK or "content-encoding" in response.headers:
+            return None
+        if response.body.type in RangeResponseInterceptor._IN_MEMORY_BODY_TYPES:
+            return len(response.body.content)
+        if response.body.type != ResponseBodyType.STREAM or "content-length" not in response.headers:
+            return None
+        if not RangeResponseInterceptor._is_seekable(response.body.content):
+            return None
+        try:
+            return int(response.headers["content-length"])
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _is_seekable(stream):
+        try:
+            return bool(stream.seekable())
+        except (AttributeError, TypeError, ValueError):
+            return False
+
+    @staticmethod
+    def _is_if_range_satisfied(request, response):
+        if_range = RequestHeaderReader.get(request.headers, "if-range")
+        if if_range is None:
+            return True
+        if_range = if_range.strip()
+        if if_range.startswith('"'):
+            return if_range == response.headers.get("etag")
+        if if_range.startswith('W/"'):
+            return False
+        return "last-modified" in response.headers and if_range == response.headers["last-modified"]
+
+    @staticmethod
+    def _build_single_range(response, response_builder, byte_range, content_length):
+        start, end = byte_range
+        response_builder.add_header(
+            "content-range",
+            "bytes {s}-{e}/{l}".format(s=start, e=end, l=content_length))
+
+        if response.body.type in RangeResponseInterceptor._IN_MEMORY_BODY_TYPES:
+            return response_builder.set_byte_body(bytes(response.body.content[start:end + 1])).build()
+
+        stream = response.body.content
+        stream.seek(stream.tell() + start)
+        return response_builder\
+            .set_stream_body(
+                BoundedStream(stream, end - start + 1),
+                content_length=end - start + 1,
+                block_size=response.body.block_size.get_or_default(None))\
+            .build()
+
+    @staticmethod
+    def _build_multiple_ranges(response, response_builder, byte_ranges, content_length):
+        boundary = binascii.hexlify(os.urandom(12)).decode("ascii")
+        part_content_type = response.headers.get("content-type")
+        parts = [
+            (RangeResponseInterceptor._format_part_header(boundary, part_content_type, byte_range, content_length),
+             byte_range)
+            for byte_range in byte_ranges]
+        closing_delimiter = "\r\n--{b}--\r\n".format(b=boundary).encode("ascii")
+
+        response_builder.add_header("content-type", "multipart/byteranges; boundary=" + boundary)
+        if response.body.type in RangeResponseInterceptor._IN_MEMORY_BODY_TYPES:
+            content = response.body.content
+            return response_builder\
+                .set_byte_body(
+                    b"".join(part_header + bytes(content[start:end + 1]) for part_header, (start, end) in parts) +
+                    closing_delimiter)\
+                .build()
+
+        multipart_length = len(closing_delimiter) + \
+            sum(len(part_header) + end - start + 1 for part_header, (start, end) in parts)
+        stream = response.body.content
+        return response_builder\
+            .add_header("content-length", str(multipart_length))\
+            .set_iterable_body(MultipartByteRangesIterator(
+                stream,
+                stream.tell(),
+                parts,
+                closing_delimiter,
+                response.body.block_size.get_or_default(StreamResponseBody.DEFAULT_BLOCK_SIZE)))\
+            .build()
+
+    @staticmethod
+    def _format_part_header(boundary, content_type, byte_range, content_length):
+        part_header = "\r\n--{b}\r\n".format(b=boundary)
+        if content_type is not None:
+            part_header += "Content-Type: {t}\r\n".format(t=content_type)
+        part_header += "Content-Range: bytes {s}-{e}/{l}\r\n\r\n".format(
+            s=byte_range[0], e=byte_range[1], l=content_length)
+        return part_header.encode("latin-1")
+
+    @staticmethod
+    def _close_body(body):
+        if body.type != ResponseBodyType.STREAM:
+            return
+        try:
+            body.content.close()
+        except (AttributeError, TypeError):
+            pass
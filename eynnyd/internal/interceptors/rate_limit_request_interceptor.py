@@ -0,0 +1,39 @@
+import math
+import time
+
+from eynnyd.exceptions import RateLimitExceededException
+
+
+class RateLimitRequestInterceptor:
+
+    def __init__(self, store, key_functions, tokens_per_second, capacity, clock=time.time):
+        self._store = store
+        self._key_functions = key_functions
+        self._tokens_per_second = tokens_per_second
+        self._capacity = capacity
+        self._clock = clock
+
+    @staticmethod
+    def client_ip_address_key(request):
+        return request.client_ip_address or ""
+
+    @staticmethod
+    def route_key(request):
+        return request.route.get_or_default(request.http_method + " " + request.request_uri.path)
+
+    @staticmethod
+    def create_header_key(header_name):
+        upper_header_name = header_name.upper()
+
+        def header_key(request):
+            return request.headers.get(upper_header_name, "")
+        return header_key
+
+    def __call__(self, request):
+        key = tuple(key_function(request) for key_function in self._key_functions)
+        seconds_until_available = self._store.acquire(key, self._tokens_per_second, self._capacity, self._clock())
+        if seconds_until_available > 0:
+            raise RateLimitExceededException(
+                "Rate limit exceeded for {k}.".format(k=key),
+                max(1, math.ceil(seconds_until_available)))
+        return request
@@ -0,0 +1,43 @@
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+from eynnyd.internal.wsgi.coalescing_iterator import CoalescingIterator
+
+
+class JSONBodyContent:
+
+    _ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+    def __init__(self, value, serializer=None, streamed=False):
+        self._value = value
+        self._serializer = JSONBodyContent.default_serializer() if serializer is None else serializer
+        self._streamed = streamed
+        self._encoded = None
+
+    @staticmethod
+    def default_serializer():
+        if orjson is not None:
+            return orjson.dumps
+        return JSONBodyContent._ENCODER.encode
+
+    @property
+    def value(self):
+        return self._value
+
+    @property
+    def streamed(self):
+        return self._streamed
+
+    @property
+    def encoded(self):
+        if self._encoded is None:
+            encoded = self._serializer(self._value)
+            self._encoded = encoded.encode("utf-8") if isinstance(encoded, str) else bytes(encoded)
+        return self._encoded
+
+    def iter_encoded(self, chunk_size=CoalescingIterator.DEFAULT_THRESHOLD):
+        return CoalescingIterator(JSONBodyContent._ENCODER.iterencode(self._value), chunk_size)
@@ -0,0 +1,59 @@
+
+class PhaseHistogram:
+
+    _BUCKET_COUNT = 64
+
+    def __init__(self):
+        self._buckets = [0] * PhaseHistogram._BUCKET_COUNT
+        self._count = 0
+        self._total_ns = 0
+        self._maximum_ns = 0
+
+    def record(self, elapsed_ns):
+        self._buckets[min(elapsed_ns.bit_length(), PhaseHistogram._BUCKET_COUNT - 1)] += 1
+        self._count += 1
+        self._total_ns += elapsed_ns
+        if elapsed_ns > self._maximum_ns:
+            self._maximum_ns = elapsed_ns
+
+    def merge(self, other):
+        for bucket, bucket_count in enumerate(other._buckets):
+            self._buckets[bucket] += bucket_count
+        self._count += other._count
+        self._total_ns += other._total_ns
+        self._maximum_ns = max(self._maximum_ns, other._maximum_ns)
+        return self
+
+    @property
+    def count(self):
+        return self._count
+
+    @property
+    def total_ns(self):
+        return self._total_ns
+
+    @property
+    def mean_ns(self):
+        return self._total_ns // self._count if self._count else 0
+
+    @property
+    def maximum_ns(self):
+        return self._maximum_ns
+
+    def percentile_ns(self, percentile):
+        if not self._count:
+            return 0
+        rank = self._count * percentile / 100
+        seen = 0
+        for bucket, bucket_count in enumerate(self._buckets):
+            seen += bucket_count
+            if seen >= rank:
+                return min((1 << bucket) - 1, self._maximum_ns)
+        return self._maximum_ns
+
+    def __str__(self):
+        return "<count={c} mean={m}ns p99<={p}ns max={x}ns>".format(
+            c=self._count,
+            m=self.mean_ns,
+            p=self.percentile_ns(99),
+            x=self._maximum_ns)
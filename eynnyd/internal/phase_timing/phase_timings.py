@@ -0,0 +1,79 @@
+import logging
+import threading
+
+from eynnyd.internal.utils.perf_counter_ns import perf_counter_ns
+from eynnyd.internal.phase_timing.phase_histogram import PhaseHistogram
+
+LOG = logging.getLogger("phase_timings")
+
+
+class PhaseTimings:
+
+    ROUTING = "routing"
+    REQUEST_INTERCEPTORS = "request_interceptors"
+    HANDLER = "handler"
+    RESPONSE_INTERCEPTORS = "response_interceptors"
+    ADAPTATION = "adaptation"
+
+    def __init__(self, observer=None, report_interval_seconds=10.0, clock_ns=perf_counter_ns):
+        self._observer = observer
+        self._report_interval_ns = int(report_interval_seconds * 1e9)
+        self._clock_ns = clock_ns
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._report_lock = threading.Lock()
+        self._threads_to_histograms = {}
+        self._retired_histograms = {}
+        self._next_report_ns = clock_ns() + self._report_interval_ns
+
+    def record(self, route, phase, elapsed_ns):
+        try:
+            histograms = self._local.histograms
+        except AttributeError:
+            histograms = self._register_thread()
+
+        histogram = histograms.get((route, phase))
+        if histogram is None:
+            histogram = histograms[(route, phase)] = PhaseHistogram()
+        histogram.record(elapsed_ns)
+
+        if self._observer is not None and self._clock_ns() >= self._next_report_ns:
+            self._report()
+
+    def snapshot(self):
+        with self._lock:
+            self._retire_finished_threads()
+            histograms_by_thread = [dict(self._retired_histograms)] + \
+                [dict(histograms) for histograms in self._threads_to_histograms.values()]
+
+        merged = {}
+        for histograms in histograms_by_thread:
+            for key, histogram in histograms.items():
+                merged.setdefault(key, PhaseHistogram()).merge(histogram)
+        return merged
+
+    def _register_thread(self):
+        histograms = self._local.histograms = {}
+        with self._lock:
+            self._retire_finished_threads()
+            self._threads_to_histograms[threading.current_thread()] = histograms
+        return histograms
+
+    def _retire_finished_threads(self):
+        for thread in [thread for thread in self._threads_to_histograms if not thread.is_alive()]:
+            for key, histogram in self._threads_to_histograms.pop(thread).items():
+                self._retired_histograms.setdefault(key, PhaseHistogram()).merge(histogram)
+
+    def _report(self):
+        if not self._report_lock.acquire(blocking=False):
+            return
+        try:
+            if self._clock_ns() < self._next_report_ns:
+                return
+            self._next_report_ns = self._clock_ns() + self._report_interval_ns
+            try:
+                self._observer(self.snapshot())
+            except Exception:
+                LOG.exception("Phase timing observer failed.")
+        finally:
+            self._report_lock.release()
@@ -0,0 +1,32 @@
+import functools
+import inspect
+
+from eynnyd.internal.utils.event_loop_thread import EventLoopThread
+
+_EVENT_LOOP_THREAD = EventLoopThread()
+
+
+class AsyncCallable:
+
+    def __init__(self, coroutine_function, event_loop_thread=_EVENT_LOOP_THREAD):
+        self._coroutine_function = coroutine_function
+        self._event_loop_thread = event_loop_thread
+        # The wrapped function's __dict__ is not merged in, as one wrapping another AsyncCallable carries its state.
+        functools.update_wrapper(self, coroutine_function, updated=())
+
+    @staticmethod
+    def from_callable(function):
+        if AsyncCallable.is_coroutine_function(function):
+            return AsyncCallable(function)
+        return function
+
+    @staticmethod
+    def is_coroutine_function(function):
+        return inspect.iscoroutinefunction(function) or \
+            inspect.iscoroutinefunction(getattr(function, "__call__", None))
+
+    def call_async(self, *args):
+        return self._coroutine_function(*args)
+
+    def __call__(self, *args):
+        return self._event_loop_thread.run(self._coroutine_function(*args))
@@ -0,0 +1,128 @@
+import asyncio
+import functools
+
+from eynnyd.exceptions import DeadlineExceededException
+from eynnyd.internal.plan_execution.async_callable import AsyncCallable
+from eynnyd.internal.plan_execution.bulkhead import Bulkhead
+from eynnyd.internal.plan_execution.plan_executor import PlanExecutor
+from eynnyd.internal.utils.thread_future import await_thread_future
+
+
+class AsyncPlanExecutor:
+
+    def __init__(self, error_handlers, plan_executor=None):
+        self._error_handlers = error_handlers
+        self._plan_executor = plan_executor if plan_executor else PlanExecutor(error_handlers)
+
+    async def execute_plan(self, execution_plan, request, executor=None, deadline=None):
+        if not AsyncPlanExecutor._has_async_callables(execution_plan):
+            return await AsyncPlanExecutor._call(
+                executor, self._plan_executor.execute_plan, execution_plan, request, deadline)
+
+        try:
+            Bulkhead.acquire_all(execution_plan.bulkheads)
+        except Exception as e:
+            return self._error_handlers.handle_pre_response_error(e, request)
+
+        abandoned_calls = []
+        try:
+            return await self._execute_plan(execution_plan, request, executor, deadline, abandoned_calls)
+        finally:
+            AsyncPlanExecutor._release_bulkheads_once_finished(execution_plan.bulkheads, abandoned_calls)
+
+    async def _execute_plan(self, execution_plan, request, executor, deadline, abandoned_calls):
+        try:
+            intercepted_request = await self._execute_request_interceptors(
+                execution_plan, request, executor, deadline, abandoned_calls)
+        except Exception as e:
+            return await AsyncPlanExecutor._call(
+                executor, self._error_handlers.handle_pre_response_error, e, request)
+
+        try:
+            handler_response = await self._execute_handler(
+                execution_plan, intercepted_request, executor, deadline, abandoned_calls)
+        except Exception as e:
+            return await AsyncPlanExecutor._call(
+                executor, self._error_handlers.handle_pre_response_error, e, intercepted_request)
+
+        try:
+            return await self._execute_response_interceptors(
+                execution_plan,
+                intercepted_request,
+                handler_response,
+                executor,
+                deadline,
+                abandoned_calls)
+        except Exception as e:
+            return await AsyncPlanExecutor._call(
+                executor, self._error_handlers.handle_post_response_error, e, intercepted_request, handler_response)
+
+    @staticmethod
+    async def _execute_request_interceptors(execution_plan, request, executor, deadline, abandoned_calls):
+        intercepted_request = request
+        for request_interceptor in execution_plan.request_interceptors:
+            intercepted_request = PlanExecutor.verify_request_interceptor_result(
+                request_interceptor,
+                await AsyncPlanExecutor._call_before_deadline(
+                    executor, deadline, abandoned_calls, request_interceptor, intercepted_request))
+        return intercepted_request
+
+    @staticmethod
+    async def _execute_handler(execution_plan, request, executor, deadline, abandoned_calls):
+        return PlanExecutor.verify_handler_result(
+            execution_plan.handler,
+            await AsyncPlanExecutor._call_before_deadline(
+                executor, deadline, abandoned_calls, execution_plan.handler, request))
+
+    @staticmethod
+    async def _execute_response_interceptors(execution_plan, request, response, executor, deadline, abandoned_calls):
+        new_response = response
+        for response_interceptor in reversed(execution_plan.response_interceptors):
+            new_response = PlanExecutor.verify_response_interceptor_result(
+                response_interceptor,
+                await AsyncPlanExecutor._call_before_deadline(
+                    executor, deadline, abandoned_calls, response_interceptor, request, new_response))
+        return new_response
+
+    @staticmethod
+    def _has_async_callables(execution_plan):
+        return isinstance(execution_plan.handler, AsyncCallable) or \
+            any(isinstance(interceptor, AsyncCallable) for interceptor in execution_plan.request_interceptors) or \
+            any(isinstance(interceptor, AsyncCallable) for interceptor in execution_plan.response_interceptors)
+
+    @staticmethod
+    async def _call_before_deadline(executor, deadline, abandoned_calls, function, *args):
+        PlanExecutor.raise_if_deadline_passed(deadline, function)
+        if deadline is None:
+            return await AsyncPlanExecutor._call(executor, function, *args)
+
+        call = asyncio.ensure_future(AsyncPlanExecutor._call(executor, function, *args))
+        try:
+            return await asyncio.wait_for(asyncio.shield(call), deadline.remaining_seconds)
+        except asyncio.TimeoutError:
+            call.cancel()
+            abandoned_calls.append(call)
+            raise DeadlineExceededException(
+                "Deadline passed while waiting on {n}.".format(n=function))
+
+    @staticmethod
+    def _release_bulkheads_once_finished(bulkheads, abandoned_calls):
+        # Calls abandoned at their deadline may still be running on a thread, which the bulkheads must keep counting.
+        if not abandoned_calls:
+            Bulkhead.release_all(bulkheads)
+            return
+
+        def release(finished):
+            for abandoned_call in abandoned_calls:
+                if not abandoned_call.cancelled():
+                    abandoned_call.exception()
+            Bulkhead.release_all(bulkheads)
+
+        asyncio.ensure_future(asyncio.wait(abandoned_calls)).add_done_callback(release)
+
+    @staticmethod
+    async def _call(executor, function, *args):
+        if isinstance(function, AsyncCallable):
+            return await function.call_async(*args)
+        return await await_thread_future(
+            asyncio.get_event_loop().run_in_executor(executor, functools.partial(function, *args)))
@@ -0,0 +1,56 @@
+import threading
+
+from eynnyd.exceptions import BulkheadFullException
+from eynnyd.internal.plan_execution.bulkhead_metrics import BulkheadMetrics
+
+
+class Bulkhead:
+
+    def __init__(self, name, maximum_in_flight, retry_after_seconds):
+        self._name = name
+        self._maximum_in_flight = maximum_in_flight
+        self._retry_after_seconds = retry_after_seconds
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._peak_in_flight = 0
+        self._rejected = 0
+
+    @staticmethod
+    def acquire_all(bulkheads):
+        for index, bulkhead in enumerate(bulkheads):
+            try:
+                bulkhead.acquire()
+            except BulkheadFullException:
+                Bulkhead.release_all(bulkheads[:index])
+                raise
+
+    @staticmethod
+    def release_all(bulkheads):
+        for bulkhead in bulkheads:
+            bulkhead.release()
+
+    @property
+    def metrics(self):
+        with self._lock:
+            return BulkheadMetrics(
+                self._name,
+                self._maximum_in_flight,
+                self._in_flight,
+                self._peak_in_flight,
+                self._rejected)
+
+    def acquire(self):
+        with self._lock:
+            if self._in_flight < self._maximum_in_flight:
+                self._in_flight += 1
+                if self._in_flight > self._peak_in_flight:
+                    self._peak_in_flight = self._in_flight
+                return
+            self._rejected += 1
+        raise BulkheadFullException(
+            "Bulkhead {n} already has {m} requests in flight.".format(n=self._name, m=self._maximum_in_flight),
+            self._retry_after_seconds)
+
+    def release(self):
+        with self._lock:
+            self._in_flight -= 1
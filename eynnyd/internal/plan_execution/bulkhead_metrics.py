@@ -0,0 +1,37 @@
+
+class BulkheadMetrics:
+
+    def __init__(self, name, maximum_in_flight, in_flight, peak_in_flight, rejected):
+        self._name = name
+        self._maximum_in_flight = maximum_in_flight
+        self._in_flight = in_flight
+        self._peak_in_flight = peak_in_flight
+        self._rejected = rejected
+
+    @property
+    def name(self):
+        return self._name
+
+    @property
+    def maximum_in_flight(self):
+        return self._maximum_in_flight
+
+    @property
+    def in_flight(self):
+        return self._in_flight
+
+    @property
+    def peak_in_flight(self):
+        return self._peak_in_flight
+
+    @property
+    def rejected(self):
+        return self._rejected
+
+    def __str__(self):
+        return "<{n} in_flight={i}/{m} peak={p} rejected={r}>".format(
+            n=self._name,
+            i=self._in_flight,
+            m=self._maximum_in_flight,
+            p=self._peak_in_flight,
+            r=self._rejected)
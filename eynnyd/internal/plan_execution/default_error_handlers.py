@@ -1,8 +1,27 @@
+import functools
 import logging
 from http import HTTPStatus
+
+from eynnyd.internal.utils.rate_limited_logger import RateLimitedLogger
 from eynnyd.response_builder import ResponseBuilder
 
 LOG = logging.getLogger("default_error_handlers")
+RATE_LIMITED_LOG = RateLimitedLogger(LOG, messages_per_second=1, burst=10)
+
+NOT_FOUND_RESPONSE = ResponseBuilder()\
+    .set_status(HTTPStatus.NOT_FOUND)\
+    .set_utf8_body("Not Found")\
+    .build_prebuilt()
+INVALID_COOKIE_HEADER_RESPONSE = ResponseBuilder()\
+    .set_status(HTTPStatus.BAD_REQUEST)\
+    .set_utf8_body(
+        "Invalid cookies sent (Did you forget to URLEncode them?). "
+        "Check your formatting against RFC6265 standards.")\
+    .build_prebuilt()
+INTERNAL_SERVER_ERROR_RESPONSE = ResponseBuilder()\
+    .set_status(HTTPStatus.INTERNAL_SERVER_ERROR)\
+    .set_utf8_body("Internal Server Error")\
+    .build_prebuilt()
 
 
 def default_route_not_found_error_handler(exc, request):
@@ -14,29 +33,71 @@ def default_route_not_found_error_handler(exc, request):
         .build()
 
 
+def static_route_not_found_error_handler(exc, request):
+    return NOT_FOUND_RESPONSE
+
+
 def default_invalid_cookie_header_error_handler(exc, request):
-    LOG.warning(
-        "Request attempted with invalid cookie header: {rc}".format(rc=str(request.headers.get("COOKIE"))))
-    return ResponseBuilder()\
-        .set_status(HTTPStatus.BAD_REQUEST)\
-        .set_utf8_body(
-            "Invalid cookies sent (Did you forget to URLEncode them?). "
-            "Check your formatting against RFC6265 standards.")\
-        .build()
+    RATE_LIMITED_LOG.log(
+        logging.WARNING,
+        type(exc),
+        "Request attempted with invalid cookie header of length %d.",
+        len(request.headers.get("COOKIE") or ""),
+        extra={"error_type": type(exc).__name__})
+    return INVALID_COOKIE_HEADER_RESPONSE
+
+
+@functools.lru_cache(maxsize=256)
+def _create_retry_after_response(status, retry_after_seconds):
+    response_builder = ResponseBuilder()\
+        .set_status(status)\
+        .set_utf8_body(status.phrase)
+    if retry_after_seconds is not None:
+        response_builder.add_header("Retry-After", str(retry_after_seconds))
+    return response_builder.build_prebuilt()
+
+
+def default_service_unavailable_error_handler(exc, request):
+    RATE_LIMITED_LOG.log(
+        logging.WARNING,
+        type(exc),
+        "Request %s rejected: %s",
+        request,
+        exc,
+        extra={"error_type": type(exc).__name__})
+    return _create_retry_after_response(HTTPStatus.SERVICE_UNAVAILABLE, getattr(exc, "retry_after_seconds", None))
+
+
+def default_rate_limit_exceeded_error_handler(exc, request):
+    return _create_retry_after_response(HTTPStatus.TOO_MANY_REQUESTS, getattr(exc, "retry_after_seconds", None))
+
+
+def default_deadline_exceeded_error_handler_only_request(exc, request):
+    return _create_retry_after_response(HTTPStatus.GATEWAY_TIMEOUT, None)
+
+
+def default_deadline_exceeded_error_handler(exc, request, response):
+    return _create_retry_after_response(HTTPStatus.GATEWAY_TIMEOUT, None)
 
 
 def default_internal_server_error_error_handler_only_request(exc, request):
-    LOG.exception("Unexpected exception occurred with request {r}.".format(r=request), exc_info=exc)
-    return ResponseBuilder()\
-        .set_status(HTTPStatus.INTERNAL_SERVER_ERROR)\
-        .set_utf8_body("Internal Server Error")\
-        .build()
+    RATE_LIMITED_LOG.log(
+        logging.ERROR,
+        type(exc),
+        "Unexpected exception occurred with request %s.",
+        request,
+        exc_info=exc,
+        extra={"error_type": type(exc).__name__})
+    return INTERNAL_SERVER_ERROR_RESPONSE
 
 
 def default_internal_server_error_error_handler(exc, request, response):
-    LOG.exception(
-        "Unexpected exception occurred with request {q} and response {s}.".format(q=request, s=response), exc_info=exc)
-    return ResponseBuilder()\
-        .set_status(HTTPStatus.INTERNAL_SERVER_ERROR)\
-        .set_utf8_body("Internal Server Error")\
-        .build()
\ No newline at end of file
+    RATE_LIMITED_LOG.log(
+        logging.ERROR,
+        type(exc),
+        "Unexpected exception occurred with request %s and response %s.",
+        request,
+        response,
+        exc_info=exc,
+        extra={"error_type": type(exc).__name__})
+    return INTERNAL_SERVER_ERROR_RESPONSE
\ No newline at end of file
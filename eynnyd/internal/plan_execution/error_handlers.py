@@ -11,28 +11,66 @@ class ErrorHandlers:
             self,
             pre_response_error_handlers,
             post_response_error_handlers):
-        self._pre_response_error_handlers = pre_response_error_handlers
-        self._post_response_error_handlers = post_response_error_handlers
+        self._pre_response_handlers_by_error_class = \
+            ErrorHandlers._index_by_error_class(pre_response_error_handlers)
+        self._post_response_handlers_by_error_class = \
+            ErrorHandlers._index_by_error_class(post_response_error_handlers)
+        self._resolved_pre_response_handlers_by_error_type = {}
+        self._resolved_post_response_handlers_by_error_type = {}
 
     def handle_pre_response_error(self, thrown_error, request):
         return ErrorHandlers\
-            ._get_handler_for_error(thrown_error, self._pre_response_error_handlers)(thrown_error, request)
+            ._get_handler_for_error(
+                thrown_error,
+                self._pre_response_handlers_by_error_class,
+                self._resolved_pre_response_handlers_by_error_type)(thrown_error, request)
 
     def handle_post_response_error(self, thrown_error, request, response):
         return ErrorHandlers\
             ._get_handler_for_error(
                 thrown_error,
-                self._post_response_error_handlers)(thrown_error, request, response)
+                self._post_response_handlers_by_error_class,
+                self._resolved_post_response_handlers_by_error_type)(thrown_error, request, response)
 
     @staticmethod
-    def _get_handler_for_error(thrown_error, error_handlers):
+    def _index_by_error_class(error_handlers):
+        handlers_by_error_class = {}
         for registered_error, registered_handler in error_handlers:
-            if isinstance(thrown_error, registered_error):
-                return registered_handler
-        raise NoGenericErrorHandlerException(
-            "No error handler registered for even generic exceptions.",
-            thrown_error)
+            handlers_by_error_class.setdefault(registered_error, registered_handler)
+        return handlers_by_error_class
 
+    @staticmethod
+    def _get_handler_for_error(thrown_error, handlers_by_error_class, resolved_handlers_by_error_type):
+        error_type = type(thrown_error)
+        handler = resolved_handlers_by_error_type.get(error_type)
+        if handler is None:
+            handler = ErrorHandlers._resolve_handler_for_error(thrown_error, handlers_by_error_class)
+            resolved_handlers_by_error_type[error_type] = handler
+        return handler
 
+    @staticmethod
+    def _resolve_handler_for_error(thrown_error, handlers_by_error_class):
+        error_mro = type(thrown_error).__mro__
+        if error_mro[0] in handlers_by_error_class:
+            return handlers_by_error_class[error_mro[0]]
 
+        matching_error_classes = [
+            registered_error for registered_error in handlers_by_error_class
+            if isinstance(thrown_error, registered_error)]
+        if not matching_error_classes:
+            raise NoGenericErrorHandlerException(
+                "No error handler registered for even generic exceptions.",
+                thrown_error)
+        most_specific_error_class = min(
+            matching_error_classes,
+            key=lambda registered_error: ErrorHandlers._get_specificity_rank(registered_error, error_mro))
+        return handlers_by_error_class[most_specific_error_class]
 
+    @staticmethod
+    def _get_specificity_rank(registered_error, error_mro):
+        if registered_error in error_mro:
+            return error_mro.index(registered_error)
+        # virtual (abc registered) base classes rank just ahead of their nearest real base class in the mro
+        return min(
+            position for position, error_class in enumerate(error_mro)
+            if issubclass(registered_error, error_class)) - 0.5
@@ -1,11 +1,26 @@
+from eynnyd.internal.plan_execution.route_priorities import DEFAULT_PRIORITY
+
 
 class ExecutionPlan:
 
-    def __init__(self, request_interceptors, handler, response_interceptors, path_parameters):
+    def __init__(
+            self,
+            request_interceptors,
+            handler,
+            response_interceptors,
+            path_parameters,
+            bulkheads=(),
+            priority=DEFAULT_PRIORITY,
+            deadline_seconds=None,
+            route=None):
         self._request_interceptors = request_interceptors
         self._handler = handler
         self._response_interceptors = response_interceptors
         self._path_parameters = path_parameters
+        self._bulkheads = bulkheads
+        self._priority = priority
+        self._deadline_seconds = deadline_seconds
+        self._route = route
 
     @property
     def request_interceptors(self):
@@ -23,3 +38,18 @@ class ExecutionPlan:
     def path_parameters(self):
         return self._path_parameters
 
+    @property
+    def bulkheads(self):
+        return self._bulkheads
+
+    @property
+    def priority(self):
+        return self._priority
+
+    @property
+    def deadline_seconds(self):
+        return self._deadline_seconds
+
+    @property
+    def route(self):
+        return self._route
@@ -1,6 +1,7 @@
 from optional import Optional
 
 from eynnyd.internal.plan_execution.execution_plan import ExecutionPlan
+from eynnyd.internal.plan_execution.route_priorities import DEFAULT_PRIORITY
 from eynnyd.exceptions import ExecutionPlanBuildException
 
 
@@ -11,6 +12,10 @@ class ExecutionPlanBuilder:
         self._handler = Optional.empty()
         self._response_interceptors = []
         self._path_parameters = {}
+        self._bulkheads = []
+        self._priority = DEFAULT_PRIORITY
+        self._deadline_seconds = None
+        self._route = None
 
     def add_request_interceptors(self, request_interceptors):
         self._request_interceptors.extend(request_interceptors)
@@ -20,10 +25,26 @@ class ExecutionPlanBuilder:
         self._response_interceptors.extend(response_interceptors)
         return self
 
+    def add_bulkheads(self, bulkheads):
+        self._bulkheads.extend(bulkheads)
+        return self
+
+    def set_priority(self, priority):
+        self._priority = priority
+        return self
+
+    def set_deadline_seconds(self, deadline_seconds):
+        self._deadline_seconds = deadline_seconds
+        return self
+
     def set_handler(self, handler):
         self._handler = Optional.of(handler)
         return self
 
+    def set_route(self, route):
+        self._route = route
+        return self
+
     def add_path_parameter(self, name_from_route, value_from_request):
         self._path_parameters[name_from_route] = value_from_request
         return self
@@ -34,6 +55,10 @@ class ExecutionPlanBuilder:
             self._handler.get_or_raise(
                 ExecutionPlanBuildException("Cannot build an execution plan without a handler.")),
             self._response_interceptors,
-            self._path_parameters)
+            self._path_parameters,
+            tuple(dict.fromkeys(self._bulkheads)),
+            self._priority,
+            self._deadline_seconds,
+            self._route)
 
 
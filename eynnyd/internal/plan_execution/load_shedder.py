@@ -0,0 +1,96 @@
+import math
+import threading
+import time
+
+from eynnyd.exceptions import RequestShedException
+from eynnyd.internal.plan_execution import route_priorities
+from eynnyd.internal.plan_execution.load_shedder_metrics import LoadShedderMetrics
+
+
+class LoadShedder:
+
+    CRITICAL_PRIORITY = route_priorities.CRITICAL_PRIORITY
+    DEFAULT_PRIORITY = route_priorities.DEFAULT_PRIORITY
+
+    def __init__(
+            self,
+            target_latency_seconds,
+            interval_seconds,
+            maximum_in_flight=None,
+            retry_after_seconds=1,
+            ewma_weight=0.1,
+            clock=time.monotonic):
+        self._target_latency_seconds = target_latency_seconds
+        self._interval_seconds = interval_seconds
+        self._maximum_in_flight = maximum_in_flight
+        self._retry_after_seconds = retry_after_seconds
+        self._ewma_weight = ewma_weight
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._in_flight_ewma = 0.0
+        self._latency_ewma_seconds = 0.0
+        self._interval_minimum_latency_seconds = None
+        self._interval_end = clock() + interval_seconds
+        self._concurrency_limit = maximum_in_flight
+        self._shed = 0
+
+    @property
+    def metrics(self):
+        with self._lock:
+            return LoadShedderMetrics(
+                self._in_flight,
+                self._in_flight_ewma,
+                self._latency_ewma_seconds,
+                self._concurrency_limit,
+                self._shed)
+
+    def admit(self, priority):
+        now = self._clock()
+        with self._lock:
+            self._end_interval_if_due(now)
+            if priority == LoadShedder.CRITICAL_PRIORITY or not self._is_over_limit(priority):
+                self._in_flight += 1
+                self._in_flight_ewma += self._ewma_weight * (self._in_flight - self._in_flight_ewma)
+                return now
+            self._shed += 1
+            in_flight = self._in_flight
+            concurrency_limit = self._concurrency_limit
+        raise RequestShedException(
+            "Overloaded, {i} requests in flight against a limit of {l}, request priority was {p}.".format(
+                i=in_flight, l=concurrency_limit, p=priority),
+            self._retry_after_seconds)
+
+    def release(self, admitted_at):
+        now = self._clock()
+        latency_seconds = now - admitted_at
+        with self._lock:
+            self._in_flight -= 1
+            self._latency_ewma_seconds += self._ewma_weight * (latency_seconds - self._latency_ewma_seconds)
+            if self._interval_minimum_latency_seconds is None or \
+                    latency_seconds < self._interval_minimum_latency_seconds:
+                self._interval_minimum_latency_seconds = latency_seconds
+            self._end_interval_if_due(now)
+
+    def _is_over_limit(self, priority):
+        return self._concurrency_limit is not None and self._in_flight * priority >= self._concurrency_limit
+
+    def _end_interval_if_due(self, now):
+        if now < self._interval_end:
+            return
+
+        # An interval without a completed request (ex. one slow request on an idle server) shows no queueing.
+        if self._interval_minimum_latency_seconds is not None:
+            if self._interval_minimum_latency_seconds > self._target_latency_seconds:
+                in_flight = self._in_flight_ewma if self._concurrency_limit is None else \
+                    min(self._in_flight_ewma, self._concurrency_limit)
+                self._concurrency_limit = max(1, math.floor(in_flight / 2))
+            elif self._concurrency_limit is not None:
+                self._concurrency_limit += 1
+                if self._maximum_in_flight is None and self._concurrency_limit > 2 * self._in_flight_ewma + 1:
+                    self._concurrency_limit = None
+                elif self._maximum_in_flight is not None and self._concurrency_limit > self._maximum_in_flight:
+                    self._concurrency_limit = self._maximum_in_flight
+
+        self._interval_minimum_latency_seconds = None
+        self._interval_end = now + self._interval_seconds
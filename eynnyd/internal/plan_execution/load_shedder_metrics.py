@@ -0,0 +1,37 @@
+
+class LoadShedderMetrics:
+
+    def __init__(self, in_flight, in_flight_ewma, latency_ewma_seconds, concurrency_limit, shed):
+        self._in_flight = in_flight
+        self._in_flight_ewma = in_flight_ewma
+        self._latency_ewma_seconds = latency_ewma_seconds
+        self._concurrency_limit = concurrency_limit
+        self._shed = shed
+
+    @property
+    def in_flight(self):
+        return self._in_flight
+
+    @property
+    def in_flight_ewma(self):
+        return self._in_flight_ewma
+
+    @property
+    def latency_ewma_seconds(self):
+        return self._latency_ewma_seconds
+
+    @property
+    def concurrency_limit(self):
+        return self._concurrency_limit
+
+    @property
+    def shed(self):
+        return self._shed
+
+    def __str__(self):
+        return "<in_flight={i} in_flight_ewma={e:.2f} latency_ewma={l:.4f}s limit={c} shed={s}>".format(
+            i=self._in_flight,
+            e=self._in_flight_ewma,
+            l=self._latency_ewma_seconds,
+            c=self._concurrency_limit,
+            s=self._shed)
@@ -1,7 +1,8 @@
 from eynnyd.exceptions import RequestInterceptorReturnedNonRequestException, HandlerReturnedNonResponseException, \
-    ResponseInterceptorReturnedNonResponseException
+    ResponseInterceptorReturnedNonResponseException, DeadlineExceededException
 from eynnyd.abstract_request import AbstractRequest
 from eynnyd.abstract_response import AbstractResponse
+from eynnyd.internal.plan_execution.bulkhead import Bulkhead
 
 
 class PlanExecutor:
@@ -9,62 +10,107 @@ class PlanExecutor:
     def __init__(self, error_handlers):
         self._error_handlers = error_handlers
 
-    def execute_plan(self, execution_plan, request):
+    def execute_plan(self, execution_plan, request, deadline=None):
+        if not execution_plan.bulkheads:
+            return self._execute_plan(execution_plan, request, deadline)
+
+        try:
+            Bulkhead.acquire_all(execution_plan.bulkheads)
+        except Exception as e:
+            return self._error_handlers.handle_pre_response_error(e, request)
+
+        try:
+            return self._execute_plan(execution_plan, request, deadline)
+        finally:
+            Bulkhead.release_all(execution_plan.bulkheads)
+
+    def _execute_plan(self, execution_plan, request, deadline):
         try:
-            intercepted_request = self._execute_request_interceptors(execution_plan, request)
+            intercepted_request = self._execute_request_interceptors(execution_plan, request, deadline)
         except Exception as e:
             return self._error_handlers.handle_pre_response_error(e, request)
 
         try:
-            handler_response = self._execute_handler(execution_plan, intercepted_request)
+            handler_response = self._execute_handler(execution_plan, intercepted_request, deadline)
         except Exception as e:
             return self._error_handlers.handle_pre_response_error(e, intercepted_request)
 
         try:
-            return self._execute_response_interceptors(execution_plan, intercepted_request, handler_response)
+            return self._execute_response_interceptors(
+                execution_plan,
+                intercepted_request,
+                handler_response,
+                deadline)
         except Exception as e:
             return self._error_handlers\
                 .handle_post_response_error(e, intercepted_request, handler_response)
 
-
     @staticmethod
-    def _execute_request_interceptors(execution_plan, request):
-        return PlanExecutor._update_request_via_request_interceptors(execution_plan.request_interceptors, request)
+    def _execute_request_interceptors(execution_plan, request, deadline):
+        return PlanExecutor\
+            ._update_request_via_request_interceptors(execution_plan.request_interceptors, request, deadline)
 
     @staticmethod
-    def _execute_handler(execution_plan, request):
-        return PlanExecutor._get_response_from_handler(execution_plan.handler, request)
+    def _execute_handler(execution_plan, request, deadline):
+        return PlanExecutor._get_response_from_handler(execution_plan.handler, request, deadline)
 
     @staticmethod
-    def _execute_response_interceptors(execution_plan, request, response):
-        return PlanExecutor\
-            ._update_response_via_response_interceptors(execution_plan.response_interceptors, request, response)
+    def _execute_response_interceptors(execution_plan, request, response, deadline):
+        return PlanExecutor._update_response_via_response_interceptors(
+            execution_plan.response_interceptors,
+            request,
+            response,
+            deadline)
 
     @staticmethod
-    def _update_request_via_request_interceptors(request_interceptors, request):
+    def _update_request_via_request_interceptors(request_interceptors, request, deadline):
         new_request = request
         for request_interceptor in request_interceptors:
-            new_request = request_interceptor(new_request)
-            if not isinstance(new_request, AbstractRequest):
-                raise RequestInterceptorReturnedNonRequestException(
-                    "Request Interceptor {n} did not return a request.".format(n=request_interceptor.__name__))
+            PlanExecutor.raise_if_deadline_passed(deadline, request_interceptor)
+            new_request = PlanExecutor.verify_request_interceptor_result(
+                request_interceptor,
+                request_interceptor(new_request))
         return new_request
 
     @staticmethod
-    def _get_response_from_handler(handler, request):
-        response = handler(request)
+    def _get_response_from_handler(handler, request, deadline):
+        PlanExecutor.raise_if_deadline_passed(deadline, handler)
+        return PlanExecutor.verify_handler_result(handler, handler(request))
+
+    @staticmethod
+    def _update_response_via_response_interceptors(response_interceptors, request, response, deadline):
+        new_response = response
+        for response_interceptor in reversed(response_interceptors):
+            PlanExecutor.raise_if_deadline_passed(deadline, response_interceptor)
+            new_response = PlanExecutor.verify_response_interceptor_result(
+                response_interceptor,
+                response_interceptor(request, new_response))
+        return new_response
+
+    @staticmethod
+    def raise_if_deadline_passed(deadline, next_callable):
+        if deadline is not None and deadline.expired:
+            raise DeadlineExceededException(
+                "Deadline passed before {n} could run.".format(n=next_callable))
+
+    @staticmethod
+    def verify_request_interceptor_result(request_interceptor, request):
+        if not isinstance(request, AbstractRequest):
+            raise RequestInterceptorReturnedNonRequestException(
+                "Request Interceptor {n} did not return a request.".format(n=request_interceptor.__name__))
+        return request
+
+    @staticmethod
+    def verify_handler_result(handler, response):
         if not isinstance(response, AbstractResponse):
             raise HandlerReturnedNonResponseException(
                 "Request Handler {n} did not return a response.".format(n=handler.__name__))
         return response
 
     @staticmethod
-    def _update_response_via_response_interceptors(response_interceptors, request, response):
-        new_response = response
-        for response_interceptor in reversed(response_interceptors):
-            new_response = response_interceptor(request, new_response)
-            if not isinstance(new_response, AbstractResponse):
-                raise ResponseInterceptorReturnedNonResponseException(
-                    "Response Interceptor {n} did not return a resposne.".format(n=response_interceptor.__name__))
-        return new_response
+    def verify_response_interceptor_result(response_interceptor, response):
+        if not isinstance(response, AbstractResponse):
+            raise ResponseInterceptorReturnedNonResponseException(
+                "Response Interceptor {n} did not return a resposne.".format(n=response_interceptor.__name__))
+        return response
 
@@ -0,0 +1,2 @@
+CRITICAL_PRIORITY = 0
+DEFAULT_PRIORITY = 1
@@ -0,0 +1,47 @@
+from eynnyd.internal.utils.perf_counter_ns import perf_counter_ns
+from eynnyd.internal.phase_timing.phase_timings import PhaseTimings
+from eynnyd.internal.plan_execution.async_plan_executor import AsyncPlanExecutor
+from eynnyd.internal.plan_execution.timed_plan_executor import TimedPlanExecutor
+
+
+class TimedAsyncPlanExecutor(AsyncPlanExecutor):
+
+    def __init__(self, error_handlers, phase_timings):
+        super().__init__(error_handlers, TimedPlanExecutor(error_handlers, phase_timings))
+        self._phase_timings = phase_timings
+
+    async def _execute_request_interceptors(self, execution_plan, request, executor, deadline, abandoned_calls):
+        started_ns = perf_counter_ns()
+        try:
+            return await AsyncPlanExecutor._execute_request_interceptors(
+                execution_plan, request, executor, deadline, abandoned_calls)
+        finally:
+            self._phase_timings.record(
+                execution_plan.route,
+                PhaseTimings.REQUEST_INTERCEPTORS,
+                perf_counter_ns() - started_ns)
+
+    async def _execute_handler(self, execution_plan, request, executor, deadline, abandoned_calls):
+        started_ns = perf_counter_ns()
+        try:
+            return await AsyncPlanExecutor._execute_handler(
+                execution_plan, request, executor, deadline, abandoned_calls)
+        finally:
+            self._phase_timings.record(execution_plan.route, PhaseTimings.HANDLER, perf_counter_ns() - started_ns)
+
+    async def _execute_response_interceptors(
+            self, execution_plan, request, response, executor, deadline, abandoned_calls):
+        started_ns = perf_counter_ns()
+        try:
+            return await AsyncPlanExecutor._execute_response_interceptors(
+                execution_plan,
+                request,
+                response,
+                executor,
+                deadline,
+                abandoned_calls)
+        finally:
+            self._phase_timings.record(
+                execution_plan.route,
+                PhaseTimings.RESPONSE_INTERCEPTORS,
+                perf_counter_ns() - started_ns)
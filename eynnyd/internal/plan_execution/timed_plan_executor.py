@@ -0,0 +1,37 @@
+from eynnyd.internal.utils.perf_counter_ns import perf_counter_ns
+from eynnyd.internal.phase_timing.phase_timings import PhaseTimings
+from eynnyd.internal.plan_execution.plan_executor import PlanExecutor
+
+
+class TimedPlanExecutor(PlanExecutor):
+
+    def __init__(self, error_handlers, phase_timings):
+        super().__init__(error_handlers)
+        self._phase_timings = phase_timings
+
+    def _execute_request_interceptors(self, execution_plan, request, deadline):
+        started_ns = perf_counter_ns()
+        try:
+            return PlanExecutor._execute_request_interceptors(execution_plan, request, deadline)
+        finally:
+            self._phase_timings.record(
+                execution_plan.route,
+                PhaseTimings.REQUEST_INTERCEPTORS,
+                perf_counter_ns() - started_ns)
+
+    def _execute_handler(self, execution_plan, request, deadline):
+        started_ns = perf_counter_ns()
+        try:
+            return PlanExecutor._execute_handler(execution_plan, request, deadline)
+        finally:
+            self._phase_timings.record(execution_plan.route, PhaseTimings.HANDLER, perf_counter_ns() - started_ns)
+
+    def _execute_response_interceptors(self, execution_plan, request, response, deadline):
+        started_ns = perf_counter_ns()
+        try:
+            return PlanExecutor._execute_response_interceptors(execution_plan, request, response, deadline)
+        finally:
+            self._phase_timings.record(
+                execution_plan.route,
+                PhaseTimings.RESPONSE_INTERCEPTORS,
+                perf_counter_ns() - started_ns)
@@ -0,0 +1,17 @@
+from types import MappingProxyType
+
+from eynnyd.internal.response import Response
+from eynnyd.internal.wsgi.wsgi_headers_converter import WSGIHeadersConverter
+from eynnyd.internal.wsgi.wsgi_response_body_factory import WSGIResponseBodyFactory
+
+
+class PrebuiltResponse(Response):
+
+    def __init__(self, status, body, headers, cookies):
+        super().__init__(status, body, MappingProxyType(dict(headers)), tuple(cookies))
+        self._wsgi_headers = WSGIHeadersConverter.from_response(self)
+        self._wsgi_body = tuple(WSGIResponseBodyFactory(None).create(body).get_body())
+
+    @property
+    def wsgi_body(self):
+        return self._wsgi_body
@@ -1,13 +1,16 @@
 from eynnyd.abstract_response import AbstractResponse
+from eynnyd.internal.wsgi.wsgi_headers_converter import WSGIHeadersConverter
 
 
 class Response(AbstractResponse):
 
-    def __init__(self, status, body, headers, cookies):
+    def __init__(self, status, body, headers, cookies, background_tasks=()):
         self._status = status
         self._body = body
         self._headers = headers
         self._cookies = cookies
+        self._background_tasks = background_tasks
+        self._wsgi_headers = None
 
     @property
     def status(self):
@@ -25,5 +28,15 @@ class Response(AbstractResponse):
     def cookies(self):
         return self._cookies
 
+    @property
+    def background_tasks(self):
+        return self._background_tasks
+
+    @property
+    def wsgi_headers(self):
+        if self._wsgi_headers is None:
+            self._wsgi_headers = WSGIHeadersConverter.from_response(self)
+        return self._wsgi_headers
+
     def __str__(self):
         return "<{c}>".format(c=self.status)
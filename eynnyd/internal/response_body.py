@@ -1,11 +1,14 @@
+from optional import Optional
+
 from eynnyd.internal.response_body_type import ResponseBodyType
 
 
 class ResponseBody:
 
-    def __init__(self, type, content):
+    def __init__(self, type, content, block_size=Optional.empty()):
         self._type = type
         self._content = content
+        self._block_size = block_size
 
     @staticmethod
     def empty_response():
@@ -17,4 +20,8 @@ class ResponseBody:
 
     @property
     def content(self):
-        return self._content
\ No newline at end of file
+        return self._content
+
+    @property
+    def block_size(self):
+        return self._block_size
@@ -6,4 +6,5 @@ class ResponseBodyType(Enum):
     UTF8 = 2
     BYTE = 3
     STREAM = 4
-    ITERABLE = 5
\ No newline at end of file
+    ITERABLE = 5
+    JSON = 6
@@ -2,7 +2,7 @@ import logging
 
 from optional import Optional
 
-from eynnyd.exceptions import DuplicateHandlerRoutesException
+from eynnyd.exceptions import DuplicateHandlerRoutesException, HandlerNotFoundException
 from eynnyd.internal.routing.pattern_route_builder import PatternRouteBuilder
 from eynnyd.internal.routing.route_tree_node import RouteTreeNode
 
@@ -11,12 +11,20 @@ LOG = logging.getLogger("route_tree")
 
 class RouteTeeBuilder:
 
-    def __init__(self):
+    def __init__(self, route_template="/"):
+        self._route_template = route_template
         self._sub_routes_to_node_builders = {}
         self._request_interceptors = []
         self._http_methods_to_handlers = {}
+        self._http_methods_to_handler_wrappers = {}
         self._response_interceptors = []
         self._pattern_route_builder = Optional.empty()
+        self._bulkheads = []
+        self._http_methods_to_bulkheads = {}
+        self._priority = Optional.empty()
+        self._http_methods_to_priorities = {}
+        self._deadline_seconds = Optional.empty()
+        self._http_methods_to_deadline_seconds = {}
 
     def add_request_interceptor(self, uri_components, interceptor):
         if len(uri_components) == 0:
@@ -41,25 +49,109 @@ class RouteTeeBuilder:
 
         return self._get_or_build_next_node(uri_components).add_handler(http_method, uri_components[1:], handler)
 
+    def add_handler_wrapper(self, http_method, uri_components, handler_wrapper):
+        if len(uri_components) == 0:
+            self._http_methods_to_handler_wrappers.setdefault(http_method, []).append(handler_wrapper)
+            return self
+
+        return self._get_or_build_next_node(uri_components)\
+            .add_handler_wrapper(http_method, uri_components[1:], handler_wrapper)
+
+    def add_bulkhead(self, uri_components, bulkhead):
+        if len(uri_components) == 0:
+            self._bulkheads.append(bulkhead)
+            return self
+
+        return self._get_or_build_next_node(uri_components).add_bulkhead(uri_components[1:], bulkhead)
+
+    def add_route_bulkhead(self, http_method, uri_components, bulkhead):
+        if len(uri_components) == 0:
+            self._http_methods_to_bulkheads.setdefault(http_method, []).append(bulkhead)
+            return self
+
+        return self._get_or_build_next_node(uri_components)\
+            .add_route_bulkhead(http_method, uri_components[1:], bulkhead)
+
+    def set_priority(self, uri_components, priority):
+        if len(uri_components) == 0:
+            self._priority = Optional.of(priority)
+            return self
+
+        return self._get_or_build_next_node(uri_components).set_priority(uri_components[1:], priority)
+
+    def set_route_priority(self, http_method, uri_components, priority):
+        if len(uri_components) == 0:
+            self._http_methods_to_priorities[http_method] = priority
+            return self
+
+        return self._get_or_build_next_node(uri_components)\
+            .set_route_priority(http_method, uri_components[1:], priority)
+
+    def set_deadline_seconds(self, uri_components, deadline_seconds):
+        if len(uri_components) == 0:
+            self._deadline_seconds = Optional.of(deadline_seconds)
+            return self
+
+        return self._get_or_build_next_node(uri_components).set_deadline_seconds(uri_components[1:], deadline_seconds)
+
+    def set_route_deadline_seconds(self, http_method, uri_components, deadline_seconds):
+        if len(uri_components) == 0:
+            self._http_methods_to_deadline_seconds[http_method] = deadline_seconds
+            return self
+
+        return self._get_or_build_next_node(uri_components)\
+            .set_route_deadline_seconds(http_method, uri_components[1:], deadline_seconds)
+
     def build(self):
+        for http_method in list(self._http_methods_to_bulkheads) + \
+                list(self._http_methods_to_priorities) + \
+                list(self._http_methods_to_deadline_seconds):
+            if http_method not in self._http_methods_to_handlers:
+                raise HandlerNotFoundException(
+                    "Cannot limit, prioritise, or set a deadline on a handler for method {m} "
+                    "without a handler registered"
+                        .format(m=http_method))
         return RouteTreeNode(
             self._request_interceptors,
             self._response_interceptors,
-            self._http_methods_to_handlers,
+            self._build_http_methods_to_handlers(),
             {route: node_builder.build() for route, node_builder in self._sub_routes_to_node_builders.items()},
-            self._pattern_route_builder.map(lambda prb: prb.build()))
+            self._pattern_route_builder.map(lambda prb: prb.build()),
+            tuple(self._bulkheads),
+            {http_method: tuple(bulkheads) for http_method, bulkheads in self._http_methods_to_bulkheads.items()},
+            self._priority,
+            dict(self._http_methods_to_priorities),
+            self._deadline_seconds,
+            dict(self._http_methods_to_deadline_seconds),
+            {http_method: http_method + " " + self._route_template for http_method in self._http_methods_to_handlers})
+
+    def _build_http_methods_to_handlers(self):
+        http_methods_to_handlers = dict(self._http_methods_to_handlers)
+        for http_method, handler_wrappers in self._http_methods_to_handler_wrappers.items():
+            if http_method not in http_methods_to_handlers:
+                raise HandlerNotFoundException(
+                    "Cannot wrap a handler for method {m} without a handler registered".format(m=http_method))
+            for handler_wrapper in handler_wrappers:
+                http_methods_to_handlers[http_method] = handler_wrapper(http_methods_to_handlers[http_method])
+        return http_methods_to_handlers
 
     def _get_or_build_next_node(self, uri_components):
         next_component = uri_components[0]
         if RouteTeeBuilder._is_pattern_component(next_component):
             if self._pattern_route_builder.is_empty():
-                self._pattern_route_builder = Optional.of(PatternRouteBuilder(next_component[1:-1], RouteTeeBuilder()))
+                self._pattern_route_builder = Optional.of(PatternRouteBuilder(
+                    next_component[1:-1],
+                    RouteTeeBuilder(self._create_sub_route_template(next_component))))
             return self._pattern_route_builder.get().pattern_route_node_builder
 
         if next_component not in self._sub_routes_to_node_builders:
-            self._sub_routes_to_node_builders[next_component] = RouteTeeBuilder()
+            self._sub_routes_to_node_builders[next_component] = \
+                RouteTeeBuilder(self._create_sub_route_template(next_component))
         return self._sub_routes_to_node_builders[next_component]
 
+    def _create_sub_route_template(self, uri_component):
+        return self._route_template.rstrip("/") + "/" + uri_component
+
     @staticmethod
     def _is_pattern_component(uri_component):
         return uri_component.startswith("{") and uri_component.endswith("}")
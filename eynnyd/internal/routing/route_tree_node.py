@@ -1,3 +1,5 @@
+from optional import Optional
+
 from eynnyd.exceptions import HandlerNotFoundException
 
 
@@ -9,21 +11,47 @@ class RouteTreeNode:
             response_interceptors,
             http_methods_to_handlers,
             sub_routes_to_nodes,
-            pattern_route):
+            pattern_route,
+            bulkheads=(),
+            http_methods_to_bulkheads=None,
+            priority=Optional.empty(),
+            http_methods_to_priorities=None,
+            deadline_seconds=Optional.empty(),
+            http_methods_to_deadline_seconds=None,
+            http_methods_to_routes=None):
         self._request_interceptors = request_interceptors
         self._response_interceptors = response_interceptors
         self._http_methods_to_handlers = http_methods_to_handlers
         self._sub_routes_to_nodes = sub_routes_to_nodes
         self._pattern_route = pattern_route
+        self._bulkheads = bulkheads
+        self._http_methods_to_bulkheads = http_methods_to_bulkheads if http_methods_to_bulkheads else {}
+        self._priority = priority
+        self._http_methods_to_priorities = http_methods_to_priorities if http_methods_to_priorities else {}
+        self._deadline_seconds = deadline_seconds
+        self._http_methods_to_deadline_seconds = \
+            http_methods_to_deadline_seconds if http_methods_to_deadline_seconds else {}
+        self._http_methods_to_routes = http_methods_to_routes if http_methods_to_routes else {}
 
     def create_execution_plan(self, execution_plan_builder, uri_components, http_method):
         execution_plan_builder \
             .add_request_interceptors(self._request_interceptors) \
-            .add_response_interceptors(self._response_interceptors)
+            .add_response_interceptors(self._response_interceptors) \
+            .add_bulkheads(self._bulkheads)
+        self._priority.if_present(execution_plan_builder.set_priority)
+        self._deadline_seconds.if_present(execution_plan_builder.set_deadline_seconds)
 
         if len(uri_components) == 0:
             if http_method in self._http_methods_to_handlers:
-                return execution_plan_builder.set_handler(self._http_methods_to_handlers.get(http_method)).build()
+                if http_method in self._http_methods_to_priorities:
+                    execution_plan_builder.set_priority(self._http_methods_to_priorities[http_method])
+                if http_method in self._http_methods_to_deadline_seconds:
+                    execution_plan_builder.set_deadline_seconds(self._http_methods_to_deadline_seconds[http_method])
+                return execution_plan_builder\
+                    .add_bulkheads(self._http_methods_to_bulkheads.get(http_method, ()))\
+                    .set_handler(self._http_methods_to_handlers.get(http_method))\
+                    .set_route(self._http_methods_to_routes.get(http_method))\
+                    .build()
             raise HandlerNotFoundException("No handler found for method {m}".format(m=http_method))
 
         if uri_components[0] in self._sub_routes_to_nodes:
@@ -0,0 +1,90 @@
+import asyncio
+
+from eynnyd.internal.utils.perf_counter_ns import perf_counter_ns
+from eynnyd.internal.eynnyd_webapp import EynnydWebapp
+from eynnyd.internal.phase_timing.phase_timings import PhaseTimings
+from eynnyd.internal.plan_execution.timed_async_plan_executor import TimedAsyncPlanExecutor
+from eynnyd.internal.plan_execution.timed_plan_executor import TimedPlanExecutor
+from eynnyd.internal.routing.route_tree_traverser import RouteTreeTraverser
+from eynnyd.internal.wsgi_loaded_request import WSGILoadedRequest
+
+
+class TimedEynnydWebapp(EynnydWebapp):
+
+    def __init__(
+            self,
+            phase_timings,
+            route_tree,
+            error_handlers,
+            stream_block_size,
+            maximum_stream_block_size=None,
+            load_shedder=None,
+            honor_deadline_headers=False,
+            background_task_runner=None):
+        super().__init__(
+            route_tree,
+            error_handlers,
+            stream_block_size,
+            maximum_stream_block_size,
+            load_shedder,
+            honor_deadline_headers,
+            background_task_runner)
+        self._phase_timings = phase_timings
+        self._plan_executor = TimedPlanExecutor(self._error_handlers, phase_timings)
+        self._async_plan_executor = TimedAsyncPlanExecutor(self._error_handlers, phase_timings)
+
+    def _wsgi_input_to_wsgi_output(self, wsgi_environment):  # pragma: no cover
+        wsgi_loaded_request = WSGILoadedRequest(wsgi_environment)
+        response, route = self._process_request_to_response_and_route(wsgi_loaded_request)
+        return self._timed_process_response_to_wsgi_output(
+            route,
+            wsgi_loaded_request,
+            response,
+            wsgi_environment.get("wsgi.file_wrapper"))
+
+    def process_request_to_response(self, wsgi_loaded_request):
+        return self._process_request_to_response_and_route(wsgi_loaded_request)[0]
+
+    async def process_request_to_wsgi_output_async(self, loaded_request, executor=None):
+        response, route = await self._process_request_to_response_and_route_async(loaded_request, executor)
+        return await asyncio.get_event_loop().run_in_executor(
+            executor,
+            self._timed_process_response_to_wsgi_output,
+            route,
+            loaded_request,
+            response)
+
+    async def process_request_to_response_async(self, loaded_request, executor=None):
+        return (await self._process_request_to_response_and_route_async(loaded_request, executor))[0]
+
+    def _process_request_to_response_and_route(self, request):
+        try:
+            execution_plan = self._timed_traverse(request)
+        except Exception as e:
+            return self._error_handlers.handle_pre_response_error(e, request), None
+
+        return self._execute_plan(execution_plan, request), execution_plan.route
+
+    async def _process_request_to_response_and_route_async(self, request, executor):
+        try:
+            execution_plan = self._timed_traverse(request)
+        except Exception as e:
+            return self._error_handlers.handle_pre_response_error(e, request), None
+
+        return await self._execute_plan_async(execution_plan, request, executor), execution_plan.route
+
+    def _timed_traverse(self, request):
+        started_ns = perf_counter_ns()
+        execution_plan = RouteTreeTraverser.traverse(self._route_tree, request.http_method, request.request_uri.path)
+        self._phase_timings.record(execution_plan.route, PhaseTimings.ROUTING, perf_counter_ns() - started_ns)
+        return execution_plan
+
+    def _timed_process_response_to_wsgi_output(self, route, request, response, wsgi_file_wrapper=None):
+        if route is None:
+            return self.process_response_to_wsgi_output(request, response, wsgi_file_wrapper)
+
+        started_ns = perf_counter_ns()
+        try:
+            return self.process_response_to_wsgi_output(request, response, wsgi_file_wrapper)
+        finally:
+            self._phase_timings.record(route, PhaseTimings.ADAPTATION, perf_counter_ns() - started_ns)
@@ -0,0 +1,54 @@
+
+class ByteRangeParser:
+
+    _BYTES_UNIT = "bytes="
+
+    @staticmethod
+    def parse(range_header, content_length):
+        if not range_header.startswith(ByteRangeParser._BYTES_UNIT):
+            return None
+
+        byte_ranges = []
+        for range_specifier in range_header[len(ByteRangeParser._BYTES_UNIT):].split(","):
+            first, separator, last = range_specifier.strip().partition("-")
+            if not separator:
+                return None
+            try:
+                byte_range = ByteRangeParser._to_byte_range(first.strip(), last.strip(), content_length)
+            except ValueError:
+                return None
+            if byte_range is not None:
+                byte_ranges.append(byte_range)
+        return ByteRangeParser._coalesce(byte_ranges)
+
+    @staticmethod
+    def _to_byte_range(first, last, content_length):
+        if not first:
+            suffix_length = ByteRangeParser._to_non_negative_int(last)
+            if suffix_length == 0 or content_length == 0:
+                return None
+            return max(content_length - suffix_length, 0), content_length - 1
+
+        start = ByteRangeParser._to_non_negative_int(first)
+        end = content_length - 1 if not last else ByteRangeParser._to_non_negative_int(last)
+        if end < start:
+            raise ValueError("Range end {e} is before its start {s}".format(e=end, s=start))
+        if start >= content_length:
+            return None
+        return start, min(end, content_length - 1)
+
+    @staticmethod
+    def _to_non_negative_int(value):
+        if not value.isdigit():
+            raise ValueError("Range value {v} is not a non negative integer".format(v=value))
+        return int(value)
+
+    @staticmethod
+    def _coalesce(byte_ranges):
+        coalesced_ranges = []
+        for start, end in sorted(byte_ranges):
+            if coalesced_ranges and start <= coalesced_ranges[-1][1] + 1:
+                coalesced_ranges[-1] = (coalesced_ranges[-1][0], max(end, coalesced_ranges[-1][1]))
+            else:
+                coalesced_ranges.append((start, end))
+        return coalesced_ranges
@@ -0,0 +1,75 @@
+import datetime
+import email.utils
+
+from eynnyd.internal.utils.header_helpers import HeaderSplitter, RequestHeaderReader
+
+
+class ConditionalRequestEvaluator:
+
+    _CONDITIONAL_METHODS = frozenset(["GET", "HEAD"])
+
+    @staticmethod
+    def is_not_modified(request, etag, last_modified):
+        if request.http_method not in ConditionalRequestEvaluator._CONDITIONAL_METHODS:
+            return False
+
+        if_none_match = RequestHeaderReader.get(request.headers, "if-none-match")
+        if if_none_match is not None:
+            return etag is not None and ConditionalRequestEvaluator._etag_matches(if_none_match, etag)
+
+        if_modified_since = RequestHeaderReader.get(request.headers, "if-modified-since")
+        if if_modified_since is not None and last_modified is not None:
+            return ConditionalRequestEvaluator._is_unmodified_since(if_modified_since, last_modified)
+
+        return False
+
+    @staticmethod
+    def format_etag(etag):
+        if etag.startswith('"') or etag.startswith('W/"'):
+            return etag
+        return '"' + etag + '"'
+
+    @staticmethod
+    def format_http_date(value):
+        if isinstance(value, datetime.datetime):
+            if value.tzinfo is None:
+                value = value.replace(tzinfo=datetime.timezone.utc)
+            return email.utils.format_datetime(value.astimezone(datetime.timezone.utc), usegmt=True)
+        return str(value)
+
+    @staticmethod
+    def _etag_matches(if_none_match, etag):
+        if if_none_match.strip() == "*":
+            return True
+        opaque_etag = ConditionalRequestEvaluator._strip_weakness(etag)
+        for candidate_etag in HeaderSplitter.split_to_values(if_none_match):
+            if ConditionalRequestEvaluator._strip_weakness(candidate_etag) == opaque_etag:
+                return True
+        return False
+
+    @staticmethod
+    def _strip_weakness(etag):
+        if etag.startswith("W/"):
+            return etag[2:]
+        return etag
+
+    @staticmethod
+    def _is_unmodified_since(if_modified_since, last_modified):
+        if_modified_since_date = ConditionalRequestEvaluator._parse_http_date(if_modified_since)
+        last_modified_date = ConditionalRequestEvaluator._parse_http_date(
+            ConditionalRequestEvaluator.format_http_date(last_modified))
+        if if_modified_since_date is None or last_modified_date is None:
+            return False
+        return last_modified_date <= if_modified_since_date
+
+    @staticmethod
+    def _parse_http_date(value):
+        try:
+            parsed_date = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError, IndexError):
+            return None
+        if parsed_date is None:
+            return None
+        if parsed_date.tzinfo is None:
+            return parsed_date.replace(tzinfo=datetime.timezone.utc)
+        return parsed_date
@@ -0,0 +1,23 @@
+import time
+
+
+class Deadline:
+
+    def __init__(self, expires_at, clock=time.monotonic):
+        self._expires_at = expires_at
+        self._clock = clock
+
+    @property
+    def expires_at(self):
+        return self._expires_at
+
+    @property
+    def remaining_seconds(self):
+        return max(0.0, self._expires_at - self._clock())
+
+    @property
+    def expired(self):
+        return self._clock() >= self._expires_at
+
+    def __str__(self):
+        return "<Deadline in {r:.3f}s>".format(r=self.remaining_seconds)
@@ -0,0 +1,38 @@
+import math
+import re
+import threading
+import time
+
+_GRPC_TIMEOUT = re.compile(r"(\d{1,8})([HMSmun])")
+_GRPC_TIMEOUT_UNIT_SECONDS = {"H": 3600.0, "M": 60.0, "S": 1.0, "m": 1e-3, "u": 1e-6, "n": 1e-9}
+# Longer budgets are capped as waiting on threads and futures overflows past this.
+_MAXIMUM_REMAINING_SECONDS = threading.TIMEOUT_MAX
+
+
+class DeadlineHeaderParser:
+
+    @staticmethod
+    def parse_remaining_seconds(headers, wall_clock=time.time):
+        remaining_seconds = None
+
+        grpc_timeout = headers.get("GRPC-TIMEOUT")
+        if grpc_timeout is not None:
+            match = _GRPC_TIMEOUT.fullmatch(grpc_timeout.strip())
+            if match:
+                remaining_seconds = int(match.group(1)) * _GRPC_TIMEOUT_UNIT_SECONDS[match.group(2)]
+
+        request_deadline = headers.get("X-REQUEST-DEADLINE")
+        if request_deadline is not None:
+            try:
+                deadline_remaining_seconds = float(request_deadline) - wall_clock()
+            except ValueError:
+                deadline_remaining_seconds = None
+            if deadline_remaining_seconds is not None and not math.isfinite(deadline_remaining_seconds):
+                deadline_remaining_seconds = None
+            if deadline_remaining_seconds is not None and \
+                    (remaining_seconds is None or deadline_remaining_seconds < remaining_seconds):
+                remaining_seconds = deadline_remaining_seconds
+
+        if remaining_seconds is None:
+            return None
+        return min(remaining_seconds, _MAXIMUM_REMAINING_SECONDS)
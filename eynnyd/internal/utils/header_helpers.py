@@ -1,3 +1,4 @@
+import functools
 
 
 class HeaderSplitter:
@@ -19,3 +20,56 @@ class HeaderSplitter:
                 kv[k.strip()] = []
             kv[k.strip()].append(v.strip())
         return kv
+
+    @staticmethod
+    def split_to_values(header_content):
+        return [token.strip() for token in header_content.split(",") if token.strip()]
+
+    @staticmethod
+    def split_to_quality_values(header_content):
+        quality_values = {}
+        for token in HeaderSplitter.split_to_values(header_content):
+            value, _, parameters = token.partition(";")
+            quality = 1.0
+            parameter_name, _, parameter_value = parameters.partition("=")
+            if parameter_name.strip().lower() == "q":
+                try:
+                    quality = float(parameter_value.strip())
+                except ValueError:
+                    continue
+            quality_values[value.strip().lower()] = quality
+        return quality_values
+
+
+class RequestHeaderReader:
+
+    @staticmethod
+    def get(headers, name, default=None):
+        upper_name = name.upper()
+        if upper_name in headers:
+            return headers[upper_name]
+        lower_name = name.lower()
+        for header_name, header_value in headers.items():
+            if header_name.lower() == lower_name:
+                return header_value
+        return default
+
+
+class HeaderNameFormatter:
+
+    _SPECIAL_CASED_NAMES = {
+        "content-md5": "Content-MD5",
+        "dnt": "DNT",
+        "etag": "ETag",
+        "te": "TE",
+        "www-authenticate": "WWW-Authenticate",
+        "x-xss-protection": "X-XSS-Protection"
+    }
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def canonicalize(name):
+        lowered_name = name.lower()
+        if lowered_name in HeaderNameFormatter._SPECIAL_CASED_NAMES:
+            return HeaderNameFormatter._SPECIAL_CASED_NAMES[lowered_name]
+        return "-".join(part.capitalize() for part in lowered_name.split("-"))
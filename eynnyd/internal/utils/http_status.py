@@ -5,6 +5,7 @@ class HTTPStatus:
         self._code = code
         self._phrase = phrase
         self._description = description
+        self._wsgi_format = "{c} {p}".format(c=code, p=phrase)
 
     @property
     def code(self):
@@ -20,10 +21,10 @@ class HTTPStatus:
 
     @property
     def wsgi_format(self):
-        return str(self)
+        return self._wsgi_format
 
     def __str__(self):
-        return "{c} {p}".format(c=self._code, p=self._phrase)
+        return self._wsgi_format
 
     def __hash__(self):
         return hash(self._code)
@@ -0,0 +1,14 @@
+from eynnyd.internal.response_body_type import ResponseBodyType
+
+
+class InMemoryBodyReader:
+
+    _IN_MEMORY_BODY_TYPES = frozenset([ResponseBodyType.UTF8, ResponseBodyType.BYTE])
+
+    @staticmethod
+    def read(body):
+        if body.type in InMemoryBodyReader._IN_MEMORY_BODY_TYPES:
+            return body.content
+        if body.type == ResponseBodyType.JSON and not body.content.streamed:
+            return body.content.encoded
+        return None
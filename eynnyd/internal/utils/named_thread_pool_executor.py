@@ -0,0 +1,9 @@
+from concurrent.futures import ThreadPoolExecutor
+
+
+def named_thread_pool_executor(maximum_workers, name):
+    try:
+        return ThreadPoolExecutor(max_workers=maximum_workers, thread_name_prefix=name)
+    except TypeError:  # pragma: no cover
+        # thread_name_prefix only exists from Python 3.6.
+        return ThreadPoolExecutor(max_workers=maximum_workers)
@@ -0,0 +1,7 @@
+import time
+
+try:
+    from time import perf_counter_ns
+except ImportError:  # pragma: no cover
+    def perf_counter_ns():
+        return int(time.perf_counter() * 1e9)
@@ -0,0 +1,15 @@
+import urllib.parse
+
+
+class QueryParametersParser:
+
+    @staticmethod
+    def parse(query_string):
+        parsed_params = urllib.parse.parse_qs(query_string)
+        unquoted_parsed_params = {}
+        for param_name, param_values in parsed_params.items():
+            unquoted_name = urllib.parse.unquote(param_name)
+            unquoted_parsed_params[unquoted_name] = []
+            for param_value in param_values:
+                unquoted_parsed_params[unquoted_name].append(urllib.parse.unquote(param_value))
+        return unquoted_parsed_params
@@ -0,0 +1,40 @@
+import threading
+import time
+
+from eynnyd.internal.utils.token_bucket import TokenBucket
+
+
+class RateLimitedLogger:
+
+    def __init__(self, logger, messages_per_second, burst):
+        self._logger = logger
+        self._messages_per_second = messages_per_second
+        self._burst = burst
+        self._lock = threading.Lock()
+        self._token_buckets_by_key = {}
+        self._suppressed_counts_by_key = {}
+
+    def log(self, level, key, message, *args, exc_info=None, extra=None):
+        if not self._logger.isEnabledFor(level):
+            return
+
+        suppressed_count = self._acquire(key)
+        if suppressed_count is None:
+            return
+        if suppressed_count:
+            message += " (%d similar messages suppressed)"
+            args += (suppressed_count,)
+        self._logger.log(level, message, *args, exc_info=exc_info, extra=extra)
+
+    def _acquire(self, key):
+        now = time.monotonic()
+        with self._lock:
+            token_bucket = self._token_buckets_by_key.get(key)
+            if token_bucket is None:
+                token_bucket = TokenBucket(self._messages_per_second, self._burst, now)
+                self._token_buckets_by_key[key] = token_bucket
+
+            if not token_bucket.try_acquire(now):
+                self._suppressed_counts_by_key[key] = self._suppressed_counts_by_key.get(key, 0) + 1
+                return None
+            return self._suppressed_counts_by_key.pop(key, 0)
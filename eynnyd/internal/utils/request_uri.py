@@ -21,25 +21,60 @@ class RequestURI:
 
     @staticmethod
     def forwarded_from_wsgi_environment(wsgi_environment):
-        scheme = wsgi_environment.get("wsgi.url_scheme")
-        host = wsgi_environment.get("SERVER_NAME")
-        if "HTTP_FORWARDED" in wsgi_environment:
-            forwarded_kv = HeaderSplitter.split_to_kv(wsgi_environment.get("HTTP_FORWARDED"))
+        return RequestURI._forwarded(
+            wsgi_environment.get("wsgi.url_scheme"),
+            wsgi_environment.get("SERVER_NAME"),
+            wsgi_environment.get("SERVER_PORT"),
+            wsgi_environment.get("PATH_INFO"),
+            wsgi_environment.get("QUERY_STRING"),
+            wsgi_environment.get("HTTP_FORWARDED"),
+            wsgi_environment.get("HTTP_X_FORWARDED_PROTO"),
+            wsgi_environment.get("HTTP_X_FORWARDED_HOST"))
+
+    @staticmethod
+    def from_asgi_scope(asgi_scope):
+        host, port = RequestURI._get_asgi_server(asgi_scope)
+        return RequestURI(
+            asgi_scope.get("scheme", "http"),
+            host,
+            port,
+            asgi_scope.get("path"),
+            asgi_scope.get("query_string", b"").decode("latin-1"))
+
+    @staticmethod
+    def forwarded_from_asgi_scope(asgi_scope, headers):
+        host, port = RequestURI._get_asgi_server(asgi_scope)
+        return RequestURI._forwarded(
+            asgi_scope.get("scheme", "http"),
+            host,
+            port,
+            asgi_scope.get("path"),
+            asgi_scope.get("query_string", b"").decode("latin-1"),
+            headers.get("FORWARDED"),
+            headers.get("X-FORWARDED-PROTO"),
+            headers.get("X-FORWARDED-HOST"))
+
+    @staticmethod
+    def _get_asgi_server(asgi_scope):
+        server = asgi_scope.get("server")
+        if not server:
+            return None, None
+        return server[0], server[1]
+
+    @staticmethod
+    def _forwarded(scheme, host, port, path, query, forwarded, x_forwarded_proto, x_forwarded_host):
+        if forwarded is not None:
+            forwarded_kv = HeaderSplitter.split_to_kv(forwarded)
             if "proto" in forwarded_kv:
                 scheme = forwarded_kv["proto"]
             if "host" in forwarded_kv:
                 host = forwarded_kv["host"]
         else:
-            if "HTTP_X_FORWARDED_PROTO" in wsgi_environment:
-                scheme = wsgi_environment.get("HTTP_X_FORWARDED_PROTO")
-            if "HTTP_X_FORWARDED_HOST" in wsgi_environment:
-                host = wsgi_environment.get("HTTP_X_FORWARDED_HOST")
-        return RequestURI(
-            scheme,
-            host,
-            wsgi_environment.get("SERVER_PORT"),
-            wsgi_environment.get("PATH_INFO"),
-            wsgi_environment.get("QUERY_STRING"))
+            if x_forwarded_proto is not None:
+                scheme = x_forwarded_proto
+            if x_forwarded_host is not None:
+                host = x_forwarded_host
+        return RequestURI(scheme, host, port, path, query)
 
     @property
     def scheme(self):
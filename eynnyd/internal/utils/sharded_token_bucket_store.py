@@ -0,0 +1,31 @@
+import threading
+from collections import OrderedDict
+
+from eynnyd.abstract_rate_limit_store import AbstractRateLimitStore
+from eynnyd.internal.utils.token_bucket import TokenBucket
+
+
+class ShardedTokenBucketStore(AbstractRateLimitStore):
+
+    def __init__(self, shard_count, maximum_keys_per_shard):
+        self._shards = tuple((threading.Lock(), OrderedDict()) for _ in range(shard_count))
+        self._maximum_keys_per_shard = maximum_keys_per_shard
+
+    def acquire(self, key, tokens_per_second, capacity, now):
+        lock, buckets_by_key = self._shards[hash(key) % len(self._shards)]
+        with lock:
+            bucket = buckets_by_key.get(key)
+            if bucket is None:
+                bucket = TokenBucket(tokens_per_second, capacity, now)
+                buckets_by_key[key] = bucket
+                if len(buckets_by_key) > self._maximum_keys_per_shard:
+                    buckets_by_key.popitem(last=False)
+            else:
+                buckets_by_key.move_to_end(key)
+
+            if bucket.try_acquire(now):
+                return 0
+            return bucket.seconds_until_available(now)
+
+    def __len__(self):
+        return sum(len(buckets_by_key) for _, buckets_by_key in self._shards)
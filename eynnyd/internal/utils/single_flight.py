@@ -0,0 +1,67 @@
+import asyncio
+import threading
+from concurrent.futures import Future, TimeoutError
+
+
+class SingleFlight:
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._futures_by_key = {}
+
+    def is_in_flight(self, key):
+        return key in self._futures_by_key
+
+    def execute(self, key, function, timeout_seconds):
+        future, is_leader = self._join(key)
+
+        if not is_leader:
+            try:
+                return future.result(timeout_seconds), False
+            except TimeoutError:
+                return function(), True
+
+        try:
+            result = function()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result, True
+        finally:
+            self._leave(key)
+
+    async def execute_async(self, key, coroutine_function, timeout_seconds):
+        future, is_leader = self._join(key)
+
+        if not is_leader:
+            try:
+                # Shielded so a waiter giving up does not cancel the result other callers are waiting on.
+                return await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(future)), timeout_seconds), False
+            except asyncio.TimeoutError:
+                return await coroutine_function(), True
+
+        try:
+            result = await coroutine_function()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result, True
+        finally:
+            self._leave(key)
+
+    def _join(self, key):
+        with self._lock:
+            future = self._futures_by_key.get(key)
+            if future is not None:
+                return future, False
+            future = Future()
+            self._futures_by_key[key] = future
+            return future, True
+
+    def _leave(self, key):
+        with self._lock:
+            del self._futures_by_key[key]
@@ -0,0 +1,10 @@
+import asyncio
+
+
+async def await_thread_future(future):
+    # Work already running on a thread cannot be stopped, so a cancelled wait only ends once the thread is done.
+    try:
+        return await asyncio.shield(future)
+    except asyncio.CancelledError:
+        await asyncio.wait([future])
+        raise
@@ -0,0 +1,31 @@
+
+class TokenBucket:
+
+    def __init__(self, tokens_per_second, capacity, now):
+        self._tokens_per_second = tokens_per_second
+        self._capacity = capacity
+        self._tokens = capacity
+        self._last_refill = now
+
+    @property
+    def tokens(self):
+        return self._tokens
+
+    def try_acquire(self, now):
+        self._refill(now)
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    def seconds_until_available(self, now):
+        self._refill(now)
+        if self._tokens >= 1:
+            return 0.0
+        return (1 - self._tokens) / self._tokens_per_second
+
+    def _refill(self, now):
+        elapsed = now - self._last_refill
+        if elapsed > 0:
+            self._tokens = min(self._capacity, self._tokens + elapsed * self._tokens_per_second)
+            self._last_refill = now
@@ -0,0 +1,25 @@
+
+class BackgroundTasksIterator:
+
+    def __init__(self, body, background_tasks, background_task_runner):
+        self._body = body
+        self._body_iterator = iter(body)
+        self._background_tasks = background_tasks
+        self._background_task_runner = background_task_runner
+        self._closed = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self._body_iterator)
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            if hasattr(self._body, "close"):
+                self._body.close()
+        finally:
+            self._background_task_runner.run(self._background_tasks)
@@ -0,0 +1,24 @@
+
+class BoundedStream:
+
+    def __init__(self, stream, length):
+        self._stream = stream
+        self._remaining = length
+
+    def read(self, size):
+        if self._remaining <= 0:
+            return b""
+        if size is None or size < 0 or size > self._remaining:
+            size = self._remaining
+        data = self._stream.read(size)
+        self._remaining -= len(data)
+        return data
+
+    def fileno(self):
+        return self._stream.fileno()
+
+    def close(self):
+        try:
+            self._stream.close()
+        except (AttributeError, TypeError):
+            pass
@@ -1,9 +1,10 @@
 
 class CloseableStreamIterator:
 
-    def __init__(self, stream, block_size):
+    def __init__(self, stream, block_size, maximum_block_size=None):
         self._stream = stream
         self._block_size = block_size
+        self._maximum_block_size = block_size if maximum_block_size is None else maximum_block_size
 
     def __iter__(self):
         return self
@@ -13,6 +14,8 @@ class CloseableStreamIterator:
 
         if data == b'':
             raise StopIteration
+        if len(data) == self._block_size and self._block_size < self._maximum_block_size:
+            self._block_size = min(self._block_size * 2, self._maximum_block_size)
         return data
 
     def close(self):
@@ -0,0 +1,54 @@
+import codecs
+import time
+
+
+class CoalescingIterator:
+
+    DEFAULT_THRESHOLD = 64 * 1024
+
+    def __init__(self, chunks, threshold=DEFAULT_THRESHOLD, time_budget=None, encoding="utf-8"):
+        self._chunks = chunks
+        self._chunk_iterator = iter(chunks)
+        self._threshold = threshold
+        self._time_budget = time_budget
+        # One encoder for the whole body so stateful encodings (ex. a utf-16 byte order mark) span chunks.
+        self._encoder = codecs.getincrementalencoder(encoding)()
+        self._finished = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._finished:
+            raise StopIteration
+
+        pending_chunks = []
+        pending_size = 0
+        deadline = None
+        for chunk in self._chunk_iterator:
+            if isinstance(chunk, str):
+                chunk = self._encoder.encode(chunk)
+            pending_chunks.append(chunk)
+            pending_size += len(chunk)
+            if pending_size >= self._threshold:
+                break
+            if self._time_budget is not None:
+                now = time.monotonic()
+                if deadline is None:
+                    deadline = now + self._time_budget
+                elif now >= deadline:
+                    break
+        else:
+            self._finished = True
+            pending_chunks.append(self._encoder.encode("", True))
+
+        batch = b"".join(pending_chunks)
+        if not batch:
+            raise StopIteration
+        return batch
+
+    def close(self):
+        try:
+            self._chunks.close()
+        except (AttributeError, TypeError):
+            pass
@@ -0,0 +1,30 @@
+
+class CompressingIterator:
+
+    def __init__(self, chunks, compressor):
+        self._chunks = chunks
+        self._chunk_iterator = iter(chunks)
+        self._compressor = compressor
+        self._finished = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        while not self._finished:
+            try:
+                chunk = next(self._chunk_iterator)
+            except StopIteration:
+                self._finished = True
+                return self._compressor.flush()
+
+            compressed_chunk = self._compressor.compress(chunk)
+            if compressed_chunk:
+                return compressed_chunk
+        raise StopIteration
+
+    def close(self):
+        try:
+            self._chunks.close()
+        except (AttributeError, TypeError):
+            pass
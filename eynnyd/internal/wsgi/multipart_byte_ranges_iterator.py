@@ -0,0 +1,36 @@
+
+class MultipartByteRangesIterator:
+
+    def __init__(self, stream, start_position, parts, closing_delimiter, block_size):
+        self._stream = stream
+        self._start_position = start_position
+        self._parts = parts
+        self._closing_delimiter = closing_delimiter
+        self._block_size = block_size
+        self._chunks = self._generate_chunks()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self._chunks)
+
+    def close(self):
+        self._chunks.close()
+        try:
+            self._stream.close()
+        except (AttributeError, TypeError):
+            pass
+
+    def _generate_chunks(self):
+        for part_header, (start, end) in self._parts:
+            yield part_header
+            self._stream.seek(self._start_position + start)
+            remaining = end - start + 1
+            while remaining > 0:
+                data = self._stream.read(min(self._block_size, remaining))
+                if not data:
+                    return
+                remaining -= len(data)
+                yield data
+        yield self._closing_delimiter
@@ -5,11 +5,12 @@ from eynnyd.internal.utils.http_status_factory import HTTPStatusFactory
 
 class RawWSGIServerErrorResponse:
 
+    _STATUS = HTTPStatusFactory.create(HTTPStatus.INTERNAL_SERVER_ERROR).wsgi_format
+    _BODY = "500 Internal Server Error".encode("utf-8")
+
     @property
     def status(self):
-        return HTTPStatusFactory\
-            .create(HTTPStatus.INTERNAL_SERVER_ERROR)\
-            .wsgi_format
+        return RawWSGIServerErrorResponse._STATUS
 
     @property
     def headers(self):
@@ -17,4 +18,4 @@ class RawWSGIServerErrorResponse:
 
     @property
     def body(self):
-        return ["500 Internal Server Error".encode("utf-8")]
\ No newline at end of file
+        return [RawWSGIServerErrorResponse._BODY]
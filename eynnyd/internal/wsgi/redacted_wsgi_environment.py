@@ -0,0 +1,34 @@
+
+class RedactedWSGIEnvironment:
+
+    _REDACTED = "[redacted]"
+    _MAXIMUM_VALUE_LENGTH = 256
+    _SENSITIVE_NAMES = frozenset([
+        "HTTP_AUTHORIZATION",
+        "HTTP_PROXY_AUTHORIZATION",
+        "HTTP_COOKIE",
+        "HTTP_X_API_KEY",
+        "HTTP_X_AUTH_TOKEN",
+        "HTTP_X_CSRF_TOKEN",
+        "HTTP_X_XSRF_TOKEN"])
+
+    def __init__(self, wsgi_environment):
+        self._wsgi_environment = wsgi_environment
+
+    def __str__(self):
+        return str(self.redact())
+
+    def redact(self):
+        return {
+            name: RedactedWSGIEnvironment._redact_value(name, value)
+            for name, value in self._wsgi_environment.items()
+            if isinstance(value, (str, bytes, int, float, bool, tuple)) or value is None}
+
+    @staticmethod
+    def _redact_value(name, value):
+        if name in RedactedWSGIEnvironment._SENSITIVE_NAMES:
+            return RedactedWSGIEnvironment._REDACTED
+        if isinstance(value, (str, bytes)) and len(value) > RedactedWSGIEnvironment._MAXIMUM_VALUE_LENGTH:
+            return value[:RedactedWSGIEnvironment._MAXIMUM_VALUE_LENGTH] + \
+                ("..." if isinstance(value, str) else b"...")
+        return value
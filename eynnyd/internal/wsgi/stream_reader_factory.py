@@ -1,10 +1,14 @@
+import functools
+
 from eynnyd.internal.wsgi.closeable_stream_iterator import CloseableStreamIterator
 
 
 class StreamReaderFactory:
 
     @staticmethod
-    def create_reader(wsgi_file_wrapper):
-        if wsgi_file_wrapper is None:
+    def create_reader(wsgi_file_wrapper, maximum_block_size=None):
+        if wsgi_file_wrapper is not None:
+            return wsgi_file_wrapper
+        if maximum_block_size is None:
             return CloseableStreamIterator
-        return wsgi_file_wrapper
\ No newline at end of file
+        return functools.partial(CloseableStreamIterator, maximum_block_size=maximum_block_size)
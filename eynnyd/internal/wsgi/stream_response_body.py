@@ -3,11 +3,12 @@ from eynnyd.internal.wsgi.abstract_response_body import AbstractResponseBody
 
 class StreamResponseBody(AbstractResponseBody):
 
-    _STREAM_BLOCK_SIZE = 8 * 1024
+    DEFAULT_BLOCK_SIZE = 8 * 1024
 
-    def __init__(self, body, reader):
+    def __init__(self, body, reader, block_size=DEFAULT_BLOCK_SIZE):
         self._reader = reader
         self._body = body
+        self._block_size = block_size
 
     def get_body(self):
-        return self._reader(self._body, StreamResponseBody._STREAM_BLOCK_SIZE)
\ No newline at end of file
+        return self._reader(self._body, self._block_size)
@@ -7,4 +7,6 @@ class UTF8ResponseBody(AbstractResponseBody):
         self._body = body
 
     def get_body(self):
+        if isinstance(self._body, (bytearray, memoryview)):
+            return [bytes(self._body)]
         return [self._body]
\ No newline at end of file
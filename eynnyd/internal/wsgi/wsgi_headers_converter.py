@@ -0,0 +1,17 @@
+from eynnyd.internal.response_body_type import ResponseBodyType
+from eynnyd.internal.utils.cookies.header_converter import CookieHeaderConverter
+from eynnyd.internal.utils.header_helpers import HeaderNameFormatter
+
+
+class WSGIHeadersConverter:
+
+    @staticmethod
+    def from_response(response):
+        headers = [
+            (HeaderNameFormatter.canonicalize(str(name)), str(value)) for name, value in response.headers.items()]
+        if response.body.type == ResponseBodyType.JSON and \
+                not response.body.content.streamed and \
+                "content-length" not in response.headers:
+            headers.append(("Content-Length", str(len(response.body.content.encoded))))
+        headers.extend(CookieHeaderConverter.from_cookie(cookie) for cookie in response.cookies)
+        return tuple(headers)
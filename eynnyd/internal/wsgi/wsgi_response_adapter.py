@@ -1,19 +1,29 @@
+from eynnyd.internal.response import Response
+from eynnyd.internal.prebuilt_response import PrebuiltResponse
 from eynnyd.internal.wsgi.wsgi_response import WSGIResponse
-from eynnyd.internal.utils.cookies.header_converter import CookieHeaderConverter
+from eynnyd.internal.wsgi.wsgi_headers_converter import WSGIHeadersConverter
+from eynnyd.internal.wsgi.stream_response_body import StreamResponseBody
 from eynnyd.internal.wsgi.wsgi_response_body_factory import WSGIResponseBodyFactory
 
 
 class WSGIResponseAdapter:
 
-    def __init__(self, stream_reader):
+    def __init__(self, stream_reader, stream_block_size=StreamResponseBody.DEFAULT_BLOCK_SIZE):
         self._stream_reader = stream_reader
+        self._stream_block_size = stream_block_size
 
     def adapt(self, response):
-        headers = [(str(k), str(v)) for k, v in response.headers.items()]
-        headers += [CookieHeaderConverter.from_cookie(cookie) for cookie in response.cookies]
+        if isinstance(response, PrebuiltResponse):
+            return WSGIResponse(response.status.wsgi_format, list(response.wsgi_headers), response.wsgi_body)
 
         return WSGIResponse(
             response.status.wsgi_format,
-            headers,
-            WSGIResponseBodyFactory(self._stream_reader).create(response.body).get_body())
+            list(WSGIResponseAdapter._get_wsgi_headers(response)),
+            WSGIResponseBodyFactory(self._stream_reader, self._stream_block_size).create(response.body).get_body())
+
+    @staticmethod
+    def _get_wsgi_headers(response):
+        if isinstance(response, Response):
+            return response.wsgi_headers
+        return WSGIHeadersConverter.from_response(response)
 
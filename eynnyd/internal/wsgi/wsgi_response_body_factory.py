@@ -9,8 +9,9 @@ from eynnyd.internal.wsgi.utf8_response_body import UTF8ResponseBody
 
 class WSGIResponseBodyFactory:
 
-    def __init__(self, reader):
+    def __init__(self, reader, stream_block_size=StreamResponseBody.DEFAULT_BLOCK_SIZE):
         self._reader = reader
+        self._stream_block_size = stream_block_size
 
     def create(self, body):
         if body.type == ResponseBodyType.EMPTY:
@@ -20,7 +21,14 @@ class WSGIResponseBodyFactory:
         if body.type == ResponseBodyType.BYTE:
             return ByteResponseBody(body.content)
         if body.type == ResponseBodyType.STREAM:
-            return StreamResponseBody(body.content, self._reader)
+            return StreamResponseBody(
+                body.content,
+                self._reader,
+                body.block_size.get_or_default(self._stream_block_size))
         if body.type == ResponseBodyType.ITERABLE:
             return IterableResponseBody(body.content)
+        if body.type == ResponseBodyType.JSON and body.content.streamed:
+            return IterableResponseBody(body.content.iter_encoded())
+        if body.type == ResponseBodyType.JSON:
+            return ByteResponseBody(body.content.encoded)
         raise UnknownResponseBodyTypeException("Unknown type for response body: {n}".format(n=body.type.name))
\ No newline at end of file
@@ -1,9 +1,11 @@
 import functools
-import urllib.parse
 import logging
 
+from optional import Optional
+
 from eynnyd.abstract_request import AbstractRequest
 from eynnyd.internal.utils.cookies.header_converter import CookieHeaderConverter
+from eynnyd.internal.utils.query_parameters_parser import QueryParametersParser
 from eynnyd.internal.utils.request_uri import RequestURI
 
 LOG = logging.getLogger("abstract_request")
@@ -11,12 +13,17 @@ LOG = logging.getLogger("abstract_request")
 
 class WSGILoadedRequest(AbstractRequest):
 
-    def __init__(self, wsgi_environment, path_parameters=None):
+    def __init__(self, wsgi_environment, path_parameters=None, deadline=None, route=None):
         self._wsgi_environment = wsgi_environment
         self._path_parameters = path_parameters if path_parameters else {}
+        self._deadline = deadline
+        self._route = route
+
+    def copy_and_set_path_parameters(self, path_parameters, route=None):
+        return WSGILoadedRequest(self._wsgi_environment, path_parameters, self._deadline, route)
 
-    def copy_and_set_path_parameters(self, path_parameters):
-        return WSGILoadedRequest(self._wsgi_environment, path_parameters)
+    def copy_and_set_deadline(self, deadline):
+        return WSGILoadedRequest(self._wsgi_environment, self._path_parameters, deadline, self._route)
 
     @property
     def http_method(self):
@@ -53,19 +60,20 @@ class WSGILoadedRequest(AbstractRequest):
     @property
     @functools.lru_cache()
     def query_parameters(self):
-        parsed_params = urllib.parse.parse_qs(self._wsgi_environment.get("QUERY_STRING"))
-        unquoted_parsed_params = {}
-        for param_name, param_values in parsed_params.items():
-            unquoted_name = urllib.parse.unquote(param_name)
-            unquoted_parsed_params[unquoted_name] = []
-            for param_value in param_values:
-                unquoted_parsed_params[unquoted_name].append(urllib.parse.unquote(param_value))
-        return unquoted_parsed_params
+        return QueryParametersParser.parse(self._wsgi_environment.get("QUERY_STRING"))
 
     @property
     def path_parameters(self):
         return self._path_parameters
 
+    @property
+    def route(self):
+        return Optional.of(self._route) if self._route is not None else Optional.empty()
+
+    @property
+    def deadline(self):
+        return Optional.of(self._deadline) if self._deadline is not None else Optional.empty()
+
     @property
     @functools.lru_cache()
     def byte_body(self):
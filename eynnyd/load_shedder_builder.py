@@ -0,0 +1,95 @@
+from eynnyd.exceptions import EynnydWebappBuildException
+from eynnyd.internal.plan_execution.load_shedder import LoadShedder
+
+
+class LoadShedderBuilder:
+    """
+    A builder for a load shedder, which turns away requests to low priority routes while the webapp is overloaded
+    so that critical routes keep answering quickly instead of every request slowing down.
+
+    The load shedder watches request latency in CoDel style: when even the fastest request of an interval took
+    longer than the target latency, requests are queueing and the webapp is overloaded.  It then limits how many
+    requests may be in flight, halving the limit (from the moving average of requests in flight) after each
+    overloaded interval and raising it by one after each good interval until it no longer binds.  Intervals in which
+    no request completed leave the limit as it is.  Routes with priority 0 are critical and never shed, routes with
+    priority 1 (the default) may use the whole limit, and higher numbered priorities a smaller share of it (priority
+    2 half, priority 3 a third, and so on).
+
+    Requests are shed after routing and before any interceptor runs, by raising a RequestShedException which by
+    default is answered with 503 Service Unavailable and a Retry-After header.  The built load shedder exposes a
+    metrics property with the requests in flight (now and as a moving average), a moving average of latency, the
+    concurrency limit (None when not limiting) and the number of requests shed.
+    """
+
+    def __init__(self):
+        self._target_latency_seconds = 0.1
+        self._interval_seconds = 1.0
+        self._maximum_in_flight = None
+        self._retry_after_seconds = 1
+
+    def set_target_latency_seconds(self, target_latency_seconds):
+        """
+        Sets the latency which the fastest request of an interval must stay under (default 0.1).  Latency is measured
+        from admission until the response is returned, so it includes the time spent in the handler and not only time
+        spent queueing.  Pick a little more than the full latency of the webapp's fast routes when not under load,
+        as an interval in which only slow routes complete otherwise looks overloaded.
+
+        :param target_latency_seconds: a positive number of seconds
+        :return: This builder to allow for fluent design.
+        """
+        if not isinstance(target_latency_seconds, (int, float)) or target_latency_seconds <= 0:
+            raise EynnydWebappBuildException(
+                "Target latency {t} must be a positive number.".format(t=target_latency_seconds))
+        self._target_latency_seconds = target_latency_seconds
+        return self
+
+    def set_interval_seconds(self, interval_seconds):
+        """
+        Sets how often latency is checked against the target and the concurrency limit adjusted (default 1).
+
+        :param interval_seconds: a positive number of seconds
+        :return: This builder to allow for fluent design.
+        """
+        if not isinstance(interval_seconds, (int, float)) or interval_seconds <= 0:
+            raise EynnydWebappBuildException(
+                "Interval {i} must be a positive number.".format(i=interval_seconds))
+        self._interval_seconds = interval_seconds
+        return self
+
+    def set_maximum_in_flight(self, maximum_in_flight):
+        """
+        Sets a limit on requests in flight which applies even when not overloaded (default unlimited).
+
+        :param maximum_in_flight: a positive number of requests
+        :return: This builder to allow for fluent design.
+        """
+        if not isinstance(maximum_in_flight, int) or maximum_in_flight < 1:
+            raise EynnydWebappBuildException(
+                "Maximum in flight {m} must be a positive integer.".format(m=maximum_in_flight))
+        self._maximum_in_flight = maximum_in_flight
+        return self
+
+    def set_retry_after_seconds(self, retry_after_seconds):
+        """
+        Sets the Retry-After header sent with shed requests (default 1).
+
+        :param retry_after_seconds: zero or a positive whole number of seconds
+        :return: This builder to allow for fluent design.
+        """
+        if not isinstance(retry_after_seconds, int) or retry_after_seconds < 0:
+            raise EynnydWebappBuildException(
+                "Retry after seconds {r} must be zero or a positive integer.".format(r=retry_after_seconds))
+        self._retry_after_seconds = retry_after_seconds
+        return self
+
+    def build(self):
+        """
+        Builds the load shedder.
+
+        :return: A load shedder for usage with the Eynnyd EynnydWebappBuilder set_load_shedder method.
+        """
+        return LoadShedder(
+            self._target_latency_seconds,
+            self._interval_seconds,
+            self._maximum_in_flight,
+            self._retry_after_seconds)
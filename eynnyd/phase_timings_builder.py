@@ -0,0 +1,60 @@
+import inspect
+
+from eynnyd.exceptions import EynnydWebappBuildException
+from eynnyd.internal.phase_timing.phase_timings import PhaseTimings
+
+
+class PhaseTimingsBuilder:
+    """
+    A builder for phase timings, which measure where each route spends its time.  Every request to a webapp with
+    phase timings set is timed with perf_counter_ns across five phases: routing, request_interceptors, handler,
+    response_interceptors and adaptation (turning the response into its WSGI status, headers and body, not sending
+    the body).  Timings are kept per route template and method, such as "GET /users/{user_id}", rather than per
+    raw path.  Requests matching no route are not timed.
+
+    Each thread records into its own histograms so timing never contends on a lock.  The built phase timings have a
+    snapshot method merging every thread's histograms into a dictionary of (route, phase) to a histogram with count,
+    total_ns, mean_ns, maximum_ns properties and a percentile_ns(percentile) method.  Histogram buckets are powers of
+    two, so percentiles are upper bounds within a factor of two.  An observer, if set, is handed a snapshot by the
+    first request finishing after each report interval.
+
+    Webapps without phase timings skip all of this, timing adds nothing to their requests.
+    """
+
+    def __init__(self):
+        self._observer = None
+        self._report_interval_seconds = 10.0
+
+    def set_observer(self, observer):
+        """
+        Sets a function periodically given a snapshot of the timings, for example to export them as metrics.
+
+        :param observer: a function taking the dictionary of (route, phase) to histogram
+        :return: This builder to allow for fluent design.
+        """
+        if not callable(observer) or 1 != len(inspect.signature(observer).parameters):
+            raise EynnydWebappBuildException("Observer must be a function taking exactly 1 argument.")
+        self._observer = observer
+        return self
+
+    def set_report_interval_seconds(self, report_interval_seconds):
+        """
+        Sets how often the observer is given a snapshot (default 10 seconds).
+
+        :param report_interval_seconds: a positive number of seconds
+        :return: This builder to allow for fluent design.
+        """
+        if not isinstance(report_interval_seconds, (int, float)) or isinstance(report_interval_seconds, bool) or \
+                report_interval_seconds <= 0:
+            raise EynnydWebappBuildException(
+                "Report interval {r} must be a positive number of seconds.".format(r=report_interval_seconds))
+        self._report_interval_seconds = report_interval_seconds
+        return self
+
+    def build(self):
+        """
+        Builds the phase timings.
+
+        :return: Phase timings for usage with the Eynnyd EynnydWebappBuilder set_phase_timings method.
+        """
+        return PhaseTimings(self._observer, self._report_interval_seconds)
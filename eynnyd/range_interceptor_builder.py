@@ -0,0 +1,38 @@
+from eynnyd.exceptions import InterceptorBuildException
+from eynnyd.internal.interceptors.range_response_interceptor import RangeResponseInterceptor
+
+
+class RangeInterceptorBuilder:
+    """
+    A builder for a response interceptor which answers HTTP range requests with 206 Partial Content responses.
+
+    Ranges are served for utf-8 and byte bodies and for seekable stream bodies with a known length (see the
+    content_length parameter of the ResponseBuilder set_stream_body method).  A single range is served by seeking
+    the stream so file bodies can still be sent using the WSGI server's file wrapper (and sendfile).  Multiple
+    ranges are sent as multipart/byteranges and unsatisfiable ranges are answered with 416.  If-Range is honoured.
+    """
+
+    def __init__(self):
+        self._maximum_ranges = 16
+
+    def set_maximum_ranges(self, maximum_ranges):
+        """
+        Sets how many (non overlapping) ranges a single request may ask for before the whole body is sent instead
+        (default 16).
+
+        :param maximum_ranges: a positive integer
+        :return: This builder to allow for fluent design.
+        """
+        if not isinstance(maximum_ranges, int) or maximum_ranges < 1:
+            raise InterceptorBuildException(
+                "Maximum ranges {m} must be a positive integer.".format(m=maximum_ranges))
+        self._maximum_ranges = maximum_ranges
+        return self
+
+    def build(self):
+        """
+        Builds the interceptor.
+
+        :return: A response interceptor for usage with the Eynnyd RoutesBuilder add_response_interceptor method.
+        """
+        return RangeResponseInterceptor(self._maximum_ranges)
@@ -0,0 +1,126 @@
+import math
+
+from eynnyd.abstract_rate_limit_store import AbstractRateLimitStore
+from eynnyd.exceptions import InterceptorBuildException
+from eynnyd.internal.interceptors.rate_limit_request_interceptor import RateLimitRequestInterceptor
+from eynnyd.internal.utils.sharded_token_bucket_store import ShardedTokenBucketStore
+
+
+class RateLimitInterceptorBuilder:
+    """
+    A builder for a request interceptor which rate limits requests with token buckets.
+
+    Each key (by default the client ip address) gets a bucket holding up to the burst number of requests, which
+    refills at the given rate.  Buckets are refilled lazily when used, so no background threads are needed.
+    Requests finding their bucket empty raise a RateLimitExceededException, which by default is answered with a
+    prebuilt 429 Too Many Requests response whose Retry-After header says when a request will next be allowed.
+
+    Keys can combine the client ip address, request header values (ex. an API key) and the route (method and
+    path template).  By default buckets are kept in this process in a sharded store holding a bounded number of
+    keys, least recently used keys being dropped first.  To share limits across worker processes set a store implementing
+    AbstractRateLimitStore.
+    """
+
+    def __init__(self):
+        self._tokens_per_second = None
+        self._burst = None
+        self._key_functions = []
+        self._store = None
+        self._shard_count = 16
+        self._maximum_keys = 100000
+
+    def set_rate(self, requests_per_second):
+        """
+        Sets how many requests per second each key is allowed on average.  Required.
+
+        :param requests_per_second: a positive number of requests
+        :return: This builder to allow for fluent design.
+        """
+        if not isinstance(requests_per_second, (int, float)) or requests_per_second <= 0:
+            raise InterceptorBuildException(
+                "Requests per second {r} must be a positive number.".format(r=requests_per_second))
+        self._tokens_per_second = requests_per_second
+        return self
+
+    def set_burst(self, burst):
+        """
+        Sets how many requests each key may make at once after being idle (defaults to the rate rounded up).
+
+        :param burst: a positive number of requests
+        :return: This builder to allow for fluent design.
+        """
+        if not isinstance(burst, int) or burst < 1:
+            raise InterceptorBuildException("Burst {b} must be a positive integer.".format(b=burst))
+        self._burst = burst
+        return self
+
+    def add_client_ip_address_key(self):
+        """
+        Adds the client ip address to the rate limit key.  The key is only the client ip address if nothing is added.
+
+        :return: This builder to allow for fluent design.
+        """
+        self._key_functions.append(RateLimitRequestInterceptor.client_ip_address_key)
+        return self
+
+    def add_header_key(self, header_name):
+        """
+        Adds the value of a request header (ex. X-API-Key) to the rate limit key.  Requests without the header share
+        a bucket.
+
+        :param header_name: the name of the request header
+        :return: This builder to allow for fluent design.
+        """
+        self._key_functions.append(RateLimitRequestInterceptor.create_header_key(str(header_name)))
+        return self
+
+    def add_route_key(self):
+        """
+        Adds the route the request matched (its http method and path template, ex. GET /users/{user_id}) to the
+        rate limit key, so that each route is limited separately however many paths it matches.
+
+        :return: This builder to allow for fluent design.
+        """
+        self._key_functions.append(RateLimitRequestInterceptor.route_key)
+        return self
+
+    def set_maximum_keys(self, maximum_keys):
+        """
+        Sets roughly how many keys the default in process store holds before dropping the least recently used
+        (default 100000).  Has no effect when a store is set.
+
+        :param maximum_keys: a positive number of keys
+        :return: This builder to allow for fluent design.
+        """
+        if not isinstance(maximum_keys, int) or maximum_keys < 1:
+            raise InterceptorBuildException("Maximum keys {m} must be a positive integer.".format(m=maximum_keys))
+        self._maximum_keys = maximum_keys
+        return self
+
+    def set_store(self, store):
+        """
+        Sets the store of token buckets, for sharing rate limits between worker processes.
+
+        :param store: an implementation of the Eynnyd AbstractRateLimitStore
+        :return: This builder to allow for fluent design.
+        """
+        if not isinstance(store, AbstractRateLimitStore):
+            raise InterceptorBuildException("Rate limit store {s} is not an AbstractRateLimitStore.".format(s=store))
+        self._store = store
+        return self
+
+    def build(self):
+        """
+        Builds the interceptor.
+
+        :return: A request interceptor for usage with the Eynnyd RoutesBuilder add_request_interceptor method.
+        """
+        if self._tokens_per_second is None:
+            raise InterceptorBuildException("A rate limit needs a rate of requests per second.")
+        burst = self._burst if self._burst is not None else max(1, math.ceil(self._tokens_per_second))
+        store = self._store if self._store is not None else ShardedTokenBucketStore(
+            self._shard_count,
+            math.ceil(self._maximum_keys / self._shard_count))
+        key_functions = tuple(self._key_functions) if self._key_functions else \
+            (RateLimitRequestInterceptor.client_ip_address_key,)
+        return RateLimitRequestInterceptor(store, key_functions, self._tokens_per_second, burst)
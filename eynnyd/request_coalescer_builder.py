@@ -0,0 +1,55 @@
+from eynnyd.exceptions import HandlerBuildException
+from eynnyd.internal.handlers.request_coalescer import RequestCoalescer
+
+
+class RequestCoalescerBuilder:
+    """
+    A builder for coalescing identical requests which are in flight at the same time.
+
+    While a GET or HEAD request is running its handler, other requests with the same method, path, query, credentials
+    (Authorization and Cookie headers) and chosen request headers wait for it rather than running the handler themselves, and are all given its (immutable)
+    response.  Responses which can only be sent once (stream and iterable bodies) and responses setting cookies or
+    carrying background tasks are not shared, so waiting requests run the handler themselves.  Waiting requests also
+    run the handler themselves once the wait timeout has passed.
+    """
+
+    _CREDENTIAL_HEADER_NAMES = ["authorization", "cookie"]
+
+    def __init__(self):
+        self._key_header_names = []
+        self._wait_timeout_seconds = 10
+
+    def add_key_header(self, header_name):
+        """
+        Adds a request header whose value must also match for requests to be coalesced (ex. Accept-Language for
+        handlers whose response depends on it).  Authorization and Cookie always have to match.
+
+        :param header_name: the name of the request header
+        :return: This builder to allow for fluent design.
+        """
+        self._key_header_names.append(str(header_name).lower())
+        return self
+
+    def set_wait_timeout_seconds(self, wait_timeout_seconds):
+        """
+        Sets how long a request waits on an identical request already running the handler before running the
+        handler itself (default 10).
+
+        :param wait_timeout_seconds: a positive number of seconds
+        :return: This builder to allow for fluent design.
+        """
+        if not isinstance(wait_timeout_seconds, (int, float)) or wait_timeout_seconds <= 0:
+            raise HandlerBuildException(
+                "Wait timeout {w} must be a positive number.".format(w=wait_timeout_seconds))
+        self._wait_timeout_seconds = wait_timeout_seconds
+        return self
+
+    def build(self):
+        """
+        Builds the request coalescer.
+
+        :return: A request coalescer for usage with the Eynnyd RoutesBuilder set_request_coalescer method.
+        """
+        return RequestCoalescer(
+            tuple(sorted(set(RequestCoalescerBuilder._CREDENTIAL_HEADER_NAMES + self._key_header_names))),
+            self._wait_timeout_seconds)
@@ -1,28 +1,87 @@
+import codecs
+import functools
 import inspect
+import os
+import stat
 from http import HTTPStatus
 
+from optional import Optional
+
 from eynnyd.exceptions import SettingNonTypedStatusWithContentTypeException, SettingNonBodyStatusWithBodyException, \
     SettingBodyWithNonBodyStatusException, InvalidBodyTypeException, InvalidHeaderException, \
-    SettingContentTypeWithNonTypedStatusException, InvalidResponseCookieException
+    SettingContentTypeWithNonTypedStatusException, InvalidResponseCookieException, InvalidBackgroundTaskException
+from eynnyd.internal.json_body_content import JSONBodyContent
+from eynnyd.internal.plan_execution.async_callable import AsyncCallable
 from eynnyd.internal.response import Response
+from eynnyd.internal.prebuilt_response import PrebuiltResponse
 from eynnyd.internal.response_body import ResponseBody
 from eynnyd.internal.response_body_type import ResponseBodyType
 from eynnyd.internal.utils.cookies.response_cookie import ResponseCookie
+from eynnyd.internal.wsgi.coalescing_iterator import CoalescingIterator
 from eynnyd.response_cookie_builder import ResponseCookieBuilder
 from eynnyd.internal.utils.http_status_factory import HTTPStatusFactory
 from eynnyd.internal.utils.http_status_groups import NON_TYPED_STATUSES, NON_BODY_STATUSES
 
+# Python codec names mapped to the charset labels registered with IANA, for codecs whose names differ.
+_CHARSETS_BY_CODEC_NAME = dict(
+    [("iso8859-{n}".format(n=n), "ISO-8859-{n}".format(n=n)) for n in range(1, 17)] +
+    [("cp125{n}".format(n=n), "windows-125{n}".format(n=n)) for n in range(9)] +
+    [
+        ("utf-8", "utf-8"),
+        ("ascii", "US-ASCII"),
+        ("utf-16", "UTF-16"),
+        ("utf-16-be", "UTF-16BE"),
+        ("utf-16-le", "UTF-16LE"),
+        ("utf-32", "UTF-32"),
+        ("euc_jp", "EUC-JP"),
+        ("euc_kr", "EUC-KR"),
+        ("shift_jis", "Shift_JIS"),
+        ("iso2022_jp", "ISO-2022-JP"),
+        ("gb2312", "GB2312"),
+        ("gbk", "GBK"),
+        ("gb18030", "GB18030"),
+        ("big5", "Big5"),
+        ("koi8-r", "KOI8-R"),
+        ("koi8-u", "KOI8-U")])
+
 
 class ResponseBuilder:
     """
     A builder allowing for the easy and validated building of a Response.
     """
 
+    _PREBUILDABLE_BODY_TYPES = frozenset([
+        ResponseBodyType.EMPTY,
+        ResponseBodyType.UTF8,
+        ResponseBodyType.BYTE,
+        ResponseBodyType.JSON])
+
     def __init__(self):
         self._status = HTTPStatusFactory.create(HTTPStatus.OK)
         self._body = ResponseBody.empty_response()
         self._headers = {}
         self._cookies = []
+        self._background_tasks = []
+
+    @staticmethod
+    def from_response(response):
+        """
+        Creates a builder pre-populated with the status, body, headers, cookies and background tasks of an existing
+        response.
+
+        This is the cheap way for a response interceptor to derive a modified copy of a response (including
+        prebuilt responses) as nothing is re-validated or re-encoded.
+
+        :param response: The response to copy.
+        :return: A new builder holding a copy of the response.
+        """
+        builder = ResponseBuilder()
+        builder._status = response.status
+        builder._body = response.body
+        builder._headers = dict(response.headers)
+        builder._cookies = list(response.cookies)
+        builder._background_tasks = list(response.background_tasks)
+        return builder
 
     def set_status(self, status):
         """
@@ -46,20 +105,64 @@ class ResponseBuilder:
         Sets a utf8 body on the request (overwriting any other set body).  Raises if setting the body conflicts
         with the status.  Sets a content-length header if one has not already been set.
 
-        :param body: The utf-8 encoded body
+        Strings are encoded to utf-8 once here.  Already encoded bytes, bytearray or memoryview bodies are kept
+        as given without being copied or re-validated.
+
+        :param body: The body as a string or as utf-8 encoded bytes, bytearray or memoryview
         :return: This builder to allow for fluent design.
         """
         if self._status.code in NON_BODY_STATUSES:
             raise SettingBodyWithNonBodyStatusException(
                 "Cannot set a body on response with status {s}".format(s=self._status))
-        encoded_body = body.encode("utf-8")
-        if len(body) != len(encoded_body):
-            raise InvalidBodyTypeException("Body must be UTF8 to set via set_utf8_body method.")
+        if isinstance(body, str):
+            encoded_body = ResponseBuilder._encode_text(body, "utf-8")
+        elif isinstance(body, memoryview):
+            encoded_body = ResponseBuilder._to_byte_view(body)
+        elif isinstance(body, (bytes, bytearray)):
+            encoded_body = body
+        else:
+            raise InvalidBodyTypeException("Body must be a string or utf-8 encoded bytes to set via set_utf8_body.")
         if "content-length" not in self._headers:
             self._headers["content-length"] = str(len(encoded_body))
         self._body = ResponseBody(ResponseBodyType.UTF8, encoded_body)
         return self
 
+    def set_text_body(self, body, encoding="utf-8"):
+        """
+        Sets a text body on the request (overwriting any other set body), encoded with the given encoding.  Raises if
+        setting the body conflicts with the status or the body cannot be encoded.  Sets a content-length header if
+        one has not already been set.  Sets a text/plain content-type header naming the charset if one has not
+        already been set, or adds the charset to a set content-type which does not name one.  The charset is named by
+        its registered label where one is known, and as given otherwise.
+
+        :param body: The body as a string
+        :param encoding: The name of the encoding to use, defaulting to utf-8
+        :return: This builder to allow for fluent design.
+        """
+        if self._status.code in NON_BODY_STATUSES:
+            raise SettingBodyWithNonBodyStatusException(
+                "Cannot set a body on response with status {s}".format(s=self._status))
+        if not isinstance(body, str):
+            raise InvalidBodyTypeException("Body must be a string to set via set_text_body.")
+        try:
+            codec_name = codecs.lookup(encoding).name
+        except (LookupError, TypeError) as e:
+            raise InvalidBodyTypeException("Unknown encoding {e} for text body.".format(e=encoding), e)
+        charset = _CHARSETS_BY_CODEC_NAME.get(codec_name, encoding)
+
+        encoded_body = ResponseBuilder._encode_text(body, codec_name)
+        content_type = self._headers.get("content-type")
+        if content_type is None:
+            self._headers["content-type"] = "text/plain; charset=" + charset
+        elif "charset=" not in content_type.lower():
+            self._headers["content-type"] = content_type + "; charset=" + charset
+        if "content-length" not in self._headers:
+            self._headers["content-length"] = str(len(encoded_body))
+        self._body = ResponseBody(
+            ResponseBodyType.UTF8 if codec_name == "utf-8" else ResponseBodyType.BYTE,
+            encoded_body)
+        return self
+
     def set_byte_body(self, body):
         """
         Sets a byte body on the request (overwriting any other set body).  Raises if setting the body conflicts
@@ -78,12 +181,45 @@ class ResponseBuilder:
         self._body = ResponseBody(ResponseBodyType.BYTE, body)
         return self
 
-    def set_stream_body(self, body):
+    def set_json_body(self, body, serializer=None, stream=False):
+        """
+        Sets a json body on the request (overwriting any other set body).  Raises if setting the body conflicts
+        with the status.  Sets an application/json content-type header if one has not already been set.
+
+        The body is only serialized when the response is sent, using orjson when it is installed and the standard
+        library json module otherwise.  A content-length header is sent unless the body is streamed.  Streaming
+        serializes the body piece by piece, sending it in chunks, so large lists never need to be held in memory as
+        one encoded document.
+
+        :param body: The json serializable body
+        :param serializer: A callable turning the body into json bytes or str, replacing the default serializer.
+        :param stream: True to serialize the body incrementally with the standard library json module.
+        :return: This builder to allow for fluent design.
+        """
+        if self._status.code in NON_BODY_STATUSES:
+            raise SettingBodyWithNonBodyStatusException(
+                "Cannot set a body on response with status {s}".format(s=self._status))
+        if serializer is not None and not callable(serializer):
+            raise InvalidBodyTypeException("Json body serializer must be callable.")
+        if serializer is not None and stream:
+            raise InvalidBodyTypeException("Streamed json bodies cannot use a custom serializer.")
+        if "content-type" not in self._headers:
+            self._headers["content-type"] = "application/json"
+        self._body = ResponseBody(ResponseBodyType.JSON, JSONBodyContent(body, serializer, stream))
+        return self
+
+    def set_stream_body(self, body, content_length=None, block_size=None):
         """
         Sets a streaming body on the request (overwriting any other set body).  Raises if setting the body conflicts
-        with the status.
+        with the status.  Sets a content-length header, if one has not already been set, when the length is given or
+        when the stream is a regular file whose remaining size can be read from the file system.
+
+        Giving the length of a seekable stream (ex. an open file) allows range requests to be answered by the
+        Eynnyd range interceptor.
 
         :param body: A streamable object with a read method taking 1 parameter (and an optional close method)
+        :param content_length: The number of bytes left to read from the stream, if known.
+        :param block_size: The number of bytes to read from the stream at a time, overriding the webapp default.
         :return: This builder to allow for fluent design.
         """
         if self._status.code in NON_BODY_STATUSES:
@@ -95,17 +231,42 @@ class ResponseBuilder:
         if 1 != len(inspect.signature(body.read).parameters):
             raise InvalidBodyTypeException("Streamable body read method must take a block size parameter")
 
-        self._body = ResponseBody(ResponseBodyType.STREAM, body)
+        if block_size is not None and (not isinstance(block_size, int) or block_size < 1):
+            raise InvalidBodyTypeException(
+                "Streamable body block size {b} must be a positive integer.".format(b=block_size))
+
+        if content_length is not None:
+            if not isinstance(content_length, int) or content_length < 0:
+                raise InvalidBodyTypeException(
+                    "Streamable body content length {l} must be a non negative integer.".format(l=content_length))
+        elif "content-length" not in self._headers:
+            content_length = ResponseBuilder._get_remaining_file_length(body)
+
+        if content_length is not None and "content-length" not in self._headers:
+            self._headers["content-length"] = str(content_length)
+
+        self._body = ResponseBody(
+            ResponseBodyType.STREAM,
+            body,
+            Optional.empty() if block_size is None else Optional.of(block_size))
         return self
 
-    def set_iterable_body(self, body):
+    def set_iterable_body(self, body, coalesce_size=None, coalesce_seconds=None):
         """
         Sets an iterable body on the request (overwriting any other set body).  Raises if setting the body conflicts
         with the status.
 
         For simple strings you should use the utf-8 body as using this would be highly inefficient.
 
+        Iterables yielding many small chunks (ex. one csv row at a time) can be coalesced so that chunks are batched
+        together before being handed to the server, saving a write per chunk.  Coalescing is turned on by giving
+        either a size or a time budget.  A batch is sent once it reaches the size (default 64KiB) or once the time
+        budget has passed since its first chunk, whichever comes first.  String chunks are utf-8 encoded as they
+        arrive, so batches are measured in encoded bytes rather than characters.
+
         :param body: The iterable body
+        :param coalesce_size: The number of bytes to batch up before sending, when coalescing.
+        :param coalesce_seconds: The longest time to hold a batch for, checked as each chunk arrives, when coalescing.
         :return: This builder to allow for fluent design.
         """
         if self._status.code in NON_BODY_STATUSES:
@@ -115,6 +276,20 @@ class ResponseBuilder:
             iter(body)
         except TypeError as e:
             raise InvalidBodyTypeException("Iterable bodies must be iterable", e)
+
+        if coalesce_size is not None and (not isinstance(coalesce_size, int) or coalesce_size < 1):
+            raise InvalidBodyTypeException(
+                "Iterable body coalesce size {s} must be a positive integer.".format(s=coalesce_size))
+        if coalesce_seconds is not None and (not isinstance(coalesce_seconds, (int, float)) or coalesce_seconds <= 0):
+            raise InvalidBodyTypeException(
+                "Iterable body coalesce seconds {s} must be a positive number.".format(s=coalesce_seconds))
+
+        if coalesce_size is not None or coalesce_seconds is not None:
+            body = CoalescingIterator(
+                body,
+                CoalescingIterator.DEFAULT_THRESHOLD if coalesce_size is None else coalesce_size,
+                coalesce_seconds)
+
         self._body = ResponseBody(ResponseBodyType.ITERABLE, body)
         return self
 
@@ -220,12 +395,84 @@ class ResponseBuilder:
         self._cookies = list(filter(lambda cookie: cookie.name != name, self._cookies))
         return self
 
+    def add_background_task(self, task, *args, **kwargs):
+        """
+        Adds work to run once the response has been sent, such as sending an email, writing an audit log or warming a
+        cache, so that it does not add to the time the client waits.  Tasks run in the order added after the server
+        closes the response body, on the background task runner set on the Eynnyd EynnydWebappBuilder.  Coroutine
+        functions are accepted as well.  Response interceptors keep the tasks as long as they derive their response
+        with from_response.
+
+        :param task: the function to call
+        :param args: positional arguments to call the function with
+        :param kwargs: keyword arguments to call the function with
+        :return: This builder to allow for fluent design.
+        """
+        if not callable(task):
+            raise InvalidBackgroundTaskException("Background task {t} must be callable.".format(t=task))
+        # Checked on the task itself as functools.partial hides coroutine functions before Python 3.8.
+        bound_task = functools.partial(task, *args, **kwargs)
+        if AsyncCallable.is_coroutine_function(task):
+            bound_task = AsyncCallable(bound_task)
+        self._background_tasks.append(bound_task)
+        return self
+
     def build(self):
         """
         :return: A response ready for returning from the webapp.
         """
         return Response(
+            self._status,
+            self._body,
+            dict(self._headers),
+            list(self._cookies),
+            tuple(self._background_tasks))
+
+    def build_prebuilt(self):
+        """
+        Builds a frozen response meant to be built once (ex. at startup) and returned from handlers on every
+        request.  The WSGI status line, header list and body are all computed here rather than per request and
+        the response can be safely shared across threads.
+
+        Raises if the body is a stream or iterable body as those can only be consumed once, or if background tasks
+        were added as those would run again on every request.
+
+        :return: An immutable response ready for returning from the webapp any number of times.
+        """
+        if self._body.type not in ResponseBuilder._PREBUILDABLE_BODY_TYPES:
+            raise InvalidBodyTypeException(
+                "Cannot prebuild a response with a {t} body as it can only be sent once."
+                    .format(t=self._body.type.name))
+        if self._background_tasks:
+            raise InvalidBackgroundTaskException("Cannot prebuild a response with background tasks.")
+        return PrebuiltResponse(
             self._status,
             self._body,
             self._headers,
-            self._cookies)
\ No newline at end of file
+            self._cookies)
+
+    @staticmethod
+    def _encode_text(body, encoding):
+        try:
+            return body.encode(encoding)
+        except UnicodeEncodeError as e:
+            raise InvalidBodyTypeException("Body cannot be encoded as {e}.".format(e=encoding), e)
+
+    @staticmethod
+    def _to_byte_view(body):
+        if not body.c_contiguous:
+            raise InvalidBodyTypeException("Memoryview bodies must be contiguous.")
+        if body.format == "B" and body.ndim == 1:
+            return body
+        return body.cast("B")
+
+    @staticmethod
+    def _get_remaining_file_length(body):
+        try:
+            file_status = os.fstat(body.fileno())
+            position = body.tell() if hasattr(body, "tell") else 0
+        except (AttributeError, TypeError, ValueError, OSError):
+            return None
+        if not stat.S_ISREG(file_status.st_mode):
+            return None
+        return max(file_status.st_size - position, 0)
@@ -0,0 +1,105 @@
+from eynnyd.exceptions import HandlerBuildException
+from eynnyd.internal.handlers.response_cache import ResponseCache
+
+
+class ResponseCacheBuilder:
+    """
+    A builder for an in process cache of handler responses.
+
+    Responses to GET and HEAD requests are cached by method, path and query (either the whole query string or only
+    the chosen query parameters), and by the request headers named in the response's Vary header.  Responses are
+    only cached when they have a cacheable status, an in memory body, no cookies and no background tasks, and when
+    their Cache-Control header allows it.  A max-age or s-maxage directive replaces the default time to live.
+    Requests carrying credentials (an Authorization or Cookie header) bypass the cache unless told otherwise, so that
+    one user's personalised response is never served to another.
+
+    The least recently used responses are evicted once the cache grows past its size limit.  When a response is
+    missing or expired, only one request runs the handler while concurrent requests for the same response wait for
+    its result (or keep being served the expired response until it is replaced).
+    """
+
+    def __init__(self):
+        self._ttl_seconds = 60
+        self._maximum_bytes = 64 * 1024 * 1024
+        self._key_query_parameter_names = None
+        self._wait_timeout_seconds = 10
+        self._cache_credentialed_requests = False
+
+    def set_ttl_seconds(self, ttl_seconds):
+        """
+        Sets how long responses are cached for when their Cache-Control header does not say (default 60).
+
+        :param ttl_seconds: a positive number of seconds
+        :return: This builder to allow for fluent design.
+        """
+        if not isinstance(ttl_seconds, (int, float)) or ttl_seconds <= 0:
+            raise HandlerBuildException("Time to live {t} must be a positive number.".format(t=ttl_seconds))
+        self._ttl_seconds = ttl_seconds
+        return self
+
+    def set_maximum_bytes(self, maximum_bytes):
+        """
+        Sets the total size of the cached bodies and headers past which responses are evicted (default 64MiB).
+
+        :param maximum_bytes: a positive number of bytes
+        :return: This builder to allow for fluent design.
+        """
+        if not isinstance(maximum_bytes, int) or maximum_bytes < 1:
+            raise HandlerBuildException("Maximum bytes {m} must be a positive integer.".format(m=maximum_bytes))
+        self._maximum_bytes = maximum_bytes
+        return self
+
+    def add_key_query_parameter(self, query_parameter_name):
+        """
+        Adds a query parameter which selects the cached response.  Once any are added all other query parameters are
+        ignored when caching, otherwise the whole query string is used.
+
+        :param query_parameter_name: the name of the query parameter
+        :return: This builder to allow for fluent design.
+        """
+        if self._key_query_parameter_names is None:
+            self._key_query_parameter_names = []
+        self._key_query_parameter_names.append(str(query_parameter_name))
+        return self
+
+    def set_wait_timeout_seconds(self, wait_timeout_seconds):
+        """
+        Sets how long a request waits on another request already running the handler for the same response before
+        running the handler itself (default 10).
+
+        :param wait_timeout_seconds: a positive number of seconds
+        :return: This builder to allow for fluent design.
+        """
+        if not isinstance(wait_timeout_seconds, (int, float)) or wait_timeout_seconds <= 0:
+            raise HandlerBuildException(
+                "Wait timeout {w} must be a positive number.".format(w=wait_timeout_seconds))
+        self._wait_timeout_seconds = wait_timeout_seconds
+        return self
+
+    def set_cache_credentialed_requests(self, cache_credentialed_requests):
+        """
+        Sets whether requests with an Authorization or Cookie header use the cache (default False).  When they do,
+        the values of those headers are part of the cache key, so responses are only shared between requests with the
+        same credentials.
+
+        :param cache_credentialed_requests: True to cache responses to requests carrying credentials
+        :return: This builder to allow for fluent design.
+        """
+        if not isinstance(cache_credentialed_requests, bool):
+            raise HandlerBuildException(
+                "Cache credentialed requests {c} must be a boolean.".format(c=cache_credentialed_requests))
+        self._cache_credentialed_requests = cache_credentialed_requests
+        return self
+
+    def build(self):
+        """
+        Builds the response cache.
+
+        :return: A response cache for usage with the Eynnyd RoutesBuilder set_response_cache method.
+        """
+        return ResponseCache(
+            self._ttl_seconds,
+            self._maximum_bytes,
+            None if self._key_query_parameter_names is None else tuple(sorted(set(self._key_query_parameter_names))),
+            self._wait_timeout_seconds,
+            self._cache_credentialed_requests)
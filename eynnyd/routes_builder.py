@@ -1,8 +1,16 @@
 import inspect
+import math
+import threading
 
+from eynnyd.internal.handlers.inline_handler_executor import InlineHandlerExecutor
+from eynnyd.internal.plan_execution.bulkhead import Bulkhead
+from eynnyd.internal.handlers.pooled_handler_executor import PooledHandlerExecutor
+from eynnyd.internal.handlers.request_coalescer import RequestCoalescer
+from eynnyd.internal.plan_execution.async_callable import AsyncCallable
+from eynnyd.internal.handlers.response_cache import ResponseCache
 from eynnyd.internal.routing.route_tree_builder import RouteTeeBuilder
 from eynnyd.exceptions import DuplicateHandlerRoutesException, RouteBuildException, NonCallableInterceptor, \
-    NonCallableHandler, CallbackIncorrectNumberOfParametersException
+    NonCallableHandler, CallbackIncorrectNumberOfParametersException, HandlerNotFoundException
 from eynnyd.internal.utils.uri_components_converter import URIComponentsConverter
 
 
@@ -19,7 +27,7 @@ class RoutesBuilder:
         Adds a request interceptor to be run (before handler execution) given a uri path for when to execute it
 
         :param uri_path: The path dictating what requests this interceptor is run against
-        :param interceptor: A function which takes a request parameter and returns a request
+        :param interceptor: A function or coroutine function which takes a request parameter and returns a request
         :return: This builder to allow fluent design
         """
         if not hasattr(interceptor, '__call__'):
@@ -32,7 +40,7 @@ class RoutesBuilder:
 
         components = URIComponentsConverter.from_uri(uri_path)
         RoutesBuilder._validate_path_has_unique_parameter_names_or_raise(components)
-        self._route_tree_builder.add_request_interceptor(components, interceptor)
+        self._route_tree_builder.add_request_interceptor(components, AsyncCallable.from_callable(interceptor))
         return self
 
     def add_response_interceptor(self, uri_path, interceptor):
@@ -40,7 +48,8 @@ class RoutesBuilder:
         Adds a response interceptor to be run (after handler execution) given a uri path for when to execute it
 
         :param uri_path: The path dictating what requests this interceptor is run against
-        :param interceptor: A function which takes a request and a response and returns a response
+        :param interceptor: A function or coroutine function which takes a request and a response and returns a
+            response
         :return: This builder to allow for fluent design
         """
         if not hasattr(interceptor, '__call__'):
@@ -53,7 +62,7 @@ class RoutesBuilder:
 
         components = URIComponentsConverter.from_uri(uri_path)
         RoutesBuilder._validate_path_has_unique_parameter_names_or_raise(components)
-        self._route_tree_builder.add_response_interceptor(components, interceptor)
+        self._route_tree_builder.add_response_interceptor(components, AsyncCallable.from_callable(interceptor))
         return self
 
     def add_handler(self, http_method, uri_path, handler):
@@ -61,9 +70,13 @@ class RoutesBuilder:
         Adds a handler to be run (after request interceptors and before response interceptors) given a http method
         and uri path for when to execute it
 
+        Handlers and interceptors may be coroutine functions, which lets a single request await several downstream
+        calls concurrently (for example with asyncio.gather).  ASGI webapps await them on the server's event loop.
+        WSGI webapps run them on an event loop thread shared by the worker process.
+
         :param http_method: the method to match to execute this handler against a request
         :param uri_path: The path dictating what requests this handler is run against
-        :param handler: A function taking a request and returning a response
+        :param handler: A function or coroutine function taking a request and returning a response
         :return: This handler to allow for fluent design
         """
         if not hasattr(handler, '__call__'):
@@ -76,20 +89,201 @@ class RoutesBuilder:
         components = URIComponentsConverter.from_uri(uri_path)
         RoutesBuilder._validate_path_has_unique_parameter_names_or_raise(components)
         try:
-            self._route_tree_builder.add_handler(http_method, components, handler)
+            self._route_tree_builder.add_handler(http_method, components, AsyncCallable.from_callable(handler))
         except DuplicateHandlerRoutesException as e:
             raise RouteBuildException(
                 "Error while trying to add handler to route {u}, method: {m}".format(u=uri_path, m=http_method),
                 e)
         return self
 
+    def set_response_cache(self, http_method, uri_path, response_cache):
+        """
+        Caches the responses of the handler registered for a http method and uri path.  Request interceptors still
+        run for every request, cached responses are served in place of running the handler, and response
+        interceptors run on cached responses as they would on the handler's.
+
+        A single response cache may be shared between routes.
+
+        :param http_method: the method of the handler to cache responses for
+        :param uri_path: the path of the handler to cache responses for
+        :param response_cache: the result from the Eynnyd ResponseCacheBuilder build method
+        :return: This builder to allow for fluent design
+        """
+        if not isinstance(response_cache, ResponseCache):
+            raise RouteBuildException(
+                "Response cache for method {m} on path {u} was not built by the ResponseCacheBuilder."
+                    .format(m=http_method, u=uri_path))
+        return self._add_handler_wrapper(http_method, uri_path, response_cache.wrap)
+
+    def set_request_coalescer(self, http_method, uri_path, request_coalescer):
+        """
+        Coalesces identical requests in flight at the same time for the handler registered for a http method and uri
+        path, so that the handler runs once and its response is shared.  Request and response interceptors still
+        run for every request.
+
+        A response cache already coalesces its own misses, so the two do not need to be set on the same route.
+
+        :param http_method: the method of the handler to coalesce requests for
+        :param uri_path: the path of the handler to coalesce requests for
+        :param request_coalescer: the result from the Eynnyd RequestCoalescerBuilder build method
+        :return: This builder to allow for fluent design
+        """
+        if not isinstance(request_coalescer, RequestCoalescer):
+            raise RouteBuildException(
+                "Request coalescer for method {m} on path {u} was not built by the RequestCoalescerBuilder."
+                    .format(m=http_method, u=uri_path))
+        return self._add_handler_wrapper(http_method, uri_path, request_coalescer.wrap)
+
+    def set_handler_executor(self, http_method, uri_path, handler_executor):
+        """
+        Runs the handler registered for a http method and uri path on the given executor.  Request and response
+        interceptors still run where they otherwise would.  Handler wrappers apply in the order they are registered,
+        so registering the executor before a response cache or request coalescer means only cache misses and coalesced
+        leaders are sent to the pool, while registering it after sends cache hits to the pool as well.
+
+        A single handler executor may be shared between routes, in which case they share its pool.
+
+        :param http_method: the method of the handler to run on the executor
+        :param uri_path: the path of the handler to run on the executor
+        :param handler_executor: the result from the Eynnyd HandlerExecutorBuilder build method
+        :return: This builder to allow for fluent design
+        """
+        if not isinstance(handler_executor, (InlineHandlerExecutor, PooledHandlerExecutor)):
+            raise RouteBuildException(
+                "Handler executor for method {m} on path {u} was not built by the HandlerExecutorBuilder."
+                    .format(m=http_method, u=uri_path))
+        return self._add_handler_wrapper(http_method, uri_path, handler_executor.wrap)
+
+    def add_bulkhead(self, uri_path, bulkhead):
+        """
+        Limits how many requests are in flight at once across every route under a uri path.
+
+        :param uri_path: The path dictating what requests count against this bulkhead
+        :param bulkhead: the result from the Eynnyd BulkheadBuilder build method
+        :return: This builder to allow for fluent design
+        """
+        RoutesBuilder._validate_bulkhead_or_raise(uri_path, bulkhead)
+        components = URIComponentsConverter.from_uri(uri_path)
+        RoutesBuilder._validate_path_has_unique_parameter_names_or_raise(components)
+        self._route_tree_builder.add_bulkhead(components, bulkhead)
+        return self
+
+    def add_route_bulkhead(self, http_method, uri_path, bulkhead):
+        """
+        Limits how many requests are in flight at once for the handler registered for a http method and uri path.
+
+        :param http_method: the method of the handler to limit
+        :param uri_path: the path of the handler to limit
+        :param bulkhead: the result from the Eynnyd BulkheadBuilder build method
+        :return: This builder to allow for fluent design
+        """
+        RoutesBuilder._validate_bulkhead_or_raise(uri_path, bulkhead)
+        components = URIComponentsConverter.from_uri(uri_path)
+        RoutesBuilder._validate_path_has_unique_parameter_names_or_raise(components)
+        self._route_tree_builder.add_route_bulkhead(http_method, components, bulkhead)
+        return self
+
+    def set_priority(self, uri_path, priority):
+        """
+        Sets the load shedding priority of every route under a uri path, unless a deeper path or the route itself
+        sets its own.  Priority 0 is critical and never shed, routes default to priority 1, and while overloaded the
+        load shedder turns away the highest numbered priorities first.
+
+        :param uri_path: The path of the routes to prioritise
+        :param priority: zero or a positive integer, higher numbers being shed first
+        :return: This builder to allow for fluent design
+        """
+        RoutesBuilder._validate_priority_or_raise(uri_path, priority)
+        components = URIComponentsConverter.from_uri(uri_path)
+        RoutesBuilder._validate_path_has_unique_parameter_names_or_raise(components)
+        self._route_tree_builder.set_priority(components, priority)
+        return self
+
+    def set_route_priority(self, http_method, uri_path, priority):
+        """
+        Sets the load shedding priority of the handler registered for a http method and uri path.  See set_priority.
+
+        :param http_method: the method of the handler to prioritise
+        :param uri_path: the path of the handler to prioritise
+        :param priority: zero or a positive integer, higher numbers being shed first
+        :return: This builder to allow for fluent design
+        """
+        RoutesBuilder._validate_priority_or_raise(uri_path, priority)
+        components = URIComponentsConverter.from_uri(uri_path)
+        RoutesBuilder._validate_path_has_unique_parameter_names_or_raise(components)
+        self._route_tree_builder.set_route_priority(http_method, components, priority)
+        return self
+
+    def set_deadline(self, uri_path, deadline_seconds):
+        """
+        Sets how long every route under a uri path has to respond, unless a deeper path or the route itself sets its
+        own.  Setting a deadline on "/" gives every route a default.  Once a request's deadline passes no further
+        interceptors or handlers are started for it and it is answered with 504 Gateway Timeout.  Deadlines are
+        cooperative, code already running is never interrupted, so long running handlers should check
+        request.deadline themselves or pass its remaining_seconds on as the timeout of any calls they make.
+
+        :param uri_path: The path of the routes to give a deadline
+        :param deadline_seconds: a positive number of seconds
+        :return: This builder to allow for fluent design
+        """
+        RoutesBuilder._validate_deadline_seconds_or_raise(uri_path, deadline_seconds)
+        components = URIComponentsConverter.from_uri(uri_path)
+        RoutesBuilder._validate_path_has_unique_parameter_names_or_raise(components)
+        self._route_tree_builder.set_deadline_seconds(components, deadline_seconds)
+        return self
+
+    def set_route_deadline(self, http_method, uri_path, deadline_seconds):
+        """
+        Sets how long the handler registered for a http method and uri path has to respond.  See set_deadline.
+
+        :param http_method: the method of the handler to give a deadline
+        :param uri_path: the path of the handler to give a deadline
+        :param deadline_seconds: a positive number of seconds
+        :return: This builder to allow for fluent design
+        """
+        RoutesBuilder._validate_deadline_seconds_or_raise(uri_path, deadline_seconds)
+        components = URIComponentsConverter.from_uri(uri_path)
+        RoutesBuilder._validate_path_has_unique_parameter_names_or_raise(components)
+        self._route_tree_builder.set_route_deadline_seconds(http_method, components, deadline_seconds)
+        return self
+
     def build(self):
         """
         Builds out the route tree for processing requests into responses.
 
         :return: The route tree for usage in the Eynnyd WebAppBuilder
         """
-        return self._route_tree_builder.build()
+        try:
+            return self._route_tree_builder.build()
+        except HandlerNotFoundException as e:
+            raise RouteBuildException("Error while trying to build routes", e)
+
+    @staticmethod
+    def _validate_priority_or_raise(uri_path, priority):
+        if not isinstance(priority, int) or isinstance(priority, bool) or priority < 0:
+            raise RouteBuildException(
+                "Priority {p} for path {u} must be zero or a positive integer.".format(p=priority, u=uri_path))
+
+    @staticmethod
+    def _validate_deadline_seconds_or_raise(uri_path, deadline_seconds):
+        if not isinstance(deadline_seconds, (int, float)) or isinstance(deadline_seconds, bool) or \
+                not math.isfinite(deadline_seconds) or deadline_seconds <= 0 or \
+                deadline_seconds > threading.TIMEOUT_MAX:
+            raise RouteBuildException(
+                "Deadline {d} for path {u} must be a positive number of seconds no greater than {m}."
+                    .format(d=deadline_seconds, u=uri_path, m=threading.TIMEOUT_MAX))
+
+    @staticmethod
+    def _validate_bulkhead_or_raise(uri_path, bulkhead):
+        if not isinstance(bulkhead, Bulkhead):
+            raise RouteBuildException(
+                "Bulkhead for path {u} was not built by the BulkheadBuilder.".format(u=uri_path))
+
+    def _add_handler_wrapper(self, http_method, uri_path, handler_wrapper):
+        components = URIComponentsConverter.from_uri(uri_path)
+        RoutesBuilder._validate_path_has_unique_parameter_names_or_raise(components)
+        self._route_tree_builder.add_handler_wrapper(http_method, components, handler_wrapper)
+        return self
 
     @staticmethod
     def _validate_path_has_unique_parameter_names_or_raise(uri_components):
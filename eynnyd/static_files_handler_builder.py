@@ -0,0 +1,87 @@
+import os
+
+from eynnyd.exceptions import HandlerBuildException
+from eynnyd.internal.handlers.static_files_handler import StaticFilesHandler
+
+
+class StaticFilesHandlerBuilder:
+    """
+    A builder for a handler which serves the files of a directory.
+
+    The handler serves the file found by removing the url prefix from the request path and looking up the rest
+    inside the directory.  Paths which resolve outside of the directory are treated as not found (raising
+    RouteNotFoundException like any other missing route).  Routes only match a single path component per
+    parameter so, for example, register the handler on "/static/{file_name}" (and "/static/{folder}/{file_name}"
+    for a nested folder).
+
+    File metadata and headers (content-type, content-length, ETag and Last-Modified) are cached for a short time
+    rather than looked up on every request.  Small files are held in memory as prebuilt responses while larger
+    files are streamed with their length set so the WSGI server's file wrapper (and sendfile) can be used.
+    Conditional GET requests are answered with 304 Not Modified.
+    """
+
+    def __init__(self, directory, url_prefix):
+        """
+        Constructs an initial StaticFilesHandlerBuilder with common defaults.
+
+        :param directory: the directory holding the files to serve
+        :param url_prefix: the part of the request path before the file path (ex. "/static")
+        """
+        self._directory = directory
+        self._url_prefix = url_prefix
+        self._cache_ttl_seconds = 5
+        self._in_memory_size_limit = 64 * 1024
+        self._cache_control = None
+
+    def set_cache_ttl_seconds(self, cache_ttl_seconds):
+        """
+        Sets how long file metadata (and in memory contents) are cached before a file is looked up again (default 5).
+
+        :param cache_ttl_seconds: a non negative number of seconds
+        :return: This builder to allow for fluent design.
+        """
+        if not isinstance(cache_ttl_seconds, (int, float)) or cache_ttl_seconds < 0:
+            raise HandlerBuildException(
+                "Cache ttl {c} must be a non negative number of seconds.".format(c=cache_ttl_seconds))
+        self._cache_ttl_seconds = cache_ttl_seconds
+        return self
+
+    def set_in_memory_size_limit(self, in_memory_size_limit):
+        """
+        Sets the size, in bytes, up to which files are held in memory rather than streamed (default 65536).
+
+        :param in_memory_size_limit: a non negative number of bytes (0 streams every file)
+        :return: This builder to allow for fluent design.
+        """
+        if not isinstance(in_memory_size_limit, int) or in_memory_size_limit < 0:
+            raise HandlerBuildException(
+                "In memory size limit {l} must be a non negative integer.".format(l=in_memory_size_limit))
+        self._in_memory_size_limit = in_memory_size_limit
+        return self
+
+    def set_cache_control(self, cache_control):
+        """
+        Sets a Cache-Control header to send with every file (default none).
+
+        :param cache_control: the header value (ex. "public, max-age=3600")
+        :return: This builder to allow for fluent design.
+        """
+        self._cache_control = str(cache_control)
+        return self
+
+    def build(self):
+        """
+        Builds the handler.
+
+        :return: A handler for usage with the Eynnyd RoutesBuilder add_handler method.
+        """
+        if not os.path.isdir(self._directory):
+            raise HandlerBuildException("Static files directory {d} does not exist.".format(d=self._directory))
+        if not str(self._url_prefix).startswith("/"):
+            raise HandlerBuildException("Url prefix {u} does not start with a /".format(u=self._url_prefix))
+        return StaticFilesHandler(
+            self._directory,
+            self._url_prefix,
+            self._cache_ttl_seconds,
+            self._in_memory_size_limit,
+            self._cache_control)
@@ -17,6 +17,9 @@ setup(
         'arrow>=0.14.4,<=1.0.0',
         'optional.py>=1.0.0,<=2.0.0'
     ],
+    extras_require={
+        'json': ['orjson']
+    },
     packages=find_packages(exclude=('test')),
     classifiers=[
         'Development Status :: 5 - Production/Stable',
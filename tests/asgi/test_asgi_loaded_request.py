@@ -0,0 +1,96 @@
+from unittest import TestCase
+
+from eynnyd.internal.asgi.asgi_loaded_request import ASGILoadedRequest
+
+
+class TestASGILoadedRequest(TestCase):
+
+    def _scope(self, **overrides):
+        scope = {
+            "type": "http",
+            "method": "GET",
+            "scheme": "https",
+            "server": ("localhost", 8008),
+            "client": ("10.0.0.1", 51234),
+            "path": "/foo/bar",
+            "query_string": b"foo=bar&fizz=buzz&fizz=bang",
+            "headers": []
+        }
+        scope.update(overrides)
+        return scope
+
+    def test_copy_and_set_path_parameters(self):
+        original = ASGILoadedRequest(self._scope(), b"body")
+        copy = original.copy_and_set_path_parameters({"pants": "awesome"})
+        self.assertDictEqual({"pants": "awesome"}, copy.path_parameters)
+        self.assertEqual(original.http_method, copy.http_method)
+        self.assertEqual(b"body", copy.byte_body)
+
+    def test_copy_and_set_deadline_keeps_path_parameters(self):
+        deadline = object()
+        copy = ASGILoadedRequest(self._scope(), b"body", {"pants": "awesome"}).copy_and_set_deadline(deadline)
+        self.assertIs(deadline, copy.deadline.get())
+        self.assertDictEqual({"pants": "awesome"}, copy.path_parameters)
+        self.assertIs(deadline, copy.copy_and_set_path_parameters({}).deadline.get())
+        self.assertTrue(ASGILoadedRequest(self._scope(), b"").deadline.is_empty())
+
+    def test_http_method(self):
+        self.assertEqual("POST", ASGILoadedRequest(self._scope(method="POST"), b"").http_method)
+
+    def test_request_uri(self):
+        request = ASGILoadedRequest(self._scope(), b"")
+        self.assertEqual("https", request.request_uri.scheme)
+        self.assertEqual("localhost", request.request_uri.host)
+        self.assertEqual(8008, request.request_uri.port)
+        self.assertEqual("/foo/bar", request.request_uri.path)
+        self.assertEqual("foo=bar&fizz=buzz&fizz=bang", request.request_uri.query)
+
+    def test_request_uri_without_server(self):
+        request = ASGILoadedRequest(self._scope(server=None), b"")
+        self.assertIsNone(request.request_uri.host)
+        self.assertIsNone(request.request_uri.port)
+
+    def test_forwarded_request_uri(self):
+        request = ASGILoadedRequest(
+            self._scope(headers=[(b"forwarded", b"proto=http;host=example.com")]),
+            b"")
+        self.assertEqual("http", request.forwarded_request_uri.scheme)
+        self.assertEqual("example.com", request.forwarded_request_uri.host)
+
+    def test_x_forwarded_request_uri(self):
+        request = ASGILoadedRequest(
+            self._scope(headers=[(b"x-forwarded-proto", b"http"), (b"x-forwarded-host", b"example.com")]),
+            b"")
+        self.assertEqual("http", request.forwarded_request_uri.scheme)
+        self.assertEqual("example.com", request.forwarded_request_uri.host)
+
+    def test_headers(self):
+        request = ASGILoadedRequest(
+            self._scope(headers=[
+                (b"content-type", b"text/plain"),
+                (b"accept", b"text/html"),
+                (b"accept", b"application/json")]),
+            b"")
+        self.assertDictEqual(
+            {"CONTENT-TYPE": "text/plain", "ACCEPT": "text/html, application/json"},
+            request.headers)
+
+    def test_client_ip_address(self):
+        self.assertEqual("10.0.0.1", ASGILoadedRequest(self._scope(), b"").client_ip_address)
+        self.assertIsNone(ASGILoadedRequest(self._scope(client=None), b"").client_ip_address)
+
+    def test_cookies_from_repeated_headers(self):
+        request = ASGILoadedRequest(
+            self._scope(headers=[(b"cookie", b"foo=bar"), (b"cookie", b"fizz=buzz")]),
+            b"")
+        self.assertEqual("bar", request.cookies["foo"][0].value)
+        self.assertEqual("buzz", request.cookies["fizz"][0].value)
+
+    def test_query_parameters(self):
+        request = ASGILoadedRequest(self._scope(query_string=b"foo=bar%20baz&fizz=buzz&fizz=bang"), b"")
+        self.assertDictEqual({"foo": ["bar baz"], "fizz": ["buzz", "bang"]}, request.query_parameters)
+
+    def test_bodies(self):
+        request = ASGILoadedRequest(self._scope(), "café".encode("utf-8"))
+        self.assertEqual("café".encode("utf-8"), request.byte_body)
+        self.assertEqual("café", request.utf8_body)
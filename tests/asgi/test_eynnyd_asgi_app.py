@@ -0,0 +1,217 @@
+import asyncio
+import io
+from unittest import TestCase
+
+from eynnyd.eynnyd_webapp_builder import EynnydWebappBuilder
+from eynnyd.exceptions import EynnydWebappBuildException, UnsupportedASGIScopeTypeException
+from eynnyd.request_coalescer_builder import RequestCoalescerBuilder
+from eynnyd.response_builder import ResponseBuilder
+from eynnyd.response_cache_builder import ResponseCacheBuilder
+from eynnyd.routes_builder import RoutesBuilder
+
+
+class TestEynnydAsgiApp(TestCase):
+
+    def setUp(self):
+        self._loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        self._loop.close()
+
+    def _run(self, app, scope, received_messages):
+        received = list(received_messages)
+        sent = []
+
+        async def receive():
+            return received.pop(0)
+
+        async def send(message):
+            sent.append(message)
+
+        self._loop.run_until_complete(app(scope, receive, send))
+        return sent
+
+    def _http_scope(self, method="GET", path="/", headers=None):
+        return {
+            "type": "http",
+            "method": method,
+            "scheme": "http",
+            "server": ("localhost", 8000),
+            "client": ("127.0.0.1", 5000),
+            "path": path,
+            "query_string": b"",
+            "headers": headers if headers else []
+        }
+
+    def _build(self, routes_builder, webapp_builder=None):
+        webapp_builder = webapp_builder if webapp_builder else EynnydWebappBuilder()
+        return webapp_builder.set_routes(routes_builder.build()).build_asgi()
+
+    def test_handler_response_sent(self):
+        app = self._build(
+            RoutesBuilder().add_handler(
+                "GET",
+                "/hello/{name}",
+                lambda request: ResponseBuilder()
+                .set_utf8_body("hi " + request.path_parameters["name"])
+                .set_headers({"X-Thing": "yes"})
+                .build()))
+
+        sent = self._run(app, self._http_scope(path="/hello/bob"), [{"type": "http.request", "body": b""}])
+
+        self.assertEqual("http.response.start", sent[0]["type"])
+        self.assertEqual(200, sent[0]["status"])
+        self.assertIn((b"x-thing", b"yes"), sent[0]["headers"])
+        self.assertEqual({"type": "http.response.body", "body": b"hi bob", "more_body": False}, sent[1])
+
+    def test_request_body_read_across_messages(self):
+        app = self._build(
+            RoutesBuilder().add_handler(
+                "POST",
+                "/echo",
+                lambda request: ResponseBuilder().set_byte_body(request.byte_body).build()))
+
+        sent = self._run(
+            app,
+            self._http_scope(method="POST", path="/echo"),
+            [
+                {"type": "http.request", "body": b"foo", "more_body": True},
+                {"type": "http.request", "body": b"bar", "more_body": False}])
+
+        self.assertEqual(b"foobar", sent[1]["body"])
+
+    def test_disconnect_while_reading_body_aborts_request(self):
+        handled_bodies = []
+
+        def handler(request):
+            handled_bodies.append(request.byte_body)
+            return ResponseBuilder().build()
+
+        app = self._build(RoutesBuilder().add_handler("POST", "/echo", handler))
+
+        sent = self._run(
+            app,
+            self._http_scope(method="POST", path="/echo"),
+            [
+                {"type": "http.request", "body": b"foo", "more_body": True},
+                {"type": "http.disconnect"}])
+
+        self.assertEqual([], handled_bodies)
+        self.assertEqual([], sent)
+
+    def test_request_interceptors_run(self):
+        def add_header(request, response):
+            return ResponseBuilder.from_response(response)\
+                .add_header("X-Intercepted", "true")\
+                .set_byte_body(b"intercepted")\
+                .build()
+
+        app = self._build(
+            RoutesBuilder()
+            .add_handler("GET", "/", lambda request: ResponseBuilder().build())
+            .add_response_interceptor("/", add_header))
+
+        sent = self._run(app, self._http_scope(), [{"type": "http.request", "body": b""}])
+
+        self.assertIn((b"x-intercepted", b"true"), sent[0]["headers"])
+        self.assertEqual(b"intercepted", sent[1]["body"])
+
+    def test_route_not_found_uses_error_handlers(self):
+        app = self._build(RoutesBuilder().add_handler("GET", "/", lambda request: ResponseBuilder().build()))
+
+        sent = self._run(app, self._http_scope(path="/missing"), [{"type": "http.request", "body": b""}])
+
+        self.assertEqual(404, sent[0]["status"])
+
+    def test_streamed_body_sent_in_chunks_and_closed(self):
+        stream = io.BytesIO(b"abcdefghij")
+        app = self._build(
+            RoutesBuilder().add_handler(
+                "GET",
+                "/",
+                lambda request: ResponseBuilder().set_stream_body(stream, block_size=4).build()))
+
+        sent = self._run(app, self._http_scope(), [{"type": "http.request", "body": b""}])
+
+        self.assertEqual(
+            [b"abcd", b"efgh", b"ij", b""],
+            [message["body"] for message in sent[1:]])
+        self.assertEqual([True, True, True, False], [message["more_body"] for message in sent[1:]])
+        self.assertTrue(stream.closed)
+
+    def test_async_handler_awaited_on_server_loop(self):
+        loops = []
+
+        async def handler(request):
+            loops.append(asyncio.get_event_loop())
+            return ResponseBuilder().set_utf8_body("async").build()
+
+        app = self._build(RoutesBuilder().add_handler("GET", "/", handler))
+
+        sent = self._run(app, self._http_scope(), [{"type": "http.request", "body": b""}])
+
+        self.assertEqual(b"async", sent[1]["body"])
+        self.assertEqual([self._loop], loops)
+
+    def test_async_handler_behind_cache_and_coalescer_awaited_on_server_loop(self):
+        loops = []
+
+        async def handler(request):
+            loops.append(asyncio.get_event_loop())
+            return ResponseBuilder().set_utf8_body("async").build()
+
+        app = self._build(
+            RoutesBuilder()
+            .add_handler("GET", "/", handler)
+            .set_request_coalescer("GET", "/", RequestCoalescerBuilder().build())
+            .set_response_cache("GET", "/", ResponseCacheBuilder().build()))
+
+        for _ in range(2):
+            sent = self._run(app, self._http_scope(), [{"type": "http.request", "body": b""}])
+            self.assertEqual(b"async", sent[1]["body"])
+        self.assertEqual([self._loop], loops)
+
+    def test_unsupported_scope_raises(self):
+        app = self._build(RoutesBuilder().add_handler("GET", "/", lambda request: ResponseBuilder().build()))
+        with self.assertRaises(UnsupportedASGIScopeTypeException):
+            self._run(app, {"type": "websocket"}, [])
+
+    def test_lifespan_hooks_run(self):
+        calls = []
+
+        async def async_startup():
+            calls.append("async_startup")
+
+        app = self._build(
+            RoutesBuilder().add_handler("GET", "/", lambda request: ResponseBuilder().build()),
+            EynnydWebappBuilder()
+            .add_startup_hook(lambda: calls.append("startup"))
+            .add_startup_hook(async_startup)
+            .add_shutdown_hook(lambda: calls.append("shutdown")))
+
+        sent = self._run(app, {"type": "lifespan"}, [{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}])
+
+        self.assertEqual(["startup", "async_startup", "shutdown"], calls)
+        self.assertEqual(
+            [{"type": "lifespan.startup.complete"}, {"type": "lifespan.shutdown.complete"}],
+            sent)
+
+    def test_lifespan_hook_failure_reported(self):
+        def failing_startup():
+            raise ValueError("no database")
+
+        app = self._build(
+            RoutesBuilder().add_handler("GET", "/", lambda request: ResponseBuilder().build()),
+            EynnydWebappBuilder().add_startup_hook(failing_startup))
+
+        sent = self._run(app, {"type": "lifespan"}, [{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}])
+
+        self.assertEqual({"type": "lifespan.startup.failed", "message": "no database"}, sent[0])
+
+    def test_lifespan_hook_with_arguments_rejected(self):
+        with self.assertRaises(EynnydWebappBuildException):
+            EynnydWebappBuilder().add_startup_hook(lambda app: None)
+
+    def test_lifespan_hook_not_callable_rejected(self):
+        with self.assertRaises(EynnydWebappBuildException):
+            EynnydWebappBuilder().add_shutdown_hook("not a hook")
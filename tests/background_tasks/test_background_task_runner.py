@@ -0,0 +1,224 @@
+import asyncio
+import io
+import threading
+from unittest import TestCase
+
+from eynnyd.background_task_runner_builder import BackgroundTaskRunnerBuilder
+from eynnyd.eynnyd_webapp_builder import EynnydWebappBuilder
+from eynnyd.exceptions import EynnydWebappBuildException, InvalidBackgroundTaskException
+from eynnyd.internal.plan_execution.async_callable import AsyncCallable
+from eynnyd.internal.wsgi_loaded_request import WSGILoadedRequest
+from eynnyd.request_coalescer_builder import RequestCoalescerBuilder
+from eynnyd.response_builder import ResponseBuilder
+from eynnyd.response_cache_builder import ResponseCacheBuilder
+from eynnyd.routes_builder import RoutesBuilder
+
+
+class TestBackgroundTaskRunner(TestCase):
+
+    def test_build_raises_on_invalid_settings(self):
+        with self.assertRaises(EynnydWebappBuildException):
+            BackgroundTaskRunnerBuilder().set_maximum_workers(-1)
+        with self.assertRaises(EynnydWebappBuildException):
+            BackgroundTaskRunnerBuilder().set_maximum_queue_size(-1)
+        with self.assertRaises(EynnydWebappBuildException):
+            BackgroundTaskRunnerBuilder().set_error_hook(lambda exc: None)
+        with self.assertRaises(EynnydWebappBuildException):
+            BackgroundTaskRunnerBuilder().set_maximum_queue_size(1).build()
+        with self.assertRaises(EynnydWebappBuildException):
+            EynnydWebappBuilder().set_background_task_runner(object())
+
+    def test_response_builder_validates_background_tasks(self):
+        with self.assertRaises(InvalidBackgroundTaskException):
+            ResponseBuilder().add_background_task("not callable")
+        with self.assertRaises(InvalidBackgroundTaskException):
+            ResponseBuilder().add_background_task(lambda: None).build_prebuilt()
+
+    def test_tasks_run_in_order_only_once_body_is_closed(self):
+        ran = []
+
+        def handler(request):
+            return ResponseBuilder()\
+                .set_utf8_body("sent")\
+                .add_background_task(ran.append, "email")\
+                .add_background_task(lambda: ran.append("audit"))\
+                .build()
+
+        webapp = TestBackgroundTaskRunner._webapp(RoutesBuilder().add_handler("GET", "/", handler))
+        wsgi_response = TestBackgroundTaskRunner._wsgi_response(webapp)
+
+        self.assertEqual([b"sent"], list(wsgi_response.body))
+        self.assertEqual([], ran)
+        wsgi_response.body.close()
+        wsgi_response.body.close()
+        self.assertEqual(["email", "audit"], ran)
+
+    def test_response_interceptors_keep_tasks(self):
+        ran = []
+        routes = RoutesBuilder()\
+            .add_handler("GET", "/", lambda request: ResponseBuilder().add_background_task(ran.append, 1).build())\
+            .add_response_interceptor(
+                "/",
+                lambda request, response: ResponseBuilder.from_response(response)
+                .add_background_task(ran.append, 2)
+                .build())
+
+        TestBackgroundTaskRunner._wsgi_response(TestBackgroundTaskRunner._webapp(routes)).body.close()
+        self.assertEqual([1, 2], ran)
+
+    def test_coroutine_tasks_with_arguments_are_wrapped(self):
+        async def warm_cache(key):
+            return key
+
+        response = ResponseBuilder().add_background_task(warm_cache, "users").build()
+        self.assertIsInstance(response.background_tasks[0], AsyncCallable)
+        self.assertEqual("users", response.background_tasks[0]())
+
+    def test_coroutine_tasks_are_awaited(self):
+        ran = []
+
+        async def warm_cache(key):
+            await asyncio.sleep(0)
+            ran.append(key)
+
+        routes = RoutesBuilder().add_handler(
+            "GET", "/", lambda request: ResponseBuilder().add_background_task(warm_cache, "users").build())
+
+        TestBackgroundTaskRunner._wsgi_response(TestBackgroundTaskRunner._webapp(routes)).body.close()
+        self.assertEqual(["users"], ran)
+
+    def test_failures_go_to_error_hook_and_do_not_stop_other_tasks(self):
+        ran = []
+        errors = []
+
+        def failing_task():
+            raise ValueError("smtp down")
+
+        routes = RoutesBuilder().add_handler(
+            "GET",
+            "/",
+            lambda request: ResponseBuilder()
+            .add_background_task(failing_task)
+            .add_background_task(ran.append, "audit")
+            .build())
+        runner = BackgroundTaskRunnerBuilder().set_error_hook(lambda exc, task: errors.append(str(exc))).build()
+
+        TestBackgroundTaskRunner._wsgi_response(TestBackgroundTaskRunner._webapp(routes, runner)).body.close()
+        self.assertEqual(["audit"], ran)
+        self.assertEqual(["smtp down"], errors)
+        self.assertEqual(1, runner.metrics.failed)
+        self.assertEqual(1, runner.metrics.completed)
+
+    def test_pool_runs_tasks_off_the_closing_thread_and_runs_overflow_inline(self):
+        release = threading.Event()
+        started = threading.Semaphore(0)
+        thread_names = []
+
+        def blocking_task():
+            thread_names.append(threading.current_thread().name)
+            started.release()
+            release.wait(5)
+
+        routes = RoutesBuilder()\
+            .add_handler("GET", "/slow", lambda request: ResponseBuilder().add_background_task(blocking_task).build())\
+            .add_handler(
+                "GET",
+                "/fast",
+                lambda request: ResponseBuilder()
+                .add_background_task(lambda: thread_names.append(threading.current_thread().name))
+                .build())
+        runner = BackgroundTaskRunnerBuilder()\
+            .set_name("mailer")\
+            .set_maximum_workers(1)\
+            .set_maximum_queue_size(1)\
+            .build()
+        webapp = TestBackgroundTaskRunner._webapp(routes, runner)
+
+        TestBackgroundTaskRunner._wsgi_response(webapp, "/slow").body.close()
+        TestBackgroundTaskRunner._wsgi_response(webapp, "/slow").body.close()
+        self.assertTrue(started.acquire(timeout=5))
+        self.assertEqual(1, runner.metrics.active)
+        self.assertEqual(1, runner.metrics.backlog)
+
+        TestBackgroundTaskRunner._wsgi_response(webapp, "/fast").body.close()
+        release.set()
+        self.assertTrue(started.acquire(timeout=5))
+        self.assertTrue(thread_names[0].startswith("mailer"))
+        self.assertEqual(threading.current_thread().name, thread_names[1])
+        self.assertEqual(1, runner.metrics.ran_inline)
+
+    def test_tasks_run_behind_response_cache_and_request_coalescer(self):
+        ran = []
+
+        def handler(request):
+            return ResponseBuilder()\
+                .add_header("Cache-Control", "max-age=60")\
+                .set_utf8_body("sent")\
+                .add_background_task(ran.append, request.request_uri.path)\
+                .build()
+
+        routes = RoutesBuilder()\
+            .add_handler("GET", "/cached", handler)\
+            .add_handler("GET", "/coalesced", handler)\
+            .set_response_cache("GET", "/cached", ResponseCacheBuilder().build())\
+            .set_request_coalescer("GET", "/coalesced", RequestCoalescerBuilder().build())
+        webapp = TestBackgroundTaskRunner._webapp(routes)
+
+        for path in ["/cached", "/cached", "/coalesced"]:
+            wsgi_response = TestBackgroundTaskRunner._wsgi_response(webapp, path)
+            self.assertEqual("200 OK", wsgi_response.status)
+            self.assertEqual([b"sent"], list(wsgi_response.body))
+            wsgi_response.body.close()
+        self.assertEqual(["/cached", "/cached", "/coalesced"], ran)
+
+    def test_asgi_tasks_run_after_body_sent(self):
+        events = []
+        routes = RoutesBuilder().add_handler(
+            "GET",
+            "/",
+            lambda request: ResponseBuilder().set_utf8_body("hi").add_background_task(events.append, "task").build())
+        app = EynnydWebappBuilder().set_routes(routes.build()).build_asgi()
+        received = [{"type": "http.request", "body": b""}]
+
+        async def receive():
+            return received.pop(0)
+
+        async def send(message):
+            events.append(message["type"])
+
+        scope = {
+            "type": "http",
+            "method": "GET",
+            "scheme": "http",
+            "server": ("localhost", 8000),
+            "client": ("127.0.0.1", 5000),
+            "path": "/",
+            "query_string": b"",
+            "headers": []
+        }
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(app(scope, receive, send))
+        finally:
+            loop.close()
+        self.assertEqual(["http.response.start", "http.response.body", "http.response.body", "task"], events)
+
+    @staticmethod
+    def _webapp(routes_builder, runner=None):
+        webapp_builder = EynnydWebappBuilder().set_routes(routes_builder.build())
+        if runner is not None:
+            webapp_builder.set_background_task_runner(runner)
+        return webapp_builder.build()
+
+    @staticmethod
+    def _wsgi_response(webapp, path="/"):
+        request = WSGILoadedRequest({
+            "REQUEST_METHOD": "GET",
+            "wsgi.url_scheme": "http",
+            "SERVER_NAME": "localhost",
+            "SERVER_PORT": "80",
+            "PATH_INFO": path,
+            "QUERY_STRING": "",
+            "wsgi.input": io.BytesIO(b"")
+        })
+        return webapp.process_response_to_wsgi_output(request, webapp.process_request_to_response(request))
@@ -0,0 +1,233 @@
+import asyncio
+import io
+import os
+import threading
+from http import HTTPStatus
+from unittest import TestCase
+
+from eynnyd.eynnyd_webapp_builder import EynnydWebappBuilder
+from eynnyd.exceptions import HandlerBuildException, HandlerExecutorSaturatedException, RouteBuildException
+from eynnyd.handler_executor_builder import HandlerExecutorBuilder
+from eynnyd.internal.plan_execution.async_callable import AsyncCallable
+from eynnyd.internal.wsgi_loaded_request import WSGILoadedRequest
+from eynnyd.response_builder import ResponseBuilder
+from eynnyd.response_cache_builder import ResponseCacheBuilder
+from eynnyd.routes_builder import RoutesBuilder
+
+
+def process_id_handler(request):
+    return ResponseBuilder()\
+        .set_utf8_body("{p} {b} {c}".format(p=os.getpid(), b=request.utf8_body, c=request.cookies["foo"][0].value))\
+        .build()
+
+
+class BlockingHandler:
+
+    def __init__(self):
+        self.started = threading.Semaphore(0)
+        self.release = threading.Event()
+
+    def __call__(self, request):
+        self.started.release()
+        self.release.wait(5)
+        return ResponseBuilder().set_utf8_body(threading.current_thread().name).build()
+
+
+class TestHandlerExecutor(TestCase):
+
+    def test_build_raises_on_invalid_settings(self):
+        with self.assertRaises(HandlerBuildException):
+            HandlerExecutorBuilder().set_maximum_workers(0)
+        with self.assertRaises(HandlerBuildException):
+            HandlerExecutorBuilder().set_maximum_queue_size(-1)
+        with self.assertRaises(HandlerBuildException):
+            HandlerExecutorBuilder().set_saturation_listener(lambda: None)
+        with self.assertRaises(HandlerBuildException):
+            HandlerExecutorBuilder().use_inline().use_process_pool().build()
+
+    def test_routes_builder_rejects_other_executors(self):
+        with self.assertRaises(RouteBuildException):
+            RoutesBuilder()\
+                .add_handler("GET", "/", lambda request: ResponseBuilder().build())\
+                .set_handler_executor("GET", "/", object())
+
+    def test_thread_pool_runs_handler_on_named_thread(self):
+        handler = HandlerExecutorBuilder().set_name("reports").build().wrap(
+            lambda request: ResponseBuilder().set_utf8_body(threading.current_thread().name).build())
+        self.assertTrue(handler(TestHandlerExecutor._request()).body.content.startswith(b"reports"))
+
+    def test_wrapped_handler_is_awaitable(self):
+        handler = HandlerExecutorBuilder().build().wrap(
+            lambda request: ResponseBuilder().set_utf8_body("awaited").build())
+        self.assertIsInstance(handler, AsyncCallable)
+
+        loop = asyncio.new_event_loop()
+        try:
+            response = loop.run_until_complete(handler.call_async(TestHandlerExecutor._request()))
+        finally:
+            loop.close()
+        self.assertEqual(b"awaited", response.body.content)
+
+    def test_saturated_pool_rejects_and_reports_metrics(self):
+        reported_metrics = []
+        blocking_handler = BlockingHandler()
+        handler_executor = HandlerExecutorBuilder()\
+            .set_name("slow")\
+            .set_maximum_workers(1)\
+            .set_maximum_queue_size(1)\
+            .set_saturation_listener(reported_metrics.append)\
+            .build()
+        handler = handler_executor.wrap(blocking_handler)
+
+        running = handler_executor.submit(blocking_handler, TestHandlerExecutor._request())
+        blocking_handler.started.acquire(timeout=5)
+        queued = handler_executor.submit(blocking_handler, TestHandlerExecutor._request())
+
+        with self.assertRaises(HandlerExecutorSaturatedException):
+            handler(TestHandlerExecutor._request())
+
+        self.assertEqual(1, len(reported_metrics))
+        self.assertEqual("slow", reported_metrics[0].name)
+        self.assertEqual(1, reported_metrics[0].active)
+        self.assertEqual(1, reported_metrics[0].queued)
+        self.assertEqual(1.0, reported_metrics[0].saturation)
+        self.assertEqual(1, reported_metrics[0].rejected)
+
+        blocking_handler.release.set()
+        running.result(5)
+        queued.result(5)
+        metrics = handler_executor.metrics
+        self.assertEqual(0, metrics.active)
+        self.assertEqual(0, metrics.queued)
+        self.assertEqual(2, metrics.completed)
+        self.assertEqual(1, metrics.rejected)
+
+    def test_saturated_route_answered_with_service_unavailable(self):
+        blocking_handler = BlockingHandler()
+        handler_executor = HandlerExecutorBuilder().set_maximum_workers(1).set_maximum_queue_size(0).build()
+        webapp = EynnydWebappBuilder()\
+            .set_routes(
+                RoutesBuilder()
+                .add_handler("GET", "/report", blocking_handler)
+                .set_handler_executor("GET", "/report", handler_executor)
+                .build())\
+            .build()
+
+        running = handler_executor.submit(blocking_handler, TestHandlerExecutor._request())
+        blocking_handler.started.acquire(timeout=5)
+        response = webapp.process_request_to_response(TestHandlerExecutor._request("/report"))
+        blocking_handler.release.set()
+        running.result(5)
+
+        self.assertEqual(HTTPStatus.SERVICE_UNAVAILABLE.value, response.status.code)
+
+    def test_only_cache_misses_pooled_when_executor_registered_before_cache(self):
+        executor_first = HandlerExecutorBuilder().build()
+        cache_first = HandlerExecutorBuilder().build()
+
+        def handler(request):
+            return ResponseBuilder().set_utf8_body("cached").build()
+
+        webapp = EynnydWebappBuilder()\
+            .set_routes(
+                RoutesBuilder()
+                .add_handler("GET", "/executor-first", handler)
+                .set_handler_executor("GET", "/executor-first", executor_first)
+                .set_response_cache("GET", "/executor-first", ResponseCacheBuilder().build())
+                .add_handler("GET", "/cache-first", handler)
+                .set_response_cache("GET", "/cache-first", ResponseCacheBuilder().build())
+                .set_handler_executor("GET", "/cache-first", cache_first)
+                .build())\
+            .build()
+
+        for _ in range(3):
+            webapp.process_request_to_response(TestHandlerExecutor._request("/executor-first"))
+            webapp.process_request_to_response(TestHandlerExecutor._request("/cache-first"))
+
+        for handler_executor, expected_submitted in [(executor_first, 1), (cache_first, 3)]:
+            metrics = handler_executor.metrics
+            self.assertEqual(expected_submitted, metrics.active + metrics.queued + metrics.completed)
+
+    def test_process_pool_runs_handler_in_another_process_with_request_copy(self):
+        handler = HandlerExecutorBuilder().set_maximum_workers(1).use_process_pool().build().wrap(process_id_handler)
+        request = TestHandlerExecutor._request(body=b"hello", cookie="foo=bar")
+
+        process_id, body, cookie = handler(request).body.content.decode("utf-8").split(" ")
+
+        self.assertNotEqual(str(os.getpid()), process_id)
+        self.assertEqual("hello", body)
+        self.assertEqual("bar", cookie)
+
+    def test_process_pool_rejects_unpicklable_handlers_when_routes_built(self):
+        async def async_handler(request):
+            return ResponseBuilder().build()
+
+        for add_handler_and_wrappers in [
+                lambda routes, executor: routes
+                    .add_handler("GET", "/foo", lambda request: ResponseBuilder().build())
+                    .set_handler_executor("GET", "/foo", executor),
+                lambda routes, executor: routes
+                    .add_handler("GET", "/foo", async_handler)
+                    .set_handler_executor("GET", "/foo", executor),
+                lambda routes, executor: routes
+                    .add_handler("GET", "/foo", process_id_handler)
+                    .set_response_cache("GET", "/foo", ResponseCacheBuilder().build())
+                    .set_handler_executor("GET", "/foo", executor)]:
+            routes = add_handler_and_wrappers(RoutesBuilder(), HandlerExecutorBuilder().use_process_pool().build())
+            with self.assertRaises(RouteBuildException):
+                routes.build()
+
+    def test_inline_runs_on_calling_thread_and_loop(self):
+        handler = HandlerExecutorBuilder().use_inline().build().wrap(
+            lambda request: ResponseBuilder().set_utf8_body(threading.current_thread().name).build())
+        self.assertEqual(
+            threading.current_thread().name.encode("utf-8"),
+            handler(TestHandlerExecutor._request()).body.content)
+
+        loop = asyncio.new_event_loop()
+        try:
+            response = loop.run_until_complete(handler.call_async(TestHandlerExecutor._request()))
+        finally:
+            loop.close()
+        self.assertEqual(threading.current_thread().name.encode("utf-8"), response.body.content)
+
+    def test_inline_awaits_async_handlers(self):
+        async def handler(request):
+            return ResponseBuilder().set_utf8_body("async").build()
+
+        inline_handler = HandlerExecutorBuilder().use_inline().build().wrap(AsyncCallable(handler))
+        loop = asyncio.new_event_loop()
+        try:
+            response = loop.run_until_complete(inline_handler.call_async(TestHandlerExecutor._request()))
+        finally:
+            loop.close()
+        self.assertEqual(b"async", response.body.content)
+
+    def test_deadline_stops_waiting_on_pooled_handler(self):
+        handler = BlockingHandler()
+        routes = RoutesBuilder()\
+            .add_handler("GET", "/slow", handler)\
+            .set_handler_executor("GET", "/slow", HandlerExecutorBuilder().build())\
+            .set_route_deadline("GET", "/slow", 0.05)\
+            .build()
+        webapp = EynnydWebappBuilder().set_routes(routes).build()
+
+        response = webapp.process_request_to_response(TestHandlerExecutor._request("/slow"))
+        handler.release.set()
+        self.assertEqual(HTTPStatus.GATEWAY_TIMEOUT.value, response.status.code)
+
+    @staticmethod
+    def _request(path="/", body=b"", cookie=None):
+        environment = {
+            "REQUEST_METHOD": "GET",
+            "wsgi.url_scheme": "http",
+            "SERVER_NAME": "localhost",
+            "SERVER_PORT": "80",
+            "PATH_INFO": path,
+            "QUERY_STRING": "",
+            "CONTENT_LENGTH": str(len(body)),
+            "wsgi.input": io.BytesIO(body)
+        }
+        if cookie:
+            environment["HTTP_COOKIE"] = cookie
+        return WSGILoadedRequest(environment)
@@ -0,0 +1,162 @@
+import threading
+import time
+from unittest import TestCase
+
+from eynnyd.exceptions import HandlerBuildException
+from eynnyd.internal.prebuilt_response import PrebuiltResponse
+from eynnyd.internal.wsgi_loaded_request import WSGILoadedRequest
+from eynnyd.request_coalescer_builder import RequestCoalescerBuilder
+from eynnyd.response_builder import ResponseBuilder
+
+
+class BlockingHandler:
+
+    def __init__(self, set_body):
+        self._set_body = set_body
+        self._lock = threading.Lock()
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.call_count = 0
+
+    def __call__(self, request):
+        with self._lock:
+            self.call_count += 1
+        self.started.set()
+        self.release.wait(5)
+        return self._set_body(ResponseBuilder()).build()
+
+
+class TestRequestCoalescer(TestCase):
+
+    def test_build_raises_on_invalid_wait_timeout(self):
+        with self.assertRaises(HandlerBuildException):
+            RequestCoalescerBuilder().set_wait_timeout_seconds(0)
+
+    def test_single_request_gets_prebuilt_response(self):
+        handler = RequestCoalescerBuilder().build().wrap(lambda request: ResponseBuilder().set_utf8_body("foo").build())
+        response = handler(TestRequestCoalescer._request())
+        self.assertIsInstance(response, PrebuiltResponse)
+        self.assertEqual(b"foo", response.body.content)
+
+    def test_sequential_requests_not_coalesced(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return ResponseBuilder().build()
+
+        coalescing_handler = RequestCoalescerBuilder().build().wrap(handler)
+        coalescing_handler(TestRequestCoalescer._request())
+        coalescing_handler(TestRequestCoalescer._request())
+        self.assertEqual(2, len(calls))
+
+    def test_concurrent_identical_requests_share_response(self):
+        handler = BlockingHandler(lambda builder: builder.set_utf8_body("shared"))
+        responses = TestRequestCoalescer._run_concurrently(
+            RequestCoalescerBuilder().build().wrap(handler),
+            handler,
+            [TestRequestCoalescer._request() for _ in range(6)])
+        self.assertEqual(1, handler.call_count)
+        self.assertEqual(6, len(responses))
+        self.assertTrue(all(response is responses[0] for response in responses))
+
+    def test_concurrent_requests_with_different_key_headers_not_coalesced(self):
+        handler = BlockingHandler(lambda builder: builder.set_utf8_body("private"))
+        TestRequestCoalescer._run_concurrently(
+            RequestCoalescerBuilder().add_key_header("Accept-Language").build().wrap(handler),
+            handler,
+            [TestRequestCoalescer._request({"HTTP_ACCEPT_LANGUAGE": "en"}),
+             TestRequestCoalescer._request({"HTTP_ACCEPT_LANGUAGE": "fr"}),
+             TestRequestCoalescer._request({"HTTP_ACCEPT_LANGUAGE": "en"})])
+        self.assertEqual(2, handler.call_count)
+
+    def test_concurrent_requests_with_different_credentials_not_coalesced(self):
+        handler = BlockingHandler(lambda builder: builder.set_utf8_body("private"))
+        TestRequestCoalescer._run_concurrently(
+            RequestCoalescerBuilder().build().wrap(handler),
+            handler,
+            [TestRequestCoalescer._request({"HTTP_AUTHORIZATION": "one"}),
+             TestRequestCoalescer._request({"HTTP_AUTHORIZATION": "two"}),
+             TestRequestCoalescer._request({"HTTP_COOKIE": "session=one"}),
+             TestRequestCoalescer._request({"HTTP_AUTHORIZATION": "one"})])
+        self.assertEqual(3, handler.call_count)
+
+    def test_concurrent_requests_with_different_query_not_coalesced(self):
+        handler = BlockingHandler(lambda builder: builder)
+        TestRequestCoalescer._run_concurrently(
+            RequestCoalescerBuilder().build().wrap(handler),
+            handler,
+            [TestRequestCoalescer._request(query="page=1"), TestRequestCoalescer._request(query="page=2")])
+        self.assertEqual(2, handler.call_count)
+
+    def test_unshareable_responses_run_independently(self):
+        handler = BlockingHandler(lambda builder: builder.set_iterable_body([b"once"]))
+        TestRequestCoalescer._run_concurrently(
+            RequestCoalescerBuilder().build().wrap(handler),
+            handler,
+            [TestRequestCoalescer._request() for _ in range(3)])
+        self.assertEqual(3, handler.call_count)
+
+    def test_cookie_setting_responses_run_independently(self):
+        handler = BlockingHandler(lambda builder: builder.add_basic_cookie("session", "leader-only"))
+        responses = TestRequestCoalescer._run_concurrently(
+            RequestCoalescerBuilder().build().wrap(handler),
+            handler,
+            [TestRequestCoalescer._request() for _ in range(2)])
+        self.assertEqual(2, handler.call_count)
+        self.assertIsNot(responses[0], responses[1])
+
+    def test_responses_with_background_tasks_run_independently(self):
+        handler = BlockingHandler(lambda builder: builder.add_background_task(print))
+        responses = TestRequestCoalescer._run_concurrently(
+            RequestCoalescerBuilder().build().wrap(handler),
+            handler,
+            [TestRequestCoalescer._request() for _ in range(2)])
+        self.assertEqual(2, handler.call_count)
+        self.assertTrue(all(1 == len(response.background_tasks) for response in responses))
+
+    def test_non_get_requests_not_coalesced(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return ResponseBuilder().build()
+
+        RequestCoalescerBuilder().build().wrap(handler)(TestRequestCoalescer._request(method="POST"))
+        self.assertEqual(1, len(calls))
+
+    def test_waiting_request_runs_independently_after_timeout(self):
+        handler = BlockingHandler(lambda builder: builder)
+        coalescing_handler = RequestCoalescerBuilder().set_wait_timeout_seconds(0.01).build().wrap(handler)
+        leader = threading.Thread(target=coalescing_handler, args=(TestRequestCoalescer._request(),))
+        leader.start()
+        handler.started.wait(5)
+        follower = threading.Thread(target=coalescing_handler, args=(TestRequestCoalescer._request(),))
+        follower.start()
+        follower.join(0.5)
+        handler.release.set()
+        leader.join(5)
+        follower.join(5)
+        self.assertEqual(2, handler.call_count)
+
+    @staticmethod
+    def _run_concurrently(coalescing_handler, handler, requests):
+        responses = []
+        threads = [
+            threading.Thread(target=lambda r=request: responses.append(coalescing_handler(r)))
+            for request in requests]
+        threads[0].start()
+        handler.started.wait(5)
+        for thread in threads[1:]:
+            thread.start()
+        time.sleep(0.05)
+        handler.release.set()
+        for thread in threads:
+            thread.join(5)
+        return responses
+
+    @staticmethod
+    def _request(headers=None, method="GET", query=""):
+        wsgi_environment = {"REQUEST_METHOD": method, "PATH_INFO": "/report", "QUERY_STRING": query}
+        wsgi_environment.update(headers if headers else {})
+        return WSGILoadedRequest(wsgi_environment)
@@ -0,0 +1,244 @@
+import threading
+from http import HTTPStatus
+from unittest import TestCase
+from unittest.mock import patch
+
+from eynnyd.exceptions import HandlerBuildException
+from eynnyd.internal.prebuilt_response import PrebuiltResponse
+from eynnyd.internal.wsgi_loaded_request import WSGILoadedRequest
+from eynnyd.response_builder import ResponseBuilder
+from eynnyd.response_cache_builder import ResponseCacheBuilder
+
+
+class CountingHandler:
+
+    def __init__(self, response_builder_factory=None):
+        self._response_builder_factory = response_builder_factory or (lambda request: ResponseBuilder())
+        self.call_count = 0
+
+    def __call__(self, request):
+        self.call_count += 1
+        return self._response_builder_factory(request)\
+            .set_utf8_body("call {c}".format(c=self.call_count))\
+            .build()
+
+
+class TestResponseCache(TestCase):
+
+    def test_build_raises_on_invalid_ttl(self):
+        with self.assertRaises(HandlerBuildException):
+            ResponseCacheBuilder().set_ttl_seconds(0)
+
+    def test_build_raises_on_invalid_maximum_bytes(self):
+        with self.assertRaises(HandlerBuildException):
+            ResponseCacheBuilder().set_maximum_bytes("big")
+
+    def test_build_raises_on_invalid_cache_credentialed_requests(self):
+        with self.assertRaises(HandlerBuildException):
+            ResponseCacheBuilder().set_cache_credentialed_requests("yes")
+
+    def test_build_raises_on_invalid_wait_timeout(self):
+        with self.assertRaises(HandlerBuildException):
+            ResponseCacheBuilder().set_wait_timeout_seconds(-1)
+
+    def test_hit_served_without_handler(self):
+        handler = CountingHandler()
+        cached_handler = ResponseCacheBuilder().build().wrap(handler)
+        first = cached_handler(TestResponseCache._request("/foo"))
+        second = cached_handler(TestResponseCache._request("/foo"))
+        self.assertEqual(1, handler.call_count)
+        self.assertIsInstance(first, PrebuiltResponse)
+        self.assertIs(first, second)
+
+    def test_key_includes_path_method_and_query(self):
+        handler = CountingHandler()
+        cached_handler = ResponseCacheBuilder().build().wrap(handler)
+        cached_handler(TestResponseCache._request("/foo"))
+        cached_handler(TestResponseCache._request("/bar"))
+        cached_handler(TestResponseCache._request("/foo", query="a=1"))
+        cached_handler(TestResponseCache._request("/foo", method="HEAD"))
+        self.assertEqual(4, handler.call_count)
+
+    def test_key_uses_only_selected_query_parameters(self):
+        handler = CountingHandler()
+        cached_handler = ResponseCacheBuilder().add_key_query_parameter("page").build().wrap(handler)
+        cached_handler(TestResponseCache._request("/foo", query="page=1&tracking=abc"))
+        cached_handler(TestResponseCache._request("/foo", query="tracking=def&page=1"))
+        cached_handler(TestResponseCache._request("/foo", query="page=2"))
+        self.assertEqual(2, handler.call_count)
+
+    def test_non_cacheable_method_not_cached(self):
+        handler = CountingHandler()
+        cached_handler = ResponseCacheBuilder().build().wrap(handler)
+        cached_handler(TestResponseCache._request("/foo", method="POST"))
+        cached_handler(TestResponseCache._request("/foo", method="POST"))
+        self.assertEqual(2, handler.call_count)
+
+    def test_expired_response_reloaded(self):
+        handler = CountingHandler()
+        cached_handler = ResponseCacheBuilder().set_ttl_seconds(10).build().wrap(handler)
+        with patch("eynnyd.internal.handlers.response_cache.time.monotonic", return_value=100):
+            cached_handler(TestResponseCache._request("/foo"))
+        with patch("eynnyd.internal.handlers.response_cache.time.monotonic", return_value=105):
+            cached_handler(TestResponseCache._request("/foo"))
+        self.assertEqual(1, handler.call_count)
+        with patch("eynnyd.internal.handlers.response_cache.time.monotonic", return_value=111):
+            response = cached_handler(TestResponseCache._request("/foo"))
+        self.assertEqual(2, handler.call_count)
+        self.assertEqual(b"call 2", response.body.content)
+
+    def test_max_age_overrides_ttl(self):
+        handler = CountingHandler(lambda request: ResponseBuilder().add_header("cache-control", "public, max-age=1"))
+        cached_handler = ResponseCacheBuilder().set_ttl_seconds(60).build().wrap(handler)
+        with patch("eynnyd.internal.handlers.response_cache.time.monotonic", return_value=100):
+            cached_handler(TestResponseCache._request("/foo"))
+        with patch("eynnyd.internal.handlers.response_cache.time.monotonic", return_value=102):
+            cached_handler(TestResponseCache._request("/foo"))
+        self.assertEqual(2, handler.call_count)
+
+    def test_uncacheable_cache_control_not_cached(self):
+        for cache_control in ("no-store", "private, max-age=60", "no-cache", "max-age=0"):
+            handler = CountingHandler(lambda request: ResponseBuilder().add_header("cache-control", cache_control))
+            cached_handler = ResponseCacheBuilder().build().wrap(handler)
+            cached_handler(TestResponseCache._request("/foo"))
+            cached_handler(TestResponseCache._request("/foo"))
+            self.assertEqual(2, handler.call_count, cache_control)
+
+    def test_responses_with_cookies_not_cached(self):
+        handler = CountingHandler(lambda request: ResponseBuilder().add_basic_cookie("session", "abc"))
+        cached_handler = ResponseCacheBuilder().build().wrap(handler)
+        cached_handler(TestResponseCache._request("/foo"))
+        cached_handler(TestResponseCache._request("/foo"))
+        self.assertEqual(2, handler.call_count)
+
+    def test_responses_with_background_tasks_not_cached(self):
+        handler = CountingHandler(
+            lambda request: ResponseBuilder().add_header("Cache-Control", "max-age=60").add_background_task(print))
+        cached_handler = ResponseCacheBuilder().build().wrap(handler)
+        cached_handler(TestResponseCache._request("/foo"))
+        response = cached_handler(TestResponseCache._request("/foo"))
+        self.assertEqual(2, handler.call_count)
+        self.assertEqual(1, len(response.background_tasks))
+
+    def test_requests_with_credentials_bypass_cache(self):
+        handler = CountingHandler()
+        cached_handler = ResponseCacheBuilder().build().wrap(handler)
+        for headers in [{"HTTP_AUTHORIZATION": "Bearer alice"}, {"HTTP_COOKIE": "session=alice"}]:
+            cached_handler(TestResponseCache._request("/foo", headers))
+            cached_handler(TestResponseCache._request("/foo", headers))
+        cached_handler(TestResponseCache._request("/foo"))
+        cached_handler(TestResponseCache._request("/foo"))
+        self.assertEqual(5, handler.call_count)
+
+    def test_credentialed_requests_cached_per_credentials_when_allowed(self):
+        handler = CountingHandler()
+        cached_handler = ResponseCacheBuilder().set_cache_credentialed_requests(True).build().wrap(handler)
+        alice = cached_handler(TestResponseCache._request("/foo", {"HTTP_AUTHORIZATION": "Bearer alice"}))
+        bob = cached_handler(TestResponseCache._request("/foo", {"HTTP_AUTHORIZATION": "Bearer bob"}))
+        alice_again = cached_handler(TestResponseCache._request("/foo", {"HTTP_AUTHORIZATION": "Bearer alice"}))
+        self.assertEqual(2, handler.call_count)
+        self.assertEqual(b"call 1", alice.body.content)
+        self.assertEqual(b"call 2", bob.body.content)
+        self.assertIs(alice, alice_again)
+
+    def test_uncacheable_status_not_cached(self):
+        handler = CountingHandler(lambda request: ResponseBuilder().set_status(HTTPStatus.INTERNAL_SERVER_ERROR))
+        cached_handler = ResponseCacheBuilder().build().wrap(handler)
+        cached_handler(TestResponseCache._request("/foo"))
+        cached_handler(TestResponseCache._request("/foo"))
+        self.assertEqual(2, handler.call_count)
+
+    def test_stream_responses_not_cached(self):
+        class StreamHandler:
+            def __init__(self):
+                self.call_count = 0
+
+            def __call__(self, request):
+                self.call_count += 1
+                return ResponseBuilder().set_stream_body(FakeStream()).build()
+
+        class FakeStream:
+            def read(self, size):
+                return b""
+
+        handler = StreamHandler()
+        cached_handler = ResponseCacheBuilder().build().wrap(handler)
+        cached_handler(TestResponseCache._request("/foo"))
+        cached_handler(TestResponseCache._request("/foo"))
+        self.assertEqual(2, handler.call_count)
+
+    def test_vary_headers_select_variant(self):
+        handler = CountingHandler(lambda request: ResponseBuilder().add_header("vary", "Accept-Language"))
+        cached_handler = ResponseCacheBuilder().build().wrap(handler)
+        english = cached_handler(TestResponseCache._request("/foo", {"HTTP_ACCEPT_LANGUAGE": "en"}))
+        french = cached_handler(TestResponseCache._request("/foo", {"HTTP_ACCEPT_LANGUAGE": "fr"}))
+        english_again = cached_handler(TestResponseCache._request("/foo", {"HTTP_ACCEPT_LANGUAGE": "en"}))
+        self.assertEqual(2, handler.call_count)
+        self.assertEqual(b"call 1", english.body.content)
+        self.assertEqual(b"call 2", french.body.content)
+        self.assertIs(english, english_again)
+
+    def test_vary_star_not_cached(self):
+        handler = CountingHandler(lambda request: ResponseBuilder().add_header("vary", "*"))
+        cached_handler = ResponseCacheBuilder().build().wrap(handler)
+        cached_handler(TestResponseCache._request("/foo"))
+        cached_handler(TestResponseCache._request("/foo"))
+        self.assertEqual(2, handler.call_count)
+
+    def test_least_recently_used_evicted_by_size(self):
+        handler = CountingHandler()
+        cached_handler = ResponseCacheBuilder().set_maximum_bytes(60).build().wrap(handler)
+        cached_handler(TestResponseCache._request("/a"))
+        cached_handler(TestResponseCache._request("/b"))
+        cached_handler(TestResponseCache._request("/a"))
+        cached_handler(TestResponseCache._request("/c"))
+        self.assertEqual(3, handler.call_count)
+        cached_handler(TestResponseCache._request("/a"))
+        self.assertEqual(3, handler.call_count)
+        cached_handler(TestResponseCache._request("/b"))
+        self.assertEqual(4, handler.call_count)
+
+    def test_evicting_one_variant_keeps_other_variants_reachable(self):
+        handler = CountingHandler(lambda request: ResponseBuilder().add_header("vary", "Accept-Language"))
+        cached_handler = ResponseCacheBuilder().set_maximum_bytes(100).build().wrap(handler)
+        cached_handler(TestResponseCache._request("/foo", {"HTTP_ACCEPT_LANGUAGE": "en"}))
+        french = cached_handler(TestResponseCache._request("/foo", {"HTTP_ACCEPT_LANGUAGE": "fr"}))
+        german = cached_handler(TestResponseCache._request("/foo", {"HTTP_ACCEPT_LANGUAGE": "de"}))
+        self.assertEqual(3, handler.call_count)
+        self.assertIs(french, cached_handler(TestResponseCache._request("/foo", {"HTTP_ACCEPT_LANGUAGE": "fr"})))
+        self.assertIs(german, cached_handler(TestResponseCache._request("/foo", {"HTTP_ACCEPT_LANGUAGE": "de"})))
+        self.assertEqual(3, handler.call_count)
+        cached_handler(TestResponseCache._request("/foo", {"HTTP_ACCEPT_LANGUAGE": "en"}))
+        self.assertEqual(4, handler.call_count)
+
+    def test_concurrent_misses_run_handler_once(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_response_builder(request):
+            started.set()
+            release.wait(5)
+            return ResponseBuilder()
+
+        handler = CountingHandler(slow_response_builder)
+        cached_handler = ResponseCacheBuilder().build().wrap(handler)
+        responses = []
+        threads = [
+            threading.Thread(target=lambda: responses.append(cached_handler(TestResponseCache._request("/foo"))))
+            for _ in range(8)]
+        threads[0].start()
+        started.wait(5)
+        for thread in threads[1:]:
+            thread.start()
+        release.set()
+        for thread in threads:
+            thread.join(5)
+        self.assertEqual(1, handler.call_count)
+        self.assertEqual(8, len(responses))
+        self.assertTrue(all(response is responses[0] for response in responses))
+
+    @staticmethod
+    def _request(path, headers=None, method="GET", query=""):
+        wsgi_environment = {"REQUEST_METHOD": method, "PATH_INFO": path, "QUERY_STRING": query}
+        wsgi_environment.update(headers if headers else {})
+        return WSGILoadedRequest(wsgi_environment)
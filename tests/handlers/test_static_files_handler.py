@@ -0,0 +1,101 @@
+import os
+import shutil
+import tempfile
+from http import HTTPStatus
+from unittest import TestCase
+
+from eynnyd.exceptions import HandlerBuildException, RouteNotFoundException
+from eynnyd.internal.response_body_type import ResponseBodyType
+from eynnyd.internal.wsgi_loaded_request import WSGILoadedRequest
+from eynnyd.static_files_handler_builder import StaticFilesHandlerBuilder
+
+
+class TestStaticFilesHandler(TestCase):
+
+    def setUp(self):
+        self._root = tempfile.mkdtemp()
+        self._directory = os.path.join(self._root, "static")
+        os.makedirs(os.path.join(self._directory, "css"))
+        with open(os.path.join(self._directory, "small.txt"), "wb") as small_file:
+            small_file.write(b"hello")
+        with open(os.path.join(self._directory, "css", "large.css"), "wb") as large_file:
+            large_file.write(b"x" * 2048)
+        with open(os.path.join(self._root, "secret.txt"), "wb") as secret_file:
+            secret_file.write(b"secret")
+
+    def tearDown(self):
+        shutil.rmtree(self._root)
+
+    def test_build_raises_on_missing_directory(self):
+        with self.assertRaises(HandlerBuildException):
+            StaticFilesHandlerBuilder(os.path.join(self._root, "missing"), "/static").build()
+
+    def test_build_raises_on_invalid_url_prefix(self):
+        with self.assertRaises(HandlerBuildException):
+            StaticFilesHandlerBuilder(self._directory, "static").build()
+
+    def test_small_file_served_from_memory(self):
+        handler = StaticFilesHandlerBuilder(self._directory, "/static").build()
+        response = handler(TestStaticFilesHandler._request("/static/small.txt"))
+        self.assertEqual(HTTPStatus.OK, response.status.code)
+        self.assertEqual(b"hello", response.body.content)
+        self.assertEqual("text/plain", response.headers["content-type"])
+        self.assertEqual("5", response.headers["content-length"])
+        self.assertIn("etag", response.headers)
+        self.assertIn("last-modified", response.headers)
+        self.assertIs(response, handler(TestStaticFilesHandler._request("/static/small.txt")))
+
+    def test_large_file_streamed(self):
+        handler = StaticFilesHandlerBuilder(self._directory, "/static/")\
+            .set_in_memory_size_limit(1024)\
+            .set_cache_control("public, max-age=60")\
+            .build()
+        response = handler(TestStaticFilesHandler._request("/static/css/large.css"))
+        self.assertEqual(ResponseBodyType.STREAM, response.body.type)
+        self.assertEqual("2048", response.headers["content-length"])
+        self.assertEqual("text/css", response.headers["content-type"])
+        self.assertEqual("public, max-age=60", response.headers["cache-control"])
+        self.assertEqual(b"x" * 2048, response.body.content.read(4096))
+        response.body.content.close()
+
+    def test_conditional_request_not_modified(self):
+        handler = StaticFilesHandlerBuilder(self._directory, "/static").build()
+        etag = handler(TestStaticFilesHandler._request("/static/small.txt")).headers["etag"]
+        response = handler(TestStaticFilesHandler._request("/static/small.txt", {"HTTP_IF_NONE_MATCH": etag}))
+        self.assertEqual(HTTPStatus.NOT_MODIFIED, response.status.code)
+        self.assertEqual(etag, response.headers["etag"])
+
+    def test_stat_cache_expires(self):
+        handler = StaticFilesHandlerBuilder(self._directory, "/static").set_cache_ttl_seconds(0).build()
+        handler(TestStaticFilesHandler._request("/static/small.txt"))
+        with open(os.path.join(self._directory, "small.txt"), "wb") as small_file:
+            small_file.write(b"changed")
+        self.assertEqual(b"changed", handler(TestStaticFilesHandler._request("/static/small.txt")).body.content)
+
+    def test_missing_file_not_found(self):
+        handler = StaticFilesHandlerBuilder(self._directory, "/static").build()
+        with self.assertRaises(RouteNotFoundException):
+            handler(TestStaticFilesHandler._request("/static/missing.txt"))
+
+    def test_directory_not_found(self):
+        handler = StaticFilesHandlerBuilder(self._directory, "/static").build()
+        with self.assertRaises(RouteNotFoundException):
+            handler(TestStaticFilesHandler._request("/static/css"))
+
+    def test_path_traversal_not_found(self):
+        handler = StaticFilesHandlerBuilder(self._directory, "/static").build()
+        for path in ("/static/../secret.txt", "/static/css/../../secret.txt", "/static/..", "/other/small.txt"):
+            with self.assertRaises(RouteNotFoundException):
+                handler(TestStaticFilesHandler._request(path))
+
+    def test_symlink_out_of_directory_not_found(self):
+        os.symlink(os.path.join(self._root, "secret.txt"), os.path.join(self._directory, "link.txt"))
+        handler = StaticFilesHandlerBuilder(self._directory, "/static").build()
+        with self.assertRaises(RouteNotFoundException):
+            handler(TestStaticFilesHandler._request("/static/link.txt"))
+
+    @staticmethod
+    def _request(path, headers=None):
+        wsgi_environment = {"REQUEST_METHOD": "GET", "PATH_INFO": path}
+        wsgi_environment.update(headers if headers else {})
+        return WSGILoadedRequest(wsgi_environment)
@@ -0,0 +1,35 @@
+from unittest import TestCase
+
+from eynnyd.compression_interceptor_builder import CompressionInterceptorBuilder
+from eynnyd.exceptions import InterceptorBuildException
+from eynnyd.internal.wsgi_loaded_request import WSGILoadedRequest
+from eynnyd.response_builder import ResponseBuilder
+
+
+class TestCompressionInterceptorBuilder(TestCase):
+
+    def test_set_minimum_size_raises_on_negative(self):
+        with self.assertRaises(InterceptorBuildException):
+            CompressionInterceptorBuilder().set_minimum_size(-1)
+
+    def test_set_compression_level_raises_out_of_range(self):
+        with self.assertRaises(InterceptorBuildException):
+            CompressionInterceptorBuilder().set_compression_level(10)
+
+    def test_set_minimum_size(self):
+        interceptor = CompressionInterceptorBuilder().set_minimum_size(0).build()
+        response = interceptor(
+            WSGILoadedRequest({"HTTP_ACCEPT_ENCODING": "gzip"}),
+            ResponseBuilder().set_utf8_body("tiny").build())
+        self.assertEqual("gzip", response.headers["content-encoding"])
+
+    def test_add_uncompressible_content_type(self):
+        interceptor = CompressionInterceptorBuilder()\
+            .set_minimum_size(0)\
+            .add_uncompressible_content_type("application/x-custom")\
+            .build()
+        original = ResponseBuilder()\
+            .add_header("content-type", "application/x-custom; charset=utf-8")\
+            .set_utf8_body("tiny")\
+            .build()
+        self.assertIs(original, interceptor(WSGILoadedRequest({"HTTP_ACCEPT_ENCODING": "gzip"}), original))
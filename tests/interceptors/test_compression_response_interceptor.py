@@ -0,0 +1,132 @@
+import gzip
+import io
+import json
+import zlib
+from http import HTTPStatus
+from unittest import TestCase
+
+from eynnyd.compression_interceptor_builder import CompressionInterceptorBuilder
+from eynnyd.internal.response_body_type import ResponseBodyType
+from eynnyd.internal.wsgi_loaded_request import WSGILoadedRequest
+from eynnyd.response_builder import ResponseBuilder
+
+
+class TestCompressionResponseInterceptor(TestCase):
+
+    _BODY = "foobar fizzbuzz " * 200
+
+    def setUp(self):
+        self._interceptor = CompressionInterceptorBuilder().build()
+
+    def test_gzip_utf8_body(self):
+        response = self._interceptor(
+            TestCompressionResponseInterceptor._request("gzip, deflate"),
+            ResponseBuilder().set_utf8_body(TestCompressionResponseInterceptor._BODY).build())
+        self.assertEqual("gzip", response.headers["content-encoding"])
+        self.assertEqual("Accept-Encoding", response.headers["vary"])
+        self.assertEqual(str(len(response.body.content)), response.headers["content-length"])
+        self.assertEqual(
+            TestCompressionResponseInterceptor._BODY.encode("utf-8"), gzip.decompress(response.body.content))
+
+    def test_deflate_when_preferred(self):
+        response = self._interceptor(
+            TestCompressionResponseInterceptor._request("gzip;q=0.5, deflate"),
+            ResponseBuilder().set_byte_body(TestCompressionResponseInterceptor._BODY.encode("utf-8")).build())
+        self.assertEqual("deflate", response.headers["content-encoding"])
+        self.assertEqual(
+            TestCompressionResponseInterceptor._BODY.encode("utf-8"), zlib.decompress(response.body.content))
+
+    def test_no_accepted_encoding_only_sets_vary(self):
+        original = ResponseBuilder()\
+            .add_header("vary", "Origin")\
+            .set_utf8_body(TestCompressionResponseInterceptor._BODY)\
+            .build()
+        response = self._interceptor(TestCompressionResponseInterceptor._request("gzip;q=0, br"), original)
+        self.assertNotIn("content-encoding", response.headers)
+        self.assertEqual("Origin, Accept-Encoding", response.headers["vary"])
+        self.assertIs(original.body, response.body)
+
+    def test_small_body_not_compressed(self):
+        original = ResponseBuilder().set_utf8_body("tiny").build()
+        self.assertIs(original, self._interceptor(TestCompressionResponseInterceptor._request("gzip"), original))
+
+    def test_uncompressible_content_type_not_compressed(self):
+        original = ResponseBuilder()\
+            .add_header("content-type", "image/png")\
+            .set_byte_body(TestCompressionResponseInterceptor._BODY.encode("utf-8"))\
+            .build()
+        self.assertIs(original, self._interceptor(TestCompressionResponseInterceptor._request("gzip"), original))
+
+    def test_already_encoded_not_compressed(self):
+        original = ResponseBuilder()\
+            .add_header("content-encoding", "br")\
+            .set_utf8_body(TestCompressionResponseInterceptor._BODY)\
+            .build()
+        self.assertIs(original, self._interceptor(TestCompressionResponseInterceptor._request("gzip"), original))
+
+    def test_no_transform_not_compressed(self):
+        original = ResponseBuilder()\
+            .add_header("cache-control", "public, no-transform")\
+            .set_utf8_body(TestCompressionResponseInterceptor._BODY)\
+            .build()
+        self.assertIs(original, self._interceptor(TestCompressionResponseInterceptor._request("gzip"), original))
+
+    def test_non_body_status_not_compressed(self):
+        original = ResponseBuilder().set_status(HTTPStatus.NO_CONTENT).build()
+        self.assertIs(original, self._interceptor(TestCompressionResponseInterceptor._request("gzip"), original))
+
+    def test_strong_etag_is_weakened(self):
+        response = self._interceptor(
+            TestCompressionResponseInterceptor._request("gzip"),
+            ResponseBuilder()
+                .add_header("etag", '"abc"')
+                .set_utf8_body(TestCompressionResponseInterceptor._BODY)
+                .build())
+        self.assertEqual('W/"abc"', response.headers["etag"])
+
+    def test_stream_body_compressed_incrementally(self):
+        stream = io.BytesIO(TestCompressionResponseInterceptor._BODY.encode("utf-8") * 10)
+        response = self._interceptor(
+            TestCompressionResponseInterceptor._request("gzip"),
+            ResponseBuilder().add_header("content-length", "32000").set_stream_body(stream).build())
+        self.assertEqual(ResponseBodyType.ITERABLE, response.body.type)
+        self.assertNotIn("content-length", response.headers)
+        self.assertEqual(
+            TestCompressionResponseInterceptor._BODY.encode("utf-8") * 10,
+            gzip.decompress(b"".join(response.body.content)))
+        response.body.content.close()
+        self.assertTrue(stream.closed)
+
+    def test_iterable_body_compressed_incrementally(self):
+        chunks = [b"foo" * 10, b"bar" * 10]
+        response = self._interceptor(
+            TestCompressionResponseInterceptor._request("deflate"),
+            ResponseBuilder().set_iterable_body(chunks).build())
+        self.assertEqual(b"".join(chunks), zlib.decompress(b"".join(response.body.content)))
+
+    def test_json_body_compressed(self):
+        body = {"items": ["foobar fizzbuzz"] * 200}
+        response = self._interceptor(
+            TestCompressionResponseInterceptor._request("gzip"),
+            ResponseBuilder().set_json_body(body).build())
+        self.assertEqual(ResponseBodyType.BYTE, response.body.type)
+        self.assertEqual("application/json", response.headers["content-type"])
+        self.assertEqual(body, json.loads(gzip.decompress(response.body.content)))
+
+    def test_small_json_body_not_compressed(self):
+        response = self._interceptor(
+            TestCompressionResponseInterceptor._request("gzip"),
+            ResponseBuilder().set_json_body({"foo": "bar"}).build())
+        self.assertNotIn("content-encoding", response.headers)
+
+    def test_streamed_json_body_compressed_incrementally(self):
+        body = list(range(1000))
+        response = self._interceptor(
+            TestCompressionResponseInterceptor._request("deflate"),
+            ResponseBuilder().set_json_body(body, stream=True).build())
+        self.assertEqual(ResponseBodyType.ITERABLE, response.body.type)
+        self.assertEqual(body, json.loads(zlib.decompress(b"".join(response.body.content))))
+
+    @staticmethod
+    def _request(accept_encoding):
+        return WSGILoadedRequest({"REQUEST_METHOD": "GET", "HTTP_ACCEPT_ENCODING": accept_encoding})
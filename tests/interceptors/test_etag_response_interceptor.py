@@ -0,0 +1,130 @@
+from http import HTTPStatus
+from unittest import TestCase
+
+from eynnyd.etag_interceptor_builder import ETagInterceptorBuilder
+from eynnyd.internal.response_body_type import ResponseBodyType
+from eynnyd.internal.wsgi_loaded_request import WSGILoadedRequest
+from eynnyd.response_builder import ResponseBuilder
+
+
+class TestETagResponseInterceptor(TestCase):
+
+    def setUp(self):
+        self._interceptor = ETagInterceptorBuilder().build()
+
+    def test_generates_etag(self):
+        response = self._interceptor(TestETagResponseInterceptor._request(), TestETagResponseInterceptor._response())
+        self.assertRegex(response.headers["etag"], r'^"[0-9a-f]{32}"$')
+        self.assertEqual(b"foobar", response.body.content)
+
+    def test_generates_weak_etag(self):
+        response = ETagInterceptorBuilder().set_weak_etags(True).build()(
+            TestETagResponseInterceptor._request(),
+            TestETagResponseInterceptor._response())
+        self.assertTrue(response.headers["etag"].startswith('W/"'))
+
+    def test_generates_etag_for_json_body(self):
+        response = self._interceptor(
+            TestETagResponseInterceptor._request(),
+            ResponseBuilder().set_json_body({"foo": "bar"}).build())
+        self.assertRegex(response.headers["etag"], r'^"[0-9a-f]{32}"$')
+        self.assertEqual(ResponseBodyType.JSON, response.body.type)
+
+    def test_no_etag_for_streamed_json_body(self):
+        response = self._interceptor(
+            TestETagResponseInterceptor._request(),
+            ResponseBuilder().set_json_body([1, 2, 3], stream=True).build())
+        self.assertNotIn("etag", response.headers)
+
+    def test_etag_is_stable(self):
+        first = self._interceptor(TestETagResponseInterceptor._request(), TestETagResponseInterceptor._response())
+        second = self._interceptor(TestETagResponseInterceptor._request(), TestETagResponseInterceptor._response())
+        self.assertEqual(first.headers["etag"], second.headers["etag"])
+
+    def test_matching_if_none_match_returns_not_modified(self):
+        etag = self._interceptor(
+            TestETagResponseInterceptor._request(),
+            TestETagResponseInterceptor._response()).headers["etag"]
+        response = self._interceptor(
+            TestETagResponseInterceptor._request({"HTTP_IF_NONE_MATCH": '"other", W/' + etag}),
+            ResponseBuilder()
+                .add_header("content-type", "text/plain")
+                .add_header("cache-control", "max-age=60")
+                .add_basic_cookie("foo", "bar")
+                .set_utf8_body("foobar")
+                .build())
+        self.assertEqual(HTTPStatus.NOT_MODIFIED, response.status.code)
+        self.assertEqual(ResponseBodyType.EMPTY, response.body.type)
+        self.assertDictEqual({"etag": etag, "cache-control": "max-age=60"}, response.headers)
+        self.assertEqual(1, len(response.cookies))
+
+    def test_non_matching_if_none_match_returns_response(self):
+        response = self._interceptor(
+            TestETagResponseInterceptor._request({"HTTP_IF_NONE_MATCH": '"other"'}),
+            TestETagResponseInterceptor._response())
+        self.assertEqual(HTTPStatus.OK, response.status.code)
+
+    def test_if_none_match_takes_precedence_over_if_modified_since(self):
+        response = self._interceptor(
+            TestETagResponseInterceptor._request({
+                "HTTP_IF_NONE_MATCH": '"other"',
+                "HTTP_IF_MODIFIED_SINCE": "Wed, 21 Oct 2015 07:28:00 GMT"}),
+            ResponseBuilder()
+                .add_header("last-modified", "Wed, 21 Oct 2015 07:28:00 GMT")
+                .set_utf8_body("foobar")
+                .build())
+        self.assertEqual(HTTPStatus.OK, response.status.code)
+
+    def test_if_modified_since(self):
+        response_builder = ResponseBuilder()\
+            .add_header("last-modified", "Wed, 21 Oct 2015 07:28:00 GMT")\
+            .set_utf8_body("foobar")
+        not_modified = self._interceptor(
+            TestETagResponseInterceptor._request({"HTTP_IF_MODIFIED_SINCE": "Wed, 21 Oct 2015 07:28:00 GMT"}),
+            response_builder.build())
+        modified = self._interceptor(
+            TestETagResponseInterceptor._request({"HTTP_IF_MODIFIED_SINCE": "Tue, 20 Oct 2015 07:28:00 GMT"}),
+            response_builder.build())
+        self.assertEqual(HTTPStatus.NOT_MODIFIED, not_modified.status.code)
+        self.assertEqual(HTTPStatus.OK, modified.status.code)
+
+    def test_invalid_if_modified_since_is_ignored(self):
+        response = self._interceptor(
+            TestETagResponseInterceptor._request({"HTTP_IF_MODIFIED_SINCE": "yesterday"}),
+            ResponseBuilder().add_header("last-modified", "Wed, 21 Oct 2015 07:28:00 GMT").build())
+        self.assertEqual(HTTPStatus.OK, response.status.code)
+
+    def test_non_get_requests_are_not_conditional(self):
+        response = self._interceptor(
+            TestETagResponseInterceptor._request({"HTTP_IF_NONE_MATCH": "*"}, method="POST"),
+            TestETagResponseInterceptor._response())
+        self.assertEqual(HTTPStatus.OK, response.status.code)
+
+    def test_non_get_requests_with_matching_if_none_match_are_untouched(self):
+        original = TestETagResponseInterceptor._response()
+        etag = self._interceptor(TestETagResponseInterceptor._request(), original).headers["etag"]
+        self.assertIs(
+            original,
+            self._interceptor(
+                TestETagResponseInterceptor._request({"HTTP_IF_NONE_MATCH": etag}, method="POST"),
+                original))
+
+    def test_non_ok_responses_are_untouched(self):
+        original = ResponseBuilder().set_status(HTTPStatus.CREATED).set_utf8_body("foobar").build()
+        self.assertIs(
+            original,
+            self._interceptor(TestETagResponseInterceptor._request({"HTTP_IF_NONE_MATCH": "*"}), original))
+
+    def test_existing_etag_is_kept(self):
+        original = ResponseBuilder().add_header("etag", '"v1"').set_utf8_body("foobar").build()
+        self.assertIs(original, self._interceptor(TestETagResponseInterceptor._request(), original))
+
+    @staticmethod
+    def _response():
+        return ResponseBuilder().set_utf8_body("foobar").build()
+
+    @staticmethod
+    def _request(headers=None, method="GET"):
+        wsgi_environment = {"REQUEST_METHOD": method}
+        wsgi_environment.update(headers if headers else {})
+        return WSGILoadedRequest(wsgi_environment)
@@ -0,0 +1,121 @@
+import io
+from http import HTTPStatus
+from unittest import TestCase
+
+from eynnyd.exceptions import InterceptorBuildException
+from eynnyd.internal.response_body_type import ResponseBodyType
+from eynnyd.internal.wsgi_loaded_request import WSGILoadedRequest
+from eynnyd.range_interceptor_builder import RangeInterceptorBuilder
+from eynnyd.response_builder import ResponseBuilder
+
+
+class TestRangeResponseInterceptor(TestCase):
+
+    _CONTENT = b"0123456789abcdefghij"
+
+    def setUp(self):
+        self._interceptor = RangeInterceptorBuilder().build()
+
+    def test_builder_raises_on_invalid_maximum_ranges(self):
+        with self.assertRaises(InterceptorBuildException):
+            RangeInterceptorBuilder().set_maximum_ranges(0)
+
+    def test_without_range_advertises_ranges(self):
+        response = self._interceptor(TestRangeResponseInterceptor._request(), self._byte_response())
+        self.assertEqual(HTTPStatus.OK, response.status.code)
+        self.assertEqual("bytes", response.headers["accept-ranges"])
+
+    def test_unknown_length_stream_is_untouched(self):
+        original = ResponseBuilder().set_stream_body(io.BytesIO(TestRangeResponseInterceptor._CONTENT)).build()
+        self.assertIs(original, self._interceptor(TestRangeResponseInterceptor._request("bytes=0-1"), original))
+
+    def test_single_range_of_byte_body(self):
+        response = self._interceptor(TestRangeResponseInterceptor._request("bytes=2-5"), self._byte_response())
+        self.assertEqual(HTTPStatus.PARTIAL_CONTENT, response.status.code)
+        self.assertEqual(b"2345", response.body.content)
+        self.assertEqual("4", response.headers["content-length"])
+        self.assertEqual("bytes 2-5/20", response.headers["content-range"])
+
+    def test_single_range_of_stream_body(self):
+        stream = io.BytesIO(TestRangeResponseInterceptor._CONTENT)
+        response = self._interceptor(
+            TestRangeResponseInterceptor._request("bytes=-5"),
+            ResponseBuilder().set_stream_body(stream, content_length=20).build())
+        self.assertEqual(HTTPStatus.PARTIAL_CONTENT, response.status.code)
+        self.assertEqual(ResponseBodyType.STREAM, response.body.type)
+        self.assertEqual("5", response.headers["content-length"])
+        self.assertEqual("bytes 15-19/20", response.headers["content-range"])
+        self.assertEqual(b"fghij", response.body.content.read(1024))
+
+    def test_multiple_ranges_of_stream_body(self):
+        stream = io.BytesIO(TestRangeResponseInterceptor._CONTENT)
+        response = self._interceptor(
+            TestRangeResponseInterceptor._request("bytes=0-1,10-11"),
+            ResponseBuilder()
+                .add_header("content-type", "text/plain")
+                .set_stream_body(stream, content_length=20)
+                .build())
+        self.assertEqual(HTTPStatus.PARTIAL_CONTENT, response.status.code)
+        boundary = response.headers["content-type"].split("boundary=")[1]
+        body = b"".join(response.body.content)
+        self.assertEqual(str(len(body)), response.headers["content-length"])
+        self.assertEqual(
+            ("\r\n--{b}\r\nContent-Type: text/plain\r\nContent-Range: bytes 0-1/20\r\n\r\n01"
+             "\r\n--{b}\r\nContent-Type: text/plain\r\nContent-Range: bytes 10-11/20\r\n\r\nab"
+             "\r\n--{b}--\r\n").format(b=boundary).encode("ascii"),
+            body)
+
+    def test_multiple_ranges_of_byte_body(self):
+        response = self._interceptor(TestRangeResponseInterceptor._request("bytes=0-0,-1"), self._byte_response())
+        self.assertTrue(response.headers["content-type"].startswith("multipart/byteranges; boundary="))
+        self.assertEqual(str(len(response.body.content)), response.headers["content-length"])
+
+    def test_too_many_ranges_sends_everything(self):
+        response = RangeInterceptorBuilder().set_maximum_ranges(1).build()(
+            TestRangeResponseInterceptor._request("bytes=0-0,5-5"),
+            self._byte_response())
+        self.assertEqual(HTTPStatus.OK, response.status.code)
+
+    def test_unsatisfiable_range(self):
+        stream = io.BytesIO(TestRangeResponseInterceptor._CONTENT)
+        response = self._interceptor(
+            TestRangeResponseInterceptor._request("bytes=50-60"),
+            ResponseBuilder().set_stream_body(stream, content_length=20).build())
+        self.assertEqual(HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE, response.status.code)
+        self.assertEqual("bytes */20", response.headers["content-range"])
+        self.assertEqual(ResponseBodyType.EMPTY, response.body.type)
+        self.assertTrue(stream.closed)
+
+    def test_invalid_range_sends_everything(self):
+        response = self._interceptor(TestRangeResponseInterceptor._request("bytes=5-1"), self._byte_response())
+        self.assertEqual(HTTPStatus.OK, response.status.code)
+
+    def test_if_range_with_matching_etag(self):
+        response = self._interceptor(
+            TestRangeResponseInterceptor._request("bytes=0-1", {"HTTP_IF_RANGE": '"v1"'}),
+            self._byte_response())
+        self.assertEqual(HTTPStatus.PARTIAL_CONTENT, response.status.code)
+
+    def test_if_range_with_changed_etag(self):
+        response = self._interceptor(
+            TestRangeResponseInterceptor._request("bytes=0-1", {"HTTP_IF_RANGE": '"v0"'}),
+            self._byte_response())
+        self.assertEqual(HTTPStatus.OK, response.status.code)
+
+    def test_non_get_is_not_ranged(self):
+        response = self._interceptor(
+            TestRangeResponseInterceptor._request("bytes=0-1", method="HEAD"),
+            self._byte_response())
+        self.assertEqual(HTTPStatus.OK, response.status.code)
+
+    @staticmethod
+    def _byte_response():
+        return ResponseBuilder().add_header("etag", '"v1"').set_byte_body(TestRangeResponseInterceptor._CONTENT).build()
+
+    @staticmethod
+    def _request(range_header=None, headers=None, method="GET"):
+        wsgi_environment = {"REQUEST_METHOD": method}
+        if range_header is not None:
+            wsgi_environment["HTTP_RANGE"] = range_header
+        wsgi_environment.update(headers if headers else {})
+        return WSGILoadedRequest(wsgi_environment)
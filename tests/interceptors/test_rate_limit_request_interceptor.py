@@ -0,0 +1,128 @@
+import io
+import time
+from http import HTTPStatus
+from unittest import TestCase
+
+from eynnyd.abstract_rate_limit_store import AbstractRateLimitStore
+from eynnyd.exceptions import InterceptorBuildException, RateLimitExceededException
+from eynnyd.eynnyd_webapp_builder import EynnydWebappBuilder
+from eynnyd.internal.interceptors.rate_limit_request_interceptor import RateLimitRequestInterceptor
+from eynnyd.internal.prebuilt_response import PrebuiltResponse
+from eynnyd.internal.utils.sharded_token_bucket_store import ShardedTokenBucketStore
+from eynnyd.internal.wsgi_loaded_request import WSGILoadedRequest
+from eynnyd.rate_limit_interceptor_builder import RateLimitInterceptorBuilder
+from eynnyd.response_builder import ResponseBuilder
+from eynnyd.routes_builder import RoutesBuilder
+
+
+class RecordingStore(AbstractRateLimitStore):
+
+    def __init__(self):
+        self.calls = []
+        self.nows = []
+
+    def acquire(self, key, tokens_per_second, capacity, now):
+        self.calls.append((key, tokens_per_second, capacity))
+        self.nows.append(now)
+        return 0
+
+
+class TestRateLimitRequestInterceptor(TestCase):
+
+    def test_build_raises_on_invalid_settings(self):
+        with self.assertRaises(InterceptorBuildException):
+            RateLimitInterceptorBuilder().build()
+        with self.assertRaises(InterceptorBuildException):
+            RateLimitInterceptorBuilder().set_rate(0)
+        with self.assertRaises(InterceptorBuildException):
+            RateLimitInterceptorBuilder().set_burst(0)
+        with self.assertRaises(InterceptorBuildException):
+            RateLimitInterceptorBuilder().set_store({})
+
+    def test_default_key_is_client_ip_and_burst_is_rate(self):
+        store = RecordingStore()
+        interceptor = RateLimitInterceptorBuilder().set_rate(2.5).set_store(store).build()
+        request = TestRateLimitRequestInterceptor._request()
+        self.assertIs(request, interceptor(request))
+        self.assertEqual([(("10.0.0.1",), 2.5, 3)], store.calls)
+
+    def test_keys_combine_in_order(self):
+        store = RecordingStore()
+        interceptor = RateLimitInterceptorBuilder()\
+            .set_rate(1)\
+            .set_burst(5)\
+            .add_header_key("X-API-Key")\
+            .add_route_key()\
+            .add_client_ip_address_key()\
+            .set_store(store)\
+            .build()
+        interceptor(TestRateLimitRequestInterceptor._request(api_key="secret"))
+        self.assertEqual([(("secret", "GET /foo", "10.0.0.1"), 1, 5)], store.calls)
+
+    def test_route_key_uses_matched_route_template(self):
+        store = RecordingStore()
+        webapp = EynnydWebappBuilder()\
+            .set_routes(
+                RoutesBuilder()
+                .add_handler("GET", "/users/{user_id}", lambda request: ResponseBuilder().build())
+                .add_request_interceptor(
+                    "/", RateLimitInterceptorBuilder().set_rate(1).add_route_key().set_store(store).build())
+                .build())\
+            .build()
+
+        for path in ["/users/1", "/users/2"]:
+            webapp.process_request_to_response(TestRateLimitRequestInterceptor._request(path=path))
+
+        self.assertEqual([("GET /users/{user_id}",), ("GET /users/{user_id}",)], [call[0] for call in store.calls])
+
+    def test_store_given_wall_clock_time(self):
+        store = RecordingStore()
+        RateLimitInterceptorBuilder().set_rate(1).set_store(store).build()(TestRateLimitRequestInterceptor._request())
+        self.assertAlmostEqual(time.time(), store.nows[0], delta=60)
+
+    def test_empty_bucket_raises_with_retry_after(self):
+        interceptor = RateLimitRequestInterceptor(
+            ShardedTokenBucketStore(1, 10),
+            (RateLimitRequestInterceptor.client_ip_address_key,),
+            0.25,
+            1,
+            clock=lambda: 100.0)
+        interceptor(TestRateLimitRequestInterceptor._request())
+        with self.assertRaises(RateLimitExceededException) as context:
+            interceptor(TestRateLimitRequestInterceptor._request())
+        self.assertEqual(4, context.exception.retry_after_seconds)
+
+    def test_over_limit_requests_get_prebuilt_429(self):
+        webapp = EynnydWebappBuilder()\
+            .set_routes(
+                RoutesBuilder()
+                .add_handler("GET", "/foo", lambda request: ResponseBuilder().build())
+                .add_request_interceptor("/", RateLimitInterceptorBuilder().set_rate(0.5).build())
+                .build())\
+            .build()
+
+        allowed = webapp.process_request_to_response(TestRateLimitRequestInterceptor._request())
+        limited = webapp.process_request_to_response(TestRateLimitRequestInterceptor._request())
+        other_client = webapp.process_request_to_response(TestRateLimitRequestInterceptor._request(ip="10.0.0.2"))
+
+        self.assertEqual(HTTPStatus.OK.value, allowed.status.code)
+        self.assertEqual(HTTPStatus.TOO_MANY_REQUESTS.value, limited.status.code)
+        self.assertEqual("2", limited.headers["retry-after"])
+        self.assertIsInstance(limited, PrebuiltResponse)
+        self.assertEqual(HTTPStatus.OK.value, other_client.status.code)
+
+    @staticmethod
+    def _request(ip="10.0.0.1", api_key=None, path="/foo"):
+        environment = {
+            "REQUEST_METHOD": "GET",
+            "wsgi.url_scheme": "http",
+            "SERVER_NAME": "localhost",
+            "SERVER_PORT": "80",
+            "PATH_INFO": path,
+            "QUERY_STRING": "",
+            "REMOTE_ADDR": ip,
+            "wsgi.input": io.BytesIO(b"")
+        }
+        if api_key:
+            environment["HTTP_X_API_KEY"] = api_key
+        return WSGILoadedRequest(environment)
@@ -0,0 +1,164 @@
+import asyncio
+import io
+import threading
+from unittest import TestCase
+
+from eynnyd.exceptions import EynnydWebappBuildException
+from eynnyd.eynnyd_webapp_builder import EynnydWebappBuilder
+from eynnyd.internal.eynnyd_webapp import EynnydWebapp
+from eynnyd.internal.phase_timing.phase_histogram import PhaseHistogram
+from eynnyd.internal.phase_timing.phase_timings import PhaseTimings
+from eynnyd.internal.wsgi_loaded_request import WSGILoadedRequest
+from eynnyd.phase_timings_builder import PhaseTimingsBuilder
+from eynnyd.response_builder import ResponseBuilder
+from eynnyd.routes_builder import RoutesBuilder
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+
+class TestPhaseTimings(TestCase):
+
+    def test_build_raises_on_invalid_settings(self):
+        with self.assertRaises(EynnydWebappBuildException):
+            PhaseTimingsBuilder().set_observer(lambda: None)
+        with self.assertRaises(EynnydWebappBuildException):
+            PhaseTimingsBuilder().set_report_interval_seconds(0)
+        with self.assertRaises(EynnydWebappBuildException):
+            EynnydWebappBuilder().set_phase_timings(object())
+
+    def test_histogram_percentiles_are_power_of_two_upper_bounds(self):
+        histogram = PhaseHistogram()
+        for elapsed_ns in [100] * 98 + [5000, 70000]:
+            histogram.record(elapsed_ns)
+
+        self.assertEqual(100, histogram.count)
+        self.assertEqual(848, histogram.mean_ns)
+        self.assertEqual(127, histogram.percentile_ns(50))
+        self.assertEqual(8191, histogram.percentile_ns(99))
+        self.assertEqual(70000, histogram.percentile_ns(100))
+        self.assertEqual(70000, histogram.maximum_ns)
+        self.assertEqual(0, PhaseHistogram().percentile_ns(99))
+
+    def test_histogram_merge(self):
+        first = PhaseHistogram()
+        first.record(10)
+        second = PhaseHistogram()
+        second.record(30)
+        merged = PhaseHistogram().merge(first).merge(second)
+        self.assertEqual(2, merged.count)
+        self.assertEqual(40, merged.total_ns)
+        self.assertEqual(30, merged.maximum_ns)
+
+    def test_threads_record_separately_and_snapshot_merges_finished_threads(self):
+        phase_timings = PhaseTimings()
+
+        def record():
+            for _ in range(100):
+                phase_timings.record("GET /", PhaseTimings.HANDLER, 10)
+
+        threads = [threading.Thread(target=record) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        record()
+
+        self.assertEqual(500, phase_timings.snapshot()[("GET /", PhaseTimings.HANDLER)].count)
+        self.assertEqual(500, phase_timings.snapshot()[("GET /", PhaseTimings.HANDLER)].count)
+
+    def test_observer_given_snapshot_once_per_interval(self):
+        clock = FakeClock()
+        snapshots = []
+        phase_timings = PhaseTimings(snapshots.append, 1, clock)
+
+        phase_timings.record("GET /", PhaseTimings.HANDLER, 10)
+        self.assertEqual([], snapshots)
+        clock.now = 1000000000
+        phase_timings.record("GET /", PhaseTimings.HANDLER, 10)
+        phase_timings.record("GET /", PhaseTimings.HANDLER, 10)
+        self.assertEqual(1, len(snapshots))
+        self.assertEqual(2, snapshots[0][("GET /", PhaseTimings.HANDLER)].count)
+
+    def test_webapp_untimed_by_default(self):
+        routes = RoutesBuilder().add_handler("GET", "/", lambda request: ResponseBuilder().build()).build()
+        self.assertIs(EynnydWebapp, type(EynnydWebappBuilder().set_routes(routes).build()))
+
+    def test_phases_timed_per_route_template(self):
+        phase_timings = PhaseTimingsBuilder().build()
+        webapp = TestPhaseTimings._webapp(phase_timings)
+
+        webapp.process_request_to_response(TestPhaseTimings._request("/users/1"))
+        webapp.process_request_to_response(TestPhaseTimings._request("/users/2"))
+        webapp.process_request_to_response(TestPhaseTimings._request("/missing"))
+
+        snapshot = phase_timings.snapshot()
+        self.assertEqual(
+            {
+                ("GET /users/{user_id}", PhaseTimings.ROUTING),
+                ("GET /users/{user_id}", PhaseTimings.REQUEST_INTERCEPTORS),
+                ("GET /users/{user_id}", PhaseTimings.HANDLER),
+                ("GET /users/{user_id}", PhaseTimings.RESPONSE_INTERCEPTORS)
+            },
+            set(snapshot))
+        self.assertEqual(2, snapshot[("GET /users/{user_id}", PhaseTimings.HANDLER)].count)
+        self.assertLessEqual(
+            10000000,
+            snapshot[("GET /users/{user_id}", PhaseTimings.REQUEST_INTERCEPTORS)].maximum_ns)
+
+    def test_async_phases_and_adaptation_timed(self):
+        phase_timings = PhaseTimingsBuilder().build()
+        webapp = TestPhaseTimings._webapp(phase_timings)
+
+        loop = asyncio.new_event_loop()
+        try:
+            wsgi_response = loop.run_until_complete(
+                webapp.process_request_to_wsgi_output_async(TestPhaseTimings._request("/async")))
+        finally:
+            loop.close()
+
+        self.assertEqual([b"async"], list(wsgi_response.body))
+        self.assertEqual(
+            {
+                ("GET /async", PhaseTimings.ROUTING),
+                ("GET /async", PhaseTimings.REQUEST_INTERCEPTORS),
+                ("GET /async", PhaseTimings.HANDLER),
+                ("GET /async", PhaseTimings.RESPONSE_INTERCEPTORS),
+                ("GET /async", PhaseTimings.ADAPTATION)
+            },
+            set(phase_timings.snapshot()))
+
+    @staticmethod
+    def _webapp(phase_timings):
+        async def async_handler(request):
+            await asyncio.sleep(0)
+            return ResponseBuilder().set_utf8_body("async").build()
+
+        def slow_interceptor(request):
+            threading.Event().wait(0.01)
+            return request
+
+        routes = RoutesBuilder()\
+            .add_handler("GET", "/users/{user_id}", lambda request: ResponseBuilder().build())\
+            .add_handler("GET", "/async", async_handler)\
+            .add_request_interceptor("/users", slow_interceptor)\
+            .build()
+        return EynnydWebappBuilder().set_routes(routes).set_phase_timings(phase_timings).build()
+
+    @staticmethod
+    def _request(path):
+        return WSGILoadedRequest({
+            "REQUEST_METHOD": "GET",
+            "wsgi.url_scheme": "http",
+            "SERVER_NAME": "localhost",
+            "SERVER_PORT": "80",
+            "PATH_INFO": path,
+            "QUERY_STRING": "",
+            "wsgi.input": io.BytesIO(b"")
+        })
@@ -0,0 +1,42 @@
+from unittest import TestCase
+
+from eynnyd.internal.plan_execution.async_callable import AsyncCallable
+
+
+class TestAsyncCallable(TestCase):
+
+    def test_from_callable_leaves_functions_alone(self):
+        def handler(request):
+            return request
+
+        self.assertIs(handler, AsyncCallable.from_callable(handler))
+
+    def test_from_callable_wraps_coroutine_functions(self):
+        async def handler(request):
+            return request
+
+        async_callable = AsyncCallable.from_callable(handler)
+        self.assertIsInstance(async_callable, AsyncCallable)
+        self.assertEqual("handler", async_callable.__name__)
+
+    def test_from_callable_wraps_objects_with_coroutine_call(self):
+        class Handler:
+            async def __call__(self, request):
+                return request
+
+        self.assertIsInstance(AsyncCallable.from_callable(Handler()), AsyncCallable)
+
+    def test_calling_runs_coroutine_to_completion(self):
+        async def handler(request):
+            return request + " handled"
+
+        self.assertEqual("request handled", AsyncCallable.from_callable(handler)("request"))
+
+    def test_call_async_returns_coroutine(self):
+        async def handler(request):
+            return request + " handled"
+
+        coroutine = AsyncCallable.from_callable(handler).call_async("request")
+        with self.assertRaises(StopIteration) as context:
+            coroutine.send(None)
+        self.assertEqual("request handled", context.exception.value)
@@ -0,0 +1,212 @@
+import asyncio
+import threading
+import time
+import unittest
+from http import HTTPStatus
+
+from eynnyd.abstract_request import AbstractRequest
+from eynnyd.bulkhead_builder import BulkheadBuilder
+from eynnyd.error_handlers_builder import ErrorHandlersBuilder
+from eynnyd.exceptions import HandlerReturnedNonResponseException
+from eynnyd.internal.plan_execution.async_callable import AsyncCallable
+from eynnyd.internal.plan_execution.async_plan_executor import AsyncPlanExecutor
+from eynnyd.internal.plan_execution.execution_plan import ExecutionPlan
+from eynnyd.internal.utils.deadline import Deadline
+from eynnyd.response_builder import ResponseBuilder
+
+
+class TestAsyncPlanExecutor(unittest.TestCase):
+
+    class FakeRequest(AbstractRequest):
+        def __init__(self, http_method):
+            self._http_method = http_method
+
+        @property
+        def http_method(self):
+            return self._http_method
+
+        @property
+        def request_uri(self):
+            pass
+
+        @property
+        def forwarded_request_uri(self):
+            pass
+
+        @property
+        def headers(self):
+            pass
+
+        @property
+        def client_ip_address(self):
+            pass
+
+        @property
+        def cookies(self):
+            pass
+
+        @property
+        def query_parameters(self):
+            pass
+
+        @property
+        def path_parameters(self):
+            pass
+
+        @property
+        def byte_body(self):
+            pass
+
+        @property
+        def utf8_body(self):
+            pass
+
+        def copy_and_set_deadline(self, deadline):
+            pass
+
+    def setUp(self):
+        self._loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        self._loop.close()
+
+    def _execute(self, plan, request, error_handlers=None, deadline=None):
+        plan_executor = AsyncPlanExecutor(error_handlers if error_handlers else ErrorHandlersBuilder().build())
+        return self._loop.run_until_complete(plan_executor.execute_plan(plan, request, deadline=deadline))
+
+    def test_mixed_async_and_sync_callables_run_in_order(self):
+        calls = []
+
+        async def request_interceptor(request):
+            calls.append("request_interceptor")
+            return TestAsyncPlanExecutor.FakeRequest("POST")
+
+        def handler(request):
+            calls.append("handler")
+            self.assertEqual("POST", request.http_method)
+            return ResponseBuilder().set_status(HTTPStatus.OK).build()
+
+        async def response_interceptor(request, response):
+            calls.append("response_interceptor")
+            self.assertEqual(HTTPStatus.OK.value, response.status.code)
+            return ResponseBuilder().set_status(HTTPStatus.CREATED).build()
+
+        plan = ExecutionPlan(
+            [AsyncCallable(request_interceptor)],
+            handler,
+            [AsyncCallable(response_interceptor)],
+            {})
+
+        response = self._execute(plan, TestAsyncPlanExecutor.FakeRequest("GET"))
+
+        self.assertEqual(HTTPStatus.CREATED.value, response.status.code)
+        self.assertEqual(["request_interceptor", "handler", "response_interceptor"], calls)
+
+    def test_async_handler_awaited_on_calling_loop(self):
+        loops = []
+
+        async def handler(request):
+            loops.append(asyncio.get_event_loop())
+            await asyncio.gather(asyncio.sleep(0), asyncio.sleep(0))
+            return ResponseBuilder().set_status(HTTPStatus.OK).build()
+
+        self._execute(ExecutionPlan([], AsyncCallable(handler), [], {}), TestAsyncPlanExecutor.FakeRequest("GET"))
+
+        self.assertEqual([self._loop], loops)
+
+    def test_bulkhead_held_until_handler_abandoned_at_deadline_finishes(self):
+        bulkhead = BulkheadBuilder().set_maximum_in_flight(1).build()
+        release = threading.Event()
+
+        async def request_interceptor(request):
+            return request
+
+        def handler(request):
+            release.wait(5)
+            return ResponseBuilder().build()
+
+        response = self._execute(
+            ExecutionPlan([AsyncCallable(request_interceptor)], handler, [], {}, bulkheads=(bulkhead,)),
+            TestAsyncPlanExecutor.FakeRequest("GET"),
+            deadline=Deadline(time.monotonic() + 0.05))
+
+        self.assertEqual(HTTPStatus.GATEWAY_TIMEOUT.value, response.status.code)
+        self.assertEqual(1, bulkhead.metrics.in_flight)
+        release.set()
+        for _ in range(100):
+            if bulkhead.metrics.in_flight == 0:
+                break
+            self._loop.run_until_complete(asyncio.sleep(0.01))
+        self.assertEqual(0, bulkhead.metrics.in_flight)
+
+    def test_sync_only_plan_runs_off_the_loop(self):
+        threads = []
+
+        def handler(request):
+            threads.append(threading.current_thread())
+            return ResponseBuilder().set_status(HTTPStatus.OK).build()
+
+        self._execute(ExecutionPlan([], handler, [], {}), TestAsyncPlanExecutor.FakeRequest("GET"))
+
+        self.assertNotEqual([threading.current_thread()], threads)
+
+    def test_async_handler_errors_run_pre_response_error_handlers(self):
+        class CustomException(Exception):
+            pass
+
+        async def handler(request):
+            raise CustomException("Just a test")
+
+        error_handlers = ErrorHandlersBuilder()\
+            .add_pre_response_error_handler(
+                CustomException,
+                lambda error, request: ResponseBuilder().set_status(HTTPStatus.SERVICE_UNAVAILABLE).build())\
+            .build()
+
+        response = self._execute(
+            ExecutionPlan([], AsyncCallable(handler), [], {}),
+            TestAsyncPlanExecutor.FakeRequest("GET"),
+            error_handlers)
+
+        self.assertEqual(HTTPStatus.SERVICE_UNAVAILABLE.value, response.status.code)
+
+    def test_async_handler_returning_non_response_raises(self):
+        async def handler(request):
+            return "not a response"
+
+        error_handlers = ErrorHandlersBuilder()\
+            .add_pre_response_error_handler(
+                HandlerReturnedNonResponseException,
+                lambda error, request: ResponseBuilder().set_status(HTTPStatus.SERVICE_UNAVAILABLE).build())\
+            .build()
+
+        response = self._execute(
+            ExecutionPlan([], AsyncCallable(handler), [], {}),
+            TestAsyncPlanExecutor.FakeRequest("GET"),
+            error_handlers)
+
+        self.assertEqual(HTTPStatus.SERVICE_UNAVAILABLE.value, response.status.code)
+
+    def test_async_response_interceptor_errors_run_post_response_error_handlers(self):
+        class CustomException(Exception):
+            pass
+
+        async def response_interceptor(request, response):
+            raise CustomException("Just a test")
+
+        error_handlers = ErrorHandlersBuilder()\
+            .add_post_response_error_handler(
+                CustomException,
+                lambda error, request, response: ResponseBuilder().set_status(HTTPStatus.BAD_GATEWAY).build())\
+            .build()
+
+        response = self._execute(
+            ExecutionPlan(
+                [],
+                lambda request: ResponseBuilder().build(),
+                [AsyncCallable(response_interceptor)],
+                {}),
+            TestAsyncPlanExecutor.FakeRequest("GET"),
+            error_handlers)
+
+        self.assertEqual(HTTPStatus.BAD_GATEWAY.value, response.status.code)
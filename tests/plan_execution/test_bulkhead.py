@@ -0,0 +1,176 @@
+import asyncio
+import io
+import threading
+from http import HTTPStatus
+from unittest import TestCase
+
+from eynnyd.bulkhead_builder import BulkheadBuilder
+from eynnyd.exceptions import BulkheadFullException, RouteBuildException
+from eynnyd.eynnyd_webapp_builder import EynnydWebappBuilder
+from eynnyd.internal.asgi.asgi_loaded_request import ASGILoadedRequest
+from eynnyd.internal.plan_execution.bulkhead import Bulkhead
+from eynnyd.internal.wsgi_loaded_request import WSGILoadedRequest
+from eynnyd.response_builder import ResponseBuilder
+from eynnyd.routes_builder import RoutesBuilder
+
+
+class BlockingHandler:
+
+    def __init__(self):
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def __call__(self, request):
+        self.started.set()
+        self.release.wait(5)
+        return ResponseBuilder().set_utf8_body("done").build()
+
+
+class TestBulkhead(TestCase):
+
+    def test_build_raises_on_invalid_settings(self):
+        with self.assertRaises(RouteBuildException):
+            BulkheadBuilder().build()
+        with self.assertRaises(RouteBuildException):
+            BulkheadBuilder().set_maximum_in_flight(0)
+        with self.assertRaises(RouteBuildException):
+            BulkheadBuilder().set_retry_after_seconds(1.5)
+
+    def test_routes_builder_rejects_other_bulkheads(self):
+        with self.assertRaises(RouteBuildException):
+            RoutesBuilder().add_bulkhead("/", object())
+
+    def test_route_bulkhead_without_handler_raises(self):
+        with self.assertRaises(RouteBuildException):
+            RoutesBuilder()\
+                .add_handler("GET", "/foo", lambda request: ResponseBuilder().build())\
+                .add_route_bulkhead("POST", "/foo", BulkheadBuilder().set_maximum_in_flight(1).build())\
+                .build()
+
+    def test_acquire_and_release_track_in_flight_and_peak(self):
+        bulkhead = BulkheadBuilder().set_name("reports").set_maximum_in_flight(2).build()
+        bulkhead.acquire()
+        bulkhead.acquire()
+        with self.assertRaises(BulkheadFullException) as context:
+            bulkhead.acquire()
+        self.assertEqual(1, context.exception.retry_after_seconds)
+        bulkhead.release()
+
+        metrics = bulkhead.metrics
+        self.assertEqual("reports", metrics.name)
+        self.assertEqual(1, metrics.in_flight)
+        self.assertEqual(2, metrics.peak_in_flight)
+        self.assertEqual(1, metrics.rejected)
+
+    def test_acquire_all_releases_acquired_bulkheads_on_rejection(self):
+        outer = BulkheadBuilder().set_maximum_in_flight(5).build()
+        inner = BulkheadBuilder().set_maximum_in_flight(1).build()
+        inner.acquire()
+
+        with self.assertRaises(BulkheadFullException):
+            Bulkhead.acquire_all((outer, inner))
+
+        self.assertEqual(0, outer.metrics.in_flight)
+
+    def test_prefix_bulkhead_rejects_with_retry_after(self):
+        blocking_handler = BlockingHandler()
+        bulkhead = BulkheadBuilder().set_maximum_in_flight(1).set_retry_after_seconds(7).build()
+        webapp = EynnydWebappBuilder()\
+            .set_routes(
+                RoutesBuilder()
+                .add_handler("GET", "/reports/export", blocking_handler)
+                .add_handler("GET", "/reports/list", lambda request: ResponseBuilder().build())
+                .add_handler("GET", "/health", lambda request: ResponseBuilder().build())
+                .add_bulkhead("/reports", bulkhead)
+                .build())\
+            .build()
+
+        thread = threading.Thread(
+            target=webapp.process_request_to_response,
+            args=(TestBulkhead._request("/reports/export"),))
+        thread.start()
+        blocking_handler.started.wait(5)
+
+        rejected = webapp.process_request_to_response(TestBulkhead._request("/reports/list"))
+        healthy = webapp.process_request_to_response(TestBulkhead._request("/health"))
+        blocking_handler.release.set()
+        thread.join(5)
+
+        self.assertEqual(HTTPStatus.SERVICE_UNAVAILABLE.value, rejected.status.code)
+        self.assertEqual("7", rejected.headers["retry-after"])
+        self.assertEqual(HTTPStatus.OK.value, healthy.status.code)
+        self.assertEqual(0, bulkhead.metrics.in_flight)
+        self.assertEqual(1, bulkhead.metrics.peak_in_flight)
+
+    def test_route_bulkhead_only_limits_its_method(self):
+        bulkhead = BulkheadBuilder().set_maximum_in_flight(1).build()
+        bulkhead.acquire()
+        webapp = EynnydWebappBuilder()\
+            .set_routes(
+                RoutesBuilder()
+                .add_handler("GET", "/foo", lambda request: ResponseBuilder().build())
+                .add_handler("POST", "/foo", lambda request: ResponseBuilder().build())
+                .add_route_bulkhead("POST", "/foo", bulkhead)
+                .build())\
+            .build()
+
+        self.assertEqual(
+            HTTPStatus.OK.value,
+            webapp.process_request_to_response(TestBulkhead._request("/foo")).status.code)
+        self.assertEqual(
+            HTTPStatus.SERVICE_UNAVAILABLE.value,
+            webapp.process_request_to_response(TestBulkhead._request("/foo", "POST")).status.code)
+
+    def test_bulkhead_set_twice_on_a_route_counts_once(self):
+        bulkhead = BulkheadBuilder().set_maximum_in_flight(1).build()
+        in_flight = []
+        webapp = EynnydWebappBuilder()\
+            .set_routes(
+                RoutesBuilder()
+                .add_handler(
+                    "GET",
+                    "/foo",
+                    lambda request: in_flight.append(bulkhead.metrics.in_flight) or ResponseBuilder().build())
+                .add_bulkhead("/", bulkhead)
+                .add_route_bulkhead("GET", "/foo", bulkhead)
+                .build())\
+            .build()
+
+        response = webapp.process_request_to_response(TestBulkhead._request("/foo"))
+
+        self.assertEqual(HTTPStatus.OK.value, response.status.code)
+        self.assertEqual([1], in_flight)
+
+    def test_bulkhead_released_after_async_handler(self):
+        async def handler(request):
+            return ResponseBuilder().build()
+
+        bulkhead = BulkheadBuilder().set_maximum_in_flight(1).build()
+        webapp = EynnydWebappBuilder()\
+            .set_routes(RoutesBuilder().add_handler("GET", "/", handler).add_bulkhead("/", bulkhead).build())\
+            .build()
+        request = ASGILoadedRequest(
+            {"type": "http", "method": "GET", "path": "/", "server": ("localhost", 80), "headers": []},
+            b"")
+
+        loop = asyncio.new_event_loop()
+        try:
+            response = loop.run_until_complete(webapp.process_request_to_response_async(request))
+        finally:
+            loop.close()
+
+        self.assertEqual(HTTPStatus.OK.value, response.status.code)
+        self.assertEqual(0, bulkhead.metrics.in_flight)
+        self.assertEqual(1, bulkhead.metrics.peak_in_flight)
+
+    @staticmethod
+    def _request(path, method="GET"):
+        return WSGILoadedRequest({
+            "REQUEST_METHOD": method,
+            "wsgi.url_scheme": "http",
+            "SERVER_NAME": "localhost",
+            "SERVER_PORT": "80",
+            "PATH_INFO": path,
+            "QUERY_STRING": "",
+            "wsgi.input": io.BytesIO(b"")
+        })
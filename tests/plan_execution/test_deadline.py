@@ -0,0 +1,214 @@
+import asyncio
+import io
+import time
+from http import HTTPStatus
+from unittest import TestCase
+
+from eynnyd.exceptions import RouteBuildException, DeadlineExceededException
+from eynnyd.eynnyd_webapp_builder import EynnydWebappBuilder
+from eynnyd.error_handlers_builder import ErrorHandlersBuilder
+from eynnyd.internal.plan_execution.execution_plan import ExecutionPlan
+from eynnyd.internal.plan_execution.plan_executor import PlanExecutor
+from eynnyd.internal.utils.deadline import Deadline
+from eynnyd.internal.wsgi_loaded_request import WSGILoadedRequest
+from eynnyd.response_builder import ResponseBuilder
+from eynnyd.routes_builder import RoutesBuilder
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestDeadline(TestCase):
+
+    def test_remaining_seconds_counts_down_to_zero(self):
+        clock = FakeClock()
+        deadline = Deadline(101.0, clock)
+        self.assertEqual(1.0, deadline.remaining_seconds)
+        self.assertFalse(deadline.expired)
+        clock.now = 102.0
+        self.assertEqual(0.0, deadline.remaining_seconds)
+        self.assertTrue(deadline.expired)
+
+    def test_set_deadline_rejects_non_positive_seconds(self):
+        for deadline_seconds in [0, -1, "1", True, None, float("nan"), float("inf"), 1e300]:
+            with self.assertRaises(RouteBuildException):
+                RoutesBuilder().set_deadline("/", deadline_seconds)
+            with self.assertRaises(RouteBuildException):
+                RoutesBuilder().set_route_deadline("GET", "/", deadline_seconds)
+
+    def test_route_deadline_without_handler_raises_on_build(self):
+        with self.assertRaises(RouteBuildException):
+            RoutesBuilder().set_route_deadline("GET", "/foo", 1).build()
+
+    def test_no_deadline_by_default(self):
+        seen = []
+        webapp = TestDeadline._webapp(
+            RoutesBuilder().add_handler(
+                "GET", "/foo", lambda request: seen.append(request) or ResponseBuilder().build()))
+
+        webapp.process_request_to_response(TestDeadline._request("/foo"))
+        self.assertTrue(seen[0].deadline.is_empty())
+
+    def test_handler_sees_remaining_budget_with_deepest_setting_winning(self):
+        seen = []
+        routes = RoutesBuilder()\
+            .add_handler("GET", "/api/slow", lambda request: seen.append(request) or ResponseBuilder().build())\
+            .add_handler("GET", "/api/fast", lambda request: seen.append(request) or ResponseBuilder().build())\
+            .add_handler("GET", "/other", lambda request: seen.append(request) or ResponseBuilder().build())\
+            .set_deadline("/", 30)\
+            .set_deadline("/api", 5)\
+            .set_route_deadline("GET", "/api/fast", 0.5)
+        webapp = TestDeadline._webapp(routes)
+
+        for path in ["/api/slow", "/api/fast", "/other"]:
+            webapp.process_request_to_response(TestDeadline._request(path))
+
+        remaining = [request.deadline.get().remaining_seconds for request in seen]
+        self.assertTrue(4 < remaining[0] <= 5)
+        self.assertTrue(0 < remaining[1] <= 0.5)
+        self.assertTrue(29 < remaining[2] <= 30)
+
+    def test_spent_budget_stops_interceptor_chain_with_504(self):
+        calls = []
+
+        def slow_interceptor(request):
+            calls.append("slow")
+            time.sleep(0.05)
+            return request
+
+        def next_interceptor(request):
+            calls.append("next")
+            return request
+
+        def handler(request):
+            calls.append("handler")
+            return ResponseBuilder().build()
+
+        routes = RoutesBuilder()\
+            .add_request_interceptor("/", slow_interceptor)\
+            .add_request_interceptor("/", next_interceptor)\
+            .add_handler("GET", "/foo", handler)\
+            .set_route_deadline("GET", "/foo", 0.01)
+        response = TestDeadline._webapp(routes).process_request_to_response(TestDeadline._request("/foo"))
+
+        self.assertEqual(HTTPStatus.GATEWAY_TIMEOUT.value, response.status.code)
+        self.assertEqual(["slow"], calls)
+
+    def test_spent_budget_after_handler_answers_504(self):
+        def slow_handler(request):
+            time.sleep(0.05)
+            return ResponseBuilder().build()
+
+        routes = RoutesBuilder()\
+            .add_response_interceptor("/", lambda request, response: response)\
+            .add_handler("GET", "/foo", slow_handler)\
+            .set_deadline("/", 0.01)
+        response = TestDeadline._webapp(routes).process_request_to_response(TestDeadline._request("/foo"))
+
+        self.assertEqual(HTTPStatus.GATEWAY_TIMEOUT.value, response.status.code)
+
+    def test_custom_deadline_exceeded_error_handler(self):
+        error_handlers = ErrorHandlersBuilder()\
+            .add_pre_response_error_handler(
+                DeadlineExceededException,
+                lambda exc, request: ResponseBuilder().set_status(HTTPStatus.REQUEST_TIMEOUT).build())\
+            .build()
+        routes = RoutesBuilder().add_handler("GET", "/foo", lambda request: ResponseBuilder().build())
+        webapp = EynnydWebappBuilder()\
+            .set_routes(routes.build())\
+            .set_error_handlers(error_handlers)\
+            .honor_deadline_headers()\
+            .build()
+
+        response = webapp.process_request_to_response(TestDeadline._request("/foo", {"HTTP_GRPC_TIMEOUT": "0n"}))
+        self.assertEqual(HTTPStatus.REQUEST_TIMEOUT.value, response.status.code)
+
+    def test_headers_ignored_unless_honored(self):
+        seen = []
+        routes = RoutesBuilder().add_handler(
+            "GET", "/foo", lambda request: seen.append(request) or ResponseBuilder().build())
+
+        response = TestDeadline._webapp(routes)\
+            .process_request_to_response(TestDeadline._request("/foo", {"HTTP_GRPC_TIMEOUT": "0n"}))
+        self.assertEqual(HTTPStatus.OK.value, response.status.code)
+        self.assertTrue(seen[0].deadline.is_empty())
+
+    def test_headers_only_shorten_route_deadline(self):
+        seen = []
+        routes = RoutesBuilder()\
+            .add_handler("GET", "/foo", lambda request: seen.append(request) or ResponseBuilder().build())\
+            .set_deadline("/", 1)
+        webapp = EynnydWebappBuilder().set_routes(routes.build()).honor_deadline_headers().build()
+
+        webapp.process_request_to_response(TestDeadline._request("/foo", {"HTTP_GRPC_TIMEOUT": "10S"}))
+        webapp.process_request_to_response(
+            TestDeadline._request("/foo", {"HTTP_X_REQUEST_DEADLINE": str(time.time() + 0.5)}))
+        webapp.process_request_to_response(TestDeadline._request("/foo", {"HTTP_GRPC_TIMEOUT": "soon"}))
+
+        remaining = [request.deadline.get().remaining_seconds for request in seen]
+        self.assertTrue(0.5 < remaining[0] <= 1)
+        self.assertTrue(0 < remaining[1] <= 0.5)
+        self.assertTrue(0.5 < remaining[2] <= 1)
+
+    def test_async_handler_cancelled_at_deadline(self):
+        cancelled = []
+
+        async def hanging_handler(request):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+            return ResponseBuilder().build()
+
+        routes = RoutesBuilder()\
+            .add_handler("GET", "/foo", hanging_handler)\
+            .set_route_deadline("GET", "/foo", 0.05)
+        webapp = TestDeadline._webapp(routes)
+
+        started = time.monotonic()
+        loop = asyncio.new_event_loop()
+        try:
+            response = loop.run_until_complete(webapp.process_request_to_response_async(TestDeadline._request("/foo")))
+        finally:
+            loop.close()
+        self.assertEqual(HTTPStatus.GATEWAY_TIMEOUT.value, response.status.code)
+        self.assertLess(time.monotonic() - started, 5)
+        self.assertEqual([True], cancelled)
+
+    def test_plan_executor_without_deadline_runs_everything(self):
+        plan = ExecutionPlan([], lambda request: ResponseBuilder().build(), [], {})
+        response = PlanExecutor(ErrorHandlersBuilder().build()).execute_plan(plan, TestDeadline._request("/"))
+        self.assertEqual(HTTPStatus.OK.value, response.status.code)
+
+    def test_plan_executor_with_expired_deadline_runs_nothing(self):
+        handled = []
+        plan = ExecutionPlan([], lambda request: handled.append(request) or ResponseBuilder().build(), [], {})
+        response = PlanExecutor(ErrorHandlersBuilder().build())\
+            .execute_plan(plan, TestDeadline._request("/"), Deadline(time.monotonic() - 1))
+        self.assertEqual(HTTPStatus.GATEWAY_TIMEOUT.value, response.status.code)
+        self.assertEqual([], handled)
+
+    @staticmethod
+    def _webapp(routes_builder):
+        return EynnydWebappBuilder().set_routes(routes_builder.build()).build()
+
+    @staticmethod
+    def _request(path, extra_environment=None):
+        environment = {
+            "REQUEST_METHOD": "GET",
+            "wsgi.url_scheme": "http",
+            "SERVER_NAME": "localhost",
+            "SERVER_PORT": "80",
+            "PATH_INFO": path,
+            "QUERY_STRING": "",
+            "wsgi.input": io.BytesIO(b"")
+        }
+        environment.update(extra_environment or {})
+        return WSGILoadedRequest(environment)
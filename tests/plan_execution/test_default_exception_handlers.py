@@ -3,7 +3,10 @@ from http import HTTPStatus
 
 from eynnyd.internal.plan_execution.default_error_handlers import default_invalid_cookie_header_error_handler, \
     default_internal_server_error_error_handler_only_request, default_internal_server_error_error_handler, \
-    default_route_not_found_error_handler
+    default_route_not_found_error_handler, static_route_not_found_error_handler, \
+    default_service_unavailable_error_handler
+from eynnyd.internal.prebuilt_response import PrebuiltResponse
+from eynnyd.exceptions import ServiceUnavailableException
 
 
 class TestDefaultExceptionHandlers(unittest.TestCase):
@@ -29,6 +32,20 @@ class TestDefaultExceptionHandlers(unittest.TestCase):
         response = default_invalid_cookie_header_error_handler(Exception(), FakeRequest())
         self.assertEqual(HTTPStatus.BAD_REQUEST.value, response.status.code)
 
+    def test_default_service_unavailable_returns_prebuilt_503(self):
+        response = default_service_unavailable_error_handler(Exception(), "fake request")
+        self.assertEqual(HTTPStatus.SERVICE_UNAVAILABLE.value, response.status.code)
+        self.assertIsInstance(response, PrebuiltResponse)
+
+    def test_default_service_unavailable_sets_retry_after(self):
+        response = default_service_unavailable_error_handler(
+            ServiceUnavailableException("busy", retry_after_seconds=5),
+            "fake request")
+        self.assertEqual("5", response.headers["retry-after"])
+        self.assertIs(
+            response,
+            default_service_unavailable_error_handler(ServiceUnavailableException("busy", 5), "fake request"))
+
     def test_default_internal_server_error_exception_request_only_returns_500(self):
         response = default_internal_server_error_error_handler_only_request(Exception(), "fake request")
         self.assertEqual(HTTPStatus.INTERNAL_SERVER_ERROR.value, response.status.code)
@@ -37,5 +54,17 @@ class TestDefaultExceptionHandlers(unittest.TestCase):
         response = default_internal_server_error_error_handler(Exception(), "fake request", "fake response")
         self.assertEqual(HTTPStatus.INTERNAL_SERVER_ERROR.value, response.status.code)
 
+    def test_static_not_found_returns_shared_prebuilt_404(self):
+        first = static_route_not_found_error_handler(Exception(), "fake request")
+        second = static_route_not_found_error_handler(Exception(), "other fake request")
+        self.assertEqual(HTTPStatus.NOT_FOUND.value, first.status.code)
+        self.assertIsInstance(first, PrebuiltResponse)
+        self.assertIs(first, second)
 
+    def test_default_internal_server_error_responses_are_shared_and_prebuilt(self):
+        only_request = default_internal_server_error_error_handler_only_request(Exception(), "fake request")
+        with_response = default_internal_server_error_error_handler(Exception(), "fake request", "fake response")
+        self.assertIsInstance(only_request, PrebuiltResponse)
+        self.assertIs(only_request, with_response)
+        self.assertEqual((b"Internal Server Error",), only_request.wsgi_body)
 
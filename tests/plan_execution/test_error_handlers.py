@@ -1,3 +1,4 @@
+import abc
 import unittest
 
 from eynnyd.internal.plan_execution.error_handlers import ErrorHandlers
@@ -121,3 +122,58 @@ class TestErrorHandlers(unittest.TestCase):
         error_handlers.handle_post_response_error(CustomRegisterException(), None, None)
         self.assertEqual(0, fake_handler.pre_call_count)
         self.assertEqual(1, fake_handler.post_call_count)
+
+    def test_most_specific_pre_error_handler_is_called_regardless_of_registration_order(self):
+
+        class BaseTestException(Exception):
+            pass
+
+        class DerivedTestException(BaseTestException):
+            pass
+
+        error_handlers = \
+            ErrorHandlers(
+                [(Exception, lambda exc, request: "generic"),
+                 (BaseTestException, lambda exc, request: "base"),
+                 (DerivedTestException, lambda exc, request: "derived")],
+                [])
+        self.assertEqual("derived", error_handlers.handle_pre_response_error(DerivedTestException(), None))
+        self.assertEqual("base", error_handlers.handle_pre_response_error(BaseTestException(), None))
+        self.assertEqual("generic", error_handlers.handle_pre_response_error(ValueError(), None))
+
+    def test_most_specific_post_error_handler_is_called_regardless_of_registration_order(self):
+        error_handlers = \
+            ErrorHandlers(
+                [],
+                [(Exception, lambda exc, request, response: "generic"),
+                 (LookupError, lambda exc, request, response: "lookup")])
+        self.assertEqual("lookup", error_handlers.handle_post_response_error(KeyError(), None, None))
+        self.assertEqual("generic", error_handlers.handle_post_response_error(ValueError(), None, None))
+
+    def test_resolved_handler_is_reused_for_error_type(self):
+
+        class CustomRegisterException(Exception):
+            pass
+
+        error_handlers = ErrorHandlers([(CustomRegisterException, lambda exc, request: exc)], [])
+        first_error = CustomRegisterException()
+        second_error = CustomRegisterException()
+        self.assertIs(first_error, error_handlers.handle_pre_response_error(first_error, None))
+        self.assertIs(second_error, error_handlers.handle_pre_response_error(second_error, None))
+        self.assertEqual(1, len(error_handlers._resolved_pre_response_handlers_by_error_type))
+
+    def test_virtual_subclass_error_handler_is_called(self):
+
+        class VirtualBaseException(Exception, metaclass=abc.ABCMeta):
+            pass
+
+        class UnrelatedException(Exception):
+            pass
+
+        VirtualBaseException.register(UnrelatedException)
+        error_handlers = \
+            ErrorHandlers(
+                [(Exception, lambda exc, request: "generic"),
+                 (VirtualBaseException, lambda exc, request: "virtual")],
+                [])
+        self.assertEqual("virtual", error_handlers.handle_pre_response_error(UnrelatedException(), None))
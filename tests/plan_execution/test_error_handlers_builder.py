@@ -6,6 +6,7 @@ from eynnyd.exceptions import ErrorHandlingBuilderException, RouteNotFoundExcept
     CallbackIncorrectNumberOfParametersException, NonCallableExceptionHandlerException, \
     InvalidCookieHeaderException
 from eynnyd.error_handlers_builder import ErrorHandlersBuilder
+from eynnyd.internal.wsgi_loaded_request import WSGILoadedRequest
 
 
 class TestExceptionHandlersRegistry(unittest.TestCase):
@@ -181,3 +182,31 @@ class TestExceptionHandlersRegistry(unittest.TestCase):
             ErrorHandlersBuilder().add_post_response_error_handler(FakeException, fake_handler).build()
         response = exception_handlers.handle_post_response_error(FakeException(), "fake request", "fake response")
         self.assertEqual(HTTPStatus.OK.value, response.status.code)
+
+    def test_detailed_route_not_found_message_by_default(self):
+        error_handlers = ErrorHandlersBuilder().build()
+        response = error_handlers.handle_pre_response_error(
+            RouteNotFoundException(),
+            WSGILoadedRequest({
+                "REQUEST_METHOD": "GET",
+                "PATH_INFO": "/missing",
+                "QUERY_STRING": "",
+                "wsgi.url_scheme": "http",
+                "SERVER_NAME": "localhost",
+                "SERVER_PORT": "80"}))
+        self.assertIn(b"/missing", response.body.content)
+
+    def test_static_route_not_found_message(self):
+        error_handlers = ErrorHandlersBuilder().set_detailed_route_not_found_message(False).build()
+        response = error_handlers.handle_pre_response_error(
+            RouteNotFoundException(),
+            WSGILoadedRequest({
+                "REQUEST_METHOD": "GET",
+                "PATH_INFO": "/missing",
+                "QUERY_STRING": "",
+                "wsgi.url_scheme": "http",
+                "SERVER_NAME": "localhost",
+                "SERVER_PORT": "80"}))
+        self.assertEqual(HTTPStatus.NOT_FOUND, response.status.code)
+        self.assertEqual(b"Not Found", response.body.content)
+
@@ -0,0 +1,158 @@
+import io
+from http import HTTPStatus
+from unittest import TestCase
+
+from eynnyd.exceptions import EynnydWebappBuildException, RequestShedException, RouteBuildException
+from eynnyd.eynnyd_webapp_builder import EynnydWebappBuilder
+from eynnyd.internal.plan_execution.load_shedder import LoadShedder
+from eynnyd.internal.wsgi_loaded_request import WSGILoadedRequest
+from eynnyd.load_shedder_builder import LoadShedderBuilder
+from eynnyd.response_builder import ResponseBuilder
+from eynnyd.routes_builder import RoutesBuilder
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestLoadShedder(TestCase):
+
+    def test_build_raises_on_invalid_settings(self):
+        with self.assertRaises(EynnydWebappBuildException):
+            LoadShedderBuilder().set_target_latency_seconds(0)
+        with self.assertRaises(EynnydWebappBuildException):
+            LoadShedderBuilder().set_interval_seconds(-1)
+        with self.assertRaises(EynnydWebappBuildException):
+            LoadShedderBuilder().set_maximum_in_flight(0)
+        with self.assertRaises(EynnydWebappBuildException):
+            EynnydWebappBuilder().set_load_shedder(object())
+        with self.assertRaises(RouteBuildException):
+            RoutesBuilder().set_priority("/", -1)
+
+    def test_nothing_shed_while_latency_under_target(self):
+        clock = FakeClock()
+        load_shedder = LoadShedder(0.1, 1.0, clock=clock)
+        for _ in range(20):
+            admitted_at = load_shedder.admit(5)
+            clock.now += 0.2
+            load_shedder.release(admitted_at)
+            clock.now += 0.05
+            TestLoadShedder._complete_fast_request(load_shedder, clock)
+        self.assertIsNone(load_shedder.metrics.concurrency_limit)
+        self.assertEqual(0, load_shedder.metrics.shed)
+
+    def test_overloaded_interval_limits_concurrency_by_priority(self):
+        clock = FakeClock()
+        load_shedder = LoadShedder(0.1, 1.0, clock=clock)
+        admitted = [load_shedder.admit(1) for _ in range(8)]
+        clock.now += 0.5
+        load_shedder.release(admitted.pop())
+        clock.now += 0.6
+
+        load_shedder.admit(LoadShedder.CRITICAL_PRIORITY)
+        limit = load_shedder.metrics.concurrency_limit
+        self.assertIsNotNone(limit)
+        self.assertLess(limit, 8)
+
+        with self.assertRaises(RequestShedException) as context:
+            load_shedder.admit(1)
+        self.assertEqual(1, context.exception.retry_after_seconds)
+        self.assertEqual(1, load_shedder.metrics.shed)
+
+    def test_interval_without_completed_requests_leaves_limit_alone(self):
+        clock = FakeClock()
+        load_shedder = LoadShedder(0.1, 1.0, clock=clock)
+        load_shedder.admit(1)
+        clock.now += 1.1
+
+        for _ in range(5):
+            load_shedder.admit(1)
+        self.assertIsNone(load_shedder.metrics.concurrency_limit)
+        self.assertEqual(0, load_shedder.metrics.shed)
+
+    def test_higher_priorities_get_smaller_share_of_limit(self):
+        load_shedder = LoadShedder(0.1, 1.0, maximum_in_flight=4, clock=FakeClock())
+        load_shedder.admit(1)
+        load_shedder.admit(1)
+        with self.assertRaises(RequestShedException):
+            load_shedder.admit(2)
+        load_shedder.admit(1)
+
+    def test_limit_recovers_after_good_intervals(self):
+        clock = FakeClock()
+        load_shedder = LoadShedder(0.1, 1.0, clock=clock)
+        admitted = [load_shedder.admit(1) for _ in range(4)]
+        clock.now += 1.1
+        for admitted_at in admitted:
+            load_shedder.release(admitted_at)
+        self.assertIsNotNone(load_shedder.metrics.concurrency_limit)
+
+        for _ in range(20):
+            clock.now += 1.1
+            TestLoadShedder._complete_fast_request(load_shedder, clock)
+        self.assertIsNone(load_shedder.metrics.concurrency_limit)
+
+    def test_shed_requests_answered_before_interceptors_with_retry_after(self):
+        intercepted = []
+        load_shedder = LoadShedderBuilder().set_maximum_in_flight(1).set_retry_after_seconds(3).build()
+        load_shedder.admit(1)
+        webapp = EynnydWebappBuilder()\
+            .set_routes(
+                RoutesBuilder()
+                .add_handler("GET", "/health", lambda request: ResponseBuilder().build())
+                .add_handler("GET", "/reports", lambda request: ResponseBuilder().build())
+                .add_request_interceptor("/", lambda request: intercepted.append(request) or request)
+                .set_priority("/health", 0)
+                .build())\
+            .set_load_shedder(load_shedder)\
+            .build()
+
+        shed = webapp.process_request_to_response(TestLoadShedder._request("/reports"))
+        critical = webapp.process_request_to_response(TestLoadShedder._request("/health"))
+
+        self.assertEqual(HTTPStatus.SERVICE_UNAVAILABLE.value, shed.status.code)
+        self.assertEqual("3", shed.headers["retry-after"])
+        self.assertEqual(HTTPStatus.OK.value, critical.status.code)
+        self.assertEqual(1, len(intercepted))
+        self.assertEqual(1, load_shedder.metrics.in_flight)
+
+    def test_route_priority_overrides_prefix_priority(self):
+        routes = RoutesBuilder()\
+            .add_handler("GET", "/api/health", lambda request: ResponseBuilder().build())\
+            .add_handler("GET", "/api/export", lambda request: ResponseBuilder().build())\
+            .set_priority("/api", 3)\
+            .set_route_priority("GET", "/api/health", 0)\
+            .build()
+        load_shedder = LoadShedderBuilder().set_maximum_in_flight(1).build()
+        load_shedder.admit(1)
+        webapp = EynnydWebappBuilder().set_routes(routes).set_load_shedder(load_shedder).build()
+
+        self.assertEqual(
+            HTTPStatus.OK.value,
+            webapp.process_request_to_response(TestLoadShedder._request("/api/health")).status.code)
+        self.assertEqual(
+            HTTPStatus.SERVICE_UNAVAILABLE.value,
+            webapp.process_request_to_response(TestLoadShedder._request("/api/export")).status.code)
+
+    @staticmethod
+    def _complete_fast_request(load_shedder, clock):
+        admitted_at = load_shedder.admit(LoadShedder.CRITICAL_PRIORITY)
+        clock.now += 0.01
+        load_shedder.release(admitted_at)
+
+    @staticmethod
+    def _request(path):
+        return WSGILoadedRequest({
+            "REQUEST_METHOD": "GET",
+            "wsgi.url_scheme": "http",
+            "SERVER_NAME": "localhost",
+            "SERVER_PORT": "80",
+            "PATH_INFO": path,
+            "QUERY_STRING": "",
+            "wsgi.input": io.BytesIO(b"")
+        })
@@ -123,6 +123,9 @@ class TestPlanExecutor(unittest.TestCase):
             def utf8_body(self):
                 pass
 
+            def copy_and_set_deadline(self, deadline):
+                pass
+
         def fake_request_interceptor_first(request):
             self.assertEqual("GET", request.http_method)
             return FakeRequest("POST")
@@ -217,6 +220,9 @@ class TestPlanExecutor(unittest.TestCase):
             def utf8_body(self):
                 pass
 
+            def copy_and_set_deadline(self, deadline):
+                pass
+
         def fake_interceptor(original_request):
             return FakeRequest()
 
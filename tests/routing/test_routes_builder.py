@@ -2,6 +2,11 @@ from unittest import TestCase
 
 from eynnyd.exceptions import RouteBuildException, NonCallableInterceptor, \
     NonCallableHandler, CallbackIncorrectNumberOfParametersException
+from eynnyd.eynnyd_webapp_builder import EynnydWebappBuilder
+from eynnyd.internal.wsgi_loaded_request import WSGILoadedRequest
+from eynnyd.request_coalescer_builder import RequestCoalescerBuilder
+from eynnyd.response_builder import ResponseBuilder
+from eynnyd.response_cache_builder import ResponseCacheBuilder
 from eynnyd.routes_builder import RoutesBuilder
 
 
@@ -105,3 +110,43 @@ class TestRoutesBuilder(TestCase):
         builder.add_handler("GET", "/foo/bar", test_handler)
         with self.assertRaises(RouteBuildException):
             builder.add_handler("GET", "/foo/bar", test_another_handler)
+
+    def test_set_response_cache_not_built_by_builder_raises(self):
+        with self.assertRaises(RouteBuildException):
+            RoutesBuilder().set_response_cache("GET", "/foo", lambda handler: handler)
+
+    def test_set_response_cache_without_handler_raises_on_build(self):
+        builder = RoutesBuilder().set_response_cache("GET", "/foo", ResponseCacheBuilder().build())
+        with self.assertRaises(RouteBuildException):
+            builder.build()
+
+    def test_set_response_cache_wraps_handler(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return ResponseBuilder().set_utf8_body("cached").build()
+
+        routes = RoutesBuilder()\
+            .set_response_cache("GET", "/foo", ResponseCacheBuilder().build())\
+            .add_handler("GET", "/foo", handler)\
+            .add_handler("POST", "/foo", handler)\
+            .build()
+        webapp = EynnydWebappBuilder().set_routes(routes).build()
+        for method in ("GET", "GET", "POST", "POST"):
+            webapp.process_request_to_response(
+                WSGILoadedRequest({"REQUEST_METHOD": method, "PATH_INFO": "/foo", "QUERY_STRING": ""}))
+        self.assertEqual(3, len(calls))
+
+    def test_set_request_coalescer_not_built_by_builder_raises(self):
+        with self.assertRaises(RouteBuildException):
+            RoutesBuilder().set_request_coalescer("GET", "/foo", "not a coalescer")
+
+    def test_set_request_coalescer_wraps_handler(self):
+        routes = RoutesBuilder()\
+            .add_handler("GET", "/foo", lambda request: ResponseBuilder().set_utf8_body("foo").build())\
+            .set_request_coalescer("GET", "/foo", RequestCoalescerBuilder().build())\
+            .build()
+        response = EynnydWebappBuilder().set_routes(routes).build().process_request_to_response(
+            WSGILoadedRequest({"REQUEST_METHOD": "GET", "PATH_INFO": "/foo", "QUERY_STRING": ""}))
+        self.assertEqual(b"foo", response.body.content)
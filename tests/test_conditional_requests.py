@@ -0,0 +1,38 @@
+import datetime
+from http import HTTPStatus
+from unittest import TestCase
+
+from eynnyd.conditional_requests import ConditionalRequests
+from eynnyd.internal.wsgi_loaded_request import WSGILoadedRequest
+
+
+class TestConditionalRequests(TestCase):
+
+    def test_is_not_modified_with_unquoted_etag(self):
+        request = WSGILoadedRequest({"REQUEST_METHOD": "GET", "HTTP_IF_NONE_MATCH": '"v42"'})
+        self.assertTrue(ConditionalRequests.is_not_modified(request, etag="v42"))
+        self.assertFalse(ConditionalRequests.is_not_modified(request, etag="v43"))
+
+    def test_is_not_modified_with_datetime(self):
+        request = WSGILoadedRequest({
+            "REQUEST_METHOD": "GET",
+            "HTTP_IF_MODIFIED_SINCE": "Wed, 21 Oct 2015 07:28:00 GMT"})
+        self.assertTrue(ConditionalRequests.is_not_modified(
+            request,
+            last_modified=datetime.datetime(2015, 10, 21, 7, 0, 0)))
+        self.assertFalse(ConditionalRequests.is_not_modified(
+            request,
+            last_modified=datetime.datetime(2015, 10, 22, tzinfo=datetime.timezone.utc)))
+
+    def test_is_not_modified_without_conditions(self):
+        request = WSGILoadedRequest({"REQUEST_METHOD": "GET"})
+        self.assertFalse(ConditionalRequests.is_not_modified(request, etag="v42"))
+
+    def test_build_not_modified_response(self):
+        response = ConditionalRequests.build_not_modified_response(
+            etag="v42",
+            last_modified=datetime.datetime(2015, 10, 21, 7, 28, 0, tzinfo=datetime.timezone.utc))
+        self.assertEqual(HTTPStatus.NOT_MODIFIED, response.status.code)
+        self.assertDictEqual(
+            {"etag": '"v42"', "last-modified": "Wed, 21 Oct 2015 07:28:00 GMT"},
+            response.headers)
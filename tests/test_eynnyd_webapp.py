@@ -1,3 +1,4 @@
+import asyncio
 import unittest
 from http import HTTPStatus
 
@@ -35,7 +36,10 @@ class TestEynnydWebappHandlers(unittest.TestCase):
             self._byte_body = byte_body
             self._utf8_body = utf8_body
 
-        def copy_and_set_path_parameters(self, path_parameters):
+        def copy_and_set_deadline(self, deadline):
+            return self
+
+        def copy_and_set_path_parameters(self, path_parameters, route=None):
             return TestEynnydWebappHandlers.StubRequest(
                 method=self.http_method,
                 request_uri=self.request_uri.path,
@@ -326,7 +330,10 @@ class TestEynnydWebappInterceptors(unittest.TestCase):
             self._byte_body = byte_body
             self._utf8_body = utf8_body
 
-        def copy_and_set_path_parameters(self, path_parameters):
+        def copy_and_set_deadline(self, deadline):
+            return self
+
+        def copy_and_set_path_parameters(self, path_parameters, route=None):
             return TestEynnydWebappHandlers.StubRequest(
                 method=self.http_method,
                 request_uri=self.request_uri.path,
@@ -540,7 +547,10 @@ class TestEynnydWebappErrorHandlers(unittest.TestCase):
             self._byte_body = byte_body
             self._utf8_body = utf8_body
 
-        def copy_and_set_path_parameters(self, path_parameters):
+        def copy_and_set_deadline(self, deadline):
+            return self
+
+        def copy_and_set_path_parameters(self, path_parameters, route=None):
             return TestEynnydWebappHandlers.StubRequest(
                 method=self.http_method,
                 request_uri=self.request_uri.path,
@@ -801,4 +811,41 @@ class TestEynnydWebappErrorHandlers(unittest.TestCase):
         self.assertEqual(1, spy_generic_exception_handler.call_count)
 
 
+class TestEynnydWebappAsyncHandlers(unittest.TestCase):
+
+    def test_async_handler_and_interceptors_run_under_wsgi(self):
+        async def downstream(name):
+            await asyncio.sleep(0)
+            return name
+
+        async def fan_out_handler(request):
+            results = await asyncio.gather(downstream("a"), downstream("b"), downstream("c"))
+            return ResponseBuilder().set_utf8_body("".join(results)).build()
+
+        async def add_header(request, response):
+            return ResponseBuilder.from_response(response).add_header("X-Async", "yes").build()
+
+        routes = \
+            RoutesBuilder() \
+                .add_handler("GET", "/fan-out", fan_out_handler) \
+                .add_response_interceptor("/", add_header) \
+                .build()
+
+        test_app = EynnydWebappBuilder().set_routes(routes).build()
+        request = TestEynnydWebappHandlers.StubRequest(method="GET", request_uri="/fan-out")
+        response = test_app.process_request_to_response(request)
+        self.assertEqual(HTTPStatus.OK.value, response.status.code)
+        self.assertEqual(b"abc", response.body.content)
+        self.assertEqual("yes", response.headers["x-async"])
+
+    def test_async_handler_path_parameters(self):
+        async def echo_handler(request):
+            return ResponseBuilder().set_utf8_body(request.path_parameters["name"]).build()
+
+        routes = RoutesBuilder().add_handler("GET", "/hello/{name}", echo_handler).build()
+
+        test_app = EynnydWebappBuilder().set_routes(routes).build()
+        request = TestEynnydWebappHandlers.StubRequest(method="GET", request_uri="/hello/bob")
+        response = test_app.process_request_to_response(request)
+        self.assertEqual(b"bob", response.body.content)
 
@@ -0,0 +1,42 @@
+from unittest import TestCase
+
+from eynnyd.eynnyd_webapp_builder import EynnydWebappBuilder
+from eynnyd.exceptions import EynnydWebappBuildException
+from eynnyd.routes_builder import RoutesBuilder
+from eynnyd.response_builder import ResponseBuilder
+
+
+class TestEynnydWebappBuilder(TestCase):
+
+    def setUp(self):
+        self._routes = RoutesBuilder()\
+            .add_handler("GET", "/", lambda request: ResponseBuilder().build())\
+            .build()
+
+    def test_build_raises_without_routes(self):
+        with self.assertRaises(EynnydWebappBuildException):
+            EynnydWebappBuilder().build()
+
+    def test_set_stream_block_size_raises_on_non_positive_size(self):
+        with self.assertRaises(EynnydWebappBuildException):
+            EynnydWebappBuilder().set_stream_block_size(0)
+
+    def test_set_adaptive_stream_block_size_raises_on_non_integer_size(self):
+        with self.assertRaises(EynnydWebappBuildException):
+            EynnydWebappBuilder().set_adaptive_stream_block_size("big")
+
+    def test_build_raises_when_maximum_block_size_is_below_block_size(self):
+        with self.assertRaises(EynnydWebappBuildException):
+            EynnydWebappBuilder()\
+                .set_routes(self._routes)\
+                .set_stream_block_size(64 * 1024)\
+                .set_adaptive_stream_block_size(8 * 1024)\
+                .build()
+
+    def test_build_with_adaptive_stream_block_size(self):
+        webapp = EynnydWebappBuilder()\
+            .set_routes(self._routes)\
+            .set_stream_block_size(16 * 1024)\
+            .set_adaptive_stream_block_size(1024 * 1024)\
+            .build()
+        self.assertIsNotNone(webapp)
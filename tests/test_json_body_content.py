@@ -0,0 +1,37 @@
+import json
+from unittest import TestCase
+
+from eynnyd.internal.json_body_content import JSONBodyContent
+
+
+class TestJSONBodyContent(TestCase):
+
+    def test_encoded_with_default_serializer(self):
+        content = JSONBodyContent({"name": "café", "values": [1, 2.5, None, True]})
+        self.assertEqual({"name": "café", "values": [1, 2.5, None, True]}, json.loads(content.encoded))
+
+    def test_encoded_is_cached(self):
+        calls = []
+
+        def serializer(value):
+            calls.append(value)
+            return b"{}"
+
+        content = JSONBodyContent({}, serializer)
+        self.assertIs(content.encoded, content.encoded)
+        self.assertEqual(1, len(calls))
+
+    def test_encoded_with_str_serializer(self):
+        content = JSONBodyContent(["€"], lambda value: json.dumps(value, ensure_ascii=False))
+        self.assertEqual('["€"]'.encode("utf-8"), content.encoded)
+
+    def test_iter_encoded_streams_in_chunks(self):
+        value = [{"id": i, "name": "row {i}".format(i=i)} for i in range(1000)]
+        chunks = list(JSONBodyContent(value, streamed=True).iter_encoded(1024))
+        self.assertTrue(len(chunks) > 1)
+        self.assertTrue(all(isinstance(chunk, bytes) for chunk in chunks))
+        self.assertEqual(value, json.loads(b"".join(chunks)))
+
+    def test_streamed(self):
+        self.assertFalse(JSONBodyContent([]).streamed)
+        self.assertTrue(JSONBodyContent([], streamed=True).streamed)
@@ -1,3 +1,6 @@
+import json
+import io
+import tempfile
 from unittest import TestCase
 from http import HTTPStatus as HTTPLibHTTPStatus
 
@@ -30,9 +33,81 @@ class TestResponseBuilder(TestCase):
         with self.assertRaises(SettingBodyWithNonBodyStatusException):
             builder.set_utf8_body("foobar")
 
-    def test_set_utf8_body_raises_on_non_utf8_body(self):
+    def test_set_utf8_body_raises_on_non_text_body(self):
         with self.assertRaises(InvalidBodyTypeException):
-            ResponseBuilder().set_utf8_body("fooć𝗱ễbar")
+            ResponseBuilder().set_utf8_body(1234)
+
+    def test_set_utf8_body_raises_on_unencodable_body(self):
+        with self.assertRaises(InvalidBodyTypeException):
+            ResponseBuilder().set_utf8_body("foo\ud800bar")
+
+    def test_set_utf8_body_with_non_ascii_body(self):
+        response = ResponseBuilder().set_utf8_body("fooć𝗱ễbar").build()
+        self.assertEqual("fooć𝗱ễbar".encode("utf-8"), response.body.content)
+        self.assertEqual(str(len("fooć𝗱ễbar".encode("utf-8"))), response.headers["content-length"])
+
+    def test_set_utf8_body_with_encoded_buffers_does_not_copy(self):
+        for body in (b"caf\xc3\xa9", bytearray(b"caf\xc3\xa9"), memoryview(b"caf\xc3\xa9")):
+            response = ResponseBuilder().set_utf8_body(body).build()
+            self.assertIs(body, response.body.content)
+            self.assertEqual("5", response.headers["content-length"])
+
+    def test_set_utf8_body_with_wide_memoryview(self):
+        body = memoryview(bytearray(8)).cast("I")
+        response = ResponseBuilder().set_utf8_body(body).build()
+        self.assertEqual(8, len(response.body.content))
+        self.assertEqual("8", response.headers["content-length"])
+
+    def test_set_utf8_body_raises_on_non_contiguous_memoryview(self):
+        with self.assertRaises(InvalidBodyTypeException):
+            ResponseBuilder().set_utf8_body(memoryview(b"abcdef")[::2])
+
+    def test_set_text_body(self):
+        response = ResponseBuilder().set_text_body("café").build()
+        self.assertEqual(ResponseBodyType.UTF8, response.body.type)
+        self.assertEqual("café".encode("utf-8"), response.body.content)
+        self.assertEqual("text/plain; charset=utf-8", response.headers["content-type"])
+        self.assertEqual("5", response.headers["content-length"])
+
+    def test_set_text_body_with_encoding(self):
+        response = ResponseBuilder().set_text_body("café", "latin_1").build()
+        self.assertEqual(ResponseBodyType.BYTE, response.body.type)
+        self.assertEqual(b"caf\xe9", response.body.content)
+        self.assertEqual("text/plain; charset=ISO-8859-1", response.headers["content-type"])
+        self.assertEqual("4", response.headers["content-length"])
+
+    def test_set_text_body_names_registered_charsets(self):
+        for encoding, charset in [
+                ("UTF8", "utf-8"),
+                ("cp1252", "windows-1252"),
+                ("euc_jp", "EUC-JP"),
+                ("sjis", "Shift_JIS"),
+                ("mac_roman", "mac_roman")]:
+            response = ResponseBuilder().set_text_body("abc", encoding).build()
+            self.assertEqual("text/plain; charset=" + charset, response.headers["content-type"])
+
+    def test_set_text_body_adds_charset_to_content_type(self):
+        response = ResponseBuilder().add_header("content-type", "text/csv").set_text_body("a,b").build()
+        self.assertEqual("text/csv; charset=utf-8", response.headers["content-type"])
+
+    def test_set_text_body_keeps_content_type_charset(self):
+        response = ResponseBuilder()\
+            .add_header("content-type", "text/html; charset=UTF-8")\
+            .set_text_body("<p/>")\
+            .build()
+        self.assertEqual("text/html; charset=UTF-8", response.headers["content-type"])
+
+    def test_set_text_body_raises_on_unknown_encoding(self):
+        with self.assertRaises(InvalidBodyTypeException):
+            ResponseBuilder().set_text_body("foo", "not-an-encoding")
+
+    def test_set_text_body_raises_on_unencodable_body(self):
+        with self.assertRaises(InvalidBodyTypeException):
+            ResponseBuilder().set_text_body("café", "ascii")
+
+    def test_set_text_body_raises_on_non_body_status(self):
+        with self.assertRaises(SettingBodyWithNonBodyStatusException):
+            ResponseBuilder().set_status(HTTPLibHTTPStatus.NOT_MODIFIED).set_text_body("foo")
 
     def test_set_utf8_body(self):
         response = ResponseBuilder().set_utf8_body("foobar fizzbuzz 1234").build()
@@ -153,3 +228,134 @@ class TestResponseBuilder(TestCase):
 
 
 
+
+    def test_build_is_not_changed_by_further_building(self):
+        builder = ResponseBuilder().add_header("foo", "bar").add_basic_cookie("fizz", "buzz")
+        response = builder.build()
+        builder.add_header("bam", "baz").add_basic_cookie("pants", "shirt")
+        self.assertDictEqual({"foo": "bar"}, response.headers)
+        self.assertListEqual([ResponseCookieBuilder("fizz", "buzz").build()], response.cookies)
+
+    def test_build_prebuilt(self):
+        response = ResponseBuilder()\
+            .set_status(HTTPLibHTTPStatus.OK)\
+            .add_header("content-type", "text/plain")\
+            .set_utf8_body("OK")\
+            .build_prebuilt()
+        self.assertEqual(b"OK", response.body.content)
+        self.assertEqual("text/plain", response.headers["content-type"])
+        self.assertTupleEqual((b"OK",), response.wsgi_body)
+        self.assertTupleEqual((("Content-Type", "text/plain"), ("Content-Length", "2")), response.wsgi_headers)
+
+    def test_build_prebuilt_is_immutable(self):
+        response = ResponseBuilder().add_header("foo", "bar").build_prebuilt()
+        with self.assertRaises(TypeError):
+            response.headers["foo"] = "baz"
+
+    def test_build_prebuilt_raises_with_iterable_body(self):
+        with self.assertRaises(InvalidBodyTypeException):
+            ResponseBuilder().set_iterable_body([b"foo"]).build_prebuilt()
+
+    def test_from_response(self):
+        prebuilt = ResponseBuilder().add_header("foo", "bar").set_utf8_body("fizz").build_prebuilt()
+        response = ResponseBuilder.from_response(prebuilt).add_header("bam", "baz").build()
+        self.assertEqual(b"fizz", response.body.content)
+        self.assertDictEqual({"foo": "bar", "content-length": "4", "bam": "baz"}, response.headers)
+        self.assertDictEqual({"foo": "bar", "content-length": "4"}, dict(prebuilt.headers))
+
+    def test_set_stream_body_with_content_length(self):
+        class FakeBody:
+            def read(self, size):
+                return b""
+        response = ResponseBuilder().set_stream_body(FakeBody(), content_length=42).build()
+        self.assertEqual("42", response.headers["content-length"])
+
+    def test_set_stream_body_raises_on_invalid_content_length(self):
+        class FakeBody:
+            def read(self, size):
+                return b""
+        with self.assertRaises(InvalidBodyTypeException):
+            ResponseBuilder().set_stream_body(FakeBody(), content_length=-1)
+
+    def test_set_stream_body_with_block_size(self):
+        class FakeBody:
+            def read(self, size):
+                return b""
+        response = ResponseBuilder().set_stream_body(FakeBody(), block_size=65536).build()
+        self.assertEqual(65536, response.body.block_size.get())
+
+    def test_set_stream_body_raises_on_invalid_block_size(self):
+        class FakeBody:
+            def read(self, size):
+                return b""
+        with self.assertRaises(InvalidBodyTypeException):
+            ResponseBuilder().set_stream_body(FakeBody(), block_size=0)
+
+    def test_set_stream_body_sets_remaining_content_length_of_regular_file(self):
+        with tempfile.TemporaryFile() as body:
+            body.write(b"0123456789")
+            body.seek(4)
+            response = ResponseBuilder().set_stream_body(body).build()
+        self.assertEqual("6", response.headers["content-length"])
+
+    def test_set_stream_body_keeps_existing_content_length_of_regular_file(self):
+        with tempfile.TemporaryFile() as body:
+            body.write(b"0123456789")
+            body.seek(0)
+            response = ResponseBuilder().add_header("content-length", "3").set_stream_body(body).build()
+        self.assertEqual("3", response.headers["content-length"])
+
+    def test_set_stream_body_without_file_has_no_content_length(self):
+        response = ResponseBuilder().set_stream_body(io.BytesIO(b"0123456789")).build()
+        self.assertNotIn("content-length", response.headers)
+
+    def test_set_iterable_body_with_coalescing(self):
+        response = ResponseBuilder().set_iterable_body((b"a" for _ in range(10)), coalesce_size=4).build()
+        self.assertEqual([b"aaaa", b"aaaa", b"aa"], list(response.body.content))
+
+    def test_set_iterable_body_with_coalesce_seconds_only(self):
+        response = ResponseBuilder().set_iterable_body(["a", "b"], coalesce_seconds=0.1).build()
+        self.assertEqual([b"ab"], list(response.body.content))
+
+    def test_set_iterable_body_raises_on_invalid_coalesce_size(self):
+        with self.assertRaises(InvalidBodyTypeException):
+            ResponseBuilder().set_iterable_body([b"a"], coalesce_size=0)
+
+    def test_set_iterable_body_raises_on_invalid_coalesce_seconds(self):
+        with self.assertRaises(InvalidBodyTypeException):
+            ResponseBuilder().set_iterable_body([b"a"], coalesce_seconds=-1)
+
+    def test_set_json_body(self):
+        response = ResponseBuilder().set_json_body({"foo": ["bar"]}).build()
+        self.assertEqual(ResponseBodyType.JSON, response.body.type)
+        self.assertEqual({"foo": ["bar"]}, response.body.content.value)
+        self.assertEqual("application/json", response.headers["content-type"])
+        self.assertNotIn("content-length", response.headers)
+
+    def test_set_json_body_keeps_content_type(self):
+        response = ResponseBuilder()\
+            .add_header("content-type", "application/problem+json")\
+            .set_json_body({"title": "oops"})\
+            .build()
+        self.assertEqual("application/problem+json", response.headers["content-type"])
+
+    def test_set_json_body_with_serializer(self):
+        response = ResponseBuilder().set_json_body({"foo": "bar"}, serializer=lambda value: b"{}").build()
+        self.assertEqual(b"{}", response.body.content.encoded)
+
+    def test_set_json_body_raises_on_non_body_status(self):
+        with self.assertRaises(SettingBodyWithNonBodyStatusException):
+            ResponseBuilder().set_status(HTTPLibHTTPStatus.NO_CONTENT).set_json_body({})
+
+    def test_set_json_body_raises_on_uncallable_serializer(self):
+        with self.assertRaises(InvalidBodyTypeException):
+            ResponseBuilder().set_json_body({}, serializer="orjson")
+
+    def test_set_json_body_raises_on_streamed_serializer(self):
+        with self.assertRaises(InvalidBodyTypeException):
+            ResponseBuilder().set_json_body([], serializer=lambda value: b"[]", stream=True)
+
+    def test_build_prebuilt_json_body(self):
+        response = ResponseBuilder().set_json_body({"foo": "bar"}).build_prebuilt()
+        self.assertEqual({"foo": "bar"}, json.loads(b"".join(response.wsgi_body)))
+        self.assertTrue(("Content-Length", str(len(b"".join(response.wsgi_body)))) in response.wsgi_headers)
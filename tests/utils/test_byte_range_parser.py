@@ -0,0 +1,35 @@
+from unittest import TestCase
+
+from eynnyd.internal.utils.byte_range_parser import ByteRangeParser
+
+
+class TestByteRangeParser(TestCase):
+
+    def test_parse_single_range(self):
+        self.assertListEqual([(0, 499)], ByteRangeParser.parse("bytes=0-499", 1000))
+
+    def test_parse_open_ended_range(self):
+        self.assertListEqual([(500, 999)], ByteRangeParser.parse("bytes=500-", 1000))
+
+    def test_parse_suffix_range(self):
+        self.assertListEqual([(900, 999)], ByteRangeParser.parse("bytes=-100", 1000))
+        self.assertListEqual([(0, 999)], ByteRangeParser.parse("bytes=-5000", 1000))
+
+    def test_parse_clamps_end(self):
+        self.assertListEqual([(900, 999)], ByteRangeParser.parse("bytes=900-5000", 1000))
+
+    def test_parse_multiple_ranges_are_sorted_and_coalesced(self):
+        self.assertListEqual(
+            [(0, 20), (50, 59)],
+            ByteRangeParser.parse("bytes=50-59, 0-10, 5-15,16-20", 1000))
+
+    def test_parse_unsatisfiable(self):
+        self.assertListEqual([], ByteRangeParser.parse("bytes=1000-1001", 1000))
+        self.assertListEqual([], ByteRangeParser.parse("bytes=-0", 1000))
+        self.assertListEqual([], ByteRangeParser.parse("bytes=-10", 0))
+
+    def test_parse_invalid(self):
+        self.assertIsNone(ByteRangeParser.parse("items=0-10", 1000))
+        self.assertIsNone(ByteRangeParser.parse("bytes=10", 1000))
+        self.assertIsNone(ByteRangeParser.parse("bytes=10-5", 1000))
+        self.assertIsNone(ByteRangeParser.parse("bytes=a-5", 1000))
@@ -0,0 +1,63 @@
+import threading
+from unittest import TestCase
+
+from eynnyd.internal.utils.deadline_header_parser import DeadlineHeaderParser
+
+
+class TestDeadlineHeaderParser(TestCase):
+
+    def test_no_headers_has_no_deadline(self):
+        self.assertIsNone(DeadlineHeaderParser.parse_remaining_seconds({}))
+
+    def test_grpc_timeout_units(self):
+        for header_value, expected_seconds in [
+                ("2H", 7200.0),
+                ("3M", 180.0),
+                ("4S", 4.0),
+                ("250m", 0.25),
+                ("500u", 0.0005),
+                ("1000000n", 0.001)]:
+            self.assertAlmostEqual(
+                expected_seconds,
+                DeadlineHeaderParser.parse_remaining_seconds({"GRPC-TIMEOUT": header_value}))
+
+    def test_malformed_grpc_timeout_ignored(self):
+        for header_value in ["", "10", "m", "1.5S", "-1S", "123456789S", "10s"]:
+            self.assertIsNone(DeadlineHeaderParser.parse_remaining_seconds({"GRPC-TIMEOUT": header_value}))
+
+    def test_request_deadline_relative_to_wall_clock(self):
+        self.assertAlmostEqual(
+            1.5,
+            DeadlineHeaderParser.parse_remaining_seconds({"X-REQUEST-DEADLINE": "1001.5"}, lambda: 1000.0))
+
+    def test_past_request_deadline_is_negative(self):
+        self.assertGreater(
+            0,
+            DeadlineHeaderParser.parse_remaining_seconds({"X-REQUEST-DEADLINE": "999"}, lambda: 1000.0))
+
+    def test_malformed_request_deadline_ignored(self):
+        self.assertIsNone(
+            DeadlineHeaderParser.parse_remaining_seconds({"X-REQUEST-DEADLINE": "tomorrow"}, lambda: 1000.0))
+
+    def test_non_finite_request_deadline_ignored(self):
+        for header_value in ["nan", "inf", "-inf", "1e400"]:
+            self.assertIsNone(
+                DeadlineHeaderParser.parse_remaining_seconds({"X-REQUEST-DEADLINE": header_value}, lambda: 1000.0))
+
+    def test_non_finite_request_deadline_does_not_replace_grpc_timeout(self):
+        headers = {"GRPC-TIMEOUT": "2S", "X-REQUEST-DEADLINE": "nan"}
+        self.assertAlmostEqual(2.0, DeadlineHeaderParser.parse_remaining_seconds(headers, lambda: 1000.0))
+
+    def test_absurd_budgets_capped(self):
+        self.assertEqual(
+            threading.TIMEOUT_MAX,
+            DeadlineHeaderParser.parse_remaining_seconds({"X-REQUEST-DEADLINE": "1e300"}, lambda: 1000.0))
+        self.assertGreaterEqual(
+            threading.TIMEOUT_MAX,
+            DeadlineHeaderParser.parse_remaining_seconds({"GRPC-TIMEOUT": "99999999H"}))
+
+    def test_sooner_header_wins(self):
+        headers = {"GRPC-TIMEOUT": "2S", "X-REQUEST-DEADLINE": "1001"}
+        self.assertAlmostEqual(1.0, DeadlineHeaderParser.parse_remaining_seconds(headers, lambda: 1000.0))
+        headers = {"GRPC-TIMEOUT": "500m", "X-REQUEST-DEADLINE": "1001"}
+        self.assertAlmostEqual(0.5, DeadlineHeaderParser.parse_remaining_seconds(headers, lambda: 1000.0))
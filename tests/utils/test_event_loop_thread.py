@@ -0,0 +1,49 @@
+import asyncio
+import threading
+from unittest import TestCase
+
+from eynnyd.internal.utils.event_loop_thread import EventLoopThread
+
+
+class TestEventLoopThread(TestCase):
+
+    def test_run_returns_coroutine_result(self):
+        async def add(a, b):
+            await asyncio.sleep(0)
+            return a + b
+
+        self.assertEqual(3, EventLoopThread().run(add(1, 2)))
+
+    def test_run_raises_coroutine_errors(self):
+        async def fail():
+            raise ValueError("nope")
+
+        with self.assertRaises(ValueError):
+            EventLoopThread().run(fail())
+
+    def test_coroutines_run_on_one_named_thread(self):
+        async def current_thread_name():
+            return threading.current_thread().name
+
+        event_loop_thread = EventLoopThread(name="test-loop")
+        self.assertEqual("test-loop", event_loop_thread.run(current_thread_name()))
+        self.assertEqual("test-loop", event_loop_thread.run(current_thread_name()))
+        self.assertEqual(
+            1,
+            len([thread for thread in threading.enumerate() if thread.name == "test-loop"]))
+
+    def test_runs_coroutines_concurrently(self):
+        async def fan_out():
+            started = asyncio.Event()
+
+            async def wait_for_other():
+                await started.wait()
+                return "waited"
+
+            async def start_other():
+                started.set()
+                return "started"
+
+            return await asyncio.gather(wait_for_other(), start_other())
+
+        self.assertEqual(["waited", "started"], EventLoopThread().run(fan_out()))
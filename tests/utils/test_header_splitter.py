@@ -1,6 +1,6 @@
 from unittest import TestCase
 
-from eynnyd.internal.utils.header_helpers import HeaderSplitter
+from eynnyd.internal.utils.header_helpers import HeaderSplitter, HeaderNameFormatter, RequestHeaderReader
 
 
 class TestHeaderSplitter(TestCase):
@@ -13,3 +13,36 @@ class TestHeaderSplitter(TestCase):
         kv = HeaderSplitter.split_to_multi_values_by_key("foo= bar;123 =456;foo=bam")
         self.assertDictEqual({"foo": ["bar", "bam"], "123": ["456"]}, kv)
 
+
+class TestHeaderNameFormatter(TestCase):
+
+    def test_canonicalize(self):
+        self.assertEqual("Content-Length", HeaderNameFormatter.canonicalize("content-length"))
+        self.assertEqual("X-Forwarded-For", HeaderNameFormatter.canonicalize("X-FORWARDED-FOR"))
+
+    def test_canonicalize_special_cased_names(self):
+        self.assertEqual("ETag", HeaderNameFormatter.canonicalize("etag"))
+        self.assertEqual("WWW-Authenticate", HeaderNameFormatter.canonicalize("www-authenticate"))
+
+
+class TestHeaderSplitterValues(TestCase):
+
+    def test_split_to_values(self):
+        self.assertListEqual(["gzip", "deflate", "br"], HeaderSplitter.split_to_values("gzip, deflate,,br "))
+
+    def test_split_to_quality_values(self):
+        self.assertDictEqual(
+            {"gzip": 1.0, "deflate": 0.5, "*": 0.0},
+            HeaderSplitter.split_to_quality_values("GZIP, deflate;q=0.5, *;q=0, br;q=bad"))
+
+
+class TestRequestHeaderReader(TestCase):
+
+    def test_get_wsgi_style_header(self):
+        self.assertEqual("gzip", RequestHeaderReader.get({"ACCEPT-ENCODING": "gzip"}, "accept-encoding"))
+
+    def test_get_is_case_insensitive(self):
+        self.assertEqual("gzip", RequestHeaderReader.get({"Accept-Encoding": "gzip"}, "accept-encoding"))
+
+    def test_get_default(self):
+        self.assertEqual("none", RequestHeaderReader.get({}, "accept-encoding", "none"))
@@ -12,10 +12,28 @@ class TestHTTPStatusFactory(TestCase):
         self._assertSameStatus(status, HTTPStatusFactory.create(status))
 
     def test_build_from_http_lib_status(self):
-        self._assertSameStatus(HTTPStatus(200, "OK"), HTTPStatusFactory.create(HTTPLibStatus.OK))
+        self._assertSameStatus(
+            HTTPStatus(200, "OK", "Request fulfilled, document follows"),
+            HTTPStatusFactory.create(HTTPLibStatus.OK))
 
     def test_build_from_number(self):
-        self._assertSameStatus(HTTPStatus(200, "OK"), HTTPStatusFactory.create(200))
+        self._assertSameStatus(
+            HTTPStatus(200, "OK", "Request fulfilled, document follows"),
+            HTTPStatusFactory.create(200))
+
+    def test_build_uses_reason_phrase(self):
+        self._assertSameStatus(
+            HTTPStatus(404, "Not Found", "Nothing matches the given URI"),
+            HTTPStatusFactory.create(HTTPLibStatus.NOT_FOUND))
+
+    def test_build_returns_shared_status(self):
+        self.assertIs(HTTPStatusFactory.create(HTTPLibStatus.OK), HTTPStatusFactory.create(200))
+
+    def test_build_covers_all_http_lib_statuses(self):
+        for lib_status in HTTPLibStatus:
+            status = HTTPStatusFactory.create(lib_status.value)
+            self.assertEqual(lib_status.value, status.code)
+            self.assertEqual("{c} {p}".format(c=lib_status.value, p=lib_status.phrase), status.wsgi_format)
 
     def test_build_from_custom(self):
         self._assertSameStatus(HTTPStatus(602, "Custom Status"), HTTPStatusFactory.create(602))
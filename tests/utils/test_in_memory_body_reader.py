@@ -0,0 +1,26 @@
+from unittest import TestCase
+
+from eynnyd.internal.json_body_content import JSONBodyContent
+from eynnyd.internal.response_body import ResponseBody
+from eynnyd.internal.response_body_type import ResponseBodyType
+from eynnyd.internal.utils.in_memory_body_reader import InMemoryBodyReader
+
+
+class TestInMemoryBodyReader(TestCase):
+
+    def test_read_utf8(self):
+        self.assertEqual(b"foo", InMemoryBodyReader.read(ResponseBody(ResponseBodyType.UTF8, b"foo")))
+
+    def test_read_byte(self):
+        self.assertEqual(b"foo", InMemoryBodyReader.read(ResponseBody(ResponseBodyType.BYTE, b"foo")))
+
+    def test_read_json(self):
+        body = ResponseBody(ResponseBodyType.JSON, JSONBodyContent({}, lambda value: b"{}"))
+        self.assertEqual(b"{}", InMemoryBodyReader.read(body))
+
+    def test_read_streamed_json(self):
+        body = ResponseBody(ResponseBodyType.JSON, JSONBodyContent([], streamed=True))
+        self.assertIsNone(InMemoryBodyReader.read(body))
+
+    def test_read_stream(self):
+        self.assertIsNone(InMemoryBodyReader.read(ResponseBody(ResponseBodyType.STREAM, object())))
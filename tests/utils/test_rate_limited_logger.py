@@ -0,0 +1,72 @@
+import logging
+from unittest import TestCase
+from unittest.mock import patch
+
+from eynnyd.internal.utils.rate_limited_logger import RateLimitedLogger
+
+
+class LazyArgument:
+
+    def __init__(self):
+        self.format_count = 0
+
+    def __str__(self):
+        self.format_count += 1
+        return "lazy"
+
+
+class TestRateLimitedLogger(TestCase):
+
+    def setUp(self):
+        self._logger = logging.getLogger("test_rate_limited_logger")
+        self._logger.setLevel(logging.DEBUG)
+
+    def test_logs_up_to_burst_then_suppresses(self):
+        rate_limited_logger = RateLimitedLogger(self._logger, 1, 2)
+        with patch("eynnyd.internal.utils.rate_limited_logger.time.monotonic", return_value=0):
+            with self.assertLogs(self._logger, logging.ERROR) as logs:
+                for _ in range(5):
+                    rate_limited_logger.log(logging.ERROR, ValueError, "failed %s", "here")
+        self.assertEqual(2, len(logs.records))
+
+    def test_reports_suppressed_count(self):
+        rate_limited_logger = RateLimitedLogger(self._logger, 1, 1)
+        with self.assertLogs(self._logger, logging.ERROR) as logs:
+            with patch("eynnyd.internal.utils.rate_limited_logger.time.monotonic", return_value=0):
+                for _ in range(4):
+                    rate_limited_logger.log(logging.ERROR, ValueError, "failed")
+            with patch("eynnyd.internal.utils.rate_limited_logger.time.monotonic", return_value=1):
+                rate_limited_logger.log(logging.ERROR, ValueError, "failed")
+        self.assertEqual(["failed", "failed (3 similar messages suppressed)"], [r.getMessage() for r in logs.records])
+
+    def test_keys_limited_independently(self):
+        rate_limited_logger = RateLimitedLogger(self._logger, 1, 1)
+        with patch("eynnyd.internal.utils.rate_limited_logger.time.monotonic", return_value=0):
+            with self.assertLogs(self._logger, logging.ERROR) as logs:
+                rate_limited_logger.log(logging.ERROR, ValueError, "value")
+                rate_limited_logger.log(logging.ERROR, ValueError, "value")
+                rate_limited_logger.log(logging.ERROR, KeyError, "key")
+        self.assertEqual(["value", "key"], [r.getMessage() for r in logs.records])
+
+    def test_arguments_not_formatted_when_suppressed(self):
+        rate_limited_logger = RateLimitedLogger(self._logger, 1, 1)
+        argument = LazyArgument()
+        with patch("eynnyd.internal.utils.rate_limited_logger.time.monotonic", return_value=0):
+            with self.assertLogs(self._logger, logging.ERROR):
+                for _ in range(3):
+                    rate_limited_logger.log(logging.ERROR, ValueError, "failed %s", argument)
+        self.assertEqual(1, argument.format_count)
+
+    def test_nothing_done_when_level_disabled(self):
+        self._logger.setLevel(logging.CRITICAL)
+        rate_limited_logger = RateLimitedLogger(self._logger, 1, 1)
+        argument = LazyArgument()
+        rate_limited_logger.log(logging.ERROR, ValueError, "failed %s", argument)
+        self.assertEqual(0, argument.format_count)
+        self.assertEqual({}, rate_limited_logger._token_buckets_by_key)
+
+    def test_passes_extra_fields(self):
+        rate_limited_logger = RateLimitedLogger(self._logger, 1, 1)
+        with self.assertLogs(self._logger, logging.WARNING) as logs:
+            rate_limited_logger.log(logging.WARNING, ValueError, "failed", extra={"error_type": "ValueError"})
+        self.assertEqual("ValueError", logs.records[0].error_type)
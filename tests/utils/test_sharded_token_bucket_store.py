@@ -0,0 +1,33 @@
+from unittest import TestCase
+
+from eynnyd.internal.utils.sharded_token_bucket_store import ShardedTokenBucketStore
+
+
+class TestShardedTokenBucketStore(TestCase):
+
+    def test_new_keys_start_with_full_buckets(self):
+        store = ShardedTokenBucketStore(4, 10)
+        self.assertEqual(0, store.acquire(("a",), 1, 2, 100.0))
+        self.assertEqual(0, store.acquire(("a",), 1, 2, 100.0))
+        self.assertEqual(1.0, store.acquire(("a",), 1, 2, 100.0))
+
+    def test_keys_have_separate_buckets(self):
+        store = ShardedTokenBucketStore(4, 10)
+        self.assertEqual(0, store.acquire(("a",), 1, 1, 100.0))
+        self.assertEqual(0, store.acquire(("b",), 1, 1, 100.0))
+
+    def test_buckets_refill_lazily(self):
+        store = ShardedTokenBucketStore(1, 10)
+        store.acquire(("a",), 2, 1, 100.0)
+        self.assertEqual(0.25, store.acquire(("a",), 2, 1, 100.25))
+        self.assertEqual(0, store.acquire(("a",), 2, 1, 100.5))
+
+    def test_least_recently_used_keys_dropped(self):
+        store = ShardedTokenBucketStore(1, 2)
+        store.acquire(("a",), 1, 1, 100.0)
+        store.acquire(("b",), 1, 1, 100.0)
+        store.acquire(("a",), 1, 1, 100.0)
+        store.acquire(("c",), 1, 1, 100.0)
+        self.assertEqual(2, len(store))
+        self.assertNotEqual(0, store.acquire(("a",), 1, 1, 100.0))
+        self.assertEqual(0, store.acquire(("b",), 1, 1, 100.0))
@@ -0,0 +1,90 @@
+import asyncio
+import threading
+from unittest import TestCase
+
+from eynnyd.internal.utils.single_flight import SingleFlight
+
+
+class TestSingleFlight(TestCase):
+
+    def test_execute_runs_function(self):
+        self.assertEqual(("foo", True), SingleFlight().execute("key", lambda: "foo", 1))
+
+    def test_execute_raises_function_error(self):
+        def failing_function():
+            raise ValueError("oops")
+
+        single_flight = SingleFlight()
+        with self.assertRaises(ValueError):
+            single_flight.execute("key", failing_function, 1)
+        self.assertFalse(single_flight.is_in_flight("key"))
+
+    def test_concurrent_callers_share_result(self):
+        single_flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def slow_function():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return "shared"
+
+        results = []
+        leader = threading.Thread(target=lambda: results.append(single_flight.execute("key", slow_function, 5)))
+        leader.start()
+        started.wait(5)
+        self.assertTrue(single_flight.is_in_flight("key"))
+        followers = [
+            threading.Thread(target=lambda: results.append(single_flight.execute("key", slow_function, 5)))
+            for _ in range(5)]
+        for follower in followers:
+            follower.start()
+        release.set()
+        for thread in [leader] + followers:
+            thread.join(5)
+
+        self.assertEqual(1, len(calls))
+        self.assertEqual(6, len(results))
+        self.assertEqual(1, results.count(("shared", True)))
+        self.assertEqual(5, results.count(("shared", False)))
+
+    def test_waiting_caller_falls_back_after_timeout(self):
+        single_flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_function():
+            started.set()
+            release.wait(5)
+            return "leader"
+
+        leader = threading.Thread(target=lambda: single_flight.execute("key", slow_function, 5))
+        leader.start()
+        started.wait(5)
+        self.assertEqual(("independent", True), single_flight.execute("key", lambda: "independent", 0.01))
+        release.set()
+        leader.join(5)
+
+    def test_concurrent_async_callers_share_result(self):
+        single_flight = SingleFlight()
+        calls = []
+
+        async def slow_function():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "shared"
+
+        async def call_concurrently():
+            return await asyncio.gather(*[single_flight.execute_async("key", slow_function, 5) for _ in range(3)])
+
+        loop = asyncio.new_event_loop()
+        try:
+            results = loop.run_until_complete(call_concurrently())
+        finally:
+            loop.close()
+
+        self.assertEqual(1, len(calls))
+        self.assertEqual([("shared", True), ("shared", False), ("shared", False)], results)
+        self.assertFalse(single_flight.is_in_flight("key"))
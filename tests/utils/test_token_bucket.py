@@ -0,0 +1,28 @@
+from unittest import TestCase
+
+from eynnyd.internal.utils.token_bucket import TokenBucket
+
+
+class TestTokenBucket(TestCase):
+
+    def test_acquire_up_to_capacity(self):
+        token_bucket = TokenBucket(1, 3, 0)
+        self.assertEqual([True, True, True, False], [token_bucket.try_acquire(0) for _ in range(4)])
+
+    def test_refills_over_time(self):
+        token_bucket = TokenBucket(2, 2, 0)
+        token_bucket.try_acquire(0)
+        token_bucket.try_acquire(0)
+        self.assertFalse(token_bucket.try_acquire(0.25))
+        self.assertTrue(token_bucket.try_acquire(0.5))
+
+    def test_refill_capped_at_capacity(self):
+        token_bucket = TokenBucket(10, 2, 0)
+        token_bucket.try_acquire(100)
+        self.assertEqual(1, token_bucket.tokens)
+
+    def test_seconds_until_available(self):
+        token_bucket = TokenBucket(4, 1, 0)
+        self.assertEqual(0.0, token_bucket.seconds_until_available(0))
+        token_bucket.try_acquire(0)
+        self.assertAlmostEqual(0.25, token_bucket.seconds_until_available(0))
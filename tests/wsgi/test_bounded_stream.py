@@ -0,0 +1,23 @@
+import io
+import tempfile
+from unittest import TestCase
+
+from eynnyd.internal.wsgi.bounded_stream import BoundedStream
+
+
+class TestBoundedStream(TestCase):
+
+    def test_read_stops_at_length(self):
+        stream = BoundedStream(io.BytesIO(b"0123456789"), 4)
+        self.assertEqual(b"012", stream.read(3))
+        self.assertEqual(b"3", stream.read(3))
+        self.assertEqual(b"", stream.read(3))
+
+    def test_fileno_is_delegated(self):
+        with tempfile.TemporaryFile() as temporary_file:
+            self.assertEqual(temporary_file.fileno(), BoundedStream(temporary_file, 1).fileno())
+
+    def test_close_is_delegated(self):
+        underlying_stream = io.BytesIO(b"0123456789")
+        BoundedStream(underlying_stream, 4).close()
+        self.assertTrue(underlying_stream.closed)
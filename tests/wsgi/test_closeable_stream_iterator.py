@@ -62,4 +62,37 @@ class TestCloseableStreamIterator(TestCase):
         for _ in stream:
             pass
         stream.close()
-        self.assertEqual(6, body.read_call_count)
\ No newline at end of file
+        self.assertEqual(6, body.read_call_count)
+
+    def test_adaptive_block_size_doubles_up_to_maximum(self):
+        class RecordingStreamableBody:
+            def __init__(self, size):
+                self._remaining = size
+                self.block_sizes = []
+
+            def read(self, block_size):
+                self.block_sizes.append(block_size)
+                read_size = min(block_size, self._remaining)
+                self._remaining -= read_size
+                return b"a" * read_size
+
+        body = RecordingStreamableBody(1000)
+        content = b"".join(CloseableStreamIterator(body, 100, maximum_block_size=300))
+        self.assertEqual(1000, len(content))
+        self.assertEqual([100, 200, 300, 300, 300, 300], body.block_sizes)
+
+    def test_adaptive_block_size_does_not_grow_after_short_read(self):
+        class ShortReadStreamableBody:
+            def __init__(self):
+                self.block_sizes = []
+
+            def read(self, block_size):
+                self.block_sizes.append(block_size)
+                if len(self.block_sizes) < 3:
+                    return b"a"
+                return b""
+
+        body = ShortReadStreamableBody()
+        for _ in CloseableStreamIterator(body, 100, maximum_block_size=800):
+            pass
+        self.assertEqual([100, 100, 100], body.block_sizes)
@@ -0,0 +1,56 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from eynnyd.internal.wsgi.coalescing_iterator import CoalescingIterator
+
+
+class TestCoalescingIterator(TestCase):
+
+    def test_batches_chunks_up_to_threshold(self):
+        chunks = [b"ab", b"cd", b"ef", b"gh", b"i"]
+        self.assertEqual([b"abcd", b"efgh", b"i"], list(CoalescingIterator(chunks, 4)))
+
+    def test_single_large_chunk_passes_through(self):
+        self.assertEqual([b"abcdefgh", b"ij"], list(CoalescingIterator([b"abcdefgh", b"ij"], 4)))
+
+    def test_empty_iterable_yields_nothing(self):
+        self.assertEqual([], list(CoalescingIterator([], 4)))
+
+    def test_string_chunks_are_encoded(self):
+        self.assertEqual(["a,b\n€,d\n".encode("utf-8")], list(CoalescingIterator(["a,b\n", "€,d\n"], 1024)))
+
+    def test_mixed_chunks_are_encoded(self):
+        self.assertEqual([b"abcd"], list(CoalescingIterator([b"ab", "cd"], 1024)))
+
+    def test_threshold_counts_encoded_bytes(self):
+        self.assertEqual(
+            ["€€".encode("utf-8"), "€".encode("utf-8")],
+            list(CoalescingIterator(["€", "€", "€"], 6)))
+
+    def test_stateful_encodings_span_chunks(self):
+        self.assertEqual(
+            ["ab".encode("utf-16"), "c".encode("utf-16-le")],
+            list(CoalescingIterator(["a", "b", "c"], 6, encoding="utf-16")))
+
+    def test_time_budget_flushes_batch(self):
+        with patch("eynnyd.internal.wsgi.coalescing_iterator.time.monotonic", side_effect=[0, 0.5, 1.5, 2.0, 2.5]):
+            batches = list(CoalescingIterator([b"a", b"b", b"c", b"d", b"e"], 1024, 1))
+        self.assertEqual([b"abc", b"de"], batches)
+
+    def test_close_forwards_to_chunks(self):
+        class ClosableChunks:
+            def __init__(self):
+                self.closed = False
+
+            def __iter__(self):
+                return iter([b"a"])
+
+            def close(self):
+                self.closed = True
+
+        chunks = ClosableChunks()
+        CoalescingIterator(chunks, 4).close()
+        self.assertTrue(chunks.closed)
+
+    def test_close_without_close_method(self):
+        CoalescingIterator([b"a"], 4).close()
@@ -0,0 +1,34 @@
+import zlib
+from unittest import TestCase
+
+from eynnyd.internal.wsgi.compressing_iterator import CompressingIterator
+
+
+class TestCompressingIterator(TestCase):
+
+    def test_compresses_all_chunks(self):
+        chunks = [b"foobar" * 100, b"fizzbuzz" * 100, b""]
+        compressed = b"".join(CompressingIterator(chunks, zlib.compressobj()))
+        self.assertEqual(b"".join(chunks), zlib.decompress(compressed))
+
+    def test_empty_chunks_still_produce_valid_stream(self):
+        compressed = b"".join(CompressingIterator([], zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)))
+        self.assertEqual(b"", zlib.decompress(compressed, 16 + zlib.MAX_WBITS))
+
+    def test_close_is_forwarded(self):
+        class SpyChunks:
+            def __init__(self):
+                self.close_called = False
+
+            def __iter__(self):
+                return iter([b"foo"])
+
+            def close(self):
+                self.close_called = True
+
+        chunks = SpyChunks()
+        CompressingIterator(chunks, zlib.compressobj()).close()
+        self.assertTrue(chunks.close_called)
+
+    def test_close_without_closeable_chunks(self):
+        CompressingIterator([b"foo"], zlib.compressobj()).close()
@@ -0,0 +1,22 @@
+import io
+from unittest import TestCase
+
+from eynnyd.internal.wsgi.multipart_byte_ranges_iterator import MultipartByteRangesIterator
+
+
+class TestMultipartByteRangesIterator(TestCase):
+
+    def test_iterates_parts(self):
+        stream = io.BytesIO(b"xx0123456789")
+        iterator = MultipartByteRangesIterator(
+            stream,
+            2,
+            [(b"<a>", (0, 2)), (b"<b>", (7, 9))],
+            b"<end>",
+            2)
+        self.assertEqual(b"<a>012<b>789<end>", b"".join(iterator))
+
+    def test_close_closes_stream(self):
+        stream = io.BytesIO(b"0123456789")
+        MultipartByteRangesIterator(stream, 0, [(b"<a>", (0, 2))], b"<end>", 2).close()
+        self.assertTrue(stream.closed)
@@ -7,9 +7,10 @@ class TestRawWSGIServerErrorResponse(TestCase):
 
     def test_server_error_response_properties(self):
         response = RawWSGIServerErrorResponse()
-        self.assertEqual("500 INTERNAL_SERVER_ERROR", response.status)
+        self.assertEqual("500 Internal Server Error", response.status)
         self.assertListEqual([], response.headers)
         self.assertListEqual(["500 Internal Server Error".encode("utf-8")], response.body)
 
-
+    def test_server_error_response_body_is_precomputed(self):
+        self.assertIs(RawWSGIServerErrorResponse().body[0], RawWSGIServerErrorResponse().body[0])
 
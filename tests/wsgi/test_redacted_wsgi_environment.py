@@ -0,0 +1,31 @@
+import io
+from unittest import TestCase
+
+from eynnyd.internal.wsgi.redacted_wsgi_environment import RedactedWSGIEnvironment
+
+
+class TestRedactedWSGIEnvironment(TestCase):
+
+    def test_redacts_sensitive_headers(self):
+        redacted = RedactedWSGIEnvironment({
+            "HTTP_AUTHORIZATION": "Bearer secret",
+            "HTTP_COOKIE": "session=secret",
+            "PATH_INFO": "/foo"}).redact()
+        self.assertEqual(
+            {"HTTP_AUTHORIZATION": "[redacted]", "HTTP_COOKIE": "[redacted]", "PATH_INFO": "/foo"},
+            redacted)
+
+    def test_truncates_long_values(self):
+        redacted = RedactedWSGIEnvironment({"QUERY_STRING": "a" * 1000, "HTTP_X_BYTES": b"b" * 1000}).redact()
+        self.assertEqual("a" * 256 + "...", redacted["QUERY_STRING"])
+        self.assertEqual(b"b" * 256 + b"...", redacted["HTTP_X_BYTES"])
+
+    def test_drops_non_scalar_values(self):
+        redacted = RedactedWSGIEnvironment({
+            "wsgi.input": io.BytesIO(b"body"),
+            "wsgi.version": (1, 0),
+            "wsgi.multithread": True}).redact()
+        self.assertEqual({"wsgi.version": (1, 0), "wsgi.multithread": True}, redacted)
+
+    def test_str_is_redacted(self):
+        self.assertNotIn("secret", str(RedactedWSGIEnvironment({"HTTP_AUTHORIZATION": "secret"})))
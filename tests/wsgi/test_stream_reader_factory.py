@@ -12,3 +12,14 @@ class TestStreamReaderFactory(TestCase):
     def test_create_reader_from_none(self):
         self.assertEqual(CloseableStreamIterator, StreamReaderFactory.create_reader(None))
 
+
+    def test_create_adaptive_reader_from_none(self):
+        class FakeStream:
+            def read(self, block_size):
+                return b""
+
+        reader = StreamReaderFactory.create_reader(None, 1024)
+        self.assertTrue(isinstance(reader(FakeStream(), 128), CloseableStreamIterator))
+
+    def test_create_reader_from_passed_in_ignores_maximum_block_size(self):
+        self.assertEqual("foobar", StreamReaderFactory.create_reader("foobar", 1024))
@@ -9,3 +9,7 @@ class TestUTF8ResponseBody(TestCase):
         body = UTF8ResponseBody("foobar")
         self.assertListEqual(["foobar"], body.get_body())
 
+
+    def test_get_body_converts_buffers_to_bytes(self):
+        for body in (bytearray(b"foobar"), memoryview(b"foobar")):
+            self.assertListEqual([b"foobar"], UTF8ResponseBody(body).get_body())
@@ -1,6 +1,10 @@
+import json
 from unittest import TestCase
 from http import HTTPStatus
 
+from eynnyd.abstract_response import AbstractResponse
+from eynnyd.internal.response_body import ResponseBody
+from eynnyd.internal.utils.http_status_factory import HTTPStatusFactory
 from eynnyd.internal.wsgi.wsgi_response_adapter import WSGIResponseAdapter
 from eynnyd.response_builder import ResponseBuilder
 
@@ -17,21 +21,49 @@ class TestWSGIResponseAdapter(TestCase):
                 .set_utf8_body("foobar-fizzbuzz")\
                 .build()
         wsgi_response = WSGIResponseAdapter(None).adapt(response)
-        self.assertEqual("201 CREATED", wsgi_response.status)
+        self.assertEqual("201 Created", wsgi_response.status)
         self.assertEqual(4, len(wsgi_response.headers))
-        self.assertTrue(("foo", "bar") in wsgi_response.headers)
-        self.assertTrue(("fizz", "buzz") in wsgi_response.headers)
-        self.assertTrue(('content-length', '15') in wsgi_response.headers)
+        self.assertTrue(("Foo", "bar") in wsgi_response.headers)
+        self.assertTrue(("Fizz", "buzz") in wsgi_response.headers)
+        self.assertTrue(('Content-Length', '15') in wsgi_response.headers)
         self.assertTrue(('Set-Cookie', 'pants=shirt; Secure; HttpOnly') in wsgi_response.headers)
         self.assertEqual(1, len(list(wsgi_response.body)))
         self.assertTrue(b"foobar-fizzbuzz" in list(wsgi_response.body))
 
+    def test_adapt_json_body(self):
+        response = ResponseBuilder().set_json_body({"name": "caf\u00e9"}).build()
+        wsgi_response = WSGIResponseAdapter(None).adapt(response)
+        body = b"".join(wsgi_response.body)
+        self.assertEqual({"name": "caf\u00e9"}, json.loads(body))
+        self.assertTrue(("Content-Type", "application/json") in wsgi_response.headers)
+        self.assertTrue(("Content-Length", str(len(body))) in wsgi_response.headers)
 
+    def test_adapt_streamed_json_body(self):
+        response = ResponseBuilder().set_json_body(list(range(100)), stream=True).build()
+        wsgi_response = WSGIResponseAdapter(None).adapt(response)
+        self.assertEqual(list(range(100)), json.loads(b"".join(wsgi_response.body)))
+        self.assertFalse(any(name == "Content-Length" for name, _ in wsgi_response.headers))
 
+    def test_adapt_reuses_response_wsgi_headers(self):
+        response = ResponseBuilder().add_header("x-request-id", "1234").build()
+        first_wsgi_response = WSGIResponseAdapter(None).adapt(response)
+        first_wsgi_response.headers.append(("Date", "Mon, 01 Jan 2018 00:00:00 GMT"))
+        second_wsgi_response = WSGIResponseAdapter(None).adapt(response)
+        self.assertListEqual([("X-Request-Id", "1234")], second_wsgi_response.headers)
+        self.assertIs(response.wsgi_headers, response.wsgi_headers)
 
+    def test_adapt_non_eynnyd_response(self):
+        class CustomResponse(AbstractResponse):
+            status = HTTPStatusFactory.create(HTTPStatus.OK)
+            body = ResponseBody.empty_response()
+            headers = {"content-type": "text/plain"}
+            cookies = []
+        wsgi_response = WSGIResponseAdapter(None).adapt(CustomResponse())
+        self.assertListEqual([("Content-Type", "text/plain")], wsgi_response.headers)
 
-
-
-
-
-
+    def test_adapt_prebuilt_response(self):
+        response = ResponseBuilder().set_byte_body(b"foo").build_prebuilt()
+        wsgi_response = WSGIResponseAdapter(None).adapt(response)
+        self.assertEqual("200 OK", wsgi_response.status)
+        self.assertListEqual([("Content-Length", "3")], wsgi_response.headers)
+        self.assertIs(response.wsgi_body, wsgi_response.body)
@@ -1,5 +1,8 @@
 from unittest import TestCase
 
+from optional import Optional
+
+from eynnyd.internal.json_body_content import JSONBodyContent
 from eynnyd.internal.response_body import ResponseBody
 from eynnyd.internal.response_body_type import ResponseBodyType
 from eynnyd.internal.wsgi.wsgi_response_body_factory import WSGIResponseBodyFactory
@@ -25,6 +28,18 @@ class TestWSGIResponseBodyFactory(TestCase):
         body = ResponseBody(ResponseBodyType.STREAM, "who cares")
         self.assertTrue(isinstance(WSGIResponseBodyFactory(None).create(body), StreamResponseBody))
 
+    def test_build_stream_uses_default_block_size(self):
+        read_sizes = []
+        body = ResponseBody(ResponseBodyType.STREAM, "who cares")
+        WSGIResponseBodyFactory(lambda stream, size: read_sizes.append(size), 4096).create(body).get_body()
+        self.assertEqual([4096], read_sizes)
+
+    def test_build_stream_prefers_body_block_size(self):
+        read_sizes = []
+        body = ResponseBody(ResponseBodyType.STREAM, "who cares", Optional.of(65536))
+        WSGIResponseBodyFactory(lambda stream, size: read_sizes.append(size), 4096).create(body).get_body()
+        self.assertEqual([65536], read_sizes)
+
     def test_build_byte(self):
         body = ResponseBody(ResponseBodyType.BYTE, "who cares")
         self.assertTrue(isinstance(WSGIResponseBodyFactory(None).create(body), ByteResponseBody))
@@ -33,6 +48,14 @@ class TestWSGIResponseBodyFactory(TestCase):
         body = ResponseBody(ResponseBodyType.ITERABLE, "who cares")
         self.assertTrue(isinstance(WSGIResponseBodyFactory(None).create(body), IterableResponseBody))
 
+    def test_build_json(self):
+        body = ResponseBody(ResponseBodyType.JSON, JSONBodyContent({"foo": "bar"}))
+        self.assertTrue(isinstance(WSGIResponseBodyFactory(None).create(body), ByteResponseBody))
+
+    def test_build_streamed_json(self):
+        body = ResponseBody(ResponseBodyType.JSON, JSONBodyContent({"foo": "bar"}, streamed=True))
+        self.assertTrue(isinstance(WSGIResponseBodyFactory(None).create(body), IterableResponseBody))
+
     def test_build_unknown_raises(self):
         class FakeType:
             def name(self):